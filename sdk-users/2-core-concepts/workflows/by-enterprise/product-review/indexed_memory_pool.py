@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Indexed Shared Memory Pool
+==========================
+
+In-memory backend for the shared memory the A2A agents read and write,
+built so attention-filter reads stay cheap as the pool grows:
+
+- One ``__slots__`` record per memory, keyed by a monotonically increasing
+  sequence number
+- Secondary indexes on segment, agent_id and tag, plus an importance index
+  of 0.01-wide bands; every index entry is a list of sequence numbers in
+  write order, so the newest matches are read from the end of a list
+- A recency log of all memories for reads without filters
+- A query planner that walks only the smallest candidate index (newest
+  first) and checks the remaining filters per record, stopping once
+  ``window_size`` matches are found
+- Eviction past ``memory_size_limit`` by importance x recency: with
+  exponential decay, ``log2(importance) + timestamp / half_life`` orders
+  memories the same way at any later time, so a heap keyed on it at write
+  time always yields the memory with the lowest current score
+- Optional embedding index (NumPy) for semantic recall
+
+Index entries of evicted memories are skipped when read and dropped by a
+rebuild once they outnumber the live entries.
+
+Usage:
+    pool = IndexedMemoryPool(memory_size_limit=100_000)
+    pool.write("validator_001", "needs battery data", segment="feedback",
+               tags=["feedback"], importance=1.0)
+    memories, plan = pool.read({"segments": ["feedback"], "window_size": 5})
+"""
+
+import heapq
+import math
+import threading
+import time
+from datetime import datetime
+from sys import intern
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Embedding index is optional
+    np = None
+
+IMPORTANCE_BANDS = 100
+
+
+class MemoryRecord:
+    """One memory; segment, agent and tags are interned."""
+
+    __slots__ = (
+        "seq",
+        "agent_id",
+        "segment",
+        "tags",
+        "importance",
+        "timestamp",
+        "content",
+        "context",
+        "row",
+    )
+
+    def __init__(
+        self,
+        seq: int,
+        agent_id: str,
+        segment: str,
+        tags: Tuple[str, ...],
+        importance: float,
+        timestamp: float,
+        content: Any,
+        context: Optional[Dict[str, Any]],
+    ):
+        self.seq = seq
+        self.agent_id = intern(agent_id)
+        self.segment = intern(segment)
+        self.tags = tuple(intern(tag) for tag in tags)
+        self.importance = importance
+        self.timestamp = timestamp
+        self.content = content
+        self.context = context
+        self.row = -1  # Embedding row, -1 without an embedding
+
+    @property
+    def memory_id(self) -> str:
+        return f"mem_{self.seq}"
+
+    def to_dict(self, relevance: Optional[float] = None) -> Dict[str, Any]:
+        memory = {
+            "id": self.memory_id,
+            "content": self.content,
+            "agent_id": self.agent_id,
+            "segment": self.segment,
+            "tags": list(self.tags),
+            "importance": self.importance,
+            "timestamp": self.timestamp,
+            "datetime": datetime.fromtimestamp(self.timestamp).isoformat(),
+            "context": self.context or {},
+        }
+        if relevance is not None:
+            memory["relevance"] = relevance
+        return memory
+
+
+def _band(importance: float) -> int:
+    return min(IMPORTANCE_BANDS - 1, max(0, int(importance * IMPORTANCE_BANDS)))
+
+
+def _newest_first(postings: Sequence[List[int]]) -> Iterable[int]:
+    """Sequence numbers of several write-ordered lists, newest first, once each."""
+    if len(postings) == 1:
+        return reversed(postings[0])
+    merged = heapq.merge(*(reversed(p) for p in postings), reverse=True)
+    return _dedupe(merged)
+
+
+def _dedupe(seqs: Iterable[int]) -> Iterable[int]:
+    last = None
+    for seq in seqs:
+        if seq != last:
+            last = seq
+            yield seq
+
+
+class EmbeddingIndex:
+    """Exact cosine search over a growable NumPy matrix, one row per memory."""
+
+    def __init__(self, dim: int, capacity: int = 1024):
+        if np is None:
+            raise ImportError("numpy is required for the embedding index")
+        self.dim = dim
+        self.vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self.seqs = np.full(capacity, -1, dtype=np.int64)  # -1 marks a free row
+        self.free: List[int] = []
+        self.used = 0  # High-water mark of assigned rows
+
+    def add(self, seq: int, vector: Sequence[float]) -> int:
+        vector = np.asarray(vector, dtype=np.float32)
+        if vector.shape != (self.dim,):
+            raise ValueError(f"Expected a {self.dim}-dimensional embedding")
+        norm = float(np.linalg.norm(vector))
+        if self.free:
+            row = self.free.pop()
+        else:
+            if self.used == len(self.seqs):
+                self.vectors = np.concatenate(
+                    [self.vectors, np.zeros_like(self.vectors)]
+                )
+                self.seqs = np.concatenate([self.seqs, np.full_like(self.seqs, -1)])
+            row = self.used
+            self.used += 1
+        self.vectors[row] = vector / norm if norm else vector
+        self.seqs[row] = seq
+        return row
+
+    def remove(self, row: int) -> None:
+        self.seqs[row] = -1
+        self.free.append(row)
+
+    def search(self, vector: Sequence[float], k: int) -> List[Tuple[int, float]]:
+        """``[(seq, cosine), ...]`` best first."""
+        if self.used == 0:
+            return []
+        query = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(query))
+        scores = self.vectors[: self.used] @ (query / norm if norm else query)
+        scores[self.seqs[: self.used] < 0] = -np.inf
+        k = min(k, self.used - len(self.free))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self.seqs[row]), float(scores[row])) for row in top]
+
+
+class IndexedMemoryPool:
+    """
+    Shared memory with secondary indexes and importance x recency eviction.
+
+    ``read`` applies an attention filter: ``segments``, ``preferred_agents``
+    and ``tags`` (any of them) and ``importance_threshold`` select memories,
+    the newest ``window_size`` matches form the window, and the window is
+    returned ranked by relevance.
+    """
+
+    def __init__(
+        self,
+        memory_size_limit: int = 1000,
+        attention_window: int = 10,
+        recency_half_life: float = 3600.0,
+        embedder: Optional[Callable[[Any], Sequence[float]]] = None,
+    ):
+        self.memory_size_limit = memory_size_limit
+        self.attention_window = attention_window
+        self.recency_half_life = recency_half_life
+        self.embedder = embedder
+        self.embeddings: Optional[EmbeddingIndex] = None
+
+        self.records: Dict[int, MemoryRecord] = {}
+        self.by_segment: Dict[str, List[int]] = {}
+        self.by_agent: Dict[str, List[int]] = {}
+        self.by_tag: Dict[str, List[int]] = {}
+        self.by_band: List[List[int]] = [[] for _ in range(IMPORTANCE_BANDS)]
+        self.recent: List[int] = []
+        # Live records per index key, for the planner's cost estimates
+        self.segment_counts: Dict[str, int] = {}
+        self.agent_counts: Dict[str, int] = {}
+        self.tag_counts: Dict[str, int] = {}
+        self.band_counts = [0] * IMPORTANCE_BANDS
+
+        self.eviction_heap: List[Tuple[float, int]] = []
+        self.subscriptions: Dict[str, set] = {}  # segment -> agent ids
+        self.next_seq = 0
+        self.dead_postings = 0
+        self.live_postings = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    # ---- writes -------------------------------------------------------
+
+    def write(
+        self,
+        agent_id: str,
+        content: Any,
+        segment: str = "general",
+        tags: Iterable[str] = (),
+        importance: float = 0.5,
+        context: Optional[Dict[str, Any]] = None,
+        embedding: Optional[Sequence[float]] = None,
+        now: Optional[float] = None,
+    ) -> Tuple[MemoryRecord, List[str]]:
+        """Store a memory; returns it and the agents subscribed to its segment."""
+        importance = min(1.0, max(0.0, float(importance)))
+        timestamp = time.time() if now is None else now
+        if embedding is None and self.embedder is not None:
+            embedding = self.embedder(content)
+
+        with self._lock:
+            seq = self.next_seq
+            self.next_seq += 1
+            record = MemoryRecord(
+                seq,
+                agent_id,
+                segment,
+                tuple(tags),
+                importance,
+                timestamp,
+                content,
+                context,
+            )
+            self.records[seq] = record
+            self._index(record)
+            heapq.heappush(
+                self.eviction_heap, (self._retention_key(importance, timestamp), seq)
+            )
+            if embedding is not None:
+                if self.embeddings is None:
+                    self.embeddings = EmbeddingIndex(len(embedding))
+                record.row = self.embeddings.add(seq, embedding)
+            while len(self.records) > self.memory_size_limit:
+                self._evict()
+            subscribers = self.subscriptions.get(record.segment, set())
+            return record, sorted(subscribers - {agent_id})
+
+    def subscribe(self, agent_id: str, segments: Iterable[str]) -> None:
+        with self._lock:
+            for segment in segments:
+                self.subscriptions.setdefault(segment, set()).add(agent_id)
+
+    def _retention_key(self, importance: float, timestamp: float) -> float:
+        # log2 of importance x 2 ** -(age / half_life), minus the shared
+        # now / half_life term
+        return math.log2(max(importance, 1e-6)) + timestamp / self.recency_half_life
+
+    def _index(self, record: MemoryRecord) -> None:
+        seq = record.seq
+        self.by_segment.setdefault(record.segment, []).append(seq)
+        self.by_agent.setdefault(record.agent_id, []).append(seq)
+        for tag in record.tags:
+            self.by_tag.setdefault(tag, []).append(seq)
+        self.by_band[_band(record.importance)].append(seq)
+        self.recent.append(seq)
+        self._count(record, 1)
+        self.live_postings += 4 + len(record.tags)
+
+    def _count(self, record: MemoryRecord, delta: int) -> None:
+        for counts, key in (
+            (self.segment_counts, record.segment),
+            (self.agent_counts, record.agent_id),
+        ):
+            counts[key] = counts.get(key, 0) + delta
+        for tag in record.tags:
+            self.tag_counts[tag] = self.tag_counts.get(tag, 0) + delta
+        self.band_counts[_band(record.importance)] += delta
+
+    def _evict(self) -> None:
+        _, seq = heapq.heappop(self.eviction_heap)
+        record = self.records.pop(seq)
+        self._count(record, -1)
+        if record.row >= 0:
+            self.embeddings.remove(record.row)
+        postings = 4 + len(record.tags)
+        self.live_postings -= postings
+        self.dead_postings += postings
+        self.evictions += 1
+        if self.dead_postings > self.live_postings:
+            self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        for index in (self.by_segment, self.by_agent, self.by_tag):
+            for key in list(index):
+                index[key] = [seq for seq in index[key] if seq in self.records]
+                if not index[key]:
+                    del index[key]
+        self.by_band = [
+            [seq for seq in band if seq in self.records] for band in self.by_band
+        ]
+        self.recent = [seq for seq in self.recent if seq in self.records]
+        for counts in (self.segment_counts, self.agent_counts, self.tag_counts):
+            for key in [key for key, count in counts.items() if count == 0]:
+                del counts[key]
+        self.dead_postings = 0
+
+    # ---- reads --------------------------------------------------------
+
+    def plan(
+        self,
+        segments: Sequence[str],
+        agents: Sequence[str],
+        tags: Sequence[str],
+        threshold: float,
+    ) -> Tuple[str, List[List[int]]]:
+        """
+        Index to walk: the filter with the fewest live candidates.
+
+        Walking several lists goes through a heap merge, so a candidate's
+        count is weighted by ``1 + log2(lists)``; a loose importance
+        threshold spanning many bands loses to the recency log.
+        """
+        candidates = [("recent", len(self.records), [self.recent])]
+        for name, values, index, counts in (
+            ("segment", segments, self.by_segment, self.segment_counts),
+            ("agent", agents, self.by_agent, self.agent_counts),
+            ("tag", tags, self.by_tag, self.tag_counts),
+        ):
+            if values:
+                candidates.append(
+                    (
+                        name,
+                        sum(counts.get(value, 0) for value in values),
+                        [index[value] for value in values if value in index],
+                    )
+                )
+        if threshold > 0:
+            bands = range(_band(threshold), IMPORTANCE_BANDS)
+            candidates.append(
+                (
+                    "importance",
+                    sum(self.band_counts[band] for band in bands),
+                    [self.by_band[band] for band in bands if self.by_band[band]],
+                )
+            )
+        name, _, postings = min(
+            candidates,
+            key=lambda candidate: candidate[1]
+            * (1 + math.log2(max(1, len(candidate[2])))),
+        )
+        return name, postings
+
+    def read(
+        self,
+        attention_filter: Optional[Dict[str, Any]] = None,
+        segment: Optional[str] = None,
+        limit: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Memories matching the filter, ranked by relevance, and the plan used."""
+        attention_filter = attention_filter or {}
+        segments = list(
+            attention_filter.get("segments") or ([segment] if segment else [])
+        )
+        agents = list(attention_filter.get("preferred_agents") or [])
+        tags = list(attention_filter.get("tags") or [])
+        threshold = float(attention_filter.get("importance_threshold", 0.0))
+        window = attention_filter.get(
+            "window_size", max(self.attention_window, limit or 0)
+        )
+        now = time.time() if now is None else now
+
+        segment_set, agent_set, tag_set = set(segments), set(agents), set(tags)
+        with self._lock:
+            plan, postings = self.plan(segments, agents, tags, threshold)
+            window_records = []
+            if window > 0 and postings:
+                records = self.records
+                for seq in _newest_first(postings):
+                    record = records.get(seq)
+                    if (
+                        record is None
+                        or record.importance < threshold
+                        or (segment_set and record.segment not in segment_set)
+                        or (agent_set and record.agent_id not in agent_set)
+                        or (tag_set and tag_set.isdisjoint(record.tags))
+                    ):
+                        continue
+                    window_records.append(record)
+                    if len(window_records) >= window:
+                        break
+
+        ranked = sorted(
+            (
+                (self.relevance(record, tag_set, agent_set, now), record)
+                for record in window_records
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [record.to_dict(score) for score, record in ranked], plan
+
+    def relevance(
+        self, record: MemoryRecord, tags: set, agents: set, now: float
+    ) -> float:
+        """Importance, tag overlap, preferred agent and recency, in [0, 1]."""
+        score = record.importance * 0.3
+        if tags:
+            score += min(len(tags.intersection(record.tags)) / len(tags), 1.0) * 0.3
+        if record.agent_id in agents:
+            score += 0.2
+        age = max(0.0, now - record.timestamp)
+        return score + 0.2 * 2 ** (-age / self.recency_half_life)
+
+    def query(
+        self,
+        embedding: Optional[Sequence[float]] = None,
+        text: Optional[Any] = None,
+        top_k: int = 5,
+        segments: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Semantic recall: nearest memories to an embedding (or embedded text)."""
+        if embedding is None:
+            if self.embedder is None or text is None:
+                raise ValueError("query needs an embedding, or text and an embedder")
+            embedding = self.embedder(text)
+        if self.embeddings is None:
+            return []
+        segment_set = set(segments or [])
+        with self._lock:
+            # Over-fetch when filtering by segment, then keep the first top_k
+            fetch = top_k * 4 if segment_set else top_k
+            results = []
+            for seq, score in self.embeddings.search(embedding, fetch):
+                record = self.records[seq]
+                if segment_set and record.segment not in segment_set:
+                    continue
+                memory = record.to_dict()
+                memory["similarity"] = score
+                results.append(memory)
+                if len(results) == top_k:
+                    break
+            return results
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "total_memories": len(self.records),
+                "segments": sorted(k for k, v in self.segment_counts.items() if v),
+                "segment_sizes": {k: v for k, v in self.segment_counts.items() if v},
+                "agents": sum(1 for count in self.agent_counts.values() if count),
+                "tags": sum(1 for count in self.tag_counts.values() if count),
+                "memory_size_limit": self.memory_size_limit,
+                "evictions": self.evictions,
+                "embedded_memories": (
+                    self.embeddings.used - len(self.embeddings.free)
+                    if self.embeddings is not None
+                    else 0
+                ),
+            }
+
+
+def read_naive(
+    records: Iterable[MemoryRecord],
+    attention_filter: Dict[str, Any],
+) -> List[MemoryRecord]:
+    """The filter as a full scan: the newest ``window_size`` matches."""
+    segments = set(attention_filter.get("segments") or [])
+    agents = set(attention_filter.get("preferred_agents") or [])
+    tags = set(attention_filter.get("tags") or [])
+    threshold = attention_filter.get("importance_threshold", 0.0)
+    matches = [
+        record
+        for record in records
+        if record.importance >= threshold
+        and (not segments or record.segment in segments)
+        and (not agents or record.agent_id in agents)
+        and (not tags or not tags.isdisjoint(record.tags))
+    ]
+    matches.sort(key=lambda record: record.seq, reverse=True)
+    return matches[: attention_filter.get("window_size", 10)]
@@ -36,9 +36,25 @@ Key Features Demonstrated:
 The workflow shows iterative quality improvement through coordinated agent
 collaboration, without any explicit workflow loops. It uses a filesystem MCP
 server with mock data to demonstrate functionality without requiring API keys.
+
+Indexed memory pool:
+- The shared memory is an IndexedSharedMemoryPoolNode backed by an
+  IndexedMemoryPool (indexed_memory_pool.py): segment, agent, tag and
+  importance indexes with a query planner, so attention-filter reads walk
+  only the smallest matching index instead of every memory
+- Past memory_size_limit, the memory with the lowest importance x recency
+  is evicted
+- Pass embeddings on write (or an embedder to the node) and use
+  action="query" for semantic recall
+
+Usage:
+    python macbook_review_analysis.py
+    python macbook_review_analysis.py benchmark [memories]
 """
 
 import json
+import random
+import sys
 import tempfile
 import time
 from pathlib import Path
@@ -46,8 +62,127 @@ from pathlib import Path
 from kailash import Workflow
 from kailash.mcp_server import MCPClient
 from kailash.nodes.ai import A2AAgentNode, A2ACoordinatorNode, SharedMemoryPoolNode
+from kailash.nodes.base import NodeParameter
 from kailash.runtime.local import LocalRuntime
 
+sys.path.insert(0, str(Path(__file__).parent))
+from indexed_memory_pool import IndexedMemoryPool, read_naive
+
+
+class IndexedSharedMemoryPoolNode(SharedMemoryPoolNode):
+    """
+    SharedMemoryPoolNode whose memories live in an IndexedMemoryPool.
+
+    write, read, query, subscribe and metrics are answered from the pool's
+    indexes; ``memory_size_limit`` and ``attention_window`` size the pool.
+    """
+
+    def __init__(self, embedder=None, **kwargs):
+        super().__init__(**kwargs)
+        self.embedder = embedder
+        self.pool = None
+
+    def get_parameters(self):
+        parameters = super().get_parameters()
+        parameters.update(
+            {
+                "memory_size_limit": NodeParameter(
+                    name="memory_size_limit",
+                    type=int,
+                    required=False,
+                    default=1000,
+                    description="Memories kept before importance x recency eviction",
+                ),
+                "attention_window": NodeParameter(
+                    name="attention_window",
+                    type=int,
+                    required=False,
+                    default=10,
+                    description="Default window_size for reads",
+                ),
+                "embedding": NodeParameter(
+                    name="embedding",
+                    type=list,
+                    required=False,
+                    description="Embedding of the content, for semantic recall",
+                ),
+                "query_embedding": NodeParameter(
+                    name="query_embedding",
+                    type=list,
+                    required=False,
+                    description="Embedding to recall the nearest memories for",
+                ),
+                "top_k": NodeParameter(
+                    name="top_k",
+                    type=int,
+                    required=False,
+                    default=5,
+                    description="Memories returned by a semantic query",
+                ),
+            }
+        )
+        return parameters
+
+    def run(self, **kwargs):
+        if self.pool is None:
+            self.pool = IndexedMemoryPool(
+                memory_size_limit=kwargs.get("memory_size_limit", 1000),
+                attention_window=kwargs.get("attention_window", 10),
+                embedder=self.embedder,
+            )
+        pool = self.pool
+        action = kwargs.get("action")
+        agent_id = kwargs.get("agent_id", "system")
+
+        if action == "write":
+            record, notified = pool.write(
+                agent_id,
+                kwargs.get("content"),
+                segment=kwargs.get("segment") or "general",
+                tags=kwargs.get("tags") or [],
+                importance=kwargs.get("importance", 0.5),
+                context=kwargs.get("context"),
+                embedding=kwargs.get("embedding"),
+            )
+            return {
+                "success": True,
+                "memory_id": record.memory_id,
+                "segment": record.segment,
+                "notified_agents": notified,
+                "timestamp": record.timestamp,
+            }
+        if action == "read":
+            memories, plan = pool.read(
+                kwargs.get("attention_filter"),
+                segment=kwargs.get("segment"),
+                limit=kwargs.get("limit"),
+            )
+            return {
+                "success": True,
+                "agent_id": agent_id,
+                "memories": memories,
+                "total_available": len(pool),
+                "query_plan": plan,
+            }
+        if action == "query":
+            try:
+                results = pool.query(
+                    kwargs.get("query_embedding"),
+                    kwargs.get("query"),
+                    top_k=kwargs.get("top_k", 5),
+                    segments=(kwargs.get("attention_filter") or {}).get("segments"),
+                )
+            except (ImportError, ValueError) as e:
+                return {"success": False, "error": str(e)}
+            return {"success": True, "results": results, "total_matches": len(results)}
+        if action == "subscribe":
+            segments = kwargs.get("segments") or [kwargs.get("segment") or "general"]
+            pool.subscribe(agent_id, segments)
+            return {"success": True, "agent_id": agent_id, "segments": segments}
+        if action == "metrics":
+            return {"success": True, **pool.metrics()}
+        return {"success": False, "error": f"Unknown action: {action}"}
+
 
 def create_mock_review_data():
     """Create mock MacBook Air M3 review data in a temporary directory."""
@@ -128,7 +263,7 @@ def create_a2a_workflow():
     # Shared memory pool - central hub for agent collaboration
     workflow.add_node(
         "memory_pool",
-        SharedMemoryPoolNode(),
+        IndexedSharedMemoryPoolNode(),
         memory_size_limit=1000,
         attention_window=50,
     )
@@ -722,6 +857,78 @@ def display_top_insights(memory_pool, limit=10):
         print(f"   Time: {memory.get('datetime', 'N/A')}")
 
 
+def run_memory_pool_benchmark(memories: int = 1_000_000, reads: int = 200):
+    """Attention-filter read latency on a full pool while 50 agents write."""
+    segments = ["context", "feedback", "search_results", "findings", "analysis"]
+    tags = ["task", "requirements", "feedback", "gaps", "context", "validation"]
+    tags += ["search_results", "findings", "analysis", "synthesis", "filesystem"]
+    tags += [f"iteration_{i}" for i in range(20)]
+    agents = [f"agent_{i:03d}" for i in range(50)]
+    rng = random.Random(0)
+
+    def write(pool, i):
+        pool.write(
+            agents[i % len(agents)],
+            f"insight {i}",
+            segment=rng.choice(segments),
+            tags=rng.sample(tags, 2),
+            importance=rng.random(),
+        )
+
+    print("=" * 70)
+    print(f"Indexed memory pool: {memories:,} memories, {len(agents)} agents")
+    print("=" * 70)
+    pool = IndexedMemoryPool(memory_size_limit=memories)
+    start = time.perf_counter()
+    for i in range(memories):
+        write(pool, i)
+    print(f"  filled in {time.perf_counter() - start:.1f}s")
+
+    # The attention filters this workflow reads with
+    filters = {
+        "search_strategist": {
+            "tags": ["feedback", "gaps", "context"],
+            "importance_threshold": 0.7,
+            "segments": ["feedback", "context"],
+            "window_size": 5,
+        },
+        "synthesis_expert": {
+            "tags": ["search_results", "findings", "analysis"],
+            "importance_threshold": 0.6,
+            "segments": ["search_results", "findings"],
+            "window_size": 20,
+        },
+        "quality_validator": {
+            "tags": ["synthesis", "analysis"],
+            "importance_threshold": 0.8,
+            "segments": ["findings", "analysis"],
+            "window_size": 3,
+        },
+        "get_agent_insights": {"preferred_agents": [agents[7]], "window_size": 100},
+        "display_top_insights": {"importance_threshold": 0.6, "window_size": 100},
+    }
+    written = memories
+    for name, attention_filter in filters.items():
+        latencies = []
+        for _ in range(reads):
+            write(pool, written)  # Agents keep writing between reads
+            written += 1
+            start = time.perf_counter()
+            _, plan = pool.read(attention_filter)
+            latencies.append(time.perf_counter() - start)
+        latencies.sort()
+        start = time.perf_counter()
+        read_naive(pool.records.values(), attention_filter)
+        scan = time.perf_counter() - start
+        print(
+            f"  {name:<21} plan={plan:<10} "
+            f"p50 {latencies[len(latencies) // 2] * 1000:.3f} ms, "
+            f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.3f} ms "
+            f"(full scan {scan * 1000:.0f} ms)"
+        )
+    print(f"✅ {len(pool):,} memories after {pool.evictions:,} evictions")
+
+
 def main():
     """Execute the A2A collaborative review analysis."""
     print("A2A AGENT COLLABORATION: MacBook Air M3 Review")
@@ -879,4 +1086,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_memory_pool_benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
+    else:
+        main()
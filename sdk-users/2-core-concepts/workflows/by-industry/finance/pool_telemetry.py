@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Connection Pool Telemetry
+=========================
+
+Structured metrics for code that borrows connections from a
+WorkflowConnectionPool (or any pool with acquire/release operations):
+
+- Acquire-wait and hold-time histograms with fixed buckets, so they add up
+  across scrapes and quantiles can be read from any time window
+- Per-query-pattern latency, keyed by a fingerprint of the SQL with
+  literals, placeholders and IN lists collapsed; slow queries are logged
+  with how busy the pool was when they started, which ties pool
+  exhaustion to the queries it slowed down
+- In-use / waiting gauges
+- Prometheus text exposition (``render_prometheus``) and a minimal asyncio
+  HTTP endpoint serving it (``serve_metrics``)
+- ``AdaptivePoolSizer``: raises max_connections when recent p95 acquire
+  wait is over target (multiplicatively) and lowers it step by step when
+  the pool sits mostly idle
+
+Usage:
+    telemetry = PoolTelemetry("portfolio_pool")
+    async with telemetry.track_connection(acquire, release) as conn:
+        with telemetry.time_query(sql):
+            ...
+    print(render_prometheus(telemetry))
+"""
+
+import asyncio
+import math
+import re
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence
+
+# Upper bounds in seconds; acquire waits and queries both fall in this range
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+OTHER_PATTERN = "other"
+
+_STRINGS = re.compile(r"'(?:[^']|'')*'")
+_NUMBERS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDERS = re.compile(r"\$\d+|(?<!:):\w+|%s|\?")  # not ::type casts
+_IN_LISTS = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def query_pattern(query: str) -> str:
+    """SQL with literals and placeholders as ``?`` and whitespace collapsed."""
+    pattern = _STRINGS.sub("?", query)
+    pattern = _PLACEHOLDERS.sub("?", pattern)
+    pattern = _NUMBERS.sub("?", pattern)
+    pattern = _IN_LISTS.sub("IN (?)", pattern)
+    return _SPACE.sub(" ", pattern).strip()
+
+
+def bucket_quantile(bounds: Sequence[float], counts: Sequence[int], q: float) -> float:
+    """
+    Quantile from per-bucket counts (the last count is the +Inf bucket),
+    interpolated linearly inside the bucket as Prometheus does.
+    """
+    total = sum(counts)
+    if not total:
+        return 0.0
+    rank = q * total
+    seen = 0
+    for i, count in enumerate(counts):
+        if count and seen + count >= rank:
+            if i == len(bounds):
+                return bounds[-1]
+            lower = bounds[i - 1] if i else 0.0
+            return lower + (bounds[i] - lower) * (rank - seen) / count
+        seen += count
+    return bounds[-1]
+
+
+class Histogram:
+    """Fixed-bucket histogram; ``counts`` has one extra slot for +Inf."""
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BUCKETS):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        return bucket_quantile(self.bounds, self.counts, q)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "p50_ms": self.quantile(0.5) * 1000,
+            "p95_ms": self.quantile(0.95) * 1000,
+            "p99_ms": self.quantile(0.99) * 1000,
+        }
+
+
+class PoolTelemetry:
+    """
+    Acquire/hold/query metrics for one pool.
+
+    ``max_patterns`` caps the distinct query patterns tracked; later ones
+    share the ``other`` series so a query built from user input cannot
+    grow the exposition without bound.
+    """
+
+    def __init__(
+        self,
+        pool_name: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        max_patterns: int = 200,
+        slow_query_seconds: float = 0.25,
+        slow_query_log: int = 100,
+    ):
+        self.pool_name = pool_name
+        self.buckets = tuple(buckets)
+        self.acquire_wait = Histogram(self.buckets)
+        self.hold_time = Histogram(self.buckets)
+        self.queries: Dict[str, Histogram] = {}
+        self.query_errors: Dict[str, int] = {}
+        self.max_patterns = max_patterns
+        self.slow_query_seconds = slow_query_seconds
+        self.slow_queries: Deque[Dict[str, Any]] = deque(maxlen=slow_query_log)
+        self.in_use = 0
+        self.waiting = 0
+        # Highest in_use since the sizer last looked
+        self.peak_in_use = 0
+        self.acquire_errors = 0
+        # Set by AdaptivePoolSizer, exported as gauges
+        self.min_connections: Optional[int] = None
+        self.max_connections: Optional[int] = None
+
+    @asynccontextmanager
+    async def track_connection(
+        self,
+        acquire: Callable[[], Awaitable[Any]],
+        release: Callable[[Any], Awaitable[Any]],
+    ):
+        """Time the wait for ``acquire()`` and how long the caller holds it."""
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            conn = await acquire()
+        except BaseException:
+            self.acquire_errors += 1
+            raise
+        finally:
+            self.waiting -= 1
+        acquired = time.perf_counter()
+        self.acquire_wait.observe(acquired - start)
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+        try:
+            yield conn
+        finally:
+            self.in_use -= 1
+            self.hold_time.observe(time.perf_counter() - acquired)
+            await release(conn)
+
+    def _pattern_series(self, query: str) -> str:
+        pattern = query_pattern(query)
+        if pattern in self.queries or len(self.queries) < self.max_patterns:
+            return pattern
+        return OTHER_PATTERN
+
+    @contextmanager
+    def time_query(self, query: str):
+        """Record the block's duration under the query's pattern."""
+        pattern = self._pattern_series(query)
+        in_use, waiting = self.in_use, self.waiting
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.query_errors[pattern] = self.query_errors.get(pattern, 0) + 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            histogram = self.queries.get(pattern)
+            if histogram is None:
+                histogram = self.queries[pattern] = Histogram(self.buckets)
+            histogram.observe(elapsed)
+            if elapsed >= self.slow_query_seconds:
+                self.slow_queries.append(
+                    {
+                        "pattern": pattern,
+                        "seconds": elapsed,
+                        "in_use": in_use,
+                        "waiting": waiting,
+                        "at": time.time(),
+                    }
+                )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict view for logs and health reports."""
+        return {
+            "pool": self.pool_name,
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "acquire_errors": self.acquire_errors,
+            "min_connections": self.min_connections,
+            "max_connections": self.max_connections,
+            "acquire_wait": self.acquire_wait.summary(),
+            "hold_time": self.hold_time.summary(),
+            "queries": {
+                pattern: dict(
+                    histogram.summary(), errors=self.query_errors.get(pattern, 0)
+                )
+                for pattern, histogram in self.queries.items()
+            },
+            "slow_queries": list(self.slow_queries),
+        }
+
+
+class InstrumentedRouter:
+    """QueryRouterNode-style executor whose requests are timed by pattern."""
+
+    def __init__(self, router: Any, telemetry: PoolTelemetry):
+        self.router = router
+        self.telemetry = telemetry
+
+    async def execute(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        with self.telemetry.time_query(request.get("query", "")):
+            return await self.router.execute(request)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.router, name)
+
+
+def _label(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'"{escaped}"'
+
+
+def _histogram_lines(
+    name: str, labels: str, histogram: Histogram, help_text: Optional[str]
+) -> List[str]:
+    lines = []
+    if help_text is not None:
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts):
+        cumulative += count
+        lines.append(f'{name}_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+    lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+    lines.append(f"{name}_sum{{{labels}}} {histogram.total:.9g}")
+    lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+    return lines
+
+
+def render_prometheus(telemetry: PoolTelemetry, pattern_chars: int = 200) -> str:
+    """Prometheus text exposition format (version 0.0.4)."""
+    pool = f"pool={_label(telemetry.pool_name)}"
+    lines = _histogram_lines(
+        "pool_acquire_wait_seconds",
+        pool,
+        telemetry.acquire_wait,
+        "Time spent waiting for a connection.",
+    )
+    lines += _histogram_lines(
+        "pool_connection_hold_seconds",
+        pool,
+        telemetry.hold_time,
+        "Time a connection was held between acquire and release.",
+    )
+    help_text = "Query latency by normalized SQL pattern."
+    for pattern, histogram in telemetry.queries.items():
+        labels = f"{pool},pattern={_label(pattern[:pattern_chars])}"
+        lines += _histogram_lines("pool_query_seconds", labels, histogram, help_text)
+        help_text = None
+
+    lines += [
+        "# HELP pool_query_errors_total Failed queries by normalized SQL pattern.",
+        "# TYPE pool_query_errors_total counter",
+    ]
+    for pattern, errors in telemetry.query_errors.items():
+        labels = f"{pool},pattern={_label(pattern[:pattern_chars])}"
+        lines.append(f"pool_query_errors_total{{{labels}}} {errors}")
+
+    gauges = [
+        ("pool_connections_in_use", "Connections currently held.", telemetry.in_use),
+        ("pool_acquire_waiting", "Callers waiting to acquire.", telemetry.waiting),
+        ("pool_min_connections", "Sizer's minimum.", telemetry.min_connections),
+        ("pool_max_connections", "Sizer's maximum.", telemetry.max_connections),
+    ]
+    for name, help_text, value in gauges:
+        if value is not None:
+            lines += [
+                f"# HELP {name} {help_text}",
+                f"# TYPE {name} gauge",
+                f"{name}{{{pool}}} {value}",
+            ]
+    lines += [
+        "# HELP pool_acquire_errors_total Acquire calls that raised.",
+        "# TYPE pool_acquire_errors_total counter",
+        f"pool_acquire_errors_total{{{pool}}} {telemetry.acquire_errors}",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+async def serve_metrics(
+    telemetry: PoolTelemetry, host: str = "0.0.0.0", port: int = 9464
+) -> asyncio.AbstractServer:
+    """Serve ``GET /metrics`` in Prometheus text format; returns the server."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            # Drain headers; the request body is never needed
+            while (await reader.readline()).strip():
+                pass
+            parts = request_line.decode("latin-1").split()
+            if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+                status = "200 OK"
+                body = render_prometheus(telemetry).encode()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                status, body, content_type = "404 Not Found", b"", "text/plain"
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+class AdaptivePoolSizer:
+    """
+    Pool min/max sizing driven by observed acquire wait.
+
+    Each ``evaluate`` looks only at acquires since the previous one. When
+    their p95 wait exceeds ``target_wait`` the max grows by
+    ``increase_factor``; when it is under a quarter of the target and the
+    peak in-use count stayed below half the max, the max gives back a
+    quarter of its headroom above twice that peak (at least
+    ``decrease_step``). The min follows half the peak in-use count. New sizes
+    go to ``resize(min, max)`` when one is given; without it they are only
+    recommendations, visible in the telemetry and ``history``. Acquires
+    fewer than ``min_samples`` per interval only allow shrinking.
+    """
+
+    def __init__(
+        self,
+        telemetry: PoolTelemetry,
+        min_connections: int,
+        max_connections: int,
+        floor: int = 2,
+        ceiling: int = 200,
+        target_wait: float = 0.005,
+        increase_factor: float = 1.5,
+        decrease_step: int = 2,
+        min_samples: int = 20,
+        resize: Optional[Callable[[int, int], Any]] = None,
+    ):
+        self.telemetry = telemetry
+        self.floor = floor
+        self.ceiling = ceiling
+        self.target_wait = target_wait
+        self.increase_factor = increase_factor
+        self.decrease_step = decrease_step
+        self.min_samples = min_samples
+        self.resize = resize
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.history: Deque[Dict[str, Any]] = deque(maxlen=500)
+        self._seen = list(telemetry.acquire_wait.counts)
+        telemetry.min_connections = min_connections
+        telemetry.max_connections = max_connections
+
+    def evaluate(self) -> Optional[Dict[str, Any]]:
+        """Resize from the acquires since the last call; None if unchanged."""
+        histogram = self.telemetry.acquire_wait
+        counts = list(histogram.counts)
+        recent = [now - before for now, before in zip(counts, self._seen)]
+        self._seen = counts
+        # Too few acquires to judge wait time; the pool can only shrink
+        p95 = (
+            bucket_quantile(histogram.bounds, recent, 0.95)
+            if sum(recent) >= self.min_samples
+            else 0.0
+        )
+        peak = self.telemetry.peak_in_use
+        self.telemetry.peak_in_use = self.telemetry.in_use
+
+        size = self.max_connections
+        if p95 > self.target_wait:
+            size = min(self.ceiling, math.ceil(size * self.increase_factor))
+        elif p95 < self.target_wait / 4 and peak < size / 2:
+            # Give back a quarter of the headroom above twice the peak
+            spare = size - 2 * peak
+            size = max(self.floor, 2 * peak, size - max(self.decrease_step, spare // 4))
+        low = min(size, max(self.floor, math.ceil(peak / 2)))
+        if (low, size) == (self.min_connections, self.max_connections):
+            return None
+
+        decision = {
+            "at": time.time(),
+            "p95_wait_ms": p95 * 1000,
+            "peak_in_use": peak,
+            "min_connections": low,
+            "max_connections": size,
+            "previous_max": self.max_connections,
+        }
+        self.min_connections, self.max_connections = low, size
+        self.telemetry.min_connections = low
+        self.telemetry.max_connections = size
+        self.history.append(decision)
+        if self.resize is not None:
+            self.resize(low, size)
+        return decision
+
+    async def run(self, interval: float = 5.0):
+        """Evaluate every ``interval`` seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            self.evaluate()
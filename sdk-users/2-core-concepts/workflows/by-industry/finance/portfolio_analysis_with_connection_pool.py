@@ -15,25 +15,385 @@ Key improvements with Phase 2:
 - Read/write splitting for better performance
 - Pattern learning for workload optimization
 - Adaptive pool sizing based on load
+
+Batch analysis:
+- analyze_portfolios(ids) loads the latest price per symbol once into an
+  in-process LatestPriceSnapshot, fetches metadata and positions for every
+  id in one set-based query each, and computes valuation and risk metrics
+  for all portfolios at once with NumPy
+
+Latest prices:
+- latest_prices keeps one row per symbol (its newest market_prices row), so
+  position queries join it instead of a correlated MAX(price_date) lookup
+- refresh_price_snapshot() reads only rows dated on or after the snapshot's
+  watermark; load_price_snapshot() rebuilds from the full history
+- analyze_portfolio(s) refresh the shared snapshot once it is older than
+  PRICE_REFRESH_SECONDS
+
+Pool telemetry (pool_telemetry.py):
+- get_connection records acquire-wait and hold-time histograms, and every
+  query is timed under its normalized SQL pattern
+- METRICS_PORT serves them at /metrics in Prometheus text format
+- AdaptivePoolSizer turns observed acquire wait into min/max pool sizes
+
+Usage:
+    python portfolio_analysis_with_connection_pool.py
+    python portfolio_analysis_with_connection_pool.py benchmark [portfolios]
+    python portfolio_analysis_with_connection_pool.py pricebench [symbols] [years]
+    python portfolio_analysis_with_connection_pool.py poolbench
 """
 
 import asyncio
 import os
+import sys
+import time
 from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from itertools import repeat
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 from kailash.nodes.code import PythonCodeNode
 from kailash.nodes.data import WorkflowConnectionPool
 from kailash.nodes.data.query_router import QueryRouterNode
 from kailash.runtime.local import LocalRuntime
 from kailash.workflow import Workflow, WorkflowBuilder
 
+sys.path.insert(0, str(Path(__file__).parent))
+from pool_telemetry import (
+    AdaptivePoolSizer,
+    InstrumentedRouter,
+    PoolTelemetry,
+    bucket_quantile,
+    render_prometheus,
+    serve_metrics,
+)
+
+# latest_prices holds one row per symbol: its most recent market_prices row.
+# The SQL is portable so the benchmarks' SQLite stand-in runs it unchanged.
+LATEST_PRICES_DDL = [
+    """CREATE TABLE IF NOT EXISTS latest_prices (
+        symbol VARCHAR(10) PRIMARY KEY,
+        price_date DATE,
+        close_price NUMERIC(10,2),
+        volatility NUMERIC(5,2)
+    )""",
+    "CREATE INDEX IF NOT EXISTS idx_latest_prices_date ON latest_prices(price_date)",
+    "CREATE INDEX IF NOT EXISTS idx_market_prices_date ON market_prices(price_date)",
+]
+
+# Full rebuild: one pass over the whole price history
+LATEST_PRICES_REBUILD = """
+    INSERT INTO latest_prices (symbol, price_date, close_price, volatility)
+    SELECT mp.symbol, mp.price_date, mp.close_price, mp.volatility
+    FROM market_prices mp
+    JOIN (
+        SELECT symbol, MAX(price_date) AS price_date
+        FROM market_prices
+        GROUP BY symbol
+    ) latest ON latest.symbol = mp.symbol AND latest.price_date = mp.price_date
+    WHERE TRUE
+    ON CONFLICT (symbol) DO UPDATE SET
+        price_date = excluded.price_date,
+        close_price = excluded.close_price,
+        volatility = excluded.volatility
+"""
+
+# Incremental refresh: only rows dated on or after the watermark, through
+# idx_market_prices_date. The watermark day itself is re-read so symbols
+# whose close for that day landed after the last refresh are picked up.
+LATEST_PRICES_REFRESH = """
+    INSERT INTO latest_prices (symbol, price_date, close_price, volatility)
+    SELECT mp.symbol, mp.price_date, mp.close_price, mp.volatility
+    FROM market_prices mp
+    WHERE mp.price_date >= ?
+    AND NOT EXISTS (
+        SELECT 1 FROM market_prices newer
+        WHERE newer.symbol = mp.symbol AND newer.price_date > mp.price_date
+    )
+    ON CONFLICT (symbol) DO UPDATE SET
+        price_date = excluded.price_date,
+        close_price = excluded.close_price,
+        volatility = excluded.volatility
+    WHERE excluded.price_date >= latest_prices.price_date
+"""
+
+LATEST_PRICES_QUERY = """
+    SELECT symbol, price_date, close_price, volatility FROM latest_prices
+"""
+
+LATEST_PRICES_SINCE_QUERY = LATEST_PRICES_QUERY + " WHERE price_date >= ?"
+
+# How long analyze_portfolio(s) may use the snapshot before refreshing it
+PRICE_REFRESH_SECONDS = 60
+
+POOL_MIN_CONNECTIONS = 10
+POOL_MAX_CONNECTIONS = 50
+# How often AdaptivePoolSizer re-reads the acquire-wait histogram
+POOL_SIZING_INTERVAL = 5.0
+
+POSITIONS_QUERY = """
+    SELECT
+        pos.*,
+        mp.close_price as current_price,
+        mp.volatility,
+        (pos.quantity * mp.close_price) as market_value,
+        ((mp.close_price - pos.purchase_price) / pos.purchase_price * 100) as return_pct
+    FROM portfolio_positions pos
+    JOIN latest_prices mp ON pos.symbol = mp.symbol
+    WHERE pos.portfolio_id = ?
+    ORDER BY market_value DESC
+"""
+
+PORTFOLIO_BATCH_QUERY = """
+    SELECT portfolio_id, client_name, risk_profile
+    FROM portfolio_metadata
+    WHERE portfolio_id = ANY(?)
+"""
+
+POSITIONS_BATCH_QUERY = """
+    SELECT *
+    FROM portfolio_positions
+    WHERE portfolio_id = ANY(?)
+"""
+
+POSITION_COLUMNS = ("portfolio_id", "symbol", "quantity", "purchase_price", "sector")
+
+# One-day 95% VaR multiplier; market_prices.volatility is in percent
+VAR_95_Z = 1.645
+
+
+class LatestPriceSnapshot:
+    """
+    Latest close and volatility per symbol as arrays indexed by symbol.
+
+    ``watermark`` is the newest price_date seen; ``update`` folds in
+    latest_prices rows read since then.
+    """
+
+    def __init__(self, rows: Sequence[Dict[str, Any]]):
+        self.symbols = [row["symbol"] for row in rows]
+        self.index = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.close = np.array([float(row["close_price"]) for row in rows])
+        self.volatility = np.array(
+            [float(row["volatility"] or 0) for row in rows], dtype=float
+        )
+        self.price_date = [row["price_date"] for row in rows]
+        self.watermark = max(self.price_date, default=None)
+        self.loaded_at = self.refreshed_at = datetime.now()
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def update(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """Apply newer prices in place; returns how many symbols changed."""
+        changed = 0
+        added = []
+        for row in rows:
+            i = self.index.get(row["symbol"])
+            if i is None:
+                added.append(row)
+            elif row["price_date"] >= self.price_date[i]:
+                self.close[i] = float(row["close_price"])
+                self.volatility[i] = float(row["volatility"] or 0)
+                self.price_date[i] = row["price_date"]
+                changed += 1
+        if added:
+            extra = LatestPriceSnapshot(added)
+            offset = len(self.symbols)
+            self.index.update((s, offset + i) for s, i in extra.index.items())
+            self.symbols += extra.symbols
+            self.close = np.concatenate([self.close, extra.close])
+            self.volatility = np.concatenate([self.volatility, extra.volatility])
+            self.price_date += extra.price_date
+        self.watermark = max(self.price_date, default=None)
+        self.refreshed_at = datetime.now()
+        return changed + len(added)
+
+    def lookup(self, symbols: Sequence[str]) -> np.ndarray:
+        """Row of each symbol, -1 where no price is known."""
+        return np.fromiter(
+            map(self.index.get, symbols, repeat(-1)), dtype=np.int64, count=len(symbols)
+        )
+
+
+def analyze_position_batch(
+    portfolio_ids: Sequence[str],
+    metadata_rows: Sequence[Dict[str, Any]],
+    position_rows: Sequence[Dict[str, Any]],
+    snapshot: LatestPriceSnapshot,
+    cache_info: Optional[Dict[str, bool]] = None,
+    top_n: int = 5,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    analyze_portfolio's result for every id, computed column-wise.
+
+    ``position_rows`` are full portfolio_positions rows, so top_positions
+    carry the same columns as POSITIONS_QUERY; ``cache_info`` describes the
+    two batch queries and is copied into every result. Positions without a
+    snapshot price are left out, as the per-portfolio join does. Each
+    result also has value-weighted volatility, 95% VaR and the largest
+    position's weight, which analyze_portfolio does not compute.
+    """
+    if cache_info is None:
+        cache_info = {"portfolio_query_cached": False, "positions_query_cached": False}
+    n = len(portfolio_ids)
+    slot = {portfolio_id: i for i, portfolio_id in enumerate(portfolio_ids)}
+    rows = list(position_rows)
+    # Column lists via C-level itemgetter passes; everything after is NumPy
+    owners, symbols, quantities, purchases, sector_names = (
+        list(map(itemgetter(column), rows)) for column in POSITION_COLUMNS
+    )
+    owner = np.fromiter(map(slot.get, owners, repeat(-1)), np.int64, len(rows))
+    symbol_rows = snapshot.lookup(symbols)
+    kept = np.flatnonzero((owner >= 0) & (symbol_rows >= 0))
+    count = len(kept)
+
+    owner = owner[kept]
+    symbol_rows = symbol_rows[kept]
+    quantity = np.array(quantities, dtype=float)[kept]
+    purchase = np.array(purchases, dtype=float)[kept]
+    sectors = list(dict.fromkeys(sector_names))
+    sector_codes = {name: code for code, name in enumerate(sectors)}
+    sector = np.fromiter(map(sector_codes.get, sector_names), np.int64, len(rows))
+    sector = sector[kept]
+
+    price = snapshot.close[symbol_rows]
+    volatility = snapshot.volatility[symbol_rows]
+    market_value = quantity * price
+    # Same operation order as POSITIONS_QUERY, so the values match it exactly
+    return_pct = (
+        np.divide(price - purchase, purchase, out=np.zeros(count), where=purchase != 0)
+        * 100
+    )
+
+    def per_portfolio(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(owner, weights=weights, minlength=n)
+
+    def share_of_total(values: np.ndarray) -> np.ndarray:
+        return np.divide(values, total, out=np.zeros(n), where=total > 0)
+
+    total = per_portfolio(market_value)
+    weighted_return = share_of_total(per_portfolio(return_pct * market_value))
+    weighted_volatility = share_of_total(per_portfolio(volatility * market_value))
+    var_95 = total * weighted_volatility / 100 * VAR_95_Z
+    position_count = np.bincount(owner, minlength=n)
+    largest = np.zeros(n)
+    np.maximum.at(largest, owner, market_value)
+    largest_pct = share_of_total(largest) * 100
+
+    # Value per (portfolio, sector) cell, for the sectors each one holds
+    width = max(1, len(sectors))
+    cells = owner * width + sector
+    by_sector = np.bincount(cells, weights=market_value, minlength=n * width)
+    held = np.flatnonzero(np.bincount(cells, minlength=n * width))
+    held_owner = held // width
+    held_percent = np.divide(
+        by_sector[held] * 100,
+        total[held_owner],
+        out=np.zeros(len(held)),
+        where=total[held_owner] > 0,
+    )
+    allocations: List[Dict[Any, Dict[str, float]]] = [{} for _ in range(n)]
+    for portfolio, code, value, percent in zip(
+        held_owner.tolist(),
+        (held % width).tolist(),
+        by_sector[held].tolist(),
+        held_percent.tolist(),
+    ):
+        allocations[portfolio][sectors[code]] = {"value": value, "percentage": percent}
+
+    # Top positions per portfolio, largest market value first; only these
+    # become Python objects
+    order = np.lexsort((-market_value, owner))
+    ordered_owner = owner[order]
+    starts = np.searchsorted(ordered_owner, np.arange(n + 1))
+    top = order[np.arange(count) - starts[ordered_owner] < top_n]
+    top_starts = np.searchsorted(owner[top], np.arange(n + 1)).tolist()
+    top_positions = list(
+        zip(
+            kept[top].tolist(),
+            price[top].tolist(),
+            volatility[top].tolist(),
+            market_value[top].tolist(),
+            return_pct[top].tolist(),
+        )
+    )
+    columns = zip(
+        total.tolist(),
+        position_count.tolist(),
+        weighted_return.tolist(),
+        weighted_volatility.tolist(),
+        var_95.tolist(),
+        largest_pct.tolist(),
+    )
+
+    metadata = {row["portfolio_id"]: row for row in metadata_rows}
+    analyzed_at = datetime.now().isoformat()
+    results = {}
+    for i, (portfolio_id, values) in enumerate(zip(portfolio_ids, columns)):
+        meta = metadata.get(portfolio_id)
+        if meta is None:
+            results[portfolio_id] = {"error": f"Portfolio {portfolio_id} not found"}
+            continue
+        positions = [
+            dict(
+                rows[row],
+                current_price=current_price,
+                volatility=position_volatility,
+                market_value=value,
+                return_pct=position_return,
+            )
+            for row, current_price, position_volatility, value, position_return in (
+                top_positions[top_starts[i] : top_starts[i + 1]]
+            )
+        ]
+        results[portfolio_id] = {
+            "portfolio_id": portfolio_id,
+            "client_name": meta["client_name"],
+            "risk_profile": meta["risk_profile"],
+            "total_value": values[0],
+            "position_count": values[1],
+            "weighted_return": values[2],
+            "weighted_volatility": values[3],
+            "var_95": values[4],
+            "largest_position_pct": values[5],
+            "top_positions": positions,
+            "sector_allocation": allocations[i],
+            "analysis_timestamp": analyzed_at,
+            "cache_info": dict(cache_info),
+        }
+    return results
+
 
 class PortfolioAnalysisService:
     """Production portfolio analysis service with connection pooling and query routing."""
 
-    def __init__(self):
+    def __init__(self, router: Optional[Any] = None, pool: Optional[Any] = None):
+        """
+        Pass ``router`` (and ``pool``) to run against other QueryRouterNode /
+        WorkflowConnectionPool-style executors instead of new ones (the
+        benchmarks do).
+        """
+        self.price_snapshot: Optional[LatestPriceSnapshot] = None
+        self.price_refresh_seconds = PRICE_REFRESH_SECONDS
+        self._price_lock = asyncio.Lock()
+        self._initialized = False
+        self.telemetry = PoolTelemetry("portfolio_pool")
+        self.metrics_server = None
+        if router is not None:
+            self.pool = pool
+            self.router = InstrumentedRouter(router, self.telemetry)
+            self.sizer = AdaptivePoolSizer(
+                self.telemetry,
+                getattr(pool, "min_connections", POOL_MIN_CONNECTIONS),
+                getattr(pool, "max_connections", POOL_MAX_CONNECTIONS),
+                resize=getattr(pool, "resize", None),
+            )
+            return
+
         # Create connection pool with Phase 2 features
         self.pool = WorkflowConnectionPool(
             name="portfolio_pool",
@@ -43,8 +403,8 @@ class PortfolioAnalysisService:
             database=os.getenv("DB_NAME", "portfolio_db"),
             user=os.getenv("DB_USER", "postgres"),
             password=os.getenv("DB_PASSWORD", "postgres"),
-            min_connections=10,  # Maintain minimum connections
-            max_connections=50,  # Scale up to 50 for peak load
+            min_connections=POOL_MIN_CONNECTIONS,  # Maintain minimum connections
+            max_connections=POOL_MAX_CONNECTIONS,  # Scale up for peak load
             health_threshold=70,  # Recycle connections below 70% health
             pre_warm=True,  # Pre-warm connections based on patterns
             adaptive_sizing=True,  # NEW: Dynamic pool sizing
@@ -52,15 +412,21 @@ class PortfolioAnalysisService:
         )
 
         # Phase 2: Query Router for intelligent routing
-        self.router = QueryRouterNode(
+        router = QueryRouterNode(
             name="portfolio_router",
             connection_pool="portfolio_pool",
             enable_read_write_split=True,  # Route reads to any connection
             cache_size=2000,  # Cache prepared statements
             pattern_learning=True,  # Learn from query patterns
         )
+        # Every routed query is timed under its SQL pattern
+        self.router = InstrumentedRouter(router, self.telemetry)
 
-        self._initialized = False
+        # WorkflowConnectionPool resizes itself (adaptive_sizing); the sizer's
+        # wait-driven min/max is published next to it as a recommendation
+        self.sizer = AdaptivePoolSizer(
+            self.telemetry, POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS
+        )
 
     async def initialize(self):
         """Initialize the connection pool and setup database."""
@@ -71,38 +437,67 @@ class PortfolioAnalysisService:
 
             # Start monitoring
             asyncio.create_task(self._monitor_pool_health())
+            asyncio.create_task(self.sizer.run(POOL_SIZING_INTERVAL))
+            if os.getenv("METRICS_PORT"):
+                self.metrics_server = await serve_metrics(
+                    self.telemetry, port=int(os.getenv("METRICS_PORT"))
+                )
 
     @asynccontextmanager
     async def get_connection(self):
-        """Context manager for safe connection handling."""
-        conn = await self.pool.execute({"operation": "acquire"})
-        conn_id = conn["connection_id"]
-        try:
-            yield conn_id
-        finally:
-            await self.pool.execute({"operation": "release", "connection_id": conn_id})
+        """Context manager for safe connection handling, with wait/hold timing."""
+
+        async def acquire():
+            return await self.pool.execute({"operation": "acquire"})
+
+        async def release(conn):
+            await self.pool.execute(
+                {"operation": "release", "connection_id": conn["connection_id"]}
+            )
+
+        async with self.telemetry.track_connection(acquire, release) as conn:
+            yield conn["connection_id"]
+
+    async def execute_on(
+        self,
+        conn_id: str,
+        query: str,
+        parameters: Optional[List[Any]] = None,
+        fetch_mode: str = "one",
+    ) -> Dict[str, Any]:
+        """Run a query on a held connection, timed under its SQL pattern."""
+        request = {
+            "operation": "execute",
+            "connection_id": conn_id,
+            "query": query,
+            "fetch_mode": fetch_mode,
+        }
+        if parameters is not None:
+            request["params"] = parameters
+        with self.telemetry.time_query(query):
+            return await self.pool.execute(request)
 
     async def _setup_database(self):
         """Set up database schema if needed."""
         async with self.get_connection() as conn_id:
             # Check if tables exist
-            result = await self.pool.execute(
-                {
-                    "operation": "execute",
-                    "connection_id": conn_id,
-                    "query": """
-                    SELECT EXISTS (
-                        SELECT FROM information_schema.tables
-                        WHERE table_name = 'portfolio_metadata'
-                    )
+            result = await self.execute_on(
+                conn_id,
+                """
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'portfolio_metadata'
+                )
                 """,
-                    "fetch_mode": "one",
-                }
             )
 
             if not result["data"]["exists"]:
                 await self._create_tables(conn_id)
 
+            # Added after the original schema, so created on existing databases too
+            for statement in LATEST_PRICES_DDL:
+                await self.execute_on(conn_id, statement)
+
     async def _create_tables(self, conn_id):
         """Create portfolio tables."""
         tables = [
@@ -144,14 +539,7 @@ class PortfolioAnalysisService:
         ]
 
         for table_sql in tables:
-            await self.pool.execute(
-                {
-                    "operation": "execute",
-                    "connection_id": conn_id,
-                    "query": table_sql,
-                    "fetch_mode": "one",
-                }
-            )
+            await self.execute_on(conn_id, table_sql)
 
     async def analyze_portfolio(self, portfolio_id: str) -> Dict[str, Any]:
         """Analyze a single portfolio using query router for optimal performance."""
@@ -176,23 +564,10 @@ class PortfolioAnalysisService:
             return {"error": f"Portfolio {portfolio_id} not found"}
 
         # Get positions with current prices - benefits from caching
+        await self.latest_prices()
         positions = await self.router.execute(
             {
-                "query": """
-                SELECT
-                    pos.*,
-                    mp.close_price as current_price,
-                    mp.volatility,
-                    (pos.quantity * mp.close_price) as market_value,
-                    ((mp.close_price - pos.purchase_price) / pos.purchase_price * 100) as return_pct
-                FROM portfolio_positions pos
-                JOIN market_prices mp ON pos.symbol = mp.symbol
-                WHERE pos.portfolio_id = ?
-                AND mp.price_date = (
-                    SELECT MAX(price_date) FROM market_prices WHERE symbol = pos.symbol
-                )
-                ORDER BY market_value DESC
-            """,
+                "query": POSITIONS_QUERY,
                 "parameters": [portfolio_id],
                 "fetch_mode": "all",
             }
@@ -243,10 +618,112 @@ class PortfolioAnalysisService:
             "cache_info": cache_info,  # Phase 2: Show caching benefits
         }
 
+    async def load_price_snapshot(self) -> LatestPriceSnapshot:
+        """Rebuild latest_prices from the full history and reload the snapshot."""
+        await self.router.execute({"query": LATEST_PRICES_REBUILD, "fetch_mode": "one"})
+        prices = await self.router.execute(
+            {"query": LATEST_PRICES_QUERY, "fetch_mode": "all"}
+        )
+        self.price_snapshot = LatestPriceSnapshot(prices["data"])
+        return self.price_snapshot
+
+    async def refresh_price_snapshot(self) -> int:
+        """
+        Fold prices dated on or after the watermark into latest_prices and
+        the snapshot; returns how many symbols changed.
+
+        Backfilled rows dated before the watermark are not seen; run
+        load_price_snapshot after a history correction.
+        """
+        snapshot = self.price_snapshot
+        if snapshot is None or snapshot.watermark is None:
+            return len(await self.load_price_snapshot())
+
+        await self.router.execute(
+            {
+                "query": LATEST_PRICES_REFRESH,
+                "parameters": [snapshot.watermark],
+                "fetch_mode": "one",
+            }
+        )
+        prices = await self.router.execute(
+            {
+                "query": LATEST_PRICES_SINCE_QUERY,
+                "parameters": [snapshot.watermark],
+                "fetch_mode": "all",
+            }
+        )
+        return snapshot.update(prices["data"])
+
+    async def latest_prices(self, refresh: bool = False) -> LatestPriceSnapshot:
+        """
+        The shared snapshot, refreshed first when ``refresh`` is set or it is
+        older than ``price_refresh_seconds``. Callers that find it stale
+        together wait on a single refresh.
+        """
+
+        def stale() -> bool:
+            snapshot = self.price_snapshot
+            return (
+                snapshot is None
+                or (datetime.now() - snapshot.refreshed_at).total_seconds()
+                >= self.price_refresh_seconds
+            )
+
+        if refresh or stale():
+            async with self._price_lock:
+                # Another caller may have refreshed while we waited
+                if refresh or stale():
+                    await self.refresh_price_snapshot()
+        return self.price_snapshot
+
+    async def analyze_portfolios(
+        self, portfolio_ids: Sequence[str], refresh_prices: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze many portfolios with two queries, plus a price refresh when
+        the snapshot is stale.
+
+        The price snapshot is shared with analyze_portfolio and refreshed
+        incrementally when stale (or with ``refresh_prices``); metadata and
+        positions for all ids come from one query each.
+        """
+        portfolio_ids = list(dict.fromkeys(portfolio_ids))
+        snapshot = await self.latest_prices(refresh=refresh_prices)
+
+        metadata, positions = await asyncio.gather(
+            self.router.execute(
+                {
+                    "query": PORTFOLIO_BATCH_QUERY,
+                    "parameters": [portfolio_ids],
+                    "fetch_mode": "all",
+                }
+            ),
+            self.router.execute(
+                {
+                    "query": POSITIONS_BATCH_QUERY,
+                    "parameters": [portfolio_ids],
+                    "fetch_mode": "all",
+                }
+            ),
+        )
+        cache_info = {
+            "portfolio_query_cached": metadata.get("routing_metadata", {}).get(
+                "cache_hit", False
+            ),
+            "positions_query_cached": positions.get("routing_metadata", {}).get(
+                "cache_hit", False
+            ),
+        }
+        return analyze_position_batch(
+            portfolio_ids, metadata["data"], positions["data"], snapshot, cache_info
+        )
+
     async def rebalance_portfolio(
         self, portfolio_id: str, target_allocations: Dict[str, float]
     ):
         """Rebalance portfolio using transactions with session affinity."""
+        await self.latest_prices()
         session_id = f"rebalance_{portfolio_id}_{datetime.now().timestamp()}"
 
         try:
@@ -265,11 +742,8 @@ class PortfolioAnalysisService:
                     "query": """
                     SELECT pos.*, mp.close_price as current_price
                     FROM portfolio_positions pos
-                    JOIN market_prices mp ON pos.symbol = mp.symbol
+                    JOIN latest_prices mp ON pos.symbol = mp.symbol
                     WHERE pos.portfolio_id = ?
-                    AND mp.price_date = (
-                        SELECT MAX(price_date) FROM market_prices WHERE symbol = pos.symbol
-                    )
                 """,
                     "parameters": [portfolio_id],
                     "session_id": session_id,
@@ -362,6 +836,7 @@ class PortfolioAnalysisService:
 
     async def _monitor_pool_health(self):
         """Monitor connection pool and router health in background."""
+        checked_at = time.time()
         while self._initialized:
             try:
                 # Pool statistics
@@ -370,9 +845,13 @@ class PortfolioAnalysisService:
                 # Router metrics (Phase 2)
                 router_metrics = await self.router.get_metrics()
 
+                # Wait/hold histograms and slow queries since the last report
+                telemetry = self.telemetry.snapshot()
+                slow = [q for q in telemetry["slow_queries"] if q["at"] >= checked_at]
+                checked_at = time.time()
+
                 # Log metrics
-                print(
-                    f"""
+                print(f"""
 Pool & Router Health Report:
 - Active connections: {stats['current_state']['active_connections']}/{stats['current_state']['total_connections']}
 - Queries executed: {stats['queries']['executed']}
@@ -380,8 +859,9 @@ Pool & Router Health Report:
 - Pool efficiency: {stats['queries']['executed'] / max(1, stats['connections']['created']):.1f} queries/connection
 - Cache hit rate: {router_metrics['cache_stats']['hit_rate']:.2%}
 - Avg routing time: {router_metrics['router_metrics']['avg_routing_time_ms']}ms
-                """
-                )
+- Acquire wait p95: {telemetry['acquire_wait']['p95_ms']:.1f}ms (hold p95: {telemetry['hold_time']['p95_ms']:.1f}ms)
+- Sizer recommendation: {self.sizer.min_connections}-{self.sizer.max_connections} connections
+                """)
 
                 # Alert on issues
                 if stats["queries"]["error_rate"] > 0.05:
@@ -392,6 +872,13 @@ Pool & Router Health Report:
                 if stats["current_state"]["available_connections"] == 0:
                     print("⚠️  WARNING: Connection pool exhausted!")
 
+                for query in slow[-5:]:
+                    print(
+                        f"⚠️  Slow query ({query['seconds'] * 1000:.0f}ms, "
+                        f"{query['waiting']} callers waiting for a connection): "
+                        f"{query['pattern'][:120]}"
+                    )
+
                 await asyncio.sleep(60)  # Check every minute
 
             except Exception as e:
@@ -431,10 +918,8 @@ result = {"service": service, "status": "initialized"}
             "code": """
 portfolio_ids = inputs.get("portfolio_ids", ["PORT001", "PORT002", "PORT003"])
 
-# Analyze portfolios concurrently using the connection pool
-analyses = await asyncio.gather(*[
-    service.analyze_portfolio(pid) for pid in portfolio_ids
-])
+# One batch: shared price snapshot, set-based position query
+analyses = list((await service.analyze_portfolios(portfolio_ids)).values())
 
 # Get pool statistics
 stats = await service.pool.execute({"operation": "stats"})
@@ -533,8 +1018,7 @@ async def main():
 
     # Display results
     report = result["generate_report"]["result"]
-    print(
-        f"""
+    print(f"""
 Portfolio Analysis Report
 ========================
 Date: {report['report_date']}
@@ -548,13 +1032,557 @@ Performance Metrics:
 - Avg Routing Time: {report['avg_routing_time_ms']:.2f}ms (Phase 2)
 
 Top Performers:
-"""
-    )
+""")
     for i, portfolio in enumerate(report["top_performers"], 1):
         print(f"{i}. {portfolio['client_name']} ({portfolio['portfolio_id']})")
         print(f"   Return: {portfolio['weighted_return']:.2f}%")
         print(f"   Value: ${portfolio['total_value']:,.2f}")
 
 
+class SQLiteQueryRouter:
+    """
+    QueryRouterNode stand-in over SQLite for the benchmark.
+
+    Each query holds one of ``max_connections`` slots for ``latency_ms``
+    (the database round trip); ``= ANY(?)`` list parameters become a
+    json_each lookup.
+    """
+
+    def __init__(self, conn, max_connections: int = 50, latency_ms: float = 1.0):
+        import json
+
+        self._json = json
+        self.conn = conn
+        self.connections = asyncio.Semaphore(max_connections)
+        self.latency = latency_ms / 1000
+        self.queries = 0
+
+    async def execute(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        query = request["query"].replace(
+            "= ANY(?)", "IN (SELECT value FROM json_each(?))"
+        )
+        parameters = [
+            self._json.dumps(value) if isinstance(value, list) else value
+            for value in request.get("parameters", [])
+        ]
+        async with self.connections:
+            await asyncio.sleep(self.latency)
+            cursor = self.conn.execute(query, parameters)
+            self.queries += 1
+            # sqlite3.Row, like asyncpg's Record, is read by key without a dict
+            if request.get("fetch_mode") == "one":
+                return {"data": cursor.fetchone()}
+            return {"data": cursor.fetchall()}
+
+
+class SQLiteConnectionPool:
+    """
+    WorkflowConnectionPool stand-in over SQLite for the telemetry benchmark.
+
+    At most ``max_connections`` are handed out, first come first served: a
+    release passes its slot straight to the oldest waiter. ``resize``
+    changes the limit at runtime. Each execute holds its connection for
+    ``latency_ms``.
+    """
+
+    def __init__(
+        self,
+        conn,
+        min_connections: int = POOL_MIN_CONNECTIONS,
+        max_connections: int = POOL_MAX_CONNECTIONS,
+        latency_ms: float = 2.0,
+    ):
+        from collections import deque
+
+        self.conn = conn
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.latency = latency_ms / 1000
+        self.in_use = 0
+        self.created = 0
+        self.executed = 0
+        self._waiters = deque()
+
+    def resize(self, min_connections: int, max_connections: int):
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_use < self.max_connections:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                # The slot is counted here so a new caller cannot take it first
+                self.in_use += 1
+                waiter.set_result(None)
+
+    async def execute(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        operation = request["operation"]
+        if operation == "acquire":
+            if self._waiters or self.in_use >= self.max_connections:
+                waiter = asyncio.get_running_loop().create_future()
+                self._waiters.append(waiter)
+                try:
+                    await waiter
+                except asyncio.CancelledError:
+                    # Handed a slot just as we were cancelled: pass it on
+                    if waiter.done() and not waiter.cancelled():
+                        self.in_use -= 1
+                        self._wake()
+                    raise
+            else:
+                self.in_use += 1
+            self.created = max(self.created, self.in_use)
+            return {"connection_id": f"sqlite_{self.in_use}"}
+        if operation == "release":
+            self.in_use -= 1
+            self._wake()
+            return {"status": "released"}
+        if operation == "execute":
+            await asyncio.sleep(self.latency)
+            cursor = self.conn.execute(request["query"], request.get("params", []))
+            self.executed += 1
+            if request.get("fetch_mode") == "one":
+                return {"data": cursor.fetchone()}
+            return {"data": cursor.fetchall()}
+        if operation == "stats":
+            return {
+                "current_state": {
+                    "active_connections": self.in_use,
+                    "total_connections": self.max_connections,
+                    "available_connections": self.max_connections - self.in_use,
+                },
+                "queries": {"executed": self.executed, "error_rate": 0.0},
+                "connections": {"created": self.created},
+            }
+        raise ValueError(f"Unsupported operation: {operation}")
+
+
+def open_portfolio_benchmark_db(path: str = ":memory:"):
+    """SQLite database with the service's schema, in autocommit mode."""
+    import sqlite3
+
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.executescript("""
+        PRAGMA journal_mode = OFF;
+        PRAGMA synchronous = OFF;
+        CREATE TABLE portfolio_metadata (
+            portfolio_id TEXT PRIMARY KEY, client_name TEXT, risk_profile TEXT,
+            created_at TEXT, total_value REAL, last_rebalanced TEXT
+        );
+        CREATE TABLE portfolio_positions (
+            id INTEGER PRIMARY KEY, portfolio_id TEXT, symbol TEXT,
+            quantity INTEGER, purchase_price REAL, purchase_date TEXT,
+            sector TEXT, current_value REAL
+        );
+        CREATE INDEX idx_positions_portfolio ON portfolio_positions(portfolio_id);
+        CREATE TABLE market_prices (
+            symbol TEXT, price_date TEXT, close_price REAL, volume INTEGER,
+            volatility REAL, PRIMARY KEY (symbol, price_date)
+        ) WITHOUT ROWID;
+        """)
+    for statement in LATEST_PRICES_DDL:
+        conn.execute(statement)
+    return conn
+
+
+def insert_benchmark_portfolios(
+    conn, ids: Sequence[str], tickers: Sequence[str], positions_per_portfolio: int
+):
+    """Metadata plus ``positions_per_portfolio`` random holdings per id."""
+    import random
+
+    rng = random.Random(0)
+    sectors = ["Technology", "Healthcare", "Financials", "Energy", "Utilities"]
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO portfolio_metadata (portfolio_id, client_name, risk_profile) "
+        "VALUES (?, ?, ?)",
+        (
+            (pid, f"Client {i}", rng.choice(["conservative", "moderate", "aggressive"]))
+            for i, pid in enumerate(ids)
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO portfolio_positions (portfolio_id, symbol, quantity, "
+        "purchase_price, purchase_date, sector) VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (
+                pid,
+                ticker,
+                rng.randrange(1, 1_000),
+                round(rng.uniform(10, 500), 2),
+                "2024-06-01",
+                rng.choice(sectors),
+            )
+            for pid in ids
+            for ticker in rng.sample(tickers, positions_per_portfolio)
+        ),
+    )
+    conn.execute("COMMIT")
+
+
+def run_batch_benchmark(
+    portfolios: int = 40_000,
+    sample: int = 2_000,
+    symbols: int = 2_000,
+    days: int = 30,
+    positions_per_portfolio: int = 12,
+    latency_ms: float = 1.0,
+):
+    """Portfolios/sec: analyze_portfolio per id under gather vs analyze_portfolios."""
+    import math
+    import random
+
+    rng = random.Random(0)
+    conn = open_portfolio_benchmark_db()
+    tickers = [f"SYM{i:04d}" for i in range(symbols)]
+    start_day = datetime(2025, 1, 1)
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO market_prices VALUES (?, ?, ?, ?, ?)",
+        (
+            (
+                ticker,
+                (start_day + timedelta(days=day)).date().isoformat(),
+                round(rng.uniform(10, 500), 2),
+                rng.randrange(10_000, 1_000_000),
+                round(rng.uniform(5, 60), 2),
+            )
+            for ticker in tickers
+            for day in range(days)
+        ),
+    )
+    conn.execute("COMMIT")
+    ids = [f"PORT{i:06d}" for i in range(portfolios)]
+    insert_benchmark_portfolios(conn, ids, tickers, positions_per_portfolio)
+    print("=" * 70)
+    print(
+        f"Portfolio analysis: {portfolios:,} portfolios x {positions_per_portfolio} "
+        f"positions, {symbols:,} symbols, {latency_ms:g} ms per query, 50 connections"
+    )
+    print("=" * 70)
+
+    async def run():
+        # Previous path: analyze_portfolio per id, gathered (on a sample)
+        router = SQLiteQueryRouter(conn, latency_ms=latency_ms)
+        service = PortfolioAnalysisService(router=router)
+        sample_ids = ids[:sample]
+        start = time.perf_counter()
+        single = await asyncio.gather(
+            *(service.analyze_portfolio(pid) for pid in sample_ids)
+        )
+        gather_seconds = time.perf_counter() - start
+        gather_queries = router.queries
+        print(
+            f"  gather of analyze_portfolio: {sample / gather_seconds:>10,.0f} "
+            f"portfolios/s ({gather_queries:,} queries for {sample:,})"
+        )
+
+        router.queries = 0
+        start = time.perf_counter()
+        batch = await service.analyze_portfolios(ids)
+        batch_seconds = time.perf_counter() - start
+        print(
+            f"  analyze_portfolios:          {portfolios / batch_seconds:>10,.0f} "
+            f"portfolios/s ({router.queries} queries for {portfolios:,}, "
+            f"{batch_seconds:.2f}s)"
+        )
+
+        # Every key analyze_portfolio returns, top positions row by row; sums
+        # may differ in the last bits since they are accumulated differently
+        def close(a, b) -> bool:
+            if isinstance(a, float) or isinstance(b, float):
+                return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
+            return a == b
+
+        def same(one: Dict[str, Any], other: Dict[str, Any]) -> bool:
+            if not one.keys() <= other.keys():
+                return False
+            for key in one.keys() - {"analysis_timestamp"}:
+                if key == "top_positions":
+                    rows = [dict(row) for row in one[key]]
+                    if len(rows) != len(other[key]) or any(
+                        row.keys() != position.keys()
+                        or not all(close(row[k], position[k]) for k in row)
+                        for row, position in zip(rows, other[key])
+                    ):
+                        return False
+                elif key == "sector_allocation":
+                    if one[key].keys() != other[key].keys() or not all(
+                        close(cell[k], other[key][sector][k])
+                        for sector, cell in one[key].items()
+                        for k in cell
+                    ):
+                        return False
+                elif not close(one[key], other[key]):
+                    return False
+            return True
+
+        matches = sum(same(one, batch[one["portfolio_id"]]) for one in single)
+        print(f"✅ {matches:,}/{sample:,} sampled portfolios match on every field")
+
+    asyncio.run(run())
+
+
+def run_price_snapshot_benchmark(
+    symbols: int = 10_000,
+    years: int = 10,
+    portfolios: int = 2_000,
+    positions_per_portfolio: int = 12,
+):
+    """Position-query latency with the correlated MAX(price_date) vs latest_prices."""
+    import tempfile
+
+    # The positions query analyze_portfolio ran before latest_prices existed
+    correlated_query = """
+        SELECT
+            pos.*,
+            mp.close_price as current_price,
+            mp.volatility,
+            (pos.quantity * mp.close_price) as market_value,
+            ((mp.close_price - pos.purchase_price) / pos.purchase_price * 100) as return_pct
+        FROM portfolio_positions pos
+        JOIN market_prices mp ON pos.symbol = mp.symbol
+        WHERE pos.portfolio_id = ?
+        AND mp.price_date = (
+            SELECT MAX(price_date) FROM market_prices WHERE symbol = pos.symbol
+        )
+        ORDER BY market_value DESC
+    """
+
+    def percentile(samples: List[float], q: float) -> float:
+        return sorted(samples)[min(len(samples) - 1, int(len(samples) * q))] * 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        conn = open_portfolio_benchmark_db(os.path.join(directory, "prices.db"))
+        tickers = [f"SYM{i:05d}" for i in range(symbols)]
+        print("=" * 70)
+        print(
+            f"Latest-price snapshot: {symbols:,} symbols x {years} years of "
+            f"trading days, {portfolios:,} portfolios"
+        )
+        print("=" * 70)
+
+        # Generated in SQL, with the date index built afterwards; a Python
+        # insert loop would dominate the run
+        start = time.perf_counter()
+        conn.execute("DROP INDEX idx_market_prices_date")
+        conn.execute("CREATE TEMP TABLE tickers (symbol TEXT)")
+        conn.executemany("INSERT INTO tickers VALUES (?)", ((t,) for t in tickers))
+        conn.execute(
+            """
+            WITH RECURSIVE day(n) AS (
+                SELECT 0 UNION ALL SELECT n + 1 FROM day WHERE n < ?
+            ),
+            trading_day(price_date) AS (
+                SELECT date('2015-01-02', '+' || n || ' days') FROM day
+                WHERE strftime('%w', '2015-01-02', '+' || n || ' days')
+                    NOT IN ('0', '6')
+            )
+            INSERT INTO market_prices
+            SELECT symbol, price_date,
+                   10 + abs(random() % 49000) / 100.0,
+                   abs(random() % 1000000),
+                   5 + abs(random() % 5500) / 100.0
+            FROM tickers CROSS JOIN trading_day
+            """,
+            [years * 365 - 1],
+        )
+        for statement in LATEST_PRICES_DDL:
+            conn.execute(statement)
+        price_rows = conn.execute("SELECT COUNT(*) FROM market_prices").fetchone()[0]
+        ids = [f"PORT{i:06d}" for i in range(portfolios)]
+        insert_benchmark_portfolios(conn, ids, tickers, positions_per_portfolio)
+        print(
+            f"  market_prices:      {price_rows:>12,} rows "
+            f"(built in {time.perf_counter() - start:.1f}s)"
+        )
+
+        service = PortfolioAnalysisService(router=SQLiteQueryRouter(conn, latency_ms=0))
+        start = time.perf_counter()
+        asyncio.run(service.load_price_snapshot())
+        print(f"  full rebuild:       {time.perf_counter() - start:>12.2f}s")
+
+        timings: Dict[str, List[float]] = {"correlated": [], "latest_prices": []}
+        mismatches = 0
+        for pid in ids:
+            results = []
+            for name, query in (
+                ("correlated", correlated_query),
+                ("latest_prices", POSITIONS_QUERY),
+            ):
+                start = time.perf_counter()
+                rows = conn.execute(query, [pid]).fetchall()
+                timings[name].append(time.perf_counter() - start)
+                results.append([(row["symbol"], row["current_price"]) for row in rows])
+            mismatches += results[0] != results[1]
+        for name, samples in timings.items():
+            print(
+                f"  {name + ' query:':<22}p50 {percentile(samples, 0.5):7.3f} ms  "
+                f"p95 {percentile(samples, 0.95):7.3f} ms"
+            )
+        speedup = percentile(timings["correlated"], 0.5) / percentile(
+            timings["latest_prices"], 0.5
+        )
+        print(f"  p50 speedup:          {speedup:>10.1f}x")
+
+        # Next trading day's closes arrive; only they are read
+        conn.execute("""
+            INSERT INTO market_prices
+            SELECT symbol, date(MAX(price_date), '+1 day'),
+                   10 + abs(random() % 49000) / 100.0, 0, 20
+            FROM market_prices GROUP BY symbol
+            """)
+        start = time.perf_counter()
+        changed = asyncio.run(service.refresh_price_snapshot())
+        print(
+            f"  incremental:        {time.perf_counter() - start:>12.3f}s "
+            f"({changed:,} symbols updated)"
+        )
+        # SQLite returns close_price from the MAX(price_date) row here
+        snapshot = service.price_snapshot
+        stale = sum(
+            snapshot.close[snapshot.index[symbol]] != close
+            for symbol, _, close in conn.execute(
+                "SELECT symbol, MAX(price_date), close_price FROM market_prices "
+                "GROUP BY symbol"
+            )
+        )
+        conn.close()
+
+    print(
+        f"{'✅' if not mismatches else '❌'} {portfolios - mismatches:,}/{portfolios:,} "
+        f"position queries match; {stale} stale symbols in the snapshot"
+    )
+
+
+def run_pool_telemetry_benchmark(
+    phases=(("steady", 20, 3.0), ("spike", 300, 6.0), ("cool-down", 10, 4.0)),
+    latency_ms: float = 20.0,
+    sizing_interval: float = 0.5,
+):
+    """
+    Closed-loop workers borrow connections through get_connection and run
+    two queries each; per phase (name, workers, seconds) it reports
+    throughput, acquire wait and pool size, with the pool held at its
+    initial max and then with AdaptivePoolSizer resizing it.
+    """
+    import random
+    from urllib.request import urlopen
+
+    conn = open_portfolio_benchmark_db()
+    tickers = [f"SYM{i:04d}" for i in range(500)]
+    conn.executemany(
+        "INSERT INTO market_prices VALUES (?, '2025-01-02', ?, 0, 20)",
+        ((ticker, 100 + i % 50) for i, ticker in enumerate(tickers)),
+    )
+    ids = [f"PORT{i:06d}" for i in range(1_000)]
+    insert_benchmark_portfolios(conn, ids, tickers, 12)
+    conn.execute(LATEST_PRICES_REBUILD)
+
+    print("=" * 70)
+    print(
+        f"Pool telemetry: {latency_ms:g} ms per query, pool "
+        f"{POOL_MIN_CONNECTIONS}-{POOL_MAX_CONNECTIONS} to start, "
+        f"sizing every {sizing_interval:g}s"
+    )
+    print("=" * 70)
+
+    async def run(adaptive: bool):
+        pool = SQLiteConnectionPool(conn, latency_ms=latency_ms)
+        service = PortfolioAnalysisService(
+            router=SQLiteQueryRouter(conn, latency_ms=latency_ms), pool=pool
+        )
+        if not adaptive:
+            service.sizer.resize = None
+        rng = random.Random(0)
+        completed = 0
+
+        async def worker():
+            nonlocal completed
+            while True:
+                pid = rng.choice(ids)
+                async with service.get_connection() as conn_id:
+                    await service.execute_on(
+                        conn_id,
+                        "SELECT * FROM portfolio_metadata WHERE portfolio_id = ?",
+                        [pid],
+                    )
+                    await service.execute_on(conn_id, POSITIONS_QUERY, [pid], "all")
+                completed += 1
+
+        sizer = asyncio.create_task(service.sizer.run(sizing_interval))
+        workers: List[asyncio.Task] = []
+        print(f"{'adaptive sizing' if adaptive else 'fixed pool'}:")
+        for name, count, seconds in phases:
+            while len(workers) < count:
+                workers.append(asyncio.create_task(worker()))
+            while len(workers) > count:
+                workers.pop().cancel()
+            before = list(service.telemetry.acquire_wait.counts)
+            done_before = completed
+            await asyncio.sleep(seconds)
+            recent = [
+                now - then
+                for now, then in zip(service.telemetry.acquire_wait.counts, before)
+            ]
+            p50, p95 = (
+                bucket_quantile(service.telemetry.buckets, recent, q) * 1000
+                for q in (0.5, 0.95)
+            )
+            throughput = (completed - done_before) / seconds
+            print(
+                f"  {name:<10} {count:>4} workers {throughput:>8,.0f} ops/s  "
+                f"wait p50 {p50:7.2f} ms  p95 {p95:7.2f} ms  "
+                f"pool {pool.min_connections}-{pool.max_connections}"
+            )
+        for task in workers:
+            task.cancel()
+        sizer.cancel()
+        await asyncio.gather(*workers, sizer, return_exceptions=True)
+        return service
+
+    asyncio.run(run(adaptive=False))
+    service = asyncio.run(run(adaptive=True))
+    for decision in list(service.sizer.history)[-3:]:
+        print(
+            f"  sizer: p95 wait {decision['p95_wait_ms']:.1f} ms, peak "
+            f"{decision['peak_in_use']} in use -> "
+            f"{decision['min_connections']}-{decision['max_connections']}"
+        )
+
+    async def scrape() -> str:
+        server = await serve_metrics(service.telemetry, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await asyncio.to_thread(
+                lambda: urlopen(f"http://127.0.0.1:{port}/metrics").read().decode()
+            )
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    body = asyncio.run(scrape())
+    assert body == render_prometheus(service.telemetry)
+    series = [line for line in body.splitlines() if not line.startswith("#")]
+    print(f"/metrics: {len(series)} series, e.g.")
+    for line in series:
+        if line.startswith(("pool_acquire_wait_seconds_count", "pool_max_connections")):
+            print(f"  {line}")
+    print(f"  {next(line for line in series if 'pool_query_seconds_count' in line)}")
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_batch_benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 40_000)
+    elif len(sys.argv) > 1 and sys.argv[1] == "poolbench":
+        run_pool_telemetry_benchmark()
+    elif len(sys.argv) > 1 and sys.argv[1] == "pricebench":
+        run_price_snapshot_benchmark(
+            int(sys.argv[2]) if len(sys.argv) > 2 else 10_000,
+            int(sys.argv[3]) if len(sys.argv) > 3 else 10,
+        )
+    else:
+        asyncio.run(main())
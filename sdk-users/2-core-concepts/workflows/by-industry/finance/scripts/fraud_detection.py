@@ -14,11 +14,11 @@ multiple detection strategies and real-time alerting.
 
 import json
 import sys
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import numpy as np
 import pandas as pd
 
 # Add project root to path
@@ -37,110 +37,149 @@ from examples.utils.data_paths import (
     get_output_data_path,
 )
 
+VELOCITY_WINDOW = timedelta(hours=1)
+LOCATION_TTL = timedelta(days=30)
 
-def enrich_fraud_indicators(transaction_data: Any, customer_data: list) -> dict:
-    """Enrich transactions with comprehensive fraud indicators.
 
-    Args:
-        transaction_data: Transaction records (list or dict with 'transactions')
-        customer_data: Customer baseline data
+class CustomerWindow:
+    """Sliding-window state for one customer.
 
-    Returns:
-        Dict with 'result' key containing enriched transactions with fraud scores
+    Holds the last hour of transactions in a deque ordered by timestamp with
+    a running amount sum, Welford running mean/variance over the full history
+    for the amount z-score, the running maximum amount, and recently seen
+    locations with expiry. Every update costs amortized O(1).
     """
-    # Handle both formats - direct array or nested in 'transactions'
-    if isinstance(transaction_data, list):
-        transactions = transaction_data
-    else:
-        transactions = transaction_data.get("transactions", [])
-    customers = customer_data
 
-    # Convert to DataFrame for analysis
-    trans_df = pd.DataFrame(transactions)
-    cust_df = pd.DataFrame(customers)
-
-    # Add timestamps if not present (for demo data)
-    if "timestamp" not in trans_df.columns and not trans_df.empty:
-        # Generate timestamps for demo
-        base_time = datetime.now() - timedelta(days=7)
-        trans_df["timestamp"] = [
-            base_time + timedelta(hours=i * 2) for i in range(len(trans_df))
-        ]
-    elif "timestamp" in trans_df.columns:
-        trans_df["timestamp"] = pd.to_datetime(trans_df["timestamp"])
-
-    trans_df = (
-        trans_df.sort_values("timestamp")
-        if "timestamp" in trans_df.columns
-        else trans_df
+    __slots__ = (
+        "recent",
+        "recent_amount",
+        "count",
+        "mean_amount",
+        "m2_amount",
+        "max_amount",
+        "location_log",
+        "location_last_seen",
     )
 
-    # Calculate velocity indicators
-    result = []
-    customer_history = {}
+    def __init__(self):
+        self.recent = deque()
+        self.recent_amount = 0.0
+        self.count = 0
+        self.mean_amount = 0.0
+        self.m2_amount = 0.0
+        self.max_amount = 0
+        self.location_log = deque()
+        self.location_last_seen = {}
+
+    def expire(self, now) -> None:
+        """Drop window entries and locations that fell out of their windows."""
+        while self.recent and now - self.recent[0][0] >= VELOCITY_WINDOW:
+            _, amount = self.recent.popleft()
+            self.recent_amount -= amount
+        if not self.recent:
+            # Reset so float drift from add/subtract cannot accumulate
+            self.recent_amount = 0.0
+
+        while self.location_log and now - self.location_log[0][0] >= LOCATION_TTL:
+            seen_at, location = self.location_log.popleft()
+            if self.location_last_seen.get(location) == seen_at:
+                del self.location_last_seen[location]
+
+    def add(self, timestamp, amount, location=None) -> None:
+        """Record a scored transaction."""
+        self.recent.append((timestamp, amount))
+        self.recent_amount += amount
+
+        self.count += 1
+        delta = amount - self.mean_amount
+        self.mean_amount += delta / self.count
+        self.m2_amount += delta * (amount - self.mean_amount)
+        self.max_amount = max(self.max_amount, amount)
+
+        if location is not None:
+            self.location_log.append((timestamp, location))
+            self.location_last_seen[location] = timestamp
+
+    @property
+    def std_amount(self) -> float:
+        """Population standard deviation, as np.std computes it."""
+        return (self.m2_amount / self.count) ** 0.5 if self.count else 0.0
+
+
+class CustomerVelocityIndex:
+    """Per-customer sliding-window index used to score transactions.
+
+    Transactions must arrive in timestamp order per customer, which is how
+    both the batch enricher (after sorting) and a live card feed deliver them.
+    """
 
-    for idx, trans in trans_df.iterrows():
-        cust_id = trans["customer_id"]
+    def __init__(self):
+        self.customers = {}
 
-        # Initialize customer history
-        if cust_id not in customer_history:
-            customer_history[cust_id] = {
-                "transactions": [],
-                "locations": set(),
-                "avg_amount": 0,
-                "max_amount": 0,
-            }
+    def score(self, trans: dict, transaction_id: Any) -> dict:
+        """Compute fraud indicators for one transaction and update the index."""
+        cust_id = trans["customer_id"]
+        window = self.customers.get(cust_id)
+        if window is None:
+            window = self.customers[cust_id] = CustomerWindow()
 
-        history = customer_history[cust_id]
+        timestamp = trans.get("timestamp")
+        has_timestamp = "timestamp" in trans
+        amount = trans["amount"]
+        location = trans.get("location")
+        if location is not None and pd.isna(location):
+            location = None
 
-        # Calculate fraud indicators
         indicators = {
-            "transaction_id": trans.get("id", f"TXN-{idx}"),
+            "transaction_id": transaction_id,
             "customer_id": cust_id,
-            "amount": trans["amount"],
-            "timestamp": trans.get("timestamp", datetime.now().isoformat()),
+            "amount": amount,
+            "timestamp": timestamp if has_timestamp else datetime.now().isoformat(),
         }
 
         # 1. Velocity check - transactions in last hour
-        recent_trans = [
-            t
-            for t in history["transactions"]
-            if "timestamp" in trans
-            and (trans["timestamp"] - t["timestamp"]).total_seconds() < 3600
-        ]
-        indicators["velocity_count"] = len(recent_trans)
-        indicators["velocity_amount"] = sum(t["amount"] for t in recent_trans)
+        if has_timestamp:
+            window.expire(timestamp)
+            indicators["velocity_count"] = len(window.recent)
+            indicators["velocity_amount"] = window.recent_amount
+        else:
+            indicators["velocity_count"] = 0
+            indicators["velocity_amount"] = 0
 
         # 2. Amount anomaly - compare to historical average
-        if history["transactions"]:
-            avg_amount = np.mean([t["amount"] for t in history["transactions"]])
-            std_amount = np.std([t["amount"] for t in history["transactions"]])
+        if window.count:
+            avg_amount = window.mean_amount
+            std_amount = window.std_amount
             if std_amount > 0:
-                indicators["amount_zscore"] = abs(
-                    (trans["amount"] - avg_amount) / std_amount
-                )
+                indicators["amount_zscore"] = abs((amount - avg_amount) / std_amount)
             else:
                 indicators["amount_zscore"] = 0
-            indicators["amount_ratio"] = trans["amount"] / (avg_amount + 1)
+            indicators["amount_ratio"] = amount / (avg_amount + 1)
         else:
             indicators["amount_zscore"] = 0
             indicators["amount_ratio"] = 1
 
         # 3. Pattern detection
-        indicators["is_round_amount"] = trans["amount"] % 10 == 0
-        indicators["is_high_value"] = trans["amount"] > 1000
-        indicators["is_low_value"] = trans["amount"] < 10
+        indicators["is_round_amount"] = amount % 10 == 0
+        indicators["is_high_value"] = amount > 1000
+        indicators["is_low_value"] = amount < 10
 
         # 4. Time-based patterns
-        if "timestamp" in trans:
-            hour = trans["timestamp"].hour
+        if has_timestamp:
+            hour = timestamp.hour
             indicators["is_unusual_time"] = hour < 6 or hour > 23
-            indicators["is_weekend"] = trans["timestamp"].weekday() >= 5
+            indicators["is_weekend"] = timestamp.weekday() >= 5
         else:
             indicators["is_unusual_time"] = False
             indicators["is_weekend"] = False
 
-        # 5. Calculate fraud risk score (0-100)
+        # 5. Geography - only for feeds that carry a location
+        if location is not None:
+            indicators["is_new_location"] = bool(
+                window.count and location not in window.location_last_seen
+            )
+
+        # 6. Calculate fraud risk score (0-100)
         risk_score = 0
 
         # High velocity
@@ -162,6 +201,8 @@ def enrich_fraud_indicators(transaction_data: Any, customer_data: list) -> dict:
             risk_score += 10
         if indicators["is_weekend"] and indicators["is_high_value"]:
             risk_score += 10
+        if indicators.get("is_new_location"):
+            risk_score += 10
 
         indicators["fraud_risk_score"] = min(risk_score, 100)
 
@@ -173,19 +214,76 @@ def enrich_fraud_indicators(transaction_data: Any, customer_data: list) -> dict:
         else:
             indicators["risk_category"] = "low"
 
-        # Update history (keep datetime objects for calculations)
-        history["transactions"].append(
-            {
-                "amount": trans["amount"],
-                "timestamp": trans.get("timestamp", datetime.now()),
-            }
-        )
+        # Update index (keep datetime objects for calculations)
+        window.add(timestamp if has_timestamp else datetime.now(), amount, location)
 
         # Convert timestamp to string for JSON serialization
-        if "timestamp" in indicators and hasattr(indicators["timestamp"], "isoformat"):
+        if hasattr(indicators["timestamp"], "isoformat"):
             indicators["timestamp"] = indicators["timestamp"].isoformat()
 
-        result.append(indicators)
+        return indicators
+
+
+def stream_fraud_indicators(transactions, index: CustomerVelocityIndex = None):
+    """Score transactions one at a time as they arrive.
+
+    Args:
+        transactions: Iterable of transaction dicts in arrival order; string
+            timestamps are parsed on the fly
+        index: Existing index to continue from, so state survives across
+            feed reconnects
+
+    Yields:
+        Fraud indicator dicts in arrival order
+    """
+    index = index if index is not None else CustomerVelocityIndex()
+    for position, trans in enumerate(transactions):
+        if isinstance(trans.get("timestamp"), str):
+            trans = {**trans, "timestamp": pd.Timestamp(trans["timestamp"])}
+        yield index.score(trans, trans.get("id", f"TXN-{position}"))
+
+
+def enrich_fraud_indicators(transaction_data: Any, customer_data: list) -> dict:
+    """Enrich transactions with comprehensive fraud indicators.
+
+    Args:
+        transaction_data: Transaction records (list or dict with 'transactions')
+        customer_data: Customer baseline data
+
+    Returns:
+        Dict with 'result' key containing enriched transactions with fraud scores
+    """
+    # Handle both formats - direct array or nested in 'transactions'
+    if isinstance(transaction_data, list):
+        transactions = transaction_data
+    else:
+        transactions = transaction_data.get("transactions", [])
+
+    # Convert to DataFrame for analysis
+    trans_df = pd.DataFrame(transactions)
+
+    # Add timestamps if not present (for demo data)
+    if "timestamp" not in trans_df.columns and not trans_df.empty:
+        # Generate timestamps for demo
+        base_time = datetime.now() - timedelta(days=7)
+        trans_df["timestamp"] = [
+            base_time + timedelta(hours=i * 2) for i in range(len(trans_df))
+        ]
+    elif "timestamp" in trans_df.columns:
+        trans_df["timestamp"] = pd.to_datetime(trans_df["timestamp"])
+
+    trans_df = (
+        trans_df.sort_values("timestamp")
+        if "timestamp" in trans_df.columns
+        else trans_df
+    )
+
+    # Score in timestamp order against the sliding-window index
+    index = CustomerVelocityIndex()
+    result = [
+        index.score(trans, trans.get("id", f"TXN-{idx}"))
+        for idx, trans in zip(trans_df.index, trans_df.to_dict("records"))
+    ]
 
     # Return enriched transactions sorted by risk
     sorted_result = sorted(result, key=lambda x: x["fraud_risk_score"], reverse=True)
@@ -55,9 +55,208 @@ def ensure_output_dir_exists():
     os.makedirs(output_dir, exist_ok=True)
 
 
+# Urgency buckets, most urgent first; codes index into both tuples
+REORDER_URGENCY_LEVELS = ("IMMEDIATE", "HIGH", "MEDIUM", "LOW")
+REORDER_URGENCY_STATUS = ("critical", "attention", "normal", "normal")
+
+ORDERING_COST = 50  # Assumed cost per order
+HOLDING_COST_RATE = 0.2  # 20% of unit cost per year
+
+
+def inventory_optimization_frame(inventory):
+    """
+    Columnar inventory engine.
+
+    Parses each numeric column once into a typed array and computes stock
+    ratio, days of supply, urgency bucket, EOQ, safety stock, reorder point
+    and cost figures for every SKU with vector ops. ``inventory`` is a
+    DataFrame with string (CSV) or numeric columns; the result holds the
+    unrounded values, one row per SKU, with ``urgency`` as an int8 code
+    into REORDER_URGENCY_LEVELS.
+
+    Division follows IEEE rules rather than raising: a SKU with
+    ``min_stock=0`` gets ``inf`` (or ``nan`` at zero stock) days of supply,
+    where the per-item path raised ZeroDivisionError for the whole batch.
+    """
+    import numpy as np
+    import pandas as pd
+
+    current_stock = inventory["current_stock"].astype(np.float64).to_numpy()
+    min_stock = inventory["min_stock"].astype(np.float64).to_numpy()
+    max_stock = inventory["max_stock"].astype(np.float64).to_numpy()
+    lead_time = inventory["lead_time_days"].astype(np.int64).to_numpy()
+    unit_cost = inventory["unit_cost"].astype(np.float64).to_numpy()
+
+    urgency = np.select(
+        [
+            current_stock <= min_stock,
+            current_stock <= min_stock * 1.5,
+            current_stock <= min_stock * 2,
+        ],
+        [0, 1, 2],
+        default=3,
+    ).astype(np.int8)
+    shortfall = max_stock - current_stock
+    reorder_quantity = np.where(urgency < 3, shortfall, 0.0)
+
+    annual_demand = min_stock * 52  # Rough estimate, as in the per-item path
+    eoq = np.sqrt((2 * annual_demand * ORDERING_COST) / (unit_cost * HOLDING_COST_RATE))
+    avg_daily_demand = min_stock / 7
+    lead_time_demand = avg_daily_demand * lead_time
+    safety_stock = lead_time_demand * 0.5
+    reorder_point = lead_time_demand + safety_stock
+
+    return pd.DataFrame(
+        {
+            "material_id": inventory["material_id"].to_numpy(),
+            "material_name": inventory["material_name"].to_numpy(),
+            "category": inventory["category"].to_numpy(),
+            "supplier_id": inventory["supplier_id"].to_numpy(),
+            "current_stock": current_stock,
+            "unit_cost": unit_cost,
+            "lead_time_days": lead_time,
+            "stock_ratio": current_stock / max_stock,
+            "days_of_supply": current_stock / avg_daily_demand,
+            "urgency": urgency,
+            "reorder_quantity": reorder_quantity,
+            "eoq": eoq,
+            "safety_stock": safety_stock,
+            "reorder_point": reorder_point,
+            "current_inventory_value": current_stock * unit_cost,
+            "optimal_inventory_value": reorder_point * unit_cost,
+            "excess_value": (current_stock - reorder_point) * unit_cost,
+        },
+        copy=False,
+    )
+
+
+def _round_like_builtin(values, digits):
+    """
+    Vectorized round() with the builtin's results. Scaling by 10**digits can
+    only change the answer when the scaled value sits within float error of
+    a .5 tie, so just those elements go through the builtin.
+    """
+    import numpy as np
+
+    scale = 10.0**digits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+    distance_to_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+    for i in np.flatnonzero(distance_to_tie <= 1e-9 * np.maximum(1, np.abs(scaled))):
+        rounded[i] = round(float(values[i]), digits)
+    return rounded
+
+
+def inventory_optimization_records(frame):
+    """
+    Shape inventory_optimization_frame() output into the per-item records
+    the workflow writes, with the same rounding as the original analyzer.
+    """
+    rounded = {
+        name: _round_like_builtin(frame[name].to_numpy(), digits).tolist()
+        for name, digits in (
+            ("stock_ratio", 3),
+            ("days_of_supply", 1),
+            ("eoq", 0),
+            ("reorder_point", 0),
+            ("safety_stock", 0),
+            ("reorder_quantity", 0),
+            ("current_inventory_value", 2),
+            ("optimal_inventory_value", 2),
+            ("excess_value", 2),
+        )
+    }
+    # Zero order quantities and savings stay int 0, as the per-item path wrote them
+    has_order = (frame["reorder_quantity"] > 0).tolist()
+    has_excess = (frame["current_stock"] > frame["reorder_point"]).tolist()
+
+    records = []
+    for (
+        material_id,
+        material_name,
+        category,
+        supplier_id,
+        current_stock,
+        unit_cost,
+        lead_time,
+        urgency,
+        stock_ratio,
+        days_of_supply,
+        eoq,
+        reorder_point,
+        safety_stock,
+        reorder_quantity,
+        current_value,
+        optimal_value,
+        excess_value,
+        order,
+        excess,
+    ) in zip(
+        *(
+            frame[name].tolist()
+            for name in (
+                "material_id",
+                "material_name",
+                "category",
+                "supplier_id",
+                "current_stock",
+                "unit_cost",
+                "lead_time_days",
+                "urgency",
+            )
+        ),
+        *rounded.values(),
+        has_order,
+        has_excess,
+    ):
+        records.append(
+            {
+                "material_id": material_id,
+                "material_name": material_name,
+                "category": category,
+                "current_metrics": {
+                    "current_stock": current_stock,
+                    "stock_ratio": stock_ratio,
+                    "days_of_supply": days_of_supply,
+                    "unit_cost": unit_cost,
+                },
+                "optimization_results": {
+                    "eoq": eoq,
+                    "optimal_reorder_point": reorder_point,
+                    "safety_stock": safety_stock,
+                    "reorder_urgency": REORDER_URGENCY_LEVELS[urgency],
+                    "recommended_order_quantity": reorder_quantity if order else 0,
+                },
+                "cost_analysis": {
+                    "current_inventory_value": current_value,
+                    "optimal_inventory_value": optimal_value,
+                    "potential_savings": excess_value if excess else 0,
+                },
+                "supplier_id": supplier_id,
+                "lead_time_days": lead_time,
+                "status": REORDER_URGENCY_STATUS[urgency],
+            }
+        )
+    return records
+
+
 def analyze_inventory_optimization(inventory_data):
     """
     Analyze inventory levels and optimize reorder points.
+    Accepts CSV records or a DataFrame of the same columns.
+    """
+    import pandas as pd
+
+    if len(inventory_data) == 0:
+        return []
+    frame = inventory_optimization_frame(pd.DataFrame(inventory_data))
+    return inventory_optimization_records(frame)
+
+
+def _analyze_inventory_optimization_itemwise(inventory_data):
+    """
+    Original item-by-item optimization, kept as the reference
+    implementation for the inventory benchmark's equivalence check.
     """
     import statistics
 
@@ -146,12 +345,200 @@ def analyze_inventory_optimization(inventory_data):
     return optimized_inventory
 
 
+class SupplierMaterialIndex:
+    """
+    Hash index from supplier_id to the inventory rows (materials) it supplies.
+
+    Built in one pass: supplier ids are hashed to dense codes and the rows
+    are stably sorted by code, so each supplier owns one contiguous slice
+    of row positions in their original order. Lookups are a dict probe
+    plus a slice, which keeps supplier evaluation linear in suppliers +
+    SKUs.
+    """
+
+    def __init__(self, supplier_ids, material_ids=None):
+        import numpy as np
+        import pandas as pd
+
+        codes, suppliers = pd.factorize(np.asarray(supplier_ids, dtype=object))
+        self.slots = {supplier_id: slot for slot, supplier_id in enumerate(suppliers)}
+        self.order = np.argsort(codes, kind="stable")
+        self.offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(codes, minlength=len(suppliers))))
+        )
+        self.material_ids = (
+            None if material_ids is None else np.asarray(material_ids, dtype=object)
+        )
+
+    def rows(self, supplier_id):
+        """Inventory row positions for ``supplier_id`` (empty if unknown)."""
+        slot = self.slots.get(supplier_id)
+        if slot is None:
+            return self.order[:0]
+        return self.order[self.offsets[slot] : self.offsets[slot + 1]]
+
+    def materials(self, supplier_id):
+        """material_ids supplied by ``supplier_id``."""
+        return self.material_ids[self.rows(supplier_id)].tolist()
+
+    def count(self, supplier_id):
+        return len(self.rows(supplier_id))
+
+    def sums(self, values):
+        """
+        Per-supplier sum of ``values`` (one per inventory row). Each slice is
+        summed with the builtin sum in row order, exactly as the per-item
+        loop did.
+        """
+        ordered = values[self.order].tolist()
+        offsets = self.offsets.tolist()
+        return {
+            supplier_id: sum(ordered[offsets[slot] : offsets[slot + 1]])
+            for supplier_id, slot in self.slots.items()
+        }
+
+
+def _supplier_evaluation(supplier, items_supplied, total_inventory_value):
+    """Scorecard for one supplier row given its inventory footprint."""
+    supplier_id = supplier["supplier_id"]
+
+    # Basic performance metrics
+    on_time_rate = float(supplier["on_time_delivery_rate"])
+    quality_score = float(supplier["quality_score"])
+    lead_time = float(supplier["average_lead_time_days"])
+    cost_index = float(supplier["cost_index"])
+    total_orders = int(supplier["total_orders_2024"])
+    rejected_shipments = int(supplier["rejected_shipments"])
+
+    # Calculate derived metrics
+    rejection_rate = (
+        (rejected_shipments / total_orders * 100) if total_orders > 0 else 0
+    )
+    reliability_score = (on_time_rate + quality_score) / 2
+
+    # Calculate weighted performance score
+    # Weights: On-time (30%), Quality (30%), Cost (20%), Reliability (20%)
+    performance_score = (
+        on_time_rate * 0.3
+        + quality_score * 0.3
+        + (100 - ((cost_index - 1.0) * 100)) * 0.2  # Lower cost index is better
+        + (100 - rejection_rate) * 0.2
+    )
+
+    # Risk assessment
+    risk_factors = []
+    risk_level = "LOW"
+
+    if on_time_rate < 90:
+        risk_factors.append("Poor delivery performance")
+    if quality_score < 95:
+        risk_factors.append("Quality issues")
+    if rejection_rate > 5:
+        risk_factors.append("High rejection rate")
+    if cost_index > 1.15:
+        risk_factors.append("High cost premium")
+    if lead_time > 21:
+        risk_factors.append("Long lead times")
+
+    if len(risk_factors) >= 3:
+        risk_level = "HIGH"
+    elif len(risk_factors) >= 1:
+        risk_level = "MEDIUM"
+
+    # Supplier category and recommendations
+    if performance_score >= 95:
+        supplier_category = "STRATEGIC"
+        recommendations = [
+            "Expand partnership",
+            "Negotiate better terms",
+            "Increase order volume",
+        ]
+    elif performance_score >= 85:
+        supplier_category = "PREFERRED"
+        recommendations = [
+            "Maintain current relationship",
+            "Monitor performance",
+            "Consider for strategic growth",
+        ]
+    elif performance_score >= 75:
+        supplier_category = "ACCEPTABLE"
+        recommendations = [
+            "Develop improvement plan",
+            "Increase monitoring",
+            "Consider alternatives",
+        ]
+    else:
+        supplier_category = "NEEDS_IMPROVEMENT"
+        recommendations = [
+            "Immediate performance review",
+            "Develop strict improvement plan",
+            "Source alternatives",
+        ]
+
+    return {
+        "supplier_id": supplier_id,
+        "supplier_name": supplier["supplier_name"],
+        "category": supplier["category"],
+        "performance_metrics": {
+            "on_time_delivery_rate": on_time_rate,
+            "quality_score": quality_score,
+            "average_lead_time_days": lead_time,
+            "cost_index": cost_index,
+            "rejection_rate": round(rejection_rate, 2),
+            "reliability_score": round(reliability_score, 2),
+            "overall_performance_score": round(performance_score, 2),
+        },
+        "business_metrics": {
+            "total_orders_2024": total_orders,
+            "rejected_shipments": rejected_shipments,
+            "items_supplied": items_supplied,
+            "total_inventory_value": round(total_inventory_value, 2),
+        },
+        "risk_assessment": {
+            "risk_level": risk_level,
+            "risk_factors": risk_factors,
+            "risk_score": round(len(risk_factors) * 25, 1),  # Simple risk scoring
+        },
+        "supplier_category": supplier_category,
+        "recommendations": recommendations,
+        "next_review_date": (datetime.now() + timedelta(days=90)).isoformat()[:10],
+    }
+
+
 def evaluate_supplier_performance(supplier_data, inventory_data):
     """
     Evaluate supplier performance and generate scorecards.
+    inventory_data may be CSV records or a DataFrame of the same columns.
     """
-    supplier_evaluations = []
+    import numpy as np
+    import pandas as pd
 
+    # Hashed supplier -> material index over the inventory, built once
+    inventory = pd.DataFrame(
+        inventory_data,
+        columns=["supplier_id", "material_id", "current_stock", "unit_cost"],
+    )
+    index = SupplierMaterialIndex(inventory["supplier_id"], inventory["material_id"])
+    inventory_values = index.sums(
+        inventory["current_stock"].astype(np.float64).to_numpy()
+        * inventory["unit_cost"].astype(np.float64).to_numpy()
+    )
+
+    return [
+        _supplier_evaluation(
+            supplier,
+            index.count(supplier["supplier_id"]),
+            inventory_values.get(supplier["supplier_id"], 0),
+        )
+        for supplier in supplier_data
+    ]
+
+
+def _evaluate_supplier_performance_rowwise(supplier_data, inventory_data):
+    """
+    Original evaluation, grouping inventory items into per-supplier lists;
+    kept as the reference for the inventory benchmark.
+    """
     # Create lookup for inventory by supplier
     inventory_by_supplier = {}
     for item in inventory_data:
@@ -160,119 +547,16 @@ def evaluate_supplier_performance(supplier_data, inventory_data):
             inventory_by_supplier[supplier_id] = []
         inventory_by_supplier[supplier_id].append(item)
 
+    supplier_evaluations = []
     for supplier in supplier_data:
-        supplier_id = supplier["supplier_id"]
-
-        # Basic performance metrics
-        on_time_rate = float(supplier["on_time_delivery_rate"])
-        quality_score = float(supplier["quality_score"])
-        lead_time = float(supplier["average_lead_time_days"])
-        cost_index = float(supplier["cost_index"])
-        total_orders = int(supplier["total_orders_2024"])
-        rejected_shipments = int(supplier["rejected_shipments"])
-
-        # Calculate derived metrics
-        rejection_rate = (
-            (rejected_shipments / total_orders * 100) if total_orders > 0 else 0
-        )
-        reliability_score = (on_time_rate + quality_score) / 2
-
-        # Calculate weighted performance score
-        # Weights: On-time (30%), Quality (30%), Cost (20%), Reliability (20%)
-        performance_score = (
-            on_time_rate * 0.3
-            + quality_score * 0.3
-            + (100 - ((cost_index - 1.0) * 100)) * 0.2  # Lower cost index is better
-            + (100 - rejection_rate) * 0.2
-        )
-
-        # Risk assessment
-        risk_factors = []
-        risk_level = "LOW"
-
-        if on_time_rate < 90:
-            risk_factors.append("Poor delivery performance")
-        if quality_score < 95:
-            risk_factors.append("Quality issues")
-        if rejection_rate > 5:
-            risk_factors.append("High rejection rate")
-        if cost_index > 1.15:
-            risk_factors.append("High cost premium")
-        if lead_time > 21:
-            risk_factors.append("Long lead times")
-
-        if len(risk_factors) >= 3:
-            risk_level = "HIGH"
-        elif len(risk_factors) >= 1:
-            risk_level = "MEDIUM"
-
-        # Supplier category and recommendations
-        if performance_score >= 95:
-            supplier_category = "STRATEGIC"
-            recommendations = [
-                "Expand partnership",
-                "Negotiate better terms",
-                "Increase order volume",
-            ]
-        elif performance_score >= 85:
-            supplier_category = "PREFERRED"
-            recommendations = [
-                "Maintain current relationship",
-                "Monitor performance",
-                "Consider for strategic growth",
-            ]
-        elif performance_score >= 75:
-            supplier_category = "ACCEPTABLE"
-            recommendations = [
-                "Develop improvement plan",
-                "Increase monitoring",
-                "Consider alternatives",
-            ]
-        else:
-            supplier_category = "NEEDS_IMPROVEMENT"
-            recommendations = [
-                "Immediate performance review",
-                "Develop strict improvement plan",
-                "Source alternatives",
-            ]
-
-        # Count items supplied
-        items_supplied = len(inventory_by_supplier.get(supplier_id, []))
+        supplier_items = inventory_by_supplier.get(supplier["supplier_id"], [])
         total_inventory_value = sum(
             float(item["current_stock"]) * float(item["unit_cost"])
-            for item in inventory_by_supplier.get(supplier_id, [])
+            for item in supplier_items
+        )
+        supplier_evaluations.append(
+            _supplier_evaluation(supplier, len(supplier_items), total_inventory_value)
         )
-
-        evaluation = {
-            "supplier_id": supplier_id,
-            "supplier_name": supplier["supplier_name"],
-            "category": supplier["category"],
-            "performance_metrics": {
-                "on_time_delivery_rate": on_time_rate,
-                "quality_score": quality_score,
-                "average_lead_time_days": lead_time,
-                "cost_index": cost_index,
-                "rejection_rate": round(rejection_rate, 2),
-                "reliability_score": round(reliability_score, 2),
-                "overall_performance_score": round(performance_score, 2),
-            },
-            "business_metrics": {
-                "total_orders_2024": total_orders,
-                "rejected_shipments": rejected_shipments,
-                "items_supplied": items_supplied,
-                "total_inventory_value": round(total_inventory_value, 2),
-            },
-            "risk_assessment": {
-                "risk_level": risk_level,
-                "risk_factors": risk_factors,
-                "risk_score": round(len(risk_factors) * 25, 1),  # Simple risk scoring
-            },
-            "supplier_category": supplier_category,
-            "recommendations": recommendations,
-            "next_review_date": (datetime.now() + timedelta(days=90)).isoformat()[:10],
-        }
-
-        supplier_evaluations.append(evaluation)
 
     return supplier_evaluations
 
@@ -581,6 +865,121 @@ def create_supply_chain_optimization_workflow():
     return workflow
 
 
+def _generate_catalogue(sku_count, supplier_count, seed=11):
+    """
+    Synthetic inventory as typed columns (skewed so a few suppliers carry
+    most SKUs) plus supplier scorecards as CSV-style records.
+    """
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    supplier_ids = np.array(
+        [f"SUP{i:04d}" for i in range(supplier_count)], dtype=object
+    )
+    weights = rng.pareto(1.2, supplier_count) + 1
+    min_stock = rng.integers(20, 500, sku_count).astype(np.float64)
+    max_stock = np.round(min_stock * rng.uniform(3, 8, sku_count))
+    inventory = pd.DataFrame(
+        {
+            "material_id": [f"MAT{i:07d}" for i in range(sku_count)],
+            "material_name": [f"Component {i}" for i in range(sku_count)],
+            "category": np.array(
+                ["Raw Materials", "Electronics", "Fasteners", "Packaging"],
+                dtype=object,
+            )[rng.integers(0, 4, sku_count)],
+            "current_stock": np.round(rng.uniform(0, 1, sku_count) * max_stock),
+            "min_stock": min_stock,
+            "max_stock": max_stock,
+            "lead_time_days": rng.integers(3, 45, sku_count),
+            "unit_cost": np.round(rng.lognormal(3, 1, sku_count), 2),
+            "supplier_id": supplier_ids[
+                rng.choice(supplier_count, sku_count, p=weights / weights.sum())
+            ],
+        }
+    )
+    suppliers = [
+        {
+            "supplier_id": supplier_id,
+            "supplier_name": f"Supplier {i}",
+            "category": "Components",
+            "on_time_delivery_rate": f"{rng.uniform(80, 100):.1f}",
+            "quality_score": f"{rng.uniform(88, 100):.1f}",
+            "average_lead_time_days": f"{rng.uniform(5, 30):.1f}",
+            "cost_index": f"{rng.uniform(0.85, 1.3):.2f}",
+            "total_orders_2024": str(rng.integers(0, 400)),
+            "rejected_shipments": str(rng.integers(0, 20)),
+        }
+        for i, supplier_id in enumerate(supplier_ids)
+    ]
+    return inventory, suppliers
+
+
+def run_inventory_benchmark(
+    sku_count=3_000_000, supplier_count=900, reference_rows=200_000
+):
+    """
+    Compare the per-item inventory and supplier analysis with the columnar
+    engine and supplier index, then run the engine over the full catalogue.
+    """
+    import time
+
+    inventory, suppliers = _generate_catalogue(sku_count, supplier_count)
+    print(f"Inventory benchmark: {sku_count:,} SKUs across {supplier_count} suppliers")
+
+    # Equivalence and speed on CSV-style records the per-item code can handle
+    records = inventory.iloc[:reference_rows].astype(str).to_dict("records")
+    timings = {}
+    outputs = {}
+    for label, analyze, evaluate in (
+        (
+            "Per-item",
+            _analyze_inventory_optimization_itemwise,
+            _evaluate_supplier_performance_rowwise,
+        ),
+        ("Columnar", analyze_inventory_optimization, evaluate_supplier_performance),
+    ):
+        started = time.perf_counter()
+        optimized = analyze(records)
+        middle = time.perf_counter()
+        evaluations = evaluate(suppliers, records)
+        timings[label] = (middle - started, time.perf_counter() - middle)
+        outputs[label] = (optimized, evaluations)
+    print(
+        f"  Equivalence check ({len(records):,} SKUs): "
+        f"inventory {outputs['Per-item'][0] == outputs['Columnar'][0]}, "
+        f"suppliers {outputs['Per-item'][1] == outputs['Columnar'][1]}"
+    )
+    for label, (inventory_seconds, supplier_seconds) in timings.items():
+        print(
+            f"  {label + ':':10} inventory {inventory_seconds:7.3f}s "
+            f"({len(records) / inventory_seconds:,.0f} SKUs/s), "
+            f"suppliers {supplier_seconds:7.3f}s"
+        )
+    del records, outputs
+
+    # Full catalogue on typed columns
+    started = time.perf_counter()
+    frame = inventory_optimization_frame(inventory)
+    engine_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    evaluations = evaluate_supplier_performance(suppliers, inventory)
+    supplier_seconds = time.perf_counter() - started
+    urgency = frame["urgency"].value_counts().sort_index()
+    print(
+        f"  Full catalogue: engine {engine_seconds:.3f}s "
+        f"({sku_count / engine_seconds:,.0f} SKUs/s), "
+        f"supplier index + {len(evaluations)} scorecards {supplier_seconds:.3f}s"
+    )
+    print(
+        "  Urgency buckets: "
+        + ", ".join(
+            f"{REORDER_URGENCY_LEVELS[code]} {count:,}"
+            for code, count in urgency.items()
+        )
+    )
+
+
 def main():
     """Execute the supply chain optimization workflow."""
     print("=" * 80)
@@ -675,4 +1074,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_inventory_benchmark()
+    else:
+        main()
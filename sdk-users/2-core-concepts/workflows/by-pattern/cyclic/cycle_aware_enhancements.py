@@ -33,17 +33,40 @@ Use Cases:
 - Retail: Inventory optimization, demand forecasting refinement
 - Technology: Algorithm tuning, system performance optimization
 - Supply Chain: Route optimization, capacity planning refinement
+
+Optimizer kernel:
+    The workflows use VectorizedProcessOptimizerNode, which updates every
+    metric in one NumPy step and produces the same outputs as the per-metric
+    loop with a smaller cycle state (PROCESS_OPTIMIZER=scalar selects the
+    per-metric loop instead). The benchmark checks both produce identical
+    outputs and reports iterations/sec for each.
+
+    python cycle_aware_enhancements.py benchmark [metrics] [iterations]
+
+Cycle state:
+    The convergence analyzer and agent coordinator keep their state in a
+    CycleStateStore (via DeltaCycleStateMixin): each iteration records only a
+    delta of appended history entries and changed keys, histories are bounded
+    windows, and get_previous_state() materializes keys lazily on access.
+
+    python cycle_aware_enhancements.py state-benchmark [iterations]
 """
 
 import json
 import logging
+import os
 import random
 import sys
+import time
 import uuid
+from collections import deque
+from collections.abc import Mapping
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
@@ -75,6 +98,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Metrics that _calculate_business_value prices
+BUSINESS_VALUE_METRICS = [
+    "efficiency_rate",
+    "cost_per_unit",
+    "quality_score",
+    "processing_time",
+]
+
 
 class EnterpriseProcessOptimizerNode(CycleAwareNode):
     """Enterprise process optimizer with cycle-aware intelligence."""
@@ -340,9 +371,378 @@ class EnterpriseProcessOptimizerNode(CycleAwareNode):
         return value * discount_factor
 
 
-class IntelligentConvergenceAnalyzerNode(CycleAwareNode):
+class OptimizerState:
+    """
+    Array-backed form of EnterpriseProcessOptimizerNode's per-metric update.
+
+    Each metric is one slot in a set of NumPy arrays (targets, bounds,
+    direction, learning rate), rebuilt each iteration from the targets,
+    constraints and learning rates the node already keeps in its cycle state.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        targets: np.ndarray,
+        has_target: np.ndarray,
+        minimize: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+        learning_rates: Optional[np.ndarray] = None,
+    ):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.targets = np.asarray(targets, dtype=float)
+        self.has_target = np.asarray(has_target, dtype=bool)
+        self.minimize = np.asarray(minimize, dtype=bool)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.learning_rates = (
+            np.full(len(self.names), 0.1)
+            if learning_rates is None
+            else np.asarray(learning_rates, dtype=float)
+        )
+
+    @classmethod
+    def from_config(
+        cls,
+        names: List[str],
+        targets: Dict[str, float],
+        constraints: Dict[str, Dict],
+        learning_rates: Optional[Dict[str, float]] = None,
+    ) -> "OptimizerState":
+        constraint_list = [constraints.get(name, {}) for name in names]
+        learning_rates = learning_rates or {}
+        return cls(
+            names,
+            targets=[targets.get(name, 0.0) for name in names],
+            has_target=[name in targets for name in names],
+            minimize=[c.get("minimize", False) for c in constraint_list],
+            lower=[c.get("min", 0) for c in constraint_list],
+            upper=[c.get("max", float("inf")) for c in constraint_list],
+            learning_rates=[learning_rates.get(name, 0.1) for name in names],
+        )
+
+    def step(self, current: np.ndarray, iteration: int) -> Tuple[np.ndarray, ...]:
+        """One optimization pass over every metric (see _optimize_metric)."""
+        target = np.where(self.has_target, self.targets, current)
+        learning_rates = self.learning_rates
+
+        decreased = np.maximum(
+            self.lower, current - np.abs(learning_rates * (current - target))
+        )
+        increased = np.minimum(
+            self.upper, current + np.abs(learning_rates * (target - current))
+        )
+        proposed = np.where(self.minimize, decreased, increased)
+
+        # Apply diminishing returns
+        progress_factor = 1 - (iteration / 100)  # Slower progress over time
+        return current + (proposed - current) * progress_factor, target
+
+    def score(self, values: np.ndarray) -> float:
+        """Mean closeness to target (see _calculate_optimization_score)."""
+        if not self.has_target.any():
+            return 0.0
+        values = values[self.has_target]
+        targets = self.targets[self.has_target]
+        minimize = self.minimize[self.has_target]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lower_is_better = np.where(
+                values > 0, np.minimum(1.0, targets / values), 1.0
+            )
+            higher_is_better = np.where(
+                targets > 0, np.minimum(1.0, values / targets), 1.0
+            )
+        # Summed left to right like the scalar node, so scores match exactly
+        scores = np.where(minimize, lower_is_better, higher_is_better).tolist()
+        return sum(scores) / len(scores)
+
+
+class VectorizedProcessOptimizerNode(EnterpriseProcessOptimizerNode):
+    """EnterpriseProcessOptimizerNode with one array update per iteration.
+
+    Same inputs, outputs and results; the per-metric loop becomes one
+    OptimizerState step. The scalar node's history tracking is dropped: it
+    reads ``history_{metric}`` keys that its cycle state never saves, so its
+    histories never grow past one entry, learning rates never adapt and the
+    convergence trend never fires. This node reproduces that (fixed learning
+    rates, ``convergence_status`` all False) without carrying the histories.
+    """
+
+    def run(self, context: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+        """Optimize all metrics in one vectorized step."""
+        iteration = self.get_iteration(context)
+        is_first = self.is_first_iteration(context)
+        prev_state = self.get_previous_state(context)
+
+        metrics = kwargs.get("process_metrics", {})
+        targets = kwargs.get("optimization_targets", {})
+        constraints = kwargs.get("constraints", {})
+
+        if is_first:
+            self.log_cycle_info(context, "Starting enterprise process optimization")
+            if not targets:
+                targets = {
+                    "efficiency_rate": 0.95,
+                    "cost_per_unit": 50.0,
+                    "quality_score": 0.98,
+                    "processing_time": 10.0,
+                }
+            metrics = self._initialize_metrics(targets)
+
+        learning_rates = prev_state.get("learning_rates", {})
+
+        # Preserve targets and constraints through cycles
+        if not targets and prev_state.get("targets"):
+            targets = prev_state["targets"]
+        if not constraints and prev_state.get("constraints"):
+            constraints = prev_state["constraints"]
+
+        names = list(metrics)
+        state = OptimizerState.from_config(names, targets, constraints, learning_rates)
+        current = np.fromiter(metrics.values(), dtype=float, count=len(names))
+        optimized, target = state.step(current, iteration)
+        optimization_score = state.score(optimized)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            improvement = np.where(
+                current != 0, np.abs(optimized - current) / np.abs(current), 0
+            )
+        optimized_list = optimized.tolist()
+        optimized_metrics = dict(zip(names, optimized_list))
+        optimization_actions = [
+            {
+                "metric": name,
+                "previous": previous,
+                "new": new,
+                "target": goal,
+                "improvement": gain,
+                "direction": "decrease" if minimize else "increase",
+            }
+            for name, previous, new, goal, gain, minimize in zip(
+                names,
+                current.tolist(),
+                optimized_list,
+                target.tolist(),
+                improvement.tolist(),
+                state.minimize.tolist(),
+            )
+        ]
+
+        # Business value only reads the four headline metrics
+        headline = [name for name in BUSINESS_VALUE_METRICS if name in state.index]
+        business_value = self._calculate_business_value(
+            {name: metrics[name] for name in headline},
+            {name: optimized_metrics[name] for name in headline},
+            iteration,
+        )
+
+        if iteration % 5 == 0:
+            self.log_cycle_info(
+                context,
+                f"Iteration {iteration}: Score={optimization_score:.3f}, "
+                f"Value=${business_value:,.2f}",
+            )
+
+        return {
+            "process_metrics": optimized_metrics,
+            "optimization_actions": optimization_actions,
+            "optimization_score": optimization_score,
+            "convergence_status": dict.fromkeys(names, False),
+            "business_value": business_value,
+            "iteration": iteration,
+            **self.set_cycle_state(
+                {
+                    "learning_rates": learning_rates,
+                    "total_value_generated": prev_state.get("total_value_generated", 0)
+                    + business_value,
+                    "targets": targets,
+                    "constraints": constraints,
+                }
+            ),
+        }
+
+
+class CycleStateView(Mapping):
+    """Read-only view of a CycleStateStore, as returned by get_previous_state().
+
+    Keys are materialized on first access (histories become lists, grouped
+    histories dicts of lists) and cached until the store's next commit, so a
+    node only pays for the keys it reads.
+    """
+
+    def __init__(self, store: "CycleStateStore"):
+        self._store = store
+        self._cache: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._cache:
+            self._cache[key] = self._store.materialize(key)
+        return self._cache[key]
+
+    def __iter__(self):
+        return iter(self._store.keys())
+
+    def __len__(self) -> int:
+        return len(self._store.keys())
+
+
+class CycleStateStore:
+    """
+    Cycle state recorded as per-iteration deltas.
+
+    A node stages changed keys with ``set()`` and history entries with
+    ``append()``; ``commit()`` closes the iteration's delta. Histories are
+    bounded windows (``deque(maxlen=window)``), so one iteration costs the same
+    at iteration 10 and iteration 10,000. Between iterations the store travels
+    through ``_cycle_state`` as its JSON form (``to_state()``/``from_state()``),
+    since node outputs must be JSON-serializable and the runtime does not hand
+    back the same object. ``last_delta`` is what a checkpoint needs to
+    persist; ``apply()`` replays deltas into a fresh store.
+    """
+
+    def __init__(self, window: int = 50):
+        self.window = window
+        self.iteration = -1
+        self.last_delta: Dict[str, Any] = {}
+        self._values: Dict[str, Any] = {}
+        self._histories: Dict[str, deque] = {}
+        self._grouped: Dict[str, Dict[str, deque]] = {}
+        self._pending_set: Dict[str, Any] = {}
+        self._pending_append: List[Tuple[str, Optional[str], Any]] = []
+        self._view: Optional[CycleStateView] = None
+
+    def keys(self) -> List[str]:
+        return [*self._values, *self._histories, *self._grouped]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._values.get(key, default)
+
+    def set(self, key: str, value: Any) -> None:
+        self._values[key] = value
+        self._pending_set[key] = value
+
+    def append(self, name: str, value: Any, group: Optional[str] = None) -> None:
+        """Append to history ``name`` (or to its ``group`` series)."""
+        if group is None:
+            history = self._histories.get(name)
+            if history is None:
+                history = self._histories[name] = deque(maxlen=self.window)
+        else:
+            series = self._grouped.setdefault(name, {})
+            history = series.get(group)
+            if history is None:
+                history = series[group] = deque(maxlen=self.window)
+        history.append(value)
+        self._pending_append.append((name, group, value))
+
+    def history(self, name: str, group: Optional[str] = None) -> deque:
+        """Live window of a history, including appends staged this iteration."""
+        if group is None:
+            return self._histories.get(name, deque())
+        return self._grouped.get(name, {}).get(group, deque())
+
+    def materialize(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        if key in self._histories:
+            return list(self._histories[key])
+        if key in self._grouped:
+            return {group: list(h) for group, h in self._grouped[key].items()}
+        raise KeyError(key)
+
+    def view(self) -> CycleStateView:
+        if self._view is None:
+            self._view = CycleStateView(self)
+        return self._view
+
+    def commit(self, iteration: int) -> Dict[str, Any]:
+        """Close this iteration's delta and return it."""
+        self.iteration = iteration
+        self.last_delta = {
+            "iteration": iteration,
+            "set": self._pending_set,
+            "append": self._pending_append,
+        }
+        self._pending_set, self._pending_append = {}, []
+        self._view = None
+        return self.last_delta
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable form: the bounded windows plus the last delta."""
+        return {
+            "window": self.window,
+            "iteration": self.iteration,
+            "values": dict(self._values),
+            "histories": {name: list(h) for name, h in self._histories.items()},
+            "grouped": {
+                name: {group: list(h) for group, h in series.items()}
+                for name, series in self._grouped.items()
+            },
+            "last_delta": self.last_delta,
+        }
+
+    @classmethod
+    def from_state(cls, data: Dict[str, Any], window: int = 50) -> "CycleStateStore":
+        """Rebuild a store from ``to_state()`` output (empty for any other state)."""
+        if "histories" not in data:
+            return cls(window=window)
+        store = cls(window=data["window"])
+        store.iteration = data["iteration"]
+        store.last_delta = data["last_delta"]
+        store._values = dict(data["values"])
+        store._histories = {
+            name: deque(values, maxlen=store.window)
+            for name, values in data["histories"].items()
+        }
+        store._grouped = {
+            name: {
+                group: deque(values, maxlen=store.window)
+                for group, values in series.items()
+            }
+            for name, series in data["grouped"].items()
+        }
+        return store
+
+    def apply(self, delta: Dict[str, Any]) -> None:
+        """Replay a delta produced by ``commit()``."""
+        for key, value in delta["set"].items():
+            self.set(key, value)
+        for name, group, value in delta["append"]:
+            self.append(name, value, group=group)
+        self.commit(delta["iteration"])
+
+
+class DeltaCycleStateMixin:
+    """CycleAwareNode mixin that keeps its cycle state in a CycleStateStore.
+
+    ``get_previous_state()`` returns the store's lazy view, so the base-class
+    helpers (``detect_convergence_trend`` and friends) keep working.
+    """
+
+    state_window = 50
+
+    def state_store(self, context: Dict[str, Any]) -> CycleStateStore:
+        node_state = self.get_cycle_info(context).get("node_state") or {}
+        return CycleStateStore.from_state(node_state, window=self.state_window)
+
+    def get_previous_state(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        return self.state_store(context).view()
+
+    def commit_cycle_state(
+        self, context: Dict[str, Any], store: CycleStateStore
+    ) -> Dict[str, Any]:
+        """Close the iteration's delta; return from run() like set_cycle_state()."""
+        store.commit(self.get_iteration(context))
+        return self.set_cycle_state(store.to_state())
+
+
+class IntelligentConvergenceAnalyzerNode(DeltaCycleStateMixin, CycleAwareNode):
     """Analyzes convergence with ML-powered predictions."""
 
+    state_window = 20  # Score history length
+
     def get_parameters(self) -> Dict[str, Any]:
         """Define parameters for convergence analysis."""
         from kailash.nodes.base import NodeParameter
@@ -362,7 +762,7 @@ class IntelligentConvergenceAnalyzerNode(CycleAwareNode):
     def run(self, context: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """Analyze convergence with predictive capabilities."""
         iteration = self.get_iteration(context)
-        prev_state = self.get_previous_state(context)
+        store = self.state_store(context)
 
         # Get inputs
         metrics = kwargs.get("process_metrics", {})
@@ -370,9 +770,8 @@ class IntelligentConvergenceAnalyzerNode(CycleAwareNode):
         convergence_status = kwargs.get("convergence_status", {})
 
         # Track score history
-        score_history = self.accumulate_values(
-            context, "score_history", score, max_history=20
-        )
+        store.append("score_history", score)
+        score_history = list(store.history("score_history"))
 
         # Predict iterations to convergence
         predicted_iterations = self._predict_iterations_to_convergence(
@@ -422,7 +821,7 @@ class IntelligentConvergenceAnalyzerNode(CycleAwareNode):
                 "metric_convergence": convergence_status,
                 "insights": insights,
             },
-            **self.set_cycle_state({"score_history": score_history}),
+            **self.commit_cycle_state(context, store),
         }
 
     def _predict_iterations_to_convergence(
@@ -510,9 +909,11 @@ class IntelligentConvergenceAnalyzerNode(CycleAwareNode):
         return min(0.99, confidence)
 
 
-class DistributedAgentCoordinatorNode(CycleAwareNode):
+class DistributedAgentCoordinatorNode(DeltaCycleStateMixin, CycleAwareNode):
     """Coordinates distributed agents with cycle-aware learning."""
 
+    state_window = 20  # Performance scores kept per agent
+
     def get_parameters(self) -> Dict[str, Any]:
         """Define parameters for agent coordination."""
         from kailash.nodes.base import NodeParameter
@@ -529,6 +930,7 @@ class DistributedAgentCoordinatorNode(CycleAwareNode):
     def run(self, context: Dict[str, Any], **kwargs) -> Dict[str, Any]:
         """Coordinate agents with performance-based task assignment."""
         iteration = self.get_iteration(context)
+        store = self.state_store(context)
         prev_state = self.get_previous_state(context)
 
         # Get parameters
@@ -542,7 +944,7 @@ class DistributedAgentCoordinatorNode(CycleAwareNode):
                 context, f"Initialized {len(agents)} optimization agents"
             )
 
-        # Get agent performance history
+        # Get agent performance history (last state_window scores per agent)
         agent_performance = prev_state.get("agent_performance", {})
 
         # Generate optimization tasks if not provided
@@ -564,9 +966,12 @@ class DistributedAgentCoordinatorNode(CycleAwareNode):
 
             # Update agent performance
             agent_id = assignment["agent_id"]
-            if agent_id not in agent_performance:
-                agent_performance[agent_id] = []
-            agent_performance[agent_id].append(result["performance_score"])
+            agent_performance.setdefault(agent_id, []).append(
+                result["performance_score"]
+            )
+            store.append(
+                "agent_performance", result["performance_score"], group=agent_id
+            )
 
         # Calculate coordination metrics
         coordination_metrics = self._calculate_coordination_metrics(
@@ -575,6 +980,10 @@ class DistributedAgentCoordinatorNode(CycleAwareNode):
 
         # Generate optimization tasks from results
         new_tasks = self._generate_tasks_from_results(execution_results)
+        store.set(
+            "total_tasks_completed",
+            store.get("total_tasks_completed", 0) + len(execution_results),
+        )
 
         return {
             "optimization_tasks": new_tasks,
@@ -582,13 +991,7 @@ class DistributedAgentCoordinatorNode(CycleAwareNode):
             "execution_results": execution_results,
             "coordination_metrics": coordination_metrics,
             "active_agents": len(agents),
-            **self.set_cycle_state(
-                {
-                    "agent_performance": agent_performance,
-                    "total_tasks_completed": prev_state.get("total_tasks_completed", 0)
-                    + len(execution_results),
-                }
-            ),
+            **self.commit_cycle_state(context, store),
         }
 
     def _initialize_agents(self) -> List[Dict[str, Any]]:
@@ -835,6 +1238,13 @@ class DistributedAgentCoordinatorNode(CycleAwareNode):
         return tasks
 
 
+def create_process_optimizer() -> EnterpriseProcessOptimizerNode:
+    """Vectorized optimizer unless PROCESS_OPTIMIZER=scalar."""
+    if os.getenv("PROCESS_OPTIMIZER", "vectorized") == "scalar":
+        return EnterpriseProcessOptimizerNode(name="process_optimizer")
+    return VectorizedProcessOptimizerNode(name="process_optimizer")
+
+
 def create_cyclic_workflow_with_packager() -> Workflow:
     """Create a working cyclic workflow with proper parameter passing."""
 
@@ -845,7 +1255,7 @@ def create_cyclic_workflow_with_packager() -> Workflow:
     )
 
     # Process optimizer node
-    optimizer = EnterpriseProcessOptimizerNode(name="process_optimizer")
+    optimizer = create_process_optimizer()
 
     # Convergence analyzer
     analyzer = IntelligentConvergenceAnalyzerNode(name="convergence_analyzer")
@@ -1021,7 +1431,7 @@ def create_enterprise_cycle_aware_workflow() -> Workflow:
     )
 
     # Initialize nodes
-    process_optimizer = EnterpriseProcessOptimizerNode(name="process_optimizer")
+    process_optimizer = create_process_optimizer()
     convergence_analyzer = IntelligentConvergenceAnalyzerNode(
         name="convergence_analyzer"
     )
@@ -1425,7 +1835,184 @@ def run_enterprise_example():
     return workflow, results
 
 
+def run_optimizer_benchmark(num_metrics: int = 200, iterations: int = 1000):
+    """Iterations/sec of the scalar and vectorized optimizer nodes.
+
+    Drives each node through execute(), as the cyclic runtime does, so
+    output validation (JSON-serializable cycle state) is part of every
+    iteration; the returned process metrics and cycle state are fed into
+    the next one. Time spent inside the node's own run() is reported
+    separately from Node.execute()'s validation overhead, and every
+    iteration's outputs are checked to be identical across the two nodes.
+    """
+    kinds = [
+        ("efficiency_rate", 0.95, {"min": 0.5, "max": 1.0}),
+        ("cost_per_unit", 50.0, {"min": 10, "minimize": True}),
+        ("quality_score", 0.98, {"min": 0.8, "max": 1.0}),
+        ("processing_time", 10.0, {"min": 5, "minimize": True}),
+    ]
+    targets, constraints = {}, {}
+    for i in range(num_metrics):
+        name, target, constraint = kinds[i % len(kinds)]
+        name = name if i < len(kinds) else f"{name}_{i // len(kinds)}"
+        targets[name] = target * random.uniform(0.9, 1.1)
+        constraints[name] = constraint
+
+    print("=" * 70)
+    print(f"Process optimizer: {num_metrics} metrics x {iterations:,} iterations")
+    print("=" * 70)
+
+    results, outputs = {}, {}
+    for label, node_class in [
+        ("scalar", EnterpriseProcessOptimizerNode),
+        ("vectorized", VectorizedProcessOptimizerNode),
+    ]:
+        node = node_class(name=f"{label}_optimizer")
+        node.log_cycle_info = lambda context, message="": None  # Keep output readable
+        run_seconds = [0.0]
+
+        def timed_run(*args, _run=node.run, **kwargs):
+            started = time.perf_counter()
+            try:
+                return _run(*args, **kwargs)
+            finally:
+                run_seconds[0] += time.perf_counter() - started
+
+        node.run = timed_run
+        random.seed(7)
+        node_state, metrics, trace = {}, {}, []
+        start = time.perf_counter()
+        for iteration in range(iterations):
+            context = {
+                "cycle": {
+                    "iteration": iteration,
+                    "node_state": node_state,
+                    "max_iterations": iterations,
+                }
+            }
+            result = node.execute(
+                context=context,
+                process_metrics=metrics,
+                optimization_targets=targets,
+                constraints=constraints,
+            )
+            metrics = result["process_metrics"]
+            node_state = result["_cycle_state"]
+            trace.append({k: v for k, v in result.items() if k != "_cycle_state"})
+        seconds = time.perf_counter() - start
+        results[label] = (seconds, run_seconds[0], result["optimization_score"])
+        outputs[label] = trace
+        print(
+            f"  {label:<11} {iterations / seconds:10,.1f} iterations/sec "
+            f"({seconds * 1000 / iterations:.3f} ms/iteration, "
+            f"run() {run_seconds[0] * 1000 / iterations:.3f} ms), "
+            f"final score {result['optimization_score']:.3f}"
+        )
+
+    speedup = results["scalar"][1] / results["vectorized"][1]
+    overall = results["scalar"][0] / results["vectorized"][0]
+    print(f"⚡ Vectorized speedup: {speedup:.1f}x in run(), {overall:.1f}x end to end")
+    mismatches = [
+        i
+        for i, (scalar, vectorized) in enumerate(
+            zip(outputs["scalar"], outputs["vectorized"])
+        )
+        if scalar != vectorized
+    ]
+    if mismatches:
+        print(f"✗ Outputs differ from iteration {mismatches[0]} ({len(mismatches)})")
+    else:
+        print(f"✓ Outputs identical for all {iterations:,} iterations")
+    return results
+
+
+def run_cycle_state_benchmark(iterations: int = 10000):
+    """Per-iteration cost of DistributedAgentCoordinatorNode's cycle state.
+
+    Drives the node through execute(), as the cyclic runtime does (so the
+    returned state must pass output validation), and at sample points
+    compares the bounded state and its delta with a checkpoint of the
+    full-history state the node used to return.
+    """
+    node = DistributedAgentCoordinatorNode(name="agent_coordinator")
+    node.log_cycle_info = lambda context, message="": None  # Keep output readable
+    random.seed(7)
+
+    samples = [10, 100, 1000, 10000, 100000]
+    samples = [s for s in samples if s <= iterations]
+    full_history: Dict[str, List[float]] = {}  # What set_cycle_state used to carry
+    node_state = {}
+
+    print("=" * 70)
+    print(f"Agent coordinator cycle state: {iterations:,} iterations")
+    print("=" * 70)
+    print(
+        f"  {'iteration':>9}  {'ms/it':>7}  {'state bytes':>11}  "
+        f"{'delta bytes':>11}  {'full-state ms':>13}  {'full-state bytes':>16}"
+    )
+    rows = []
+    timings: List[float] = []
+    for iteration in range(1, iterations + 1):
+        context = {
+            "cycle": {
+                "iteration": iteration - 1,
+                "node_state": node_state,
+                "max_iterations": iterations,
+            }
+        }
+        start = time.perf_counter()
+        # Fresh agent availability each iteration, so every iteration assigns work
+        result = node.execute(
+            context=context,
+            optimization_tasks=[],
+            available_agents=node._initialize_agents(),
+        )
+        node_state = result["_cycle_state"]
+        timings.append(time.perf_counter() - start)
+
+        for execution in result["execution_results"]:
+            full_history.setdefault(execution["agent_id"], []).append(
+                execution["performance_score"]
+            )
+
+        if iteration in samples:
+            # Median of the last ten iterations, so one GC pause does not skew it
+            recent = sorted(timings[-10:])
+            start = time.perf_counter()
+            full_bytes = len(
+                json.dumps(
+                    {
+                        "agent_performance": full_history,
+                        "total_tasks_completed": node_state["values"].get(
+                            "total_tasks_completed"
+                        ),
+                    }
+                )
+            )
+            full_ms = (time.perf_counter() - start) * 1000
+            rows.append((iteration, recent[len(recent) // 2] * 1000))
+            state_bytes = len(json.dumps(node_state))
+            delta_bytes = len(json.dumps(node_state["last_delta"]))
+            print(
+                f"  {iteration:>9,}  {rows[-1][1]:>7.3f}  {state_bytes:>11,}  "
+                f"{delta_bytes:>11,}  {full_ms:>13.3f}  {full_bytes:>16,}"
+            )
+
+    growth = rows[-1][1] / rows[0][1]
+    print(
+        f"📈 Bounded-state iteration cost at {rows[-1][0]:,} vs {rows[0][0]:,}: "
+        f"{growth:.2f}x"
+    )
+    return rows
+
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_optimizer_benchmark(*(int(arg) for arg in sys.argv[2:4]))
+        sys.exit(0)
+    if len(sys.argv) > 1 and sys.argv[1] == "state-benchmark":
+        run_cycle_state_benchmark(*(int(arg) for arg in sys.argv[2:3]))
+        sys.exit(0)
     try:
         workflow, results = run_enterprise_example()
         logger.info(
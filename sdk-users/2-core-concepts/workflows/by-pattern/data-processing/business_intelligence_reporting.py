@@ -32,7 +32,7 @@ import logging
 import random
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -52,6 +52,7 @@ from kailash.nodes.code.python import PythonCodeNode
 from kailash.nodes.data.writers import CSVWriterNode, JSONWriterNode
 from kailash.runtime.local import LocalRuntime
 from kailash.workflow.graph import Workflow
+from node_cache import NodeResultCache, cache_from_env
 
 from examples.utils.paths import get_data_dir
 
@@ -62,7 +63,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_business_data_generator():
+def create_business_data_generator(cache: Optional[NodeResultCache] = None):
     """Create a node that generates comprehensive business data for BI analysis."""
 
     def generate_business_metrics(
@@ -94,11 +95,11 @@ def create_business_data_generator():
 
         business_data = []
 
-        for date in dates:
+        for day in dates:
             for dept in departments:
                 # Base metrics with realistic trends
                 month_factor = 1 + 0.1 * np.sin(
-                    2 * np.pi * date.month / 12
+                    2 * np.pi * day.month / 12
                 )  # Seasonal pattern
 
                 if dept == "Sales":
@@ -141,7 +142,7 @@ def create_business_data_generator():
                 )
 
                 record = {
-                    "report_date": date.strftime("%Y-%m-%d"),
+                    "report_date": day.strftime("%Y-%m-%d"),
                     "department": dept,
                     "revenue": float(round(revenue, 2)),
                     "leads_generated": int(leads),
@@ -152,9 +153,9 @@ def create_business_data_generator():
                     ),
                     "total_acquisition_cost": float(round(total_acquisition_cost, 2)),
                     "roi": float(round(roi, 4)),
-                    "month_name": date.strftime("%B"),
-                    "quarter": f"Q{(date.month-1)//3 + 1}",
-                    "year": int(date.year),
+                    "month_name": day.strftime("%B"),
+                    "quarter": f"Q{(day.month-1)//3 + 1}",
+                    "year": int(day.year),
                 }
                 business_data.append(record)
 
@@ -181,14 +182,19 @@ def create_business_data_generator():
             "data_generation_timestamp": datetime.now().isoformat(),
         }
 
+    func = generate_business_metrics
+    if cache is not None:
+        # Metrics come from the unseeded random module: snapshot per day
+        func = cache.wrap(func, salt=date.today().isoformat())
+
     return PythonCodeNode.from_function(
-        func=generate_business_metrics,
+        func=func,
         name="business_data_generator",
         description="Generate comprehensive business data for BI analysis",
     )
 
 
-def create_kpi_calculator():
+def create_kpi_calculator(cache: Optional[NodeResultCache] = None):
     """Create a node that calculates executive KPIs and performance metrics."""
 
     def calculate_executive_kpis(business_data: List[Dict]) -> Dict[str, Any]:
@@ -350,8 +356,13 @@ def create_kpi_calculator():
             "data_period": f"{df['report_date'].min().strftime('%Y-%m-%d')} to {df['report_date'].max().strftime('%Y-%m-%d')}",
         }
 
+    func = calculate_executive_kpis
+    if cache is not None:
+        # calculation_timestamp is stamped from datetime.now()
+        func = cache.wrap(func, salt=date.today().isoformat())
+
     return PythonCodeNode.from_function(
-        func=calculate_executive_kpis,
+        func=func,
         name="kpi_calculator",
         description="Calculate executive KPIs and performance metrics",
     )
@@ -722,9 +733,12 @@ def main():
         }
     )
 
+    # Opt-in result cache (NODE_CACHE=1) lets nightly reruns skip upstream stages
+    cache = cache_from_env(data_dir / "node_cache")
+
     # Create nodes
-    data_generator = create_business_data_generator()
-    kpi_calculator = create_kpi_calculator()
+    data_generator = create_business_data_generator(cache)
+    kpi_calculator = create_kpi_calculator(cache)
     exception_detector = create_exception_detector()
     report_generator = create_report_generator()
 
@@ -944,6 +958,16 @@ def main():
         print(f"✗ Workflow execution failed: {e}")
         return 1
 
+    if cache is not None:
+        cache.flush()
+        stats = cache.stats()
+        print("\n🗄️  Node Result Cache:")
+        print(
+            f"  • Hits: {stats['hits']} ({stats['disk_hits']} from disk), "
+            f"Misses: {stats['misses']}, Evictions: {stats['evictions']}"
+        )
+        print(f"  • Hit Rate: {stats['hit_rate']:.1%}")
+
     print("\n🎉 Business Intelligence & Reporting completed!")
     print("📊 This workflow demonstrates:")
     print("  • Executive KPI calculation and trend analysis")
@@ -32,9 +32,9 @@ import logging
 import random
 import sys
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -53,6 +53,7 @@ from kailash.nodes.data.readers import CSVReaderNode
 from kailash.nodes.data.writers import CSVWriterNode, JSONWriterNode
 from kailash.runtime.local import LocalRuntime
 from kailash.workflow.graph import Workflow
+from node_cache import NodeResultCache, cache_from_env
 
 from examples.utils.paths import get_data_dir
 
@@ -63,7 +64,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_business_data_generator():
+def create_business_data_generator(cache: Optional[NodeResultCache] = None):
     """Create realistic customer data for demonstration."""
 
     def generate_customer_data(record_count: int = 500) -> Dict[str, Any]:
@@ -214,14 +215,19 @@ def create_business_data_generator():
 
         return {"customers": customers}
 
+    func = generate_customer_data
+    if cache is not None:
+        # Injected anomalies use the unseeded random module: snapshot per day
+        func = cache.wrap(func, salt=date.today().isoformat())
+
     return PythonCodeNode.from_function(
-        func=generate_customer_data,
+        func=func,
         name="business_data_generator",
         description="Generates realistic customer data with business patterns",
     )
 
 
-def create_advanced_data_cleaner():
+def create_advanced_data_cleaner(cache: Optional[NodeResultCache] = None):
     """Create advanced data cleaning with business rule validation."""
 
     def clean_customer_data(customers: List[Dict]) -> Dict[str, Any]:
@@ -378,14 +384,18 @@ def create_advanced_data_cleaner():
             "cleaning_report": cleaning_report,
         }
 
+    func = clean_customer_data
+    if cache is not None:
+        func = cache.wrap(func)
+
     return PythonCodeNode.from_function(
-        func=clean_customer_data,
+        func=func,
         name="advanced_data_cleaner",
         description="Advanced data cleaning with business rule validation",
     )
 
 
-def create_customer_feature_engineer():
+def create_customer_feature_engineer(cache: Optional[NodeResultCache] = None):
     """Create advanced feature engineering for customer analytics."""
 
     def engineer_customer_features(cleaned_customers: List[Dict]) -> Dict[str, Any]:
@@ -594,14 +604,19 @@ def create_customer_feature_engineer():
             "feature_summary": feature_summary,
         }
 
+    func = engineer_customer_features
+    if cache is not None:
+        # Recency and tenure features are relative to datetime.now()
+        func = cache.wrap(func, salt=date.today().isoformat())
+
     return PythonCodeNode.from_function(
-        func=engineer_customer_features,
+        func=func,
         name="customer_feature_engineer",
         description="Engineer advanced features for customer analytics",
     )
 
 
-def create_business_intelligence_aggregator():
+def create_business_intelligence_aggregator(cache: Optional[NodeResultCache] = None):
     """Create business intelligence aggregations."""
 
     def create_business_aggregations(enriched_customers: List[Dict]) -> Dict[str, Any]:
@@ -709,8 +724,12 @@ def create_business_intelligence_aggregator():
 
         return {"business_aggregations": aggregations}
 
+    func = create_business_aggregations
+    if cache is not None:
+        func = cache.wrap(func)
+
     return PythonCodeNode.from_function(
-        func=create_business_aggregations,
+        func=func,
         name="business_intelligence_aggregator",
         description="Create comprehensive business intelligence aggregations",
     )
@@ -925,11 +944,14 @@ def main():
     # Create nodes for comprehensive data transformation
     print("🔧 Creating transformation nodes...")
 
+    # Opt-in result cache (NODE_CACHE=1) lets reruns skip unchanged stages
+    cache = cache_from_env(output_dir / "node_cache")
+
     # Data generation and processing nodes
-    data_generator = create_business_data_generator()
-    data_cleaner = create_advanced_data_cleaner()
-    feature_engineer = create_customer_feature_engineer()
-    bi_aggregator = create_business_intelligence_aggregator()
+    data_generator = create_business_data_generator(cache)
+    data_cleaner = create_advanced_data_cleaner(cache)
+    feature_engineer = create_customer_feature_engineer(cache)
+    bi_aggregator = create_business_intelligence_aggregator(cache)
     quality_monitor = create_data_quality_monitor()
 
     # Add nodes to workflow
@@ -1088,6 +1110,16 @@ def main():
             print(f"✗ Scenario execution failed: {e}")
             print(f"  Error Type: {type(e).__name__}")
 
+    if cache is not None:
+        cache.flush()
+        stats = cache.stats()
+        print("\n🗄️  Node Result Cache:")
+        print(
+            f"  • Hits: {stats['hits']} ({stats['disk_hits']} from disk), "
+            f"Misses: {stats['misses']}, Evictions: {stats['evictions']}"
+        )
+        print(f"  • Hit Rate: {stats['hit_rate']:.1%}")
+
     print("\n🎉 Customer Analytics Data Transformation completed!")
     print("📊 This workflow demonstrates production-ready patterns for:")
     print("  • Advanced data cleaning with business rule validation")
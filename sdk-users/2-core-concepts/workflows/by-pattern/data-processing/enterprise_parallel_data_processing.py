@@ -33,19 +33,49 @@ Use Cases:
 - Marketing analytics: Campaign performance analysis with attribution modeling
 - Operations intelligence: Real-time monitoring with predictive maintenance
 - Risk management: Multi-source risk data aggregation with scenario analysis
+
+Process-pool execution:
+    python enterprise_parallel_data_processing.py parallel [records_per_stream] [workers]
+    python enterprise_parallel_data_processing.py benchmark [total_records] [max_workers]
+
+``parallel`` runs the workflow's pipeline outside the Kailash runtime: the
+independent source -> processor branches run in a ProcessPoolExecutor and
+exchange records as shared-memory columns, then the filter, enrichment and
+aggregation stages run on their output in the parent process, wired as in the
+workflow. ``benchmark`` times the processor stage alone, reporting scaling of
+process_enterprise_data from 1 to N workers (default 1M records). The
+process-pool and columnar machinery lives in enterprise_batches.py.
+
+Columnar records:
+    ENTERPRISE_RECORD_FORMAT=columnar python enterprise_parallel_data_processing.py
+    python enterprise_parallel_data_processing.py columnar [records_per_stream]
+
+With ENTERPRISE_RECORD_FORMAT=columnar each node works on a RecordBatch (one
+NumPy array per field, categorical codes for strings) instead of a list of
+dicts; ``batch[i]`` still reads like the record dict. Between nodes a batch
+travels as its JSON-serializable ``to_dict()`` form (one list per column).
+The columnar benchmark reports time and memory per stage for both formats
+(default 20k per stream), counting each stage's from_dict/to_dict. Generation,
+processing and enrichment come out well ahead; filter and aggregator re-encode
+their row selections and end up slightly slower, with more memory kept, than
+the list-of-dicts path, which shares record dicts between stages.
 """
 
 import asyncio
 import json
 import logging
+import os
 import random
 import sys
 import time
+import tracemalloc
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent.parent.parent.parent
 sys.path.insert(0, str(project_root / "src"))
@@ -55,6 +85,29 @@ sys.path.insert(0, str(project_root))
 examples_dir = project_root / "examples"
 sys.path.insert(0, str(examples_dir))
 
+from enterprise_batches import (
+    ParallelStreamExecutor,
+    aggregate_enterprise_batches,
+    batch_from_dict,
+    batches_from_dict,
+    batches_to_dict,
+    calculate_competitive_advantage,
+    calculate_growth_potential,
+    calculate_market_position,
+    calculate_opportunity_score,
+    calculate_risk_score,
+    calculate_roi_estimate,
+    calculate_trend_indicator,
+    encode_enterprise_records,
+    enrich_enterprise_batches,
+    filter_enterprise_batch,
+    generate_enterprise_batch,
+    model_scenarios,
+    process_enterprise_batch,
+    recommendations_from_counts,
+    summarize_enterprise_batch,
+    trace_data_lineage,
+)
 from kailash.nodes.code.python import PythonCodeNode
 from kailash.nodes.data.writers import JSONWriterNode
 from kailash.nodes.logic.operations import MergeNode, SwitchNode
@@ -70,11 +123,98 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def generate_enterprise_records(
+    source_name: str, source_config: Dict[str, Any], data_size: int
+) -> List[Dict[str, Any]]:
+    """Generate realistic enterprise records for one source system."""
+    domains = source_config.get(
+        "domains",
+        ["finance", "sales", "operations", "marketing", "customer_service"],
+    )
+    regions = source_config.get(
+        "regions",
+        ["North America", "Europe", "Asia Pacific", "Latin America", "EMEA"],
+    )
+    priorities = source_config.get("priorities", ["critical", "high", "medium", "low"])
+
+    enterprise_data = []
+    base_timestamp = datetime.now()
+
+    for i in range(data_size):
+        # Create realistic business record
+        record_timestamp = base_timestamp - timedelta(
+            days=random.randint(0, 365),
+            hours=random.randint(0, 23),
+            minutes=random.randint(0, 59),
+        )
+
+        business_record = {
+            "record_id": f"{source_name}_{i:06d}",
+            "source_system": source_name,
+            "timestamp": record_timestamp.isoformat(),
+            "domain": random.choice(domains),
+            "region": random.choice(regions),
+            "priority": random.choice(priorities),
+            "business_value": round(random.uniform(1000, 1000000), 2),
+            "volume": random.randint(1, 10000),
+            "performance_score": round(random.uniform(0.1, 1.0), 3),
+            "metadata": {
+                "created_by": f"system_{source_name}",
+                "version": "2.1.0",
+                "compliance_status": random.choice(
+                    ["compliant", "pending_review", "approved"]
+                ),
+                "data_quality_score": round(random.uniform(0.7, 1.0), 2),
+            },
+        }
+
+        # Add domain-specific fields
+        if business_record["domain"] == "finance":
+            business_record["financial_metrics"] = {
+                "revenue": round(random.uniform(10000, 500000), 2),
+                "cost": round(random.uniform(5000, 200000), 2),
+                "profit_margin": round(random.uniform(0.05, 0.30), 3),
+                "currency": random.choice(["USD", "EUR", "GBP", "JPY", "CAD"]),
+            }
+        elif business_record["domain"] == "sales":
+            business_record["sales_metrics"] = {
+                "deals_closed": random.randint(1, 50),
+                "conversion_rate": round(random.uniform(0.05, 0.40), 3),
+                "deal_size": round(random.uniform(1000, 100000), 2),
+                "sales_rep_id": f"rep_{random.randint(1, 100):03d}",
+            }
+        elif business_record["domain"] == "operations":
+            business_record["operational_metrics"] = {
+                "efficiency_score": round(random.uniform(0.6, 0.98), 3),
+                "downtime_minutes": random.randint(0, 120),
+                "throughput": random.randint(100, 5000),
+                "resource_utilization": round(random.uniform(0.4, 0.95), 3),
+            }
+
+        enterprise_data.append(business_record)
+
+    return enterprise_data
+
+
 def create_enterprise_data_source(
-    source_name: str, data_characteristics: Dict[str, Any]
+    source_name: str, data_characteristics: Dict[str, Any], columnar: bool = False
 ) -> PythonCodeNode:
     """Create enterprise data source with realistic business data generation."""
 
+    def generate_enterprise_columns(
+        data_size: int = 1000, source_config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Generate enterprise data as a columnar batch (RecordBatch.to_dict)."""
+        if source_config is None:
+            source_config = data_characteristics
+        batch = generate_enterprise_batch(source_name, source_config, data_size)
+        return {
+            "enterprise_data": batch.to_dict(),
+            "source_analytics": summarize_enterprise_batch(
+                batch, source_name, source_config
+            ),
+        }
+
     def generate_enterprise_data(
         data_size: int = 1000, source_config: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -97,61 +237,9 @@ def create_enterprise_data_source(
         )
 
         # Generate enterprise records
-        enterprise_data = []
-        base_timestamp = datetime.now()
-
-        for i in range(data_size):
-            # Create realistic business record
-            record_timestamp = base_timestamp - timedelta(
-                days=random.randint(0, 365),
-                hours=random.randint(0, 23),
-                minutes=random.randint(0, 59),
-            )
-
-            business_record = {
-                "record_id": f"{source_name}_{i:06d}",
-                "source_system": source_name,
-                "timestamp": record_timestamp.isoformat(),
-                "domain": random.choice(domains),
-                "region": random.choice(regions),
-                "priority": random.choice(priorities),
-                "business_value": round(random.uniform(1000, 1000000), 2),
-                "volume": random.randint(1, 10000),
-                "performance_score": round(random.uniform(0.1, 1.0), 3),
-                "metadata": {
-                    "created_by": f"system_{source_name}",
-                    "version": "2.1.0",
-                    "compliance_status": random.choice(
-                        ["compliant", "pending_review", "approved"]
-                    ),
-                    "data_quality_score": round(random.uniform(0.7, 1.0), 2),
-                },
-            }
-
-            # Add domain-specific fields
-            if business_record["domain"] == "finance":
-                business_record["financial_metrics"] = {
-                    "revenue": round(random.uniform(10000, 500000), 2),
-                    "cost": round(random.uniform(5000, 200000), 2),
-                    "profit_margin": round(random.uniform(0.05, 0.30), 3),
-                    "currency": random.choice(["USD", "EUR", "GBP", "JPY", "CAD"]),
-                }
-            elif business_record["domain"] == "sales":
-                business_record["sales_metrics"] = {
-                    "deals_closed": random.randint(1, 50),
-                    "conversion_rate": round(random.uniform(0.05, 0.40), 3),
-                    "deal_size": round(random.uniform(1000, 100000), 2),
-                    "sales_rep_id": f"rep_{random.randint(1, 100):03d}",
-                }
-            elif business_record["domain"] == "operations":
-                business_record["operational_metrics"] = {
-                    "efficiency_score": round(random.uniform(0.6, 0.98), 3),
-                    "downtime_minutes": random.randint(0, 120),
-                    "throughput": random.randint(100, 5000),
-                    "resource_utilization": round(random.uniform(0.4, 0.95), 3),
-                }
-
-            enterprise_data.append(business_record)
+        enterprise_data = generate_enterprise_records(
+            source_name, source_config, data_size
+        )
 
         # Source metadata with business intelligence
         source_analytics = {
@@ -203,7 +291,7 @@ def create_enterprise_data_source(
         }
 
     node = PythonCodeNode.from_function(
-        func=generate_enterprise_data,
+        func=generate_enterprise_columns if columnar else generate_enterprise_data,
         name=f"{source_name}_data_source",
         description=f"Enterprise data source for {source_name} with business intelligence",
     )
@@ -214,279 +302,185 @@ def create_enterprise_data_source(
     return node
 
 
-def create_advanced_data_processor(processor_name: str) -> PythonCodeNode:
-    """Create advanced data processor with machine learning capabilities."""
+def process_enterprise_records(
+    enterprise_data: List[Dict[str, Any]], processor_name: str
+) -> Dict[str, Any]:
+    """Advanced data processing with machine learning and statistical analysis."""
+    if not enterprise_data:
+        return {"processed_data": [], "processing_analytics": {}}
+
+    processing_start = time.time()
+    processed_records = []
+    anomalies = []
+
+    # Calculate baseline statistics for anomaly detection
+    business_values = [r["business_value"] for r in enterprise_data]
+    performance_scores = [r["performance_score"] for r in enterprise_data]
+
+    avg_business_value = sum(business_values) / len(business_values)
+    std_business_value = (
+        sum((x - avg_business_value) ** 2 for x in business_values)
+        / len(business_values)
+    ) ** 0.5
+
+    avg_performance = sum(performance_scores) / len(performance_scores)
+    std_performance = (
+        sum((x - avg_performance) ** 2 for x in performance_scores)
+        / len(performance_scores)
+    ) ** 0.5
+
+    for record in enterprise_data:
+        # Create enhanced record with advanced analytics
+        enhanced_record = record.copy()
+
+        # Machine learning features
+        enhanced_record["ml_features"] = {
+            "normalized_business_value": (
+                (record["business_value"] - avg_business_value) / std_business_value
+                if std_business_value > 0
+                else 0
+            ),
+            "normalized_performance": (
+                (record["performance_score"] - avg_performance) / std_performance
+                if std_performance > 0
+                else 0
+            ),
+            "risk_score": calculate_risk_score(record),
+            "opportunity_score": calculate_opportunity_score(record),
+            "trend_indicator": calculate_trend_indicator(record),
+        }
 
-    def process_enterprise_data(
-        enterprise_data: List[Dict[str, Any]],
-    ) -> Dict[str, Any]:
-        """Advanced data processing with machine learning and statistical analysis."""
+        # Advanced business calculations
+        enhanced_record["advanced_metrics"] = {
+            "roi_estimate": calculate_roi_estimate(record),
+            "growth_potential": calculate_growth_potential(record),
+            "market_position": calculate_market_position(record),
+            "competitive_advantage": calculate_competitive_advantage(record),
+        }
 
-        if not enterprise_data:
-            return {"processed_data": [], "processing_analytics": {}}
-
-        processing_start = time.time()
-        processed_records = []
-        anomalies = []
-
-        # Calculate baseline statistics for anomaly detection
-        business_values = [r["business_value"] for r in enterprise_data]
-        performance_scores = [r["performance_score"] for r in enterprise_data]
-
-        avg_business_value = sum(business_values) / len(business_values)
-        std_business_value = (
-            sum((x - avg_business_value) ** 2 for x in business_values)
-            / len(business_values)
-        ) ** 0.5
-
-        avg_performance = sum(performance_scores) / len(performance_scores)
-        std_performance = (
-            sum((x - avg_performance) ** 2 for x in performance_scores)
-            / len(performance_scores)
-        ) ** 0.5
-
-        for record in enterprise_data:
-            # Create enhanced record with advanced analytics
-            enhanced_record = record.copy()
-
-            # Machine learning features
-            enhanced_record["ml_features"] = {
-                "normalized_business_value": (
-                    (record["business_value"] - avg_business_value) / std_business_value
-                    if std_business_value > 0
-                    else 0
+        # Anomaly detection
+        if abs(enhanced_record["ml_features"]["normalized_business_value"]) > 2.5:
+            anomaly = {
+                "record_id": record["record_id"],
+                "anomaly_type": "business_value_outlier",
+                "severity": (
+                    "high"
+                    if abs(enhanced_record["ml_features"]["normalized_business_value"])
+                    > 3.0
+                    else "medium"
                 ),
-                "normalized_performance": (
-                    (record["performance_score"] - avg_performance) / std_performance
-                    if std_performance > 0
-                    else 0
-                ),
-                "risk_score": calculate_risk_score(record),
-                "opportunity_score": calculate_opportunity_score(record),
-                "trend_indicator": calculate_trend_indicator(record),
-            }
-
-            # Advanced business calculations
-            enhanced_record["advanced_metrics"] = {
-                "roi_estimate": calculate_roi_estimate(record),
-                "growth_potential": calculate_growth_potential(record),
-                "market_position": calculate_market_position(record),
-                "competitive_advantage": calculate_competitive_advantage(record),
+                "details": f"Business value {record['business_value']} is {enhanced_record['ml_features']['normalized_business_value']:.2f} standard deviations from mean",
             }
+            anomalies.append(anomaly)
+            enhanced_record["anomaly_flags"] = [anomaly["anomaly_type"]]
+
+        # Predictive scoring
+        enhanced_record["predictions"] = {
+            "success_probability": min(
+                1.0,
+                max(0.0, record["performance_score"] * random.uniform(0.8, 1.2)),
+            ),
+            "future_value_estimate": record["business_value"]
+            * random.uniform(0.85, 1.35),
+            "time_to_outcome_days": random.randint(7, 365),
+            "confidence_level": round(random.uniform(0.6, 0.95), 2),
+        }
 
-            # Anomaly detection
-            if abs(enhanced_record["ml_features"]["normalized_business_value"]) > 2.5:
-                anomaly = {
-                    "record_id": record["record_id"],
-                    "anomaly_type": "business_value_outlier",
-                    "severity": (
-                        "high"
-                        if abs(
-                            enhanced_record["ml_features"]["normalized_business_value"]
-                        )
-                        > 3.0
-                        else "medium"
-                    ),
-                    "details": f"Business value {record['business_value']} is {enhanced_record['ml_features']['normalized_business_value']:.2f} standard deviations from mean",
-                }
-                anomalies.append(anomaly)
-                enhanced_record["anomaly_flags"] = [anomaly["anomaly_type"]]
-
-            # Predictive scoring
-            enhanced_record["predictions"] = {
-                "success_probability": min(
-                    1.0,
-                    max(0.0, record["performance_score"] * random.uniform(0.8, 1.2)),
-                ),
-                "future_value_estimate": record["business_value"]
-                * random.uniform(0.85, 1.35),
-                "time_to_outcome_days": random.randint(7, 365),
-                "confidence_level": round(random.uniform(0.6, 0.95), 2),
-            }
+        # Processing timestamp
+        enhanced_record["processing_metadata"] = {
+            "processed_at": datetime.now().isoformat(),
+            "processor_name": processor_name,
+            "processing_version": "3.0.0",
+            "enhancement_level": "advanced_ml",
+        }
 
-            # Processing timestamp
-            enhanced_record["processing_metadata"] = {
-                "processed_at": datetime.now().isoformat(),
-                "processor_name": processor_name,
-                "processing_version": "3.0.0",
-                "enhancement_level": "advanced_ml",
-            }
+        processed_records.append(enhanced_record)
+
+    processing_time = time.time() - processing_start
+
+    # Processing analytics
+    processing_analytics = {
+        "processor_name": processor_name,
+        "total_processed": len(processed_records),
+        "processing_time_seconds": round(processing_time, 3),
+        "records_per_second": (
+            round(len(processed_records) / processing_time, 1)
+            if processing_time > 0
+            else 0
+        ),
+        "anomalies_detected": len(anomalies),
+        "quality_metrics": {
+            "avg_roi_estimate": sum(
+                r["advanced_metrics"]["roi_estimate"] for r in processed_records
+            )
+            / len(processed_records),
+            "avg_risk_score": sum(
+                r["ml_features"]["risk_score"] for r in processed_records
+            )
+            / len(processed_records),
+            "high_opportunity_count": len(
+                [
+                    r
+                    for r in processed_records
+                    if r["ml_features"]["opportunity_score"] > 0.7
+                ]
+            ),
+            "prediction_confidence": sum(
+                r["predictions"]["confidence_level"] for r in processed_records
+            )
+            / len(processed_records),
+        },
+        "business_insights": {
+            "high_value_records": len(
+                [
+                    r
+                    for r in processed_records
+                    if r["business_value"] > avg_business_value + std_business_value
+                ]
+            ),
+            "top_performers": len(
+                [r for r in processed_records if r["performance_score"] > 0.8]
+            ),
+            "critical_priority_items": len(
+                [r for r in processed_records if r["priority"] == "critical"]
+            ),
+            "cross_regional_opportunities": len(
+                set(
+                    r["region"]
+                    for r in processed_records
+                    if r["ml_features"]["opportunity_score"] > 0.6
+                )
+            ),
+        },
+    }
 
-            processed_records.append(enhanced_record)
+    return {
+        "processed_data": processed_records,
+        "processing_analytics": processing_analytics,
+        "anomalies": anomalies,
+    }
 
-        processing_time = time.time() - processing_start
 
-        # Processing analytics
-        processing_analytics = {
-            "processor_name": processor_name,
-            "total_processed": len(processed_records),
-            "processing_time_seconds": round(processing_time, 3),
-            "records_per_second": (
-                round(len(processed_records) / processing_time, 1)
-                if processing_time > 0
-                else 0
-            ),
-            "anomalies_detected": len(anomalies),
-            "quality_metrics": {
-                "avg_roi_estimate": sum(
-                    r["advanced_metrics"]["roi_estimate"] for r in processed_records
-                )
-                / len(processed_records),
-                "avg_risk_score": sum(
-                    r["ml_features"]["risk_score"] for r in processed_records
-                )
-                / len(processed_records),
-                "high_opportunity_count": len(
-                    [
-                        r
-                        for r in processed_records
-                        if r["ml_features"]["opportunity_score"] > 0.7
-                    ]
-                ),
-                "prediction_confidence": sum(
-                    r["predictions"]["confidence_level"] for r in processed_records
-                )
-                / len(processed_records),
-            },
-            "business_insights": {
-                "high_value_records": len(
-                    [
-                        r
-                        for r in processed_records
-                        if r["business_value"] > avg_business_value + std_business_value
-                    ]
-                ),
-                "top_performers": len(
-                    [r for r in processed_records if r["performance_score"] > 0.8]
-                ),
-                "critical_priority_items": len(
-                    [r for r in processed_records if r["priority"] == "critical"]
-                ),
-                "cross_regional_opportunities": len(
-                    set(
-                        r["region"]
-                        for r in processed_records
-                        if r["ml_features"]["opportunity_score"] > 0.6
-                    )
-                ),
-            },
-        }
+def create_advanced_data_processor(
+    processor_name: str, columnar: bool = False
+) -> PythonCodeNode:
+    """Create advanced data processor with machine learning capabilities."""
 
-        return {
-            "processed_data": processed_records,
-            "processing_analytics": processing_analytics,
-            "anomalies": anomalies,
-        }
+    def process_enterprise_data(
+        enterprise_data: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Advanced data processing with machine learning and statistical analysis."""
+        return process_enterprise_records(enterprise_data, processor_name)
 
-    # Helper functions for advanced calculations
-    def calculate_risk_score(record: Dict[str, Any]) -> float:
-        """Calculate business risk score based on multiple factors."""
-        base_risk = 0.3
-
-        # Priority-based risk
-        priority_risk = {"critical": 0.8, "high": 0.6, "medium": 0.4, "low": 0.2}
-        base_risk += priority_risk.get(record["priority"], 0.4)
-
-        # Performance-based risk (inverse relationship)
-        performance_risk = max(0, 1.0 - record["performance_score"])
-        base_risk += performance_risk * 0.3
-
-        # Volume-based risk
-        if record["volume"] > 5000:
-            base_risk += 0.2
-
-        return min(1.0, base_risk)
-
-    def calculate_opportunity_score(record: Dict[str, Any]) -> float:
-        """Calculate business opportunity score."""
-        base_opportunity = record["performance_score"]
-
-        # Business value multiplier
-        if record["business_value"] > 100000:
-            base_opportunity += 0.3
-        elif record["business_value"] > 50000:
-            base_opportunity += 0.2
-
-        # Domain-specific opportunities
-        domain_multipliers = {
-            "finance": 1.2,
-            "sales": 1.3,
-            "operations": 1.1,
-            "marketing": 1.15,
-        }
-        base_opportunity *= domain_multipliers.get(record["domain"], 1.0)
-
-        return min(1.0, base_opportunity)
-
-    def calculate_trend_indicator(record: Dict[str, Any]) -> str:
-        """Calculate trend indicator based on data patterns."""
-        score = record["performance_score"]
-        value = record["business_value"]
-
-        if score > 0.8 and value > 200000:
-            return "strong_positive"
-        elif score > 0.6 and value > 100000:
-            return "positive"
-        elif score > 0.4:
-            return "stable"
-        elif score > 0.2:
-            return "declining"
-        else:
-            return "needs_attention"
-
-    def calculate_roi_estimate(record: Dict[str, Any]) -> float:
-        """Calculate return on investment estimate."""
-        base_roi = record["business_value"] / max(1000, record["volume"])
-        performance_multiplier = 1 + (record["performance_score"] - 0.5)
-        return round(base_roi * performance_multiplier, 2)
-
-    def calculate_growth_potential(record: Dict[str, Any]) -> float:
-        """Calculate growth potential score."""
-        growth_factors = [
-            record["performance_score"],
-            min(1.0, record["business_value"] / 100000),
-            0.8 if record["priority"] in ["critical", "high"] else 0.4,
-            0.9 if record["metadata"]["compliance_status"] == "compliant" else 0.5,
-        ]
-        return round(sum(growth_factors) / len(growth_factors), 3)
-
-    def calculate_market_position(record: Dict[str, Any]) -> str:
-        """Calculate market position category."""
-        value = record["business_value"]
-        performance = record["performance_score"]
-
-        if value > 500000 and performance > 0.8:
-            return "market_leader"
-        elif value > 200000 and performance > 0.6:
-            return "strong_performer"
-        elif value > 50000 and performance > 0.4:
-            return "competitive"
-        elif performance > 0.6:
-            return "emerging"
-        else:
-            return "developing"
-
-    def calculate_competitive_advantage(record: Dict[str, Any]) -> float:
-        """Calculate competitive advantage score."""
-        advantage_score = 0.0
-
-        # Performance advantage
-        advantage_score += record["performance_score"] * 0.4
-
-        # Scale advantage
-        if record["business_value"] > 200000:
-            advantage_score += 0.3
-        elif record["business_value"] > 100000:
-            advantage_score += 0.2
-
-        # Quality advantage
-        quality_score = record["metadata"]["data_quality_score"]
-        advantage_score += quality_score * 0.3
-
-        return round(min(1.0, advantage_score), 3)
+    def process_enterprise_columns(enterprise_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Vectorized processing of a columnar batch (RecordBatch.to_dict)."""
+        result = process_enterprise_batch(
+            batch_from_dict(enterprise_data), processor_name
+        )
+        return {**result, "processed_data": result["processed_data"].to_dict()}
 
     node = PythonCodeNode.from_function(
-        func=process_enterprise_data,
+        func=process_enterprise_columns if columnar else process_enterprise_data,
         name=f"{processor_name}_advanced_processor",
         description=f"Advanced enterprise data processor with ML capabilities for {processor_name}",
     )
@@ -497,8 +491,166 @@ def create_advanced_data_processor(processor_name: str) -> PythonCodeNode:
     return node
 
 
+def filter_enterprise_records(
+    processed_data: List[Dict[str, Any]],
+    filter_config: Dict[str, Any],
+    filter_name: str,
+) -> Dict[str, Any]:
+    """Advanced filtering with intelligent business rules and machine learning."""
+    filtering_start = time.time()
+
+    # Initialize filter categories
+    filtered_categories = {
+        "high_value": [],
+        "high_performance": [],
+        "high_opportunity": [],
+        "high_risk": [],
+        "anomalies": [],
+        "priority_items": [],
+    }
+
+    filter_stats = {
+        "total_input_records": len(processed_data),
+        "filter_criteria_applied": [],
+        "category_counts": {},
+    }
+
+    for record in processed_data:
+        # High value filter
+        value_threshold = filter_config.get("business_value_threshold", 100000)
+        if record["business_value"] > value_threshold:
+            filtered_categories["high_value"].append(record)
+            if "high_value_filter" not in filter_stats["filter_criteria_applied"]:
+                filter_stats["filter_criteria_applied"].append("high_value_filter")
+
+        # High performance filter
+        performance_threshold = filter_config.get("performance_threshold", 0.7)
+        if record["performance_score"] > performance_threshold:
+            filtered_categories["high_performance"].append(record)
+            if "performance_filter" not in filter_stats["filter_criteria_applied"]:
+                filter_stats["filter_criteria_applied"].append("performance_filter")
+
+        # High opportunity filter (using ML features)
+        opportunity_threshold = filter_config.get("opportunity_threshold", 0.6)
+        if (
+            record.get("ml_features", {}).get("opportunity_score", 0)
+            > opportunity_threshold
+        ):
+            filtered_categories["high_opportunity"].append(record)
+            if "opportunity_filter" not in filter_stats["filter_criteria_applied"]:
+                filter_stats["filter_criteria_applied"].append("opportunity_filter")
+
+        # High risk filter
+        risk_threshold = filter_config.get("risk_threshold", 0.7)
+        if record.get("ml_features", {}).get("risk_score", 0) > risk_threshold:
+            filtered_categories["high_risk"].append(record)
+            if "risk_filter" not in filter_stats["filter_criteria_applied"]:
+                filter_stats["filter_criteria_applied"].append("risk_filter")
+
+        # Anomaly filter
+        if record.get("anomaly_flags"):
+            filtered_categories["anomalies"].append(record)
+            if "anomaly_filter" not in filter_stats["filter_criteria_applied"]:
+                filter_stats["filter_criteria_applied"].append("anomaly_filter")
+
+        # Priority filter
+        priority_filter = filter_config.get("priority_levels", ["critical", "high"])
+        if record["priority"] in priority_filter:
+            filtered_categories["priority_items"].append(record)
+            if "priority_filter" not in filter_stats["filter_criteria_applied"]:
+                filter_stats["filter_criteria_applied"].append("priority_filter")
+
+    # Calculate category statistics
+    for category, records in filtered_categories.items():
+        filter_stats["category_counts"][category] = len(records)
+
+    # Business intelligence on filtered data
+    filter_intelligence = {
+        "most_valuable_category": max(
+            filter_stats["category_counts"], key=filter_stats["category_counts"].get
+        ),
+        "highest_concentration": (
+            max(filter_stats["category_counts"].values())
+            / filter_stats["total_input_records"]
+            if filter_stats["total_input_records"] > 0
+            else 0
+        ),
+        "cross_category_overlap": calculate_category_overlap(filtered_categories),
+        "filtering_efficiency": {
+            "total_filtered": sum(filter_stats["category_counts"].values()),
+            "unique_filtered": len(
+                set(
+                    r["record_id"]
+                    for records in filtered_categories.values()
+                    for r in records
+                )
+            ),
+            "filtering_rate": (
+                sum(filter_stats["category_counts"].values())
+                / filter_stats["total_input_records"]
+                if filter_stats["total_input_records"] > 0
+                else 0
+            ),
+        },
+    }
+
+    # Recommendations based on filtering results
+    recommendations = []
+    if (
+        filter_stats["category_counts"]["high_risk"]
+        > filter_stats["total_input_records"] * 0.2
+    ):
+        recommendations.append(
+            "High risk concentration detected - consider risk mitigation strategies"
+        )
+    if (
+        filter_stats["category_counts"]["high_opportunity"]
+        > filter_stats["category_counts"]["high_value"]
+    ):
+        recommendations.append(
+            "More opportunities than high-value items - consider opportunity development"
+        )
+    if filter_stats["category_counts"]["anomalies"] > 0:
+        recommendations.append(
+            f"Anomalies detected ({filter_stats['category_counts']['anomalies']}) - investigate for insights"
+        )
+
+    filtering_time = time.time() - filtering_start
+
+    filter_metadata = {
+        "filter_name": filter_name,
+        "filtering_time_seconds": round(filtering_time, 3),
+        "filtering_timestamp": datetime.now().isoformat(),
+        "filter_version": "2.0.0",
+        "intelligent_recommendations": recommendations,
+    }
+
+    return {
+        "filtered_categories": filtered_categories,
+        "filter_statistics": filter_stats,
+        "filter_intelligence": filter_intelligence,
+        "filter_metadata": filter_metadata,
+    }
+
+
+def calculate_category_overlap(categories: Dict[str, List[Dict]]) -> Dict[str, int]:
+    """Calculate overlap between filter categories."""
+    overlap = {}
+    category_names = list(categories.keys())
+
+    for i, cat1 in enumerate(category_names):
+        for cat2 in category_names[i + 1 :]:
+            records1 = {r["record_id"] for r in categories[cat1]}
+            records2 = {r["record_id"] for r in categories[cat2]}
+            overlap_count = len(records1.intersection(records2))
+            if overlap_count > 0:
+                overlap[f"{cat1}_and_{cat2}"] = overlap_count
+
+    return overlap
+
+
 def create_intelligent_filter(
-    filter_name: str, filter_criteria: Dict[str, Any]
+    filter_name: str, filter_criteria: Dict[str, Any], columnar: bool = False
 ) -> PythonCodeNode:
     """Create intelligent filter with dynamic criteria and business rules."""
 
@@ -507,587 +659,1041 @@ def create_intelligent_filter(
         filter_config: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Advanced filtering with intelligent business rules and machine learning."""
+        if filter_config is None:
+            filter_config = filter_criteria
+        return filter_enterprise_records(processed_data, filter_config, filter_name)
 
+    def intelligent_filter_columns(
+        processed_data: Dict[str, Any],
+        filter_config: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Vectorized filtering of a columnar batch (RecordBatch.to_dict)."""
         if filter_config is None:
             filter_config = filter_criteria
+        result = filter_enterprise_batch(
+            batch_from_dict(processed_data), filter_config, filter_name
+        )
+        return {
+            **result,
+            "filtered_categories": batches_to_dict(result["filtered_categories"]),
+        }
 
-        filtering_start = time.time()
+    node = PythonCodeNode.from_function(
+        func=(
+            intelligent_filter_columns if columnar else intelligent_filter_processing
+        ),
+        name=f"{filter_name}_intelligent_filter",
+        description=f"Intelligent enterprise filter with ML-based business rules for {filter_name}",
+    )
 
-        # Initialize filter categories
-        filtered_categories = {
-            "high_value": [],
-            "high_performance": [],
-            "high_opportunity": [],
-            "high_risk": [],
-            "anomalies": [],
-            "priority_items": [],
-        }
+    # Set default configuration
+    node.config = {"processed_data": [], "filter_config": filter_criteria}
 
-        filter_stats = {
-            "total_input_records": len(processed_data),
-            "filter_criteria_applied": [],
-            "category_counts": {},
-        }
+    return node
 
-        for record in processed_data:
-            # High value filter
-            value_threshold = filter_config.get("business_value_threshold", 100000)
-            if record["business_value"] > value_threshold:
-                filtered_categories["high_value"].append(record)
-                if "high_value_filter" not in filter_stats["filter_criteria_applied"]:
-                    filter_stats["filter_criteria_applied"].append("high_value_filter")
-
-            # High performance filter
-            performance_threshold = filter_config.get("performance_threshold", 0.7)
-            if record["performance_score"] > performance_threshold:
-                filtered_categories["high_performance"].append(record)
-                if "performance_filter" not in filter_stats["filter_criteria_applied"]:
-                    filter_stats["filter_criteria_applied"].append("performance_filter")
-
-            # High opportunity filter (using ML features)
-            opportunity_threshold = filter_config.get("opportunity_threshold", 0.6)
-            if (
-                record.get("ml_features", {}).get("opportunity_score", 0)
-                > opportunity_threshold
-            ):
-                filtered_categories["high_opportunity"].append(record)
-                if "opportunity_filter" not in filter_stats["filter_criteria_applied"]:
-                    filter_stats["filter_criteria_applied"].append("opportunity_filter")
-
-            # High risk filter
-            risk_threshold = filter_config.get("risk_threshold", 0.7)
-            if record.get("ml_features", {}).get("risk_score", 0) > risk_threshold:
-                filtered_categories["high_risk"].append(record)
-                if "risk_filter" not in filter_stats["filter_criteria_applied"]:
-                    filter_stats["filter_criteria_applied"].append("risk_filter")
-
-            # Anomaly filter
-            if record.get("anomaly_flags"):
-                filtered_categories["anomalies"].append(record)
-                if "anomaly_filter" not in filter_stats["filter_criteria_applied"]:
-                    filter_stats["filter_criteria_applied"].append("anomaly_filter")
-
-            # Priority filter
-            priority_filter = filter_config.get("priority_levels", ["critical", "high"])
-            if record["priority"] in priority_filter:
-                filtered_categories["priority_items"].append(record)
-                if "priority_filter" not in filter_stats["filter_criteria_applied"]:
-                    filter_stats["filter_criteria_applied"].append("priority_filter")
-
-        # Calculate category statistics
-        for category, records in filtered_categories.items():
-            filter_stats["category_counts"][category] = len(records)
-
-        # Business intelligence on filtered data
-        filter_intelligence = {
-            "most_valuable_category": max(
-                filter_stats["category_counts"], key=filter_stats["category_counts"].get
-            ),
-            "highest_concentration": (
-                max(filter_stats["category_counts"].values())
-                / filter_stats["total_input_records"]
-                if filter_stats["total_input_records"] > 0
-                else 0
-            ),
-            "cross_category_overlap": calculate_category_overlap(filtered_categories),
-            "filtering_efficiency": {
-                "total_filtered": sum(filter_stats["category_counts"].values()),
-                "unique_filtered": len(
-                    set(
-                        r["record_id"]
-                        for records in filtered_categories.values()
-                        for r in records
-                    )
-                ),
-                "filtering_rate": (
-                    sum(filter_stats["category_counts"].values())
-                    / filter_stats["total_input_records"]
-                    if filter_stats["total_input_records"] > 0
-                    else 0
-                ),
-            },
-        }
 
-        # Recommendations based on filtering results
-        recommendations = []
-        if (
-            filter_stats["category_counts"]["high_risk"]
-            > filter_stats["total_input_records"] * 0.2
-        ):
-            recommendations.append(
-                "High risk concentration detected - consider risk mitigation strategies"
-            )
-        if (
-            filter_stats["category_counts"]["high_opportunity"]
-            > filter_stats["category_counts"]["high_value"]
-        ):
-            recommendations.append(
-                "More opportunities than high-value items - consider opportunity development"
+def enrich_enterprise_data(
+    filtered_categories: Dict[str, List[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Advanced data enrichment with external integrations and predictive analytics."""
+
+    enrichment_start = time.time()
+    enriched_data = {}
+    enrichment_analytics = {}
+
+    # Process each category
+    for category_name, records in filtered_categories.items():
+        if not records:
+            enriched_data[category_name] = []
+            continue
+
+        enriched_records = []
+
+        for record in records:
+            # Create enriched record
+            enriched_record = record.copy()
+
+            # External data simulation (APIs, databases, etc.)
+            enriched_record["external_enrichment"] = {
+                "market_data": simulate_market_data(record),
+                "industry_benchmarks": simulate_industry_benchmarks(record),
+                "social_sentiment": simulate_social_sentiment(record),
+                "economic_indicators": simulate_economic_indicators(record),
+                "competitive_intelligence": simulate_competitive_intelligence(record),
+            }
+
+            # Advanced predictive analytics
+            enriched_record["predictive_analytics"] = {
+                "next_quarter_forecast": generate_forecast(record, quarters=1),
+                "annual_projection": generate_forecast(record, quarters=4),
+                "trend_analysis": analyze_trends(record),
+                "scenario_modeling": model_scenarios(record),
+                "risk_projections": project_risks(record),
+            }
+
+            # Business context enrichment
+            enriched_record["business_context"] = {
+                "strategic_importance": calculate_strategic_importance(record),
+                "operational_impact": calculate_operational_impact(record),
+                "financial_implications": calculate_financial_implications(record),
+                "stakeholder_relevance": identify_stakeholder_relevance(record),
+                "action_recommendations": generate_action_recommendations(record),
+            }
+
+            # Compliance and governance
+            enriched_record["governance"] = {
+                "compliance_score": calculate_compliance_score(record),
+                "audit_trail": generate_audit_trail(record),
+                "data_lineage": trace_data_lineage(record),
+                "security_classification": classify_security_level(record),
+                "retention_policy": determine_retention_policy(record),
+            }
+
+            # Enrichment metadata
+            enriched_record["enrichment_metadata"] = {
+                "enriched_at": datetime.now().isoformat(),
+                "enrichment_version": "4.0.0",
+                "data_sources_used": [
+                    "market_api",
+                    "industry_db",
+                    "social_media",
+                    "economic_feeds",
+                    "competitor_intel",
+                ],
+                "enrichment_confidence": round(random.uniform(0.8, 0.98), 3),
+                "freshness_score": round(random.uniform(0.9, 1.0), 3),
+            }
+
+            enriched_records.append(enriched_record)
+
+        enriched_data[category_name] = enriched_records
+
+        # Category-specific analytics
+        enrichment_analytics[category_name] = {
+            "records_enriched": len(enriched_records),
+            "enrichment_fields_added": 25,  # Count of new fields added
+            "avg_confidence_score": sum(
+                r["enrichment_metadata"]["enrichment_confidence"]
+                for r in enriched_records
             )
-        if filter_stats["category_counts"]["anomalies"] > 0:
-            recommendations.append(
-                f"Anomalies detected ({filter_stats['category_counts']['anomalies']}) - investigate for insights"
+            / len(enriched_records),
+            "external_api_calls": len(enriched_records) * 5,  # Simulated API usage
+            "business_value_enhancement": sum(
+                r["external_enrichment"]["market_data"]["value_multiplier"]
+                for r in enriched_records
             )
+            / len(enriched_records),
+        }
 
-        filtering_time = time.time() - filtering_start
+    enrichment_time = time.time() - enrichment_start
+
+    # Overall enrichment analytics
+    total_records = sum(len(records) for records in enriched_data.values())
+    overall_analytics = {
+        "total_records_enriched": total_records,
+        "enrichment_time_seconds": round(enrichment_time, 3),
+        "enrichment_rate": (
+            round(total_records / enrichment_time, 1) if enrichment_time > 0 else 0
+        ),
+        "categories_processed": len(enriched_data),
+        "external_integrations_used": 5,
+        "data_quality_improvement": round(random.uniform(0.15, 0.35), 3),
+        "business_insight_generation": {
+            "strategic_insights": sum(
+                len(r.get("business_context", {}).get("action_recommendations", []))
+                for records in enriched_data.values()
+                for r in records
+            ),
+            "predictive_models_applied": total_records * 4,
+            "compliance_assessments": total_records,
+            "risk_evaluations": total_records,
+        },
+    }
+
+    return {
+        "enriched_data": enriched_data,
+        "enrichment_analytics": enrichment_analytics,
+        "overall_analytics": overall_analytics,
+    }
+
+
+# Helper functions for enrichment
+def simulate_market_data(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate external market data integration."""
+    return {
+        "market_trend": random.choice(["bullish", "bearish", "neutral", "volatile"]),
+        "industry_growth_rate": round(random.uniform(-0.05, 0.15), 3),
+        "market_share_estimate": round(random.uniform(0.01, 0.25), 3),
+        "value_multiplier": round(random.uniform(0.8, 1.4), 2),
+        "competitive_position": random.choice(
+            ["leader", "challenger", "follower", "niche"]
+        ),
+    }
+
+
+def simulate_industry_benchmarks(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate industry benchmark data."""
+    return {
+        "industry_average_performance": round(random.uniform(0.5, 0.8), 3),
+        "percentile_ranking": random.randint(10, 95),
+        "best_practice_score": round(random.uniform(0.6, 0.95), 3),
+        "efficiency_rating": random.choice(
+            ["above_average", "average", "below_average", "excellent"]
+        ),
+        "innovation_index": round(random.uniform(0.3, 0.9), 3),
+    }
+
+
+def simulate_social_sentiment(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate social media sentiment analysis."""
+    return {
+        "sentiment_score": round(random.uniform(-1.0, 1.0), 3),
+        "mention_volume": random.randint(100, 10000),
+        "engagement_rate": round(random.uniform(0.02, 0.12), 3),
+        "brand_awareness": round(random.uniform(0.1, 0.8), 3),
+        "customer_satisfaction": round(random.uniform(0.4, 0.9), 3),
+    }
+
+
+def simulate_economic_indicators(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate economic indicator integration."""
+    return {
+        "gdp_impact_factor": round(random.uniform(0.8, 1.2), 3),
+        "inflation_adjustment": round(random.uniform(0.95, 1.05), 3),
+        "currency_stability": round(random.uniform(0.9, 1.1), 3),
+        "interest_rate_sensitivity": round(random.uniform(0.1, 0.7), 3),
+        "economic_outlook": random.choice(
+            ["positive", "neutral", "negative", "uncertain"]
+        ),
+    }
+
+
+def simulate_competitive_intelligence(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Simulate competitive intelligence data."""
+    return {
+        "competitor_activity_level": random.choice(["high", "medium", "low"]),
+        "market_disruption_risk": round(random.uniform(0.1, 0.6), 3),
+        "innovation_threat_level": random.choice(
+            ["critical", "moderate", "low", "minimal"]
+        ),
+        "price_competitiveness": round(random.uniform(0.7, 1.3), 3),
+        "strategic_response_urgency": random.choice(
+            ["immediate", "short_term", "medium_term", "long_term"]
+        ),
+    }
+
+
+def generate_forecast(record: Dict[str, Any], quarters: int) -> Dict[str, Any]:
+    """Generate business forecasts."""
+    base_value = record["business_value"]
+    growth_rate = random.uniform(-0.1, 0.2)
+
+    return {
+        "forecasted_value": round(base_value * (1 + growth_rate) ** quarters, 2),
+        "growth_rate": round(growth_rate, 3),
+        "confidence_interval": {
+            "lower": round(base_value * (1 + growth_rate - 0.05) ** quarters, 2),
+            "upper": round(base_value * (1 + growth_rate + 0.05) ** quarters, 2),
+        },
+        "forecast_accuracy_estimate": round(random.uniform(0.7, 0.9), 3),
+    }
+
+
+def analyze_trends(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Analyze business trends."""
+    return {
+        "trend_direction": random.choice(["upward", "downward", "stable", "cyclical"]),
+        "trend_strength": round(random.uniform(0.1, 0.9), 3),
+        "seasonality_factor": round(random.uniform(0.8, 1.2), 3),
+        "volatility_index": round(random.uniform(0.1, 0.5), 3),
+        "trend_sustainability": random.choice(["high", "medium", "low"]),
+    }
+
+
+def project_risks(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Project business risks."""
+    return {
+        "operational_risk": round(random.uniform(0.1, 0.4), 3),
+        "financial_risk": round(random.uniform(0.1, 0.5), 3),
+        "strategic_risk": round(random.uniform(0.1, 0.3), 3),
+        "regulatory_risk": round(random.uniform(0.05, 0.2), 3),
+        "technology_risk": round(random.uniform(0.1, 0.35), 3),
+        "overall_risk_score": round(random.uniform(0.2, 0.6), 3),
+    }
+
+
+def calculate_strategic_importance(record: Dict[str, Any]) -> str:
+    """Calculate strategic importance level."""
+    value = record["business_value"]
+    performance = record["performance_score"]
+
+    if value > 500000 and performance > 0.8:
+        return "critical"
+    elif value > 200000 and performance > 0.6:
+        return "high"
+    elif value > 50000:
+        return "medium"
+    else:
+        return "low"
+
+
+def calculate_operational_impact(record: Dict[str, Any]) -> Dict[str, float]:
+    """Calculate operational impact metrics."""
+    return {
+        "efficiency_impact": round(random.uniform(0.1, 0.8), 3),
+        "cost_impact": round(random.uniform(-0.2, 0.3), 3),
+        "quality_impact": round(random.uniform(0.0, 0.5), 3),
+        "scalability_impact": round(random.uniform(0.1, 0.7), 3),
+    }
+
+
+def calculate_financial_implications(record: Dict[str, Any]) -> Dict[str, float]:
+    """Calculate financial implications."""
+    base_value = record["business_value"]
+
+    return {
+        "revenue_impact": round(base_value * random.uniform(0.1, 0.3), 2),
+        "cost_impact": round(base_value * random.uniform(-0.1, 0.2), 2),
+        "profit_impact": round(base_value * random.uniform(0.05, 0.25), 2),
+        "cash_flow_impact": round(base_value * random.uniform(0.0, 0.2), 2),
+    }
+
+
+def identify_stakeholder_relevance(record: Dict[str, Any]) -> List[str]:
+    """Identify relevant stakeholders."""
+    stakeholders = [
+        "executive_team",
+        "operations",
+        "finance",
+        "sales",
+        "marketing",
+        "customers",
+    ]
+    relevant = []
 
-        filter_metadata = {
-            "filter_name": filter_name,
-            "filtering_time_seconds": round(filtering_time, 3),
-            "filtering_timestamp": datetime.now().isoformat(),
-            "filter_version": "2.0.0",
-            "intelligent_recommendations": recommendations,
-        }
+    if record["business_value"] > 200000:
+        relevant.append("executive_team")
+    if record["domain"] == "operations":
+        relevant.extend(["operations", "executive_team"])
+    if record["priority"] == "critical":
+        relevant.extend(["executive_team", "operations"])
+    if record["domain"] in ["sales", "marketing"]:
+        relevant.extend(["sales", "marketing", "customers"])
 
-        return {
-            "filtered_categories": filtered_categories,
-            "filter_statistics": filter_stats,
-            "filter_intelligence": filter_intelligence,
-            "filter_metadata": filter_metadata,
-        }
+    return list(set(relevant))
+
+
+def generate_action_recommendations(record: Dict[str, Any]) -> List[str]:
+    """Generate actionable business recommendations."""
+    recommendations = []
+
+    if record["performance_score"] < 0.5:
+        recommendations.append("Performance improvement initiative required")
+    if record["business_value"] > 200000:
+        recommendations.append("Strategic review and investment consideration")
+    if record["priority"] == "critical":
+        recommendations.append("Immediate attention and resource allocation")
+    if record.get("ml_features", {}).get("risk_score", 0) > 0.7:
+        recommendations.append("Risk mitigation strategy development")
 
-    def calculate_category_overlap(categories: Dict[str, List[Dict]]) -> Dict[str, int]:
-        """Calculate overlap between filter categories."""
-        overlap = {}
-        category_names = list(categories.keys())
+    return recommendations
 
-        for i, cat1 in enumerate(category_names):
-            for cat2 in category_names[i + 1 :]:
-                records1 = {r["record_id"] for r in categories[cat1]}
-                records2 = {r["record_id"] for r in categories[cat2]}
-                overlap_count = len(records1.intersection(records2))
-                if overlap_count > 0:
-                    overlap[f"{cat1}_and_{cat2}"] = overlap_count
 
-        return overlap
+def calculate_compliance_score(record: Dict[str, Any]) -> float:
+    """Calculate compliance score."""
+    base_score = 0.8
+
+    if record["metadata"]["compliance_status"] == "compliant":
+        base_score += 0.15
+    elif record["metadata"]["compliance_status"] == "approved":
+        base_score += 0.05
+
+    quality_score = record["metadata"]["data_quality_score"]
+    base_score += (quality_score - 0.7) * 0.5
+
+    return min(1.0, max(0.0, base_score))
+
+
+def generate_audit_trail(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Generate audit trail entries."""
+    return [
+        {
+            "action": "data_ingestion",
+            "timestamp": record["timestamp"],
+            "user": record["metadata"]["created_by"],
+            "details": "Initial data capture",
+        },
+        {
+            "action": "data_processing",
+            "timestamp": datetime.now().isoformat(),
+            "user": "system_processor",
+            "details": "Advanced ML processing applied",
+        },
+        {
+            "action": "data_enrichment",
+            "timestamp": datetime.now().isoformat(),
+            "user": "enrichment_engine",
+            "details": "External data integration and analytics",
+        },
+    ]
+
+
+def classify_security_level(record: Dict[str, Any]) -> str:
+    """Classify security level."""
+    if record["business_value"] > 500000:
+        return "confidential"
+    elif record["business_value"] > 100000:
+        return "restricted"
+    elif record["priority"] == "critical":
+        return "restricted"
+    else:
+        return "internal"
+
+
+def determine_retention_policy(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Determine data retention policy."""
+    return {
+        "retention_period_years": 7 if record["business_value"] > 100000 else 5,
+        "archival_policy": (
+            "cold_storage" if record["business_value"] < 50000 else "warm_storage"
+        ),
+        "deletion_eligible_date": (
+            datetime.now()
+            + timedelta(days=365 * (7 if record["business_value"] > 100000 else 5))
+        ).isoformat(),
+        "legal_hold_required": record["business_value"] > 500000,
+    }
+
+
+def create_enterprise_enrichment_engine(columnar: bool = False) -> PythonCodeNode:
+    """Create enterprise-grade data enrichment engine with external integrations."""
+
+    def enrich_enterprise_columns(
+        filtered_categories: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Vectorized enrichment of columnar batches (RecordBatch.to_dict)."""
+        result = enrich_enterprise_batches(batches_from_dict(filtered_categories))
+        return {**result, "enriched_data": batches_to_dict(result["enriched_data"])}
 
     node = PythonCodeNode.from_function(
-        func=intelligent_filter_processing,
-        name=f"{filter_name}_intelligent_filter",
-        description=f"Intelligent enterprise filter with ML-based business rules for {filter_name}",
+        func=enrich_enterprise_columns if columnar else enrich_enterprise_data,
+        name="enterprise_enrichment_engine",
+        description="Advanced enterprise data enrichment with external integrations and predictive analytics",
     )
 
     # Set default configuration
-    node.config = {"processed_data": [], "filter_config": filter_criteria}
+    node.config = {"filtered_categories": {}}
 
     return node
 
 
-def create_enterprise_enrichment_engine() -> PythonCodeNode:
-    """Create enterprise-grade data enrichment engine with external integrations."""
+def aggregate_enterprise_insights(
+    operations_data: List[Dict[str, Any]],
+    risk_data: Dict[str, List[Dict[str, Any]]],
+    enriched_data: Dict[str, List[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Aggregate comprehensive enterprise insights from all streams."""
 
-    def enrich_enterprise_data(
-        filtered_categories: Dict[str, List[Dict[str, Any]]],
-    ) -> Dict[str, Any]:
-        """Advanced data enrichment with external integrations and predictive analytics."""
+    aggregation_start = time.time()
 
-        enrichment_start = time.time()
-        enriched_data = {}
-        enrichment_analytics = {}
+    # Combine all data streams
+    all_records = []
 
-        # Process each category
-        for category_name, records in filtered_categories.items():
-            if not records:
-                enriched_data[category_name] = []
-                continue
+    # Add operations data
+    if operations_data:
+        for record in operations_data:
+            record["data_stream"] = "operations"
+            all_records.append(record)
 
-            enriched_records = []
+    # Add risk analysis data
+    if risk_data:
+        for category, records in risk_data.items():
+            for record in records:
+                record["data_stream"] = "risk_analysis"
+                record["risk_category"] = category
+                all_records.append(record)
 
+    # Add enriched data
+    if enriched_data:
+        for category, records in enriched_data.items():
             for record in records:
-                # Create enriched record
-                enriched_record = record.copy()
-
-                # External data simulation (APIs, databases, etc.)
-                enriched_record["external_enrichment"] = {
-                    "market_data": simulate_market_data(record),
-                    "industry_benchmarks": simulate_industry_benchmarks(record),
-                    "social_sentiment": simulate_social_sentiment(record),
-                    "economic_indicators": simulate_economic_indicators(record),
-                    "competitive_intelligence": simulate_competitive_intelligence(
-                        record
-                    ),
-                }
+                record["data_stream"] = "enriched"
+                record["enrichment_category"] = category
+                all_records.append(record)
+
+    # Enterprise-wide analytics
+    total_business_value = sum(r["business_value"] for r in all_records)
+    avg_performance = (
+        sum(r["performance_score"] for r in all_records) / len(all_records)
+        if all_records
+        else 0
+    )
 
-                # Advanced predictive analytics
-                enriched_record["predictive_analytics"] = {
-                    "next_quarter_forecast": generate_forecast(record, quarters=1),
-                    "annual_projection": generate_forecast(record, quarters=4),
-                    "trend_analysis": analyze_trends(record),
-                    "scenario_modeling": model_scenarios(record),
-                    "risk_projections": project_risks(record),
-                }
+    # Cross-stream insights
+    cross_stream_analytics = {
+        "total_records_processed": len(all_records),
+        "total_business_value": total_business_value,
+        "average_performance_score": round(avg_performance, 3),
+        "data_stream_distribution": {
+            "operations": len(
+                [r for r in all_records if r.get("data_stream") == "operations"]
+            ),
+            "risk_analysis": len(
+                [r for r in all_records if r.get("data_stream") == "risk_analysis"]
+            ),
+            "enriched": len(
+                [r for r in all_records if r.get("data_stream") == "enriched"]
+            ),
+        },
+        "regional_insights": analyze_regional_distribution(all_records),
+        "priority_insights": analyze_priority_distribution(all_records),
+        "domain_insights": analyze_domain_distribution(all_records),
+    }
+
+    # Executive recommendations
+    executive_recommendations = generaterecommendations_from_counts(
+        all_records, cross_stream_analytics
+    )
 
-                # Business context enrichment
-                enriched_record["business_context"] = {
-                    "strategic_importance": calculate_strategic_importance(record),
-                    "operational_impact": calculate_operational_impact(record),
-                    "financial_implications": calculate_financial_implications(record),
-                    "stakeholder_relevance": identify_stakeholder_relevance(record),
-                    "action_recommendations": generate_action_recommendations(record),
-                }
+    # Performance metrics
+    aggregation_time = time.time() - aggregation_start
+    performance_metrics = {
+        "aggregation_time_seconds": round(aggregation_time, 3),
+        "processing_rate_records_per_second": (
+            round(len(all_records) / aggregation_time, 1) if aggregation_time > 0 else 0
+        ),
+        "data_quality_score": calculate_overall_data_quality(all_records),
+        "insights_generated": len(executive_recommendations),
+        "business_value_per_record": (
+            round(total_business_value / len(all_records), 2) if all_records else 0
+        ),
+    }
+
+    return {
+        "enterprise_insights": cross_stream_analytics,
+        "executive_recommendations": executive_recommendations,
+        "performance_metrics": performance_metrics,
+        "aggregated_records": all_records,
+    }
+
+
+def analyze_regional_distribution(
+    records: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Analyze regional distribution and performance."""
+    regional_data = {}
+
+    for record in records:
+        region = record.get("region", "Unknown")
+        if region not in regional_data:
+            regional_data[region] = {
+                "count": 0,
+                "total_value": 0,
+                "avg_performance": 0,
+                "high_priority_count": 0,
+            }
 
-                # Compliance and governance
-                enriched_record["governance"] = {
-                    "compliance_score": calculate_compliance_score(record),
-                    "audit_trail": generate_audit_trail(record),
-                    "data_lineage": trace_data_lineage(record),
-                    "security_classification": classify_security_level(record),
-                    "retention_policy": determine_retention_policy(record),
-                }
+        regional_data[region]["count"] += 1
+        regional_data[region]["total_value"] += record["business_value"]
+        regional_data[region]["avg_performance"] += record["performance_score"]
+        if record["priority"] in ["critical", "high"]:
+            regional_data[region]["high_priority_count"] += 1
+
+    # Calculate averages
+    for region_data in regional_data.values():
+        if region_data["count"] > 0:
+            region_data["avg_performance"] = round(
+                region_data["avg_performance"] / region_data["count"], 3
+            )
+            region_data["total_value"] = round(region_data["total_value"], 2)
 
-                # Enrichment metadata
-                enriched_record["enrichment_metadata"] = {
-                    "enriched_at": datetime.now().isoformat(),
-                    "enrichment_version": "4.0.0",
-                    "data_sources_used": [
-                        "market_api",
-                        "industry_db",
-                        "social_media",
-                        "economic_feeds",
-                        "competitor_intel",
-                    ],
-                    "enrichment_confidence": round(random.uniform(0.8, 0.98), 3),
-                    "freshness_score": round(random.uniform(0.9, 1.0), 3),
-                }
+    return regional_data
 
-                enriched_records.append(enriched_record)
 
-            enriched_data[category_name] = enriched_records
+def analyze_priority_distribution(
+    records: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Analyze priority distribution and characteristics."""
+    priority_data = {}
 
-            # Category-specific analytics
-            enrichment_analytics[category_name] = {
-                "records_enriched": len(enriched_records),
-                "enrichment_fields_added": 25,  # Count of new fields added
-                "avg_confidence_score": sum(
-                    r["enrichment_metadata"]["enrichment_confidence"]
-                    for r in enriched_records
-                )
-                / len(enriched_records),
-                "external_api_calls": len(enriched_records) * 5,  # Simulated API usage
-                "business_value_enhancement": sum(
-                    r["external_enrichment"]["market_data"]["value_multiplier"]
-                    for r in enriched_records
-                )
-                / len(enriched_records),
+    for record in records:
+        priority = record.get("priority", "unknown")
+        if priority not in priority_data:
+            priority_data[priority] = {
+                "count": 0,
+                "total_value": 0,
+                "avg_performance": 0,
+                "domains": set(),
             }
 
-        enrichment_time = time.time() - enrichment_start
+        priority_data[priority]["count"] += 1
+        priority_data[priority]["total_value"] += record["business_value"]
+        priority_data[priority]["avg_performance"] += record["performance_score"]
+        priority_data[priority]["domains"].add(record.get("domain", "unknown"))
+
+    # Calculate averages and convert sets to lists
+    for priority, data in priority_data.items():
+        if data["count"] > 0:
+            data["avg_performance"] = round(data["avg_performance"] / data["count"], 3)
+            data["total_value"] = round(data["total_value"], 2)
+            data["domains"] = list(data["domains"])
+
+    return priority_data
+
+
+def analyze_domain_distribution(
+    records: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Analyze domain distribution and performance."""
+    domain_data = {}
+
+    for record in records:
+        domain = record.get("domain", "unknown")
+        if domain not in domain_data:
+            domain_data[domain] = {
+                "count": 0,
+                "total_value": 0,
+                "avg_performance": 0,
+                "regions": set(),
+                "critical_count": 0,
+            }
 
-        # Overall enrichment analytics
-        total_records = sum(len(records) for records in enriched_data.values())
-        overall_analytics = {
-            "total_records_enriched": total_records,
-            "enrichment_time_seconds": round(enrichment_time, 3),
-            "enrichment_rate": (
-                round(total_records / enrichment_time, 1) if enrichment_time > 0 else 0
-            ),
-            "categories_processed": len(enriched_data),
-            "external_integrations_used": 5,
-            "data_quality_improvement": round(random.uniform(0.15, 0.35), 3),
-            "business_insight_generation": {
-                "strategic_insights": sum(
-                    len(r.get("business_context", {}).get("action_recommendations", []))
-                    for records in enriched_data.values()
-                    for r in records
-                ),
-                "predictive_models_applied": total_records * 4,
-                "compliance_assessments": total_records,
-                "risk_evaluations": total_records,
-            },
-        }
+        domain_data[domain]["count"] += 1
+        domain_data[domain]["total_value"] += record["business_value"]
+        domain_data[domain]["avg_performance"] += record["performance_score"]
+        domain_data[domain]["regions"].add(record.get("region", "unknown"))
+        if record["priority"] == "critical":
+            domain_data[domain]["critical_count"] += 1
+
+    # Calculate averages and convert sets to lists
+    for domain, data in domain_data.items():
+        if data["count"] > 0:
+            data["avg_performance"] = round(data["avg_performance"] / data["count"], 3)
+            data["total_value"] = round(data["total_value"], 2)
+            data["regions"] = list(data["regions"])
+
+    return domain_data
+
+
+def generaterecommendations_from_counts(
+    records: List[Dict[str, Any]], analytics: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Generate executive-level recommendations."""
+    return recommendations_from_counts(
+        analytics,
+        record_count=len(records),
+        high_value_count=len([r for r in records if r["business_value"] > 200000]),
+        anomaly_count=len([r for r in records if r.get("anomaly_flags")]),
+    )
 
-        return {
-            "enriched_data": enriched_data,
-            "enrichment_analytics": enrichment_analytics,
-            "overall_analytics": overall_analytics,
-        }
 
-    # Helper functions for enrichment
-    def simulate_market_data(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate external market data integration."""
-        return {
-            "market_trend": random.choice(
-                ["bullish", "bearish", "neutral", "volatile"]
-            ),
-            "industry_growth_rate": round(random.uniform(-0.05, 0.15), 3),
-            "market_share_estimate": round(random.uniform(0.01, 0.25), 3),
-            "value_multiplier": round(random.uniform(0.8, 1.4), 2),
-            "competitive_position": random.choice(
-                ["leader", "challenger", "follower", "niche"]
-            ),
-        }
+def calculate_overall_data_quality(records: List[Dict[str, Any]]) -> float:
+    """Calculate overall data quality score."""
+    if not records:
+        return 0.0
+
+    quality_factors = []
+
+    # Completeness
+    complete_records = len(
+        [
+            r
+            for r in records
+            if all(
+                r.get(field) is not None
+                for field in [
+                    "business_value",
+                    "performance_score",
+                    "domain",
+                    "region",
+                ]
+            )
+        ]
+    )
+    completeness = complete_records / len(records)
+    quality_factors.append(completeness)
 
-    def simulate_industry_benchmarks(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate industry benchmark data."""
-        return {
-            "industry_average_performance": round(random.uniform(0.5, 0.8), 3),
-            "percentile_ranking": random.randint(10, 95),
-            "best_practice_score": round(random.uniform(0.6, 0.95), 3),
-            "efficiency_rating": random.choice(
-                ["above_average", "average", "below_average", "excellent"]
-            ),
-            "innovation_index": round(random.uniform(0.3, 0.9), 3),
-        }
+    # Consistency (metadata quality scores)
+    consistency_scores = [
+        r.get("metadata", {}).get("data_quality_score", 0.8) for r in records
+    ]
+    consistency = sum(consistency_scores) / len(consistency_scores)
+    quality_factors.append(consistency)
 
-    def simulate_social_sentiment(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate social media sentiment analysis."""
-        return {
-            "sentiment_score": round(random.uniform(-1.0, 1.0), 3),
-            "mention_volume": random.randint(100, 10000),
-            "engagement_rate": round(random.uniform(0.02, 0.12), 3),
-            "brand_awareness": round(random.uniform(0.1, 0.8), 3),
-            "customer_satisfaction": round(random.uniform(0.4, 0.9), 3),
-        }
+    # Validity (no anomalies is better)
+    anomaly_count = len([r for r in records if r.get("anomaly_flags")])
+    validity = max(0.0, 1.0 - (anomaly_count / len(records)))
+    quality_factors.append(validity)
 
-    def simulate_economic_indicators(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate economic indicator integration."""
-        return {
-            "gdp_impact_factor": round(random.uniform(0.8, 1.2), 3),
-            "inflation_adjustment": round(random.uniform(0.95, 1.05), 3),
-            "currency_stability": round(random.uniform(0.9, 1.1), 3),
-            "interest_rate_sensitivity": round(random.uniform(0.1, 0.7), 3),
-            "economic_outlook": random.choice(
-                ["positive", "neutral", "negative", "uncertain"]
-            ),
-        }
+    return round(sum(quality_factors) / len(quality_factors), 3)
 
-    def simulate_competitive_intelligence(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Simulate competitive intelligence data."""
-        return {
-            "competitor_activity_level": random.choice(["high", "medium", "low"]),
-            "market_disruption_risk": round(random.uniform(0.1, 0.6), 3),
-            "innovation_threat_level": random.choice(
-                ["critical", "moderate", "low", "minimal"]
-            ),
-            "price_competitiveness": round(random.uniform(0.7, 1.3), 3),
-            "strategic_response_urgency": random.choice(
-                ["immediate", "short_term", "medium_term", "long_term"]
-            ),
-        }
 
-    def generate_forecast(record: Dict[str, Any], quarters: int) -> Dict[str, Any]:
-        """Generate business forecasts."""
-        base_value = record["business_value"]
-        growth_rate = random.uniform(-0.1, 0.2)
+def create_enterprise_aggregator(columnar: bool = False):
+    """Create enterprise data aggregator with comprehensive analytics."""
 
+    def aggregate_enterprise_columns(
+        operations_data: Dict[str, Any],
+        risk_data: Dict[str, Dict[str, Any]],
+        enriched_data: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Vectorized aggregation of columnar batches (RecordBatch.to_dict)."""
+        result = aggregate_enterprise_batches(
+            batch_from_dict(operations_data),
+            batches_from_dict(risk_data),
+            batches_from_dict(enriched_data),
+        )
+        records = result["aggregated_records"]
         return {
-            "forecasted_value": round(base_value * (1 + growth_rate) ** quarters, 2),
-            "growth_rate": round(growth_rate, 3),
-            "confidence_interval": {
-                "lower": round(base_value * (1 + growth_rate - 0.05) ** quarters, 2),
-                "upper": round(base_value * (1 + growth_rate + 0.05) ** quarters, 2),
-            },
-            "forecast_accuracy_estimate": round(random.uniform(0.7, 0.9), 3),
+            **result,
+            "aggregated_records": None if records is None else records.to_dict(),
         }
 
-    def analyze_trends(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze business trends."""
-        return {
-            "trend_direction": random.choice(
-                ["upward", "downward", "stable", "cyclical"]
-            ),
-            "trend_strength": round(random.uniform(0.1, 0.9), 3),
-            "seasonality_factor": round(random.uniform(0.8, 1.2), 3),
-            "volatility_index": round(random.uniform(0.1, 0.5), 3),
-            "trend_sustainability": random.choice(["high", "medium", "low"]),
-        }
+    node = PythonCodeNode.from_function(
+        func=(
+            aggregate_enterprise_columns if columnar else aggregate_enterprise_insights
+        ),
+        name="enterprise_aggregator",
+        description="Comprehensive enterprise data aggregator with cross-stream analytics",
+    )
 
-    def model_scenarios(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Model business scenarios."""
-        base_value = record["business_value"]
+    # Set default configuration
+    node.config = {"operations_data": [], "risk_data": {}, "enriched_data": {}}
 
-        return {
-            "optimistic_scenario": round(base_value * 1.3, 2),
-            "realistic_scenario": round(base_value * 1.1, 2),
-            "pessimistic_scenario": round(base_value * 0.9, 2),
-            "black_swan_impact": round(base_value * 0.5, 2),
-            "scenario_probabilities": {
-                "optimistic": 0.2,
-                "realistic": 0.6,
-                "pessimistic": 0.15,
-                "black_swan": 0.05,
-            },
-        }
+    return node
 
-    def project_risks(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Project business risks."""
-        return {
-            "operational_risk": round(random.uniform(0.1, 0.4), 3),
-            "financial_risk": round(random.uniform(0.1, 0.5), 3),
-            "strategic_risk": round(random.uniform(0.1, 0.3), 3),
-            "regulatory_risk": round(random.uniform(0.05, 0.2), 3),
-            "technology_risk": round(random.uniform(0.1, 0.35), 3),
-            "overall_risk_score": round(random.uniform(0.2, 0.6), 3),
-        }
 
-    def calculate_strategic_importance(record: Dict[str, Any]) -> str:
-        """Calculate strategic importance level."""
-        value = record["business_value"]
-        performance = record["performance_score"]
-
-        if value > 500000 and performance > 0.8:
-            return "critical"
-        elif value > 200000 and performance > 0.6:
-            return "high"
-        elif value > 50000:
-            return "medium"
-        else:
-            return "low"
-
-    def calculate_operational_impact(record: Dict[str, Any]) -> Dict[str, float]:
-        """Calculate operational impact metrics."""
-        return {
-            "efficiency_impact": round(random.uniform(0.1, 0.8), 3),
-            "cost_impact": round(random.uniform(-0.2, 0.3), 3),
-            "quality_impact": round(random.uniform(0.0, 0.5), 3),
-            "scalability_impact": round(random.uniform(0.1, 0.7), 3),
-        }
+STREAM_BRANCHES = {
+    "financial_analytics": (
+        "financial_systems",
+        {
+            "domains": ["finance", "accounting", "treasury"],
+            "regions": ["North America", "Europe", "Asia Pacific"],
+            "priorities": ["critical", "high"],
+        },
+    ),
+    "sales_intelligence": (
+        "sales_crm",
+        {
+            "domains": ["sales", "customer_service", "marketing"],
+            "regions": ["North America", "Europe", "Latin America"],
+            "priorities": ["high", "medium"],
+        },
+    ),
+    "operations_optimization": (
+        "operations_erp",
+        {
+            "domains": ["operations", "supply_chain", "manufacturing"],
+            "regions": ["Asia Pacific", "Europe", "North America"],
+            "priorities": ["critical", "high", "medium"],
+        },
+    ),
+}
+
+HIGH_VALUE_FILTER_CRITERIA = {
+    "business_value_threshold": 200000,
+    "performance_threshold": 0.7,
+    "opportunity_threshold": 0.6,
+    "priority_levels": ["critical", "high"],
+}
+RISK_FILTER_CRITERIA = {
+    "risk_threshold": 0.6,
+    "business_value_threshold": 100000,
+    "performance_threshold": 0.5,
+    "priority_levels": ["critical"],
+}
+
+
+def run_parallel_branches(records_per_stream: int = 5000, max_workers: int = None):
+    """Run the workflow's pipeline with the processor branches in a process pool.
+
+    The three source -> processor branches fan out to worker processes; the
+    filter, enrichment and aggregation stages then consume their output in
+    this process, connected the same way as the workflow's nodes.
+    """
+    print("🏢 Enterprise Parallel Data Processing - process-pool branches")
+    print("=" * 70)
 
-    def calculate_financial_implications(record: Dict[str, Any]) -> Dict[str, float]:
-        """Calculate financial implications."""
-        base_value = record["business_value"]
+    streams = {
+        processor_name: generate_enterprise_records(
+            source_name, config, records_per_stream
+        )
+        for processor_name, (source_name, config) in STREAM_BRANCHES.items()
+    }
+
+    with ParallelStreamExecutor(max_workers) as executor:
+        executor.warm_up()
+        start = time.perf_counter()
+        results = executor.process_streams(streams)
+        processing_seconds = time.perf_counter() - start
+
+    stage_start = time.perf_counter()
+    high_value = filter_enterprise_records(
+        results["financial_analytics"]["processed_data"],
+        HIGH_VALUE_FILTER_CRITERIA,
+        "high_value_opportunities",
+    )
+    risk = filter_enterprise_records(
+        results["sales_intelligence"]["processed_data"],
+        RISK_FILTER_CRITERIA,
+        "risk_management",
+    )
+    enrichment = enrich_enterprise_data(high_value["filtered_categories"])
+    aggregation = aggregate_enterprise_insights(
+        results["operations_optimization"]["processed_data"],
+        risk["filtered_categories"],
+        enrichment["enriched_data"],
+    )
+    downstream_seconds = time.perf_counter() - stage_start
+    elapsed = processing_seconds + downstream_seconds
+
+    total = sum(len(records) for records in streams.values())
+    print(f"⚙️  Workers: {executor.max_workers}")
+    for processor_name, result in results.items():
+        analytics = result["processing_analytics"]
+        print(
+            f"  • {processor_name}: {analytics['total_processed']:,} records, "
+            f"{analytics['anomalies_detected']} anomalies, "
+            f"{analytics['quality_metrics']['high_opportunity_count']:,} high-opportunity"
+        )
+    insights = aggregation["enterprise_insights"]
+    print(
+        f"  • aggregated: {insights['total_records_processed']:,} records, "
+        f"${insights['total_business_value']:,.0f} business value, "
+        f"{len(aggregation['executive_recommendations'])} recommendations"
+    )
+    print(
+        f"⏱️  processors {processing_seconds:.2f}s, "
+        f"filter/enrichment/aggregation {downstream_seconds:.2f}s"
+    )
+    print(
+        f"⏱️  {total:,} records in {elapsed:.2f}s ({total / elapsed:,.0f} records/sec)"
+    )
+    return {
+        "processing": results,
+        "filtering": {"high_value": high_value, "risk": risk},
+        "enrichment": enrichment,
+        "aggregation": aggregation,
+    }
 
-        return {
-            "revenue_impact": round(base_value * random.uniform(0.1, 0.3), 2),
-            "cost_impact": round(base_value * random.uniform(-0.1, 0.2), 2),
-            "profit_impact": round(base_value * random.uniform(0.05, 0.25), 2),
-            "cash_flow_impact": round(base_value * random.uniform(0.0, 0.2), 2),
-        }
 
-    def identify_stakeholder_relevance(record: Dict[str, Any]) -> List[str]:
-        """Identify relevant stakeholders."""
-        stakeholders = [
-            "executive_team",
-            "operations",
-            "finance",
-            "sales",
-            "marketing",
-            "customers",
-        ]
-        relevant = []
+def run_parallel_benchmark(total_records: int = 1_000_000, max_workers: int = None):
+    """Scaling of process_enterprise_data from 1 to N worker processes."""
+    max_workers = max_workers or os.cpu_count() or 1
+    print("=" * 70)
+    print(
+        f"process_enterprise_data scaling: {total_records:,} records, "
+        f"1-{max_workers} workers"
+    )
+    print("=" * 70)
 
-        if record["business_value"] > 200000:
-            relevant.append("executive_team")
-        if record["domain"] == "operations":
-            relevant.extend(["operations", "executive_team"])
-        if record["priority"] == "critical":
-            relevant.extend(["executive_team", "operations"])
-        if record["domain"] in ["sales", "marketing"]:
-            relevant.extend(["sales", "marketing", "customers"])
+    random.seed(42)
+    per_stream = total_records // len(STREAM_BRANCHES)
+    streams = {
+        processor_name: generate_enterprise_records(source_name, config, per_stream)
+        for processor_name, (source_name, config) in STREAM_BRANCHES.items()
+    }
+    batches = {
+        name: encode_enterprise_records(records) for name, records in streams.items()
+    }
+    total = sum(batch.length for batch in batches.values())
+
+    worker_counts = sorted({1, *range(2, max_workers + 1, 2), max_workers})
+    baseline_seconds = None
+    reference = None
+    try:
+        for workers in worker_counts:
+            with ParallelStreamExecutor(workers) as executor:
+                executor.warm_up()
+                start = time.perf_counter()
+                processed = executor.process_batches(batches, seed=7)
+                seconds = time.perf_counter() - start
+
+            # Deterministic columns must not depend on the worker count
+            risk = np.concatenate(
+                [processed[name]["batch"].columns["risk_score"] for name in batches]
+            )
+            if reference is None:
+                reference = risk.copy()
+            consistent = np.array_equal(reference, risk)
+            for result in processed.values():
+                result["batch"].release()
+
+            baseline_seconds = baseline_seconds or seconds
+            speedup = baseline_seconds / seconds
+            print(
+                f"  {workers:>3} workers: {seconds:6.2f}s, "
+                f"{total / seconds:>10,.0f} records/sec, "
+                f"speedup {speedup:4.1f}x, efficiency {speedup / workers:5.1%}"
+                f"{'' if consistent else '  ⚠️ results differ'}"
+            )
+    finally:
+        for batch in batches.values():
+            batch.release()
 
-        return list(set(relevant))
 
-    def generate_action_recommendations(record: Dict[str, Any]) -> List[str]:
-        """Generate actionable business recommendations."""
-        recommendations = []
+def run_columnar_benchmark(records_per_stream: int = 20000):
+    """Per-stage time and memory: list-of-dicts path versus RecordBatch path.
 
-        if record["performance_score"] < 0.5:
-            recommendations.append("Performance improvement initiative required")
-        if record["business_value"] > 200000:
-            recommendations.append("Strategic review and investment consideration")
-        if record["priority"] == "critical":
-            recommendations.append("Immediate attention and resource allocation")
-        if record.get("ml_features", {}).get("risk_score", 0) > 0.7:
-            recommendations.append("Risk mitigation strategy development")
-
-        return recommendations
-
-    def calculate_compliance_score(record: Dict[str, Any]) -> float:
-        """Calculate compliance score."""
-        base_score = 0.8
-
-        if record["metadata"]["compliance_status"] == "compliant":
-            base_score += 0.15
-        elif record["metadata"]["compliance_status"] == "approved":
-            base_score += 0.05
-
-        quality_score = record["metadata"]["data_quality_score"]
-        base_score += (quality_score - 0.7) * 0.5
-
-        return min(1.0, max(0.0, base_score))
-
-    def generate_audit_trail(record: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate audit trail entries."""
-        return [
-            {
-                "action": "data_ingestion",
-                "timestamp": record["timestamp"],
-                "user": record["metadata"]["created_by"],
-                "details": "Initial data capture",
-            },
-            {
-                "action": "data_processing",
-                "timestamp": datetime.now().isoformat(),
-                "user": "system_processor",
-                "details": "Advanced ML processing applied",
-            },
-            {
-                "action": "data_enrichment",
-                "timestamp": datetime.now().isoformat(),
-                "user": "enrichment_engine",
-                "details": "External data integration and analytics",
-            },
-        ]
+    Each columnar stage decodes its inputs with RecordBatch.from_dict and
+    encodes its outputs with to_dict, as the columnar nodes do, so the
+    serialization between nodes is part of every stage's time and memory.
+    """
+    print("=" * 78)
+    print(
+        f"Record representation benchmark: {records_per_stream:,} records x "
+        f"{len(STREAM_BRANCHES)} streams"
+    )
+    print("=" * 78)
 
-    def trace_data_lineage(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Trace data lineage."""
-        return {
-            "source_system": record["source_system"],
-            "original_timestamp": record["timestamp"],
-            "processing_stages": [
-                "ingestion",
-                "validation",
-                "transformation",
-                "enrichment",
-            ],
-            "data_transformations": [
-                "normalization",
-                "feature_engineering",
-                "anomaly_detection",
-                "predictive_modeling",
-            ],
-            "quality_checkpoints": [
-                "schema_validation",
-                "business_rule_validation",
-                "statistical_validation",
-            ],
+    def records_pipeline():
+        random.seed(42)
+        yield "generator", lambda state: {
+            name: generate_enterprise_records(source, config, records_per_stream)
+            for name, (source, config) in STREAM_BRANCHES.items()
         }
-
-    def classify_security_level(record: Dict[str, Any]) -> str:
-        """Classify security level."""
-        if record["business_value"] > 500000:
-            return "confidential"
-        elif record["business_value"] > 100000:
-            return "restricted"
-        elif record["priority"] == "critical":
-            return "restricted"
-        else:
-            return "internal"
-
-    def determine_retention_policy(record: Dict[str, Any]) -> Dict[str, Any]:
-        """Determine data retention policy."""
-        return {
-            "retention_period_years": 7 if record["business_value"] > 100000 else 5,
-            "archival_policy": (
-                "cold_storage" if record["business_value"] < 50000 else "warm_storage"
+        yield "processor", lambda state: {
+            name: process_enterprise_records(records, name)
+            for name, records in state["generator"].items()
+        }
+        yield "filter", lambda state: (
+            filter_enterprise_records(
+                state["processor"]["financial_analytics"]["processed_data"],
+                HIGH_VALUE_FILTER_CRITERIA,
+                "high_value_opportunities",
             ),
-            "deletion_eligible_date": (
-                datetime.now()
-                + timedelta(days=365 * (7 if record["business_value"] > 100000 else 5))
-            ).isoformat(),
-            "legal_hold_required": record["business_value"] > 500000,
+            filter_enterprise_records(
+                state["processor"]["sales_intelligence"]["processed_data"],
+                RISK_FILTER_CRITERIA,
+                "risk_management",
+            ),
+        )
+        yield "enrichment", lambda state: enrich_enterprise_data(
+            state["filter"][0]["filtered_categories"]
+        )
+        yield "aggregator", lambda state: aggregate_enterprise_insights(
+            state["processor"]["operations_optimization"]["processed_data"],
+            state["filter"][1]["filtered_categories"],
+            state["enrichment"]["enriched_data"],
+        )
+
+    def columnar_pipeline():
+        # Batches cross each stage boundary as to_dict() output, decoded again
+        # by the consumer, exactly as the columnar nodes pass them
+        rng = np.random.default_rng(42)
+        yield "generator", lambda state: {
+            name: generate_enterprise_batch(
+                source, config, records_per_stream, rng
+            ).to_dict()
+            for name, (source, config) in STREAM_BRANCHES.items()
         }
 
-    node = PythonCodeNode.from_function(
-        func=enrich_enterprise_data,
-        name="enterprise_enrichment_engine",
-        description="Advanced enterprise data enrichment with external integrations and predictive analytics",
-    )
+        def process(state):
+            outputs = {}
+            for name, data in state["generator"].items():
+                result = process_enterprise_batch(batch_from_dict(data), name, rng)
+                outputs[name] = {
+                    **result,
+                    "processed_data": result["processed_data"].to_dict(),
+                }
+            return outputs
 
-    # Set default configuration
-    node.config = {"filtered_categories": {}}
+        yield "processor", process
 
-    return node
+        def filter_stream(state, stream, criteria, filter_name):
+            result = filter_enterprise_batch(
+                batch_from_dict(state["processor"][stream]["processed_data"]),
+                criteria,
+                filter_name,
+            )
+            return {
+                **result,
+                "filtered_categories": batches_to_dict(result["filtered_categories"]),
+            }
+
+        yield "filter", lambda state: (
+            filter_stream(
+                state,
+                "financial_analytics",
+                HIGH_VALUE_FILTER_CRITERIA,
+                "high_value_opportunities",
+            ),
+            filter_stream(
+                state, "sales_intelligence", RISK_FILTER_CRITERIA, "risk_management"
+            ),
+        )
+
+        def enrich(state):
+            result = enrich_enterprise_batches(
+                batches_from_dict(state["filter"][0]["filtered_categories"]), rng
+            )
+            return {
+                **result,
+                "enriched_data": batches_to_dict(result["enriched_data"]),
+            }
+
+        yield "enrichment", enrich
+
+        def aggregate(state):
+            result = aggregate_enterprise_batches(
+                batch_from_dict(
+                    state["processor"]["operations_optimization"]["processed_data"]
+                ),
+                batches_from_dict(state["filter"][1]["filtered_categories"]),
+                batches_from_dict(state["enrichment"]["enriched_data"]),
+            )
+            records = result["aggregated_records"]
+            return {
+                **result,
+                "aggregated_records": None if records is None else records.to_dict(),
+            }
+
+        yield "aggregator", aggregate
+
+    def measure(pipeline, trace_memory: bool) -> Dict[str, tuple]:
+        state, stats = {}, {}
+        if trace_memory:
+            tracemalloc.start()
+        for stage, run in pipeline():
+            if trace_memory:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            state[stage] = run(state)
+            seconds = time.perf_counter() - start
+            if trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                stats[stage] = ((current - before) / 2**20, (peak - before) / 2**20)
+            else:
+                stats[stage] = seconds
+        if trace_memory:
+            tracemalloc.stop()
+        return stats
+
+    # Timings run without tracemalloc, which slows allocation-heavy code
+    results = {}
+    for label, pipeline in [
+        ("records", records_pipeline),
+        ("columnar", columnar_pipeline),
+    ]:
+        seconds = measure(pipeline, trace_memory=False)
+        memory = measure(pipeline, trace_memory=True)
+        results[label] = {stage: (seconds[stage], *memory[stage]) for stage in seconds}
+
+    print(
+        f"{'stage':<12}{'list-of-dicts':>28}{'columnar':>28}{'speedup':>9}{'memory':>8}"
+    )
+    columns = f"{'sec':>8}{'kept MB':>10}{'peak MB':>10}"
+    print(f"{'':<12}{columns}{columns}")
+    for stage in results["records"]:
+        dict_seconds, dict_kept, dict_peak = results["records"][stage]
+        col_seconds, col_kept, col_peak = results["columnar"][stage]
+        print(
+            f"{stage:<12}"
+            f"{dict_seconds:8.3f}{dict_kept:10.1f}{dict_peak:10.1f}"
+            f"{col_seconds:8.3f}{col_kept:10.1f}{col_peak:10.1f}"
+            f"{dict_seconds / max(col_seconds, 1e-9):8.1f}x"
+            f"{dict_kept / max(col_kept, 1e-3):7.1f}x"
+        )
 
 
 def main():
@@ -1097,7 +1703,11 @@ def main():
     data_dir = get_data_dir()
     data_dir.mkdir(exist_ok=True)
 
+    # ENTERPRISE_RECORD_FORMAT=columnar passes columnar dicts between nodes
+    columnar = os.getenv("ENTERPRISE_RECORD_FORMAT", "records") == "columnar"
+
     print("🏢 Starting Enterprise Parallel Data Processing")
+    print(f"🧱 Record format: {'columnar' if columnar else 'list of dicts'}")
     print("=" * 70)
 
     # Create enterprise workflow
@@ -1139,6 +1749,7 @@ def main():
             "regions": ["North America", "Europe", "Asia Pacific"],
             "priorities": ["critical", "high"],
         },
+        columnar=columnar,
     )
 
     sales_source = create_enterprise_data_source(
@@ -1148,6 +1759,7 @@ def main():
             "regions": ["North America", "Europe", "Latin America"],
             "priorities": ["high", "medium"],
         },
+        columnar=columnar,
     )
 
     operations_source = create_enterprise_data_source(
@@ -1157,6 +1769,7 @@ def main():
             "regions": ["Asia Pacific", "Europe", "North America"],
             "priorities": ["critical", "high", "medium"],
         },
+        columnar=columnar,
     )
 
     # Add data sources to workflow
@@ -1167,9 +1780,15 @@ def main():
     print("🤖 Creating advanced data processors...")
 
     # Create advanced processors for each stream
-    financial_processor = create_advanced_data_processor("financial_analytics")
-    sales_processor = create_advanced_data_processor("sales_intelligence")
-    operations_processor = create_advanced_data_processor("operations_optimization")
+    financial_processor = create_advanced_data_processor(
+        "financial_analytics", columnar=columnar
+    )
+    sales_processor = create_advanced_data_processor(
+        "sales_intelligence", columnar=columnar
+    )
+    operations_processor = create_advanced_data_processor(
+        "operations_optimization", columnar=columnar
+    )
 
     # Add processors to workflow
     workflow.add_node("financial_processor", financial_processor)
@@ -1195,23 +1814,11 @@ def main():
 
     # Create intelligent filters with different criteria
     high_value_filter = create_intelligent_filter(
-        "high_value_opportunities",
-        {
-            "business_value_threshold": 200000,
-            "performance_threshold": 0.7,
-            "opportunity_threshold": 0.6,
-            "priority_levels": ["critical", "high"],
-        },
+        "high_value_opportunities", HIGH_VALUE_FILTER_CRITERIA, columnar=columnar
     )
 
     risk_analysis_filter = create_intelligent_filter(
-        "risk_management",
-        {
-            "risk_threshold": 0.6,
-            "business_value_threshold": 100000,
-            "performance_threshold": 0.5,
-            "priority_levels": ["critical"],
-        },
+        "risk_management", RISK_FILTER_CRITERIA, columnar=columnar
     )
 
     # Add filters to workflow
@@ -1229,7 +1836,7 @@ def main():
     print("💎 Creating enterprise enrichment engine...")
 
     # Create enrichment engine
-    enrichment_engine = create_enterprise_enrichment_engine()
+    enrichment_engine = create_enterprise_enrichment_engine(columnar=columnar)
     workflow.add_node("enrichment_engine", enrichment_engine)
 
     # Connect filters to enrichment
@@ -1241,358 +1848,8 @@ def main():
 
     print("🔗 Creating data aggregation and routing...")
 
-    # Create data merger for comprehensive analysis
-    def create_enterprise_aggregator():
-        """Create enterprise data aggregator with comprehensive analytics."""
-
-        def aggregate_enterprise_insights(
-            operations_data: List[Dict[str, Any]],
-            risk_data: Dict[str, List[Dict[str, Any]]],
-            enriched_data: Dict[str, List[Dict[str, Any]]],
-        ) -> Dict[str, Any]:
-            """Aggregate comprehensive enterprise insights from all streams."""
-
-            aggregation_start = time.time()
-
-            # Combine all data streams
-            all_records = []
-
-            # Add operations data
-            if operations_data:
-                for record in operations_data:
-                    record["data_stream"] = "operations"
-                    all_records.append(record)
-
-            # Add risk analysis data
-            if risk_data:
-                for category, records in risk_data.items():
-                    for record in records:
-                        record["data_stream"] = "risk_analysis"
-                        record["risk_category"] = category
-                        all_records.append(record)
-
-            # Add enriched data
-            if enriched_data:
-                for category, records in enriched_data.items():
-                    for record in records:
-                        record["data_stream"] = "enriched"
-                        record["enrichment_category"] = category
-                        all_records.append(record)
-
-            # Enterprise-wide analytics
-            total_business_value = sum(r["business_value"] for r in all_records)
-            avg_performance = (
-                sum(r["performance_score"] for r in all_records) / len(all_records)
-                if all_records
-                else 0
-            )
-
-            # Cross-stream insights
-            cross_stream_analytics = {
-                "total_records_processed": len(all_records),
-                "total_business_value": total_business_value,
-                "average_performance_score": round(avg_performance, 3),
-                "data_stream_distribution": {
-                    "operations": len(
-                        [r for r in all_records if r.get("data_stream") == "operations"]
-                    ),
-                    "risk_analysis": len(
-                        [
-                            r
-                            for r in all_records
-                            if r.get("data_stream") == "risk_analysis"
-                        ]
-                    ),
-                    "enriched": len(
-                        [r for r in all_records if r.get("data_stream") == "enriched"]
-                    ),
-                },
-                "regional_insights": analyze_regional_distribution(all_records),
-                "priority_insights": analyze_priority_distribution(all_records),
-                "domain_insights": analyze_domain_distribution(all_records),
-            }
-
-            # Executive recommendations
-            executive_recommendations = generate_executive_recommendations(
-                all_records, cross_stream_analytics
-            )
-
-            # Performance metrics
-            aggregation_time = time.time() - aggregation_start
-            performance_metrics = {
-                "aggregation_time_seconds": round(aggregation_time, 3),
-                "processing_rate_records_per_second": (
-                    round(len(all_records) / aggregation_time, 1)
-                    if aggregation_time > 0
-                    else 0
-                ),
-                "data_quality_score": calculate_overall_data_quality(all_records),
-                "insights_generated": len(executive_recommendations),
-                "business_value_per_record": (
-                    round(total_business_value / len(all_records), 2)
-                    if all_records
-                    else 0
-                ),
-            }
-
-            return {
-                "enterprise_insights": cross_stream_analytics,
-                "executive_recommendations": executive_recommendations,
-                "performance_metrics": performance_metrics,
-                "aggregated_records": all_records,
-            }
-
-        def analyze_regional_distribution(
-            records: List[Dict[str, Any]],
-        ) -> Dict[str, Any]:
-            """Analyze regional distribution and performance."""
-            regional_data = {}
-
-            for record in records:
-                region = record.get("region", "Unknown")
-                if region not in regional_data:
-                    regional_data[region] = {
-                        "count": 0,
-                        "total_value": 0,
-                        "avg_performance": 0,
-                        "high_priority_count": 0,
-                    }
-
-                regional_data[region]["count"] += 1
-                regional_data[region]["total_value"] += record["business_value"]
-                regional_data[region]["avg_performance"] += record["performance_score"]
-                if record["priority"] in ["critical", "high"]:
-                    regional_data[region]["high_priority_count"] += 1
-
-            # Calculate averages
-            for region_data in regional_data.values():
-                if region_data["count"] > 0:
-                    region_data["avg_performance"] = round(
-                        region_data["avg_performance"] / region_data["count"], 3
-                    )
-                    region_data["total_value"] = round(region_data["total_value"], 2)
-
-            return regional_data
-
-        def analyze_priority_distribution(
-            records: List[Dict[str, Any]],
-        ) -> Dict[str, Any]:
-            """Analyze priority distribution and characteristics."""
-            priority_data = {}
-
-            for record in records:
-                priority = record.get("priority", "unknown")
-                if priority not in priority_data:
-                    priority_data[priority] = {
-                        "count": 0,
-                        "total_value": 0,
-                        "avg_performance": 0,
-                        "domains": set(),
-                    }
-
-                priority_data[priority]["count"] += 1
-                priority_data[priority]["total_value"] += record["business_value"]
-                priority_data[priority]["avg_performance"] += record[
-                    "performance_score"
-                ]
-                priority_data[priority]["domains"].add(record.get("domain", "unknown"))
-
-            # Calculate averages and convert sets to lists
-            for priority, data in priority_data.items():
-                if data["count"] > 0:
-                    data["avg_performance"] = round(
-                        data["avg_performance"] / data["count"], 3
-                    )
-                    data["total_value"] = round(data["total_value"], 2)
-                    data["domains"] = list(data["domains"])
-
-            return priority_data
-
-        def analyze_domain_distribution(
-            records: List[Dict[str, Any]],
-        ) -> Dict[str, Any]:
-            """Analyze domain distribution and performance."""
-            domain_data = {}
-
-            for record in records:
-                domain = record.get("domain", "unknown")
-                if domain not in domain_data:
-                    domain_data[domain] = {
-                        "count": 0,
-                        "total_value": 0,
-                        "avg_performance": 0,
-                        "regions": set(),
-                        "critical_count": 0,
-                    }
-
-                domain_data[domain]["count"] += 1
-                domain_data[domain]["total_value"] += record["business_value"]
-                domain_data[domain]["avg_performance"] += record["performance_score"]
-                domain_data[domain]["regions"].add(record.get("region", "unknown"))
-                if record["priority"] == "critical":
-                    domain_data[domain]["critical_count"] += 1
-
-            # Calculate averages and convert sets to lists
-            for domain, data in domain_data.items():
-                if data["count"] > 0:
-                    data["avg_performance"] = round(
-                        data["avg_performance"] / data["count"], 3
-                    )
-                    data["total_value"] = round(data["total_value"], 2)
-                    data["regions"] = list(data["regions"])
-
-            return domain_data
-
-        def generate_executive_recommendations(
-            records: List[Dict[str, Any]], analytics: Dict[str, Any]
-        ) -> List[Dict[str, Any]]:
-            """Generate executive-level recommendations."""
-            recommendations = []
-
-            # Performance-based recommendations
-            if analytics["average_performance_score"] < 0.6:
-                recommendations.append(
-                    {
-                        "type": "performance_improvement",
-                        "priority": "high",
-                        "title": "Enterprise Performance Below Target",
-                        "description": f"Average performance score ({analytics['average_performance_score']:.2f}) is below target (0.6)",
-                        "action_items": [
-                            "Conduct performance audit across all domains",
-                            "Implement performance improvement initiatives",
-                            "Increase monitoring and support for underperforming areas",
-                        ],
-                        "expected_impact": "15-25% improvement in overall performance",
-                        "timeline": "3-6 months",
-                    }
-                )
-
-            # Value concentration recommendations
-            high_value_records = len(
-                [r for r in records if r["business_value"] > 200000]
-            )
-            if high_value_records > len(records) * 0.3:
-                recommendations.append(
-                    {
-                        "type": "value_optimization",
-                        "priority": "medium",
-                        "title": "High Concentration of High-Value Opportunities",
-                        "description": f"{high_value_records} high-value opportunities identified ({high_value_records/len(records)*100:.1f}% of total)",
-                        "action_items": [
-                            "Prioritize resource allocation to high-value opportunities",
-                            "Develop dedicated teams for high-value initiatives",
-                            "Implement fast-track processes for high-value items",
-                        ],
-                        "expected_impact": "20-30% increase in realized business value",
-                        "timeline": "2-4 months",
-                    }
-                )
-
-            # Regional distribution recommendations
-            regional_data = analytics.get("regional_insights", {})
-            if len(regional_data) > 1:
-                # Find best and worst performing regions
-                best_region = max(
-                    regional_data.items(), key=lambda x: x[1]["avg_performance"]
-                )
-                worst_region = min(
-                    regional_data.items(), key=lambda x: x[1]["avg_performance"]
-                )
-
-                if (
-                    best_region[1]["avg_performance"]
-                    - worst_region[1]["avg_performance"]
-                    > 0.2
-                ):
-                    recommendations.append(
-                        {
-                            "type": "regional_optimization",
-                            "priority": "medium",
-                            "title": "Significant Regional Performance Variance",
-                            "description": f"Performance gap between {best_region[0]} ({best_region[1]['avg_performance']:.2f}) and {worst_region[0]} ({worst_region[1]['avg_performance']:.2f})",
-                            "action_items": [
-                                f"Knowledge transfer from {best_region[0]} to {worst_region[0]}",
-                                "Regional performance improvement program",
-                                "Standardize best practices across regions",
-                            ],
-                            "expected_impact": "10-20% improvement in underperforming regions",
-                            "timeline": "4-8 months",
-                        }
-                    )
-
-            # Data quality recommendations
-            if len([r for r in records if r.get("anomaly_flags")]) > len(records) * 0.1:
-                recommendations.append(
-                    {
-                        "type": "data_quality",
-                        "priority": "high",
-                        "title": "Significant Data Anomalies Detected",
-                        "description": f"{len([r for r in records if r.get('anomaly_flags')])} anomalies detected requiring investigation",
-                        "action_items": [
-                            "Investigate root causes of data anomalies",
-                            "Implement enhanced data validation processes",
-                            "Establish anomaly monitoring and alerting",
-                        ],
-                        "expected_impact": "Improved data reliability and decision accuracy",
-                        "timeline": "1-3 months",
-                    }
-                )
-
-            return recommendations
-
-        def calculate_overall_data_quality(records: List[Dict[str, Any]]) -> float:
-            """Calculate overall data quality score."""
-            if not records:
-                return 0.0
-
-            quality_factors = []
-
-            # Completeness
-            complete_records = len(
-                [
-                    r
-                    for r in records
-                    if all(
-                        r.get(field) is not None
-                        for field in [
-                            "business_value",
-                            "performance_score",
-                            "domain",
-                            "region",
-                        ]
-                    )
-                ]
-            )
-            completeness = complete_records / len(records)
-            quality_factors.append(completeness)
-
-            # Consistency (metadata quality scores)
-            consistency_scores = [
-                r.get("metadata", {}).get("data_quality_score", 0.8) for r in records
-            ]
-            consistency = sum(consistency_scores) / len(consistency_scores)
-            quality_factors.append(consistency)
-
-            # Validity (no anomalies is better)
-            anomaly_count = len([r for r in records if r.get("anomaly_flags")])
-            validity = max(0.0, 1.0 - (anomaly_count / len(records)))
-            quality_factors.append(validity)
-
-            return round(sum(quality_factors) / len(quality_factors), 3)
-
-        node = PythonCodeNode.from_function(
-            func=aggregate_enterprise_insights,
-            name="enterprise_aggregator",
-            description="Comprehensive enterprise data aggregator with cross-stream analytics",
-        )
-
-        # Set default configuration
-        node.config = {"operations_data": [], "risk_data": {}, "enriched_data": {}}
-
-        return node
-
     # Add aggregator to workflow
-    enterprise_aggregator = create_enterprise_aggregator()
+    enterprise_aggregator = create_enterprise_aggregator(columnar=columnar)
     workflow.add_node("enterprise_aggregator", enterprise_aggregator)
 
     # Connect processing streams to aggregator
@@ -1871,4 +2128,11 @@ def main():
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    if len(sys.argv) > 1 and sys.argv[1] == "parallel":
+        run_parallel_branches(*(int(arg) for arg in sys.argv[2:4]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_parallel_benchmark(*(int(arg) for arg in sys.argv[2:4]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "columnar":
+        run_columnar_benchmark(*(int(arg) for arg in sys.argv[2:3]))
+    else:
+        sys.exit(main())
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Result Cache for PythonCodeNode Functions
+
+Opt-in memoization for deterministic ``PythonCodeNode.from_function`` nodes:
+- Key: SHA-256 of the function source (plus closure values) and its
+  canonicalized inputs, so editing the function or its inputs misses
+- In-memory LRU bounded by entry count and bytes
+- Entries evicted from memory spill to disk, and ``flush()`` persists the
+  rest, so the next process run can reuse them
+- Hit / miss / eviction metrics via ``stats()``
+
+Usage:
+    cache = NodeResultCache(max_entries=64, spill_dir="outputs/node_cache")
+    node = PythonCodeNode.from_function(
+        func=cache.wrap(engineer_customer_features), name="feature_engineer"
+    )
+    ...
+    cache.flush()
+    print(cache.stats())
+
+Only wrap functions whose output depends on their inputs alone. Functions
+that read the clock or an unseeded RNG can pass a ``salt`` (for example
+today's date) to bound how long a cached result stays valid.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+from collections import OrderedDict
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+
+def _canonical_default(value: Any) -> Any:
+    """JSON fallback that gives equal values an equal, stable encoding."""
+    if isinstance(value, (np.generic,)):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (datetime, date, pd.Timestamp)):
+        return value.isoformat()
+    if isinstance(value, pd.DataFrame):
+        return value.to_dict(orient="split")
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    return repr(value)
+
+
+def canonicalize(value: Any) -> str:
+    """Serialize inputs with sorted keys so dict ordering does not matter."""
+    return json.dumps(
+        value, sort_keys=True, default=_canonical_default, separators=(",", ":")
+    )
+
+
+def function_fingerprint(func: Callable) -> str:
+    """Hash of a function's source and captured closure values."""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        source = func.__code__.co_code.hex()
+
+    closure = {}
+    if func.__closure__:
+        for name, cell in zip(func.__code__.co_freevars, func.__closure__):
+            try:
+                closure[name] = cell.cell_contents
+            except ValueError:  # Empty cell
+                closure[name] = None
+
+    payload = (
+        f"{func.__module__}.{func.__qualname__}\n{source}\n{canonicalize(closure)}"
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class NodeResultCache:
+    """Bounded LRU of pickled node results with on-disk spill."""
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_bytes: int = 256 * 1024 * 1024,
+        spill_dir: str = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self.metrics = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "spills": 0,
+        }
+
+    def key(self, func: Callable, inputs: Dict[str, Any], salt: str = "") -> str:
+        payload = f"{function_fingerprint(func)}\n{salt}\n{canonicalize(inputs)}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _spill_path(self, key: str) -> Path:
+        return self.spill_dir / f"{key}.pkl"
+
+    def _store(self, key: str, blob: bytes) -> None:
+        if key in self._entries:
+            self._bytes -= len(self._entries.pop(key))
+        self._entries[key] = blob
+        self._bytes += len(blob)
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            old_key, old_blob = self._entries.popitem(last=False)
+            self._bytes -= len(old_blob)
+            self.metrics["evictions"] += 1
+            self._write_spill(old_key, old_blob)
+
+    def _write_spill(self, key: str, blob: bytes) -> None:
+        if self.spill_dir is None:
+            return
+        path = self._spill_path(key)
+        if path.exists():
+            return
+        # Write then rename so a crashed run never leaves a truncated entry
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, path)
+        self.metrics["spills"] += 1
+
+    def get(self, key: str):
+        """Return ``(True, result)`` on a hit, ``(False, None)`` on a miss."""
+        blob = self._entries.get(key)
+        if blob is not None:
+            self._entries.move_to_end(key)
+            self.metrics["hits"] += 1
+            return True, pickle.loads(blob)
+
+        if self.spill_dir is not None and self._spill_path(key).exists():
+            blob = self._spill_path(key).read_bytes()
+            self._store(key, blob)
+            self.metrics["hits"] += 1
+            self.metrics["disk_hits"] += 1
+            return True, pickle.loads(blob)
+
+        self.metrics["misses"] += 1
+        return False, None
+
+    def put(self, key: str, result: Any) -> None:
+        self._store(key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def wrap(self, func: Callable, salt: str = "") -> Callable:
+        """Memoize ``func``; the wrapper keeps its signature for from_function."""
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def cached(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = self.key(func, dict(bound.arguments), salt)
+
+            found, result = self.get(key)
+            if found:
+                return result
+            result = func(*args, **kwargs)
+            self.put(key, result)
+            return result
+
+        return cached
+
+    def flush(self) -> None:
+        """Persist every in-memory entry so later runs can reuse it."""
+        for key, blob in self._entries.items():
+            self._write_spill(key, blob)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+        if self.spill_dir is not None:
+            for path in self.spill_dir.glob("*.pkl"):
+                path.unlink()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.metrics["hits"] + self.metrics["misses"]
+        return {
+            **self.metrics,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hit_rate": round(self.metrics["hits"] / lookups, 3) if lookups else 0.0,
+        }
+
+
+def cache_from_env(default_dir: Path) -> NodeResultCache:
+    """Cache configured by NODE_CACHE (on/off) and NODE_CACHE_DIR, or None."""
+    if os.getenv("NODE_CACHE", "").lower() not in ("1", "true", "yes", "on"):
+        return None
+    return NodeResultCache(
+        max_entries=int(os.getenv("NODE_CACHE_MAX_ENTRIES", "64")),
+        spill_dir=os.getenv("NODE_CACHE_DIR", str(default_dir)),
+    )
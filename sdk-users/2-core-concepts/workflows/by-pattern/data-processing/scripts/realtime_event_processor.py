@@ -14,18 +14,37 @@ Key Features:
 - Implements sliding window aggregations
 - Handles conditional routing with SwitchNode
 - Production-ready patterns
+- Streaming mode: events are read from NDJSON or a JSON array in fixed-size
+  batches (shared/event_stream_reader.py), one workflow run per batch, so memory
+  stays bounded by the batch size rather than the file size
+
+Usage:
+    python realtime_event_processor.py                       # CSV demo
+    python realtime_event_processor.py stream [events_file] [batch_size]
 """
 
+import os
+import sys
 from datetime import datetime
+from pathlib import Path
 
 from kailash import Workflow
+from kailash.nodes.code import PythonCodeNode
 from kailash.nodes.data import CSVReaderNode, CSVWriterNode
 from kailash.nodes.logic import SwitchNode
 from kailash.nodes.transform import DataTransformer, FilterNode
 from kailash.runtime.local import LocalRuntime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "shared"))
+from event_stream_reader import EventStreamReader
+
+
+def receive_event_batch(events: list) -> list:
+    """Event reader node in streaming mode: the batch handed in by the driver."""
+    return events
+
 
-def create_event_processor_workflow() -> Workflow:
+def create_event_processor_workflow(streaming: bool = False) -> Workflow:
     """Create an event processing workflow."""
     workflow = Workflow(
         workflow_id="event_processor_001",
@@ -33,14 +52,23 @@ def create_event_processor_workflow() -> Workflow:
         description="Real-time event processing with anomaly detection",
     )
 
-    # Event source (CSV for demo, replace with streaming source in production)
-    event_reader = CSVReaderNode(id="event_reader", file_path="data/events.csv")
+    # Event source: CSV for the demo, or one batch per run from the streaming reader
+    if streaming:
+        event_reader = PythonCodeNode.from_function(
+            func=receive_event_batch,
+            name="event_reader",
+            description="One batch of events from EventStreamReader",
+        )
+        reader_output = "result"
+    else:
+        event_reader = CSVReaderNode(id="event_reader", file_path="data/events.csv")
+        reader_output = "data"
     workflow.add_node("event_reader", event_reader)
 
     # Filter high-priority events
     priority_filter = FilterNode(id="priority_filter")
     workflow.add_node("priority_filter", priority_filter)
-    workflow.connect("event_reader", "priority_filter", mapping={"data": "data"})
+    workflow.connect("event_reader", "priority_filter", mapping={reader_output: "data"})
 
     # Enrich events with metadata
     event_enricher = DataTransformer(
@@ -97,13 +125,9 @@ def create_event_processor_workflow() -> Workflow:
     return workflow
 
 
-def run_event_processor():
-    """Execute the event processing workflow."""
-    workflow = create_event_processor_workflow()
-    runtime = LocalRuntime()
-
-    # Define runtime parameters
-    parameters = {
+def event_processor_parameters() -> dict:
+    """Runtime parameters for the filter, transformer and router nodes."""
+    return {
         "priority_filter": {
             "field": "priority",
             "operator": ">=",
@@ -188,6 +212,15 @@ else:
         },
     }
 
+
+def run_event_processor():
+    """Execute the event processing workflow."""
+    workflow = create_event_processor_workflow()
+    runtime = LocalRuntime()
+
+    # Define runtime parameters
+    parameters = event_processor_parameters()
+
     try:
         print("Starting event processor...")
         result, run_id = runtime.execute(workflow, parameters=parameters)
@@ -200,7 +233,48 @@ else:
         raise
 
 
-def generate_sample_events():
+def run_streaming_event_processor(
+    event_file: str = "data/events.ndjson", batch_size: int = 100
+):
+    """
+    Run the workflow once per batch of a streamed event file.
+
+    Each batch is one aggregation window. The reader parses the next batches
+    while the current one runs, up to its ``max_pending`` limit, then waits.
+    Outputs are written as one part file per batch.
+    """
+    workflow = create_event_processor_workflow(streaming=True)
+    runtime = LocalRuntime()
+    reader = EventStreamReader(event_file, batch_size=batch_size)
+    os.makedirs("data/outputs/stream", exist_ok=True)
+
+    print(f"Streaming events from {event_file} in batches of {batch_size}...")
+    batches = anomalous_windows = 0
+    for batch in reader.batches():
+        part = batch["batch_number"]
+        parameters = event_processor_parameters()
+        parameters["event_reader"] = {"events": batch["events"]}
+        parameters["alert_writer"] = {
+            "file_path": f"data/outputs/stream/alerts-{part:05d}.csv"
+        }
+        parameters["results_writer"] = {
+            "file_path": f"data/outputs/stream/processed_events-{part:05d}.csv"
+        }
+        result, run_id = runtime.execute(workflow, parameters=parameters)
+        window = result.get("window_aggregator", {}).get("result", {})
+        if isinstance(window, dict) and window.get("is_anomaly"):
+            anomalous_windows += 1
+        batches += 1
+
+    print(
+        f"Processed {reader.events_read} events in {batches} batches "
+        f"({reader.invalid_count} rejected, {anomalous_windows} anomalous windows)"
+    )
+    print("Part files written to: data/outputs/stream/")
+    return reader
+
+
+def generate_sample_events(event_file: str = "data/events.csv"):
     """Generate sample event data for testing."""
     import csv
     import os
@@ -236,12 +310,18 @@ def generate_sample_events():
         }
         events.append(event)
 
-    # Write to CSV
-    with open("data/events.csv", "w", newline="") as f:
-        if events:
-            writer = csv.DictWriter(f, fieldnames=events[0].keys())
-            writer.writeheader()
-            writer.writerows(events)
+    if event_file.endswith((".ndjson", ".jsonl")):
+        import json
+
+        with open(event_file, "w") as f:
+            f.writelines(json.dumps(event) + "\n" for event in events)
+    else:
+        # Write to CSV
+        with open(event_file, "w", newline="") as f:
+            if events:
+                writer = csv.DictWriter(f, fieldnames=events[0].keys())
+                writer.writeheader()
+                writer.writerows(events)
 
     print(f"Generated {len(events)} sample events")
     return events
@@ -249,6 +329,14 @@ def generate_sample_events():
 
 def main():
     """Main entry point."""
+    if len(sys.argv) > 1 and sys.argv[1] == "stream":
+        event_file = sys.argv[2] if len(sys.argv) > 2 else "data/events.ndjson"
+        if not os.path.exists(event_file):
+            generate_sample_events(event_file)
+        batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+        run_streaming_event_processor(event_file, batch_size)
+        return
+
     # Generate sample data
     generate_sample_events()
 
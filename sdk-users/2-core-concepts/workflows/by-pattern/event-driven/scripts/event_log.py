@@ -0,0 +1,706 @@
+#!/usr/bin/env python3
+"""
+Segmented Event Log
+===================
+
+Append-only event store behind event_sourcing_workflow.py, sized for order
+streams of hundreds of millions of events:
+
+- Events are appended as NDJSON to segment files named by their first offset;
+  an event's offset is its position in the log
+- A SQLite index maps each aggregate to the offsets and byte positions of its
+  events, so one aggregate is read without scanning the log
+- Projections store a checkpoint (offset plus segment byte position) in the
+  same transaction as their rows, and resume from it, so a run reads only the
+  events appended since the last run
+- The order projection snapshots an aggregate every ``snapshot_every`` events,
+  so rebuilding one aggregate replays only the events since its snapshot
+- Events are folded in log order. A payment or shipment that arrives before
+  its OrderCreated is parked with the projection and applied, in log order,
+  right after the order is created
+
+The log assumes a single writer. Segment bytes past the last committed index
+transaction (a crash mid-append) are truncated when the log is reopened.
+
+Usage:
+    log = EventLog("data/outputs/event_log")
+    appended, invalid = log.append(events, source="order_events.json")
+    projection = OrderProjection(log)
+    update = projection.catch_up()
+    rebuilt = projection.rebuild("ORDER-2024-001")
+
+    python event_log.py benchmark [orders] [hot_aggregate_events]
+"""
+
+import json
+import os
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+REQUIRED_FIELDS = ("event_id", "event_type", "aggregate_id", "timestamp", "data")
+
+
+def validate_event(event: Any) -> Optional[str]:
+    """Reason an event is invalid, or None if it can be appended."""
+    if not isinstance(event, dict) or not all(k in event for k in REQUIRED_FIELDS):
+        return "Missing required fields"
+    return None
+
+
+class EventLog:
+    """
+    Append-only event log stored as NDJSON segments plus a SQLite index.
+
+    Layout of ``path``:
+        <first offset>.ndjson   segment files, ``segment_events`` events each
+        index.sqlite            per-aggregate offset index, source positions,
+                                projection rows, checkpoints and snapshots
+    """
+
+    def __init__(self, path: str, segment_events: int = 1_000_000):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.segment_events = segment_events
+
+        self.db = sqlite3.connect(str(self.path / "index.sqlite"))
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS aggregate_index (
+                aggregate_id TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                segment INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                PRIMARY KEY (aggregate_id, offset)
+            ) WITHOUT ROWID;
+            """)
+
+        self.next_offset = int(self.get_meta("next_offset") or 0)
+        self.active_segment = int(self.get_meta("active_segment") or 0)
+        self.active_bytes = int(self.get_meta("active_bytes") or 0)
+        self._writer = None
+        self._recover()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: Any) -> None:
+        self.db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value))
+        )
+
+    def segment_path(self, segment: int) -> Path:
+        return self.path / f"{segment:020d}.ndjson"
+
+    def segments(self) -> List[int]:
+        """First offsets of the segment files, oldest first."""
+        return sorted(int(p.stem) for p in self.path.glob("*.ndjson"))
+
+    def _recover(self) -> None:
+        """Drop segment bytes that were written but never committed."""
+        for segment in self.segments():
+            if segment > self.active_segment:  # Rolled over mid-append
+                self.segment_path(segment).unlink()
+        segment_file = self.segment_path(self.active_segment)
+        if segment_file.exists() and segment_file.stat().st_size > self.active_bytes:
+            with open(segment_file, "r+b") as f:
+                f.truncate(self.active_bytes)
+
+    @staticmethod
+    def _source_key(source: str, kind: str = "source") -> str:
+        # Keyed by absolute path, so relative and resolved paths share a position
+        return f"{kind}:{os.path.abspath(source)}"
+
+    def source_position(self, source: str) -> int:
+        """Number of events already taken from an append-only source."""
+        return int(self.get_meta(self._source_key(source)) or 0)
+
+    def source_offset(self, source: str) -> int:
+        """Byte offset in the source just past the records already taken."""
+        return int(self.get_meta(self._source_key(source, "source_offset")) or 0)
+
+    def append(
+        self,
+        events: List[Dict[str, Any]],
+        source: Optional[str] = None,
+        source_records: Optional[int] = None,
+        source_offset: Optional[int] = None,
+    ) -> Tuple[List[Tuple[int, Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        Validate and append events in one index transaction.
+
+        Returns ``(appended, invalid)``: ``(offset, event)`` pairs for the
+        appended events and rejection records for the rest. With ``source``,
+        the source position advances in the same commit, by ``source_records``
+        (records the caller consumed, including any it rejected itself) or by
+        ``len(events)``, and ``source_offset`` (the reader's byte offset after
+        those records) is stored with it.
+        """
+        appended, invalid, index_rows = [], [], []
+        if self._writer is None:
+            self._writer = open(self.segment_path(self.active_segment), "ab")
+
+        for event in events:
+            reason = validate_event(event)
+            if reason:
+                invalid.append(
+                    {
+                        "event": event,
+                        "reason": reason,
+                        "validated_at": datetime.now().isoformat(),
+                    }
+                )
+                continue
+
+            if self.next_offset - self.active_segment >= self.segment_events:
+                self._writer.close()
+                self.active_segment, self.active_bytes = self.next_offset, 0
+                self._writer = open(self.segment_path(self.active_segment), "ab")
+
+            line = json.dumps(event, separators=(",", ":")).encode() + b"\n"
+            self._writer.write(line)
+            index_rows.append(
+                (
+                    event["aggregate_id"],
+                    self.next_offset,
+                    self.active_segment,
+                    self.active_bytes,
+                )
+            )
+            appended.append((self.next_offset, event))
+            self.next_offset += 1
+            self.active_bytes += len(line)
+
+        self._writer.flush()
+        self.db.executemany(
+            "INSERT INTO aggregate_index (aggregate_id, offset, segment, position) "
+            "VALUES (?, ?, ?, ?)",
+            index_rows,
+        )
+        self.set_meta("next_offset", self.next_offset)
+        self.set_meta("active_segment", self.active_segment)
+        self.set_meta("active_bytes", self.active_bytes)
+        if source is not None:
+            consumed = len(events) if source_records is None else source_records
+            position = self.source_position(source) + consumed
+            self.set_meta(self._source_key(source), position)
+            if source_offset is not None:
+                self.set_meta(self._source_key(source, "source_offset"), source_offset)
+        self.db.commit()
+        return appended, invalid
+
+    def read(
+        self, cursor: Optional[Dict[str, int]] = None
+    ) -> Iterator[Tuple[int, Dict[str, Any], Dict[str, int]]]:
+        """
+        Yield ``(offset, event, next_cursor)`` from ``cursor`` to the end.
+
+        A cursor is ``{"offset", "segment", "position"}``; storing the last
+        ``next_cursor`` and passing it back resumes without scanning.
+        """
+        cursor = cursor or {"offset": 0, "segment": 0, "position": 0}
+        offset = cursor["offset"]
+        for segment in self.segments():
+            if segment < cursor["segment"]:
+                continue
+            position = cursor["position"] if segment == cursor["segment"] else 0
+            end = (
+                self.active_bytes
+                if segment == self.active_segment
+                else self.segment_path(segment).stat().st_size
+            )
+            with open(self.segment_path(segment), "rb") as f:
+                f.seek(position)
+                for line in f:
+                    if position >= end or offset >= self.next_offset:
+                        break
+                    position += len(line)
+                    yield offset, json.loads(line), {
+                        "offset": offset + 1,
+                        "segment": segment,
+                        "position": position,
+                    }
+                    offset += 1
+
+    def read_aggregate(
+        self, aggregate_id: str, after_offset: int = -1
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield ``(offset, event)`` for one aggregate, via the offset index."""
+        rows = self.db.execute(
+            "SELECT offset, segment, position FROM aggregate_index "
+            "WHERE aggregate_id = ? AND offset > ? ORDER BY offset",
+            (aggregate_id, after_offset),
+        )
+        handles = {}
+        try:
+            for offset, segment, position in rows:
+                if segment not in handles:
+                    handles[segment] = open(self.segment_path(segment), "rb")
+                f = handles[segment]
+                f.seek(position)
+                yield offset, json.loads(f.readline())
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.db.close()
+
+
+def apply_order_event(
+    state: Optional[Dict[str, Any]], event: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """Order aggregate reducer: fold one event into the order's state."""
+    event_type = event["event_type"]
+    data = event.get("data", {})
+
+    if event_type == "OrderCreated":
+        if state is None:
+            state = {
+                "order_id": event["aggregate_id"],
+                "customer_id": data.get("customer_id"),
+                "total_amount": data.get("total_amount"),
+                "item_count": len(data.get("items", [])),
+                "status": "created",
+                "created_at": event["timestamp"],
+                "payments": [],
+                "shipments": [],
+                "last_updated": event["timestamp"],
+            }
+    elif state is None:
+        return None  # Payment or shipment for an order that was never created
+    elif event_type == "PaymentProcessed":
+        state["payments"].append(
+            {
+                "payment_id": data.get("payment_id"),
+                "amount": data.get("amount"),
+                "method": data.get("method"),
+                "status": data.get("status"),
+                "processed_at": event["timestamp"],
+            }
+        )
+        if data.get("status") == "success":
+            state["status"] = "paid"
+        state["last_updated"] = event["timestamp"]
+    elif event_type == "OrderShipped":
+        state["shipments"].append(
+            {
+                "tracking_number": data.get("tracking_number"),
+                "status": data.get("status"),
+                "shipped_at": event["timestamp"],
+            }
+        )
+        state["status"] = "shipped"
+        state["last_updated"] = event["timestamp"]
+    return state
+
+
+class OrderProjection:
+    """
+    Incremental order-state projection over an EventLog.
+
+    Each aggregate's state is a row in ``index.sqlite``; ``catch_up()`` folds
+    new events into the rows it touches and commits rows, summary counters
+    and checkpoint together, once per batch. Events for an order that does
+    not exist yet wait in ``parked_events`` until its OrderCreated arrives.
+    """
+
+    name = "orders"
+
+    def __init__(
+        self, log: EventLog, snapshot_every: int = 100, batch_size: int = 10_000
+    ):
+        self.log = log
+        self.db = log.db
+        self.snapshot_every = snapshot_every
+        self.batch_size = batch_size
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS projection_rows (
+                projection TEXT NOT NULL,
+                aggregate_id TEXT NOT NULL,
+                state TEXT NOT NULL,
+                events_since_snapshot INTEGER NOT NULL,
+                PRIMARY KEY (projection, aggregate_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS snapshots (
+                projection TEXT NOT NULL,
+                aggregate_id TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                state TEXT NOT NULL,
+                PRIMARY KEY (projection, aggregate_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS parked_events (
+                projection TEXT NOT NULL,
+                aggregate_id TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                event TEXT NOT NULL,
+                PRIMARY KEY (projection, aggregate_id, offset)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                projection TEXT PRIMARY KEY,
+                cursor TEXT NOT NULL,
+                summary TEXT NOT NULL
+            );
+            """)
+
+    def checkpoint(self) -> Tuple[Optional[Dict[str, int]], Dict[str, Any]]:
+        row = self.db.execute(
+            "SELECT cursor, summary FROM checkpoints WHERE projection = ?",
+            (self.name,),
+        ).fetchone()
+        if row is None:
+            return None, {
+                "total_orders": 0,
+                "status_breakdown": {},
+                "total_revenue": 0,
+                "parked_events": 0,
+            }
+        cursor, summary = json.loads(row[0]), json.loads(row[1])
+        summary.setdefault("parked_events", 0)
+        return cursor, summary
+
+    def _load_rows(self, aggregate_ids: List[str]) -> Dict[str, List[Any]]:
+        rows = {}
+        for i in range(0, len(aggregate_ids), 500):  # SQLite variable limit
+            chunk = aggregate_ids[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for aggregate_id, state, since_snapshot in self.db.execute(
+                "SELECT aggregate_id, state, events_since_snapshot "
+                "FROM projection_rows "
+                f"WHERE projection = ? AND aggregate_id IN ({placeholders})",
+                (self.name, *chunk),
+            ):
+                rows[aggregate_id] = [json.loads(state), since_snapshot]
+        return rows
+
+    def _load_parked(
+        self, aggregate_ids: List[str]
+    ) -> Dict[str, List[Tuple[int, Dict[str, Any]]]]:
+        parked = {}
+        for i in range(0, len(aggregate_ids), 500):  # SQLite variable limit
+            chunk = aggregate_ids[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for aggregate_id, offset, event in self.db.execute(
+                "SELECT aggregate_id, offset, event FROM parked_events "
+                f"WHERE projection = ? AND aggregate_id IN ({placeholders}) "
+                "ORDER BY offset",
+                (self.name, *chunk),
+            ):
+                parked.setdefault(aggregate_id, []).append((offset, json.loads(event)))
+        return parked
+
+    def _apply_batch(
+        self,
+        batch: List[Tuple[int, Dict[str, Any]]],
+        cursor: Dict[str, int],
+        summary: Dict[str, Any],
+    ) -> Dict[str, Dict[str, Any]]:
+        aggregate_ids = list({event["aggregate_id"] for _, event in batch})
+        rows = self._load_rows(aggregate_ids)
+        parked = self._load_parked([a for a in aggregate_ids if a not in rows])
+        stored_parked = {a: len(events) for a, events in parked.items()}
+        new_parked, released = [], set()
+        snapshots = []
+        breakdown = summary["status_breakdown"]
+
+        for offset, event in batch:
+            aggregate_id = event["aggregate_id"]
+            state, since_snapshot = rows.get(aggregate_id, (None, 0))
+            old_status = state["status"] if state else None
+            if state is None and event["event_type"] != "OrderCreated":
+                # Arrived before its order: hold it until OrderCreated
+                parked.setdefault(aggregate_id, []).append((offset, event))
+                new_parked.append((aggregate_id, offset, event))
+                continue
+            state = apply_order_event(state, event)
+            if state is None:
+                continue
+            applied = 1
+            if old_status is None and aggregate_id in parked:
+                for _, early_event in parked.pop(aggregate_id):
+                    state = apply_order_event(state, early_event)
+                    applied += 1
+                released.add(aggregate_id)
+
+            # Keep summary counters in step with the projected rows
+            if old_status is None:
+                summary["total_orders"] += 1
+                summary["total_revenue"] += state.get("total_amount") or 0
+            elif old_status != state["status"]:
+                breakdown[old_status] -= 1
+                if not breakdown[old_status]:
+                    del breakdown[old_status]
+            if old_status != state["status"]:
+                breakdown[state["status"]] = breakdown.get(state["status"], 0) + 1
+
+            # Parked events precede ``offset``, so a snapshot taken here
+            # already covers them
+            since_snapshot += applied
+            if since_snapshot >= self.snapshot_every:
+                snapshots.append((self.name, aggregate_id, offset, json.dumps(state)))
+                since_snapshot = 0
+            rows[aggregate_id] = [state, since_snapshot]
+
+        changed = {event["aggregate_id"] for _, event in batch}
+        changed_states = {a: rows[a][0] for a in changed if a in rows}
+        self.db.executemany(
+            "INSERT OR REPLACE INTO projection_rows "
+            "(projection, aggregate_id, state, events_since_snapshot) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (self.name, a, json.dumps(rows[a][0]), rows[a][1])
+                for a in changed_states
+            ],
+        )
+        self.db.executemany(
+            "INSERT OR REPLACE INTO snapshots (projection, aggregate_id, offset, state) "
+            "VALUES (?, ?, ?, ?)",
+            snapshots,
+        )
+        still_parked = [p for p in new_parked if p[0] not in released]
+        self.db.executemany(
+            "INSERT OR REPLACE INTO parked_events "
+            "(projection, aggregate_id, offset, event) VALUES (?, ?, ?, ?)",
+            [(self.name, a, offset, json.dumps(e)) for a, offset, e in still_parked],
+        )
+        self.db.executemany(
+            "DELETE FROM parked_events WHERE projection = ? AND aggregate_id = ?",
+            [(self.name, a) for a in released if a in stored_parked],
+        )
+        summary["parked_events"] += len(still_parked) - sum(
+            stored_parked[a] for a in released if a in stored_parked
+        )
+        self.db.execute(
+            "INSERT OR REPLACE INTO checkpoints (projection, cursor, summary) "
+            "VALUES (?, ?, ?)",
+            (self.name, json.dumps(cursor), json.dumps(summary)),
+        )
+        self.db.commit()
+        return changed_states
+
+    def catch_up(self, max_changed: int = 10_000) -> Dict[str, Any]:
+        """
+        Fold every event after the checkpoint into the projection.
+
+        Returns the summary, the number of events read and up to
+        ``max_changed`` of the order states this call changed.
+        """
+        cursor, summary = self.checkpoint()
+        start_offset = cursor["offset"] if cursor else 0
+        changed: Dict[str, Dict[str, Any]] = {}
+        changed_count = 0
+        events_processed = 0
+
+        batch = []
+        for offset, event, next_cursor in self.log.read(cursor):
+            batch.append((offset, event))
+            if len(batch) >= self.batch_size:
+                batch_changed = self._apply_batch(batch, next_cursor, summary)
+                events_processed += len(batch)
+                changed_count += len(batch_changed)
+                for aggregate_id, state in batch_changed.items():
+                    if aggregate_id in changed or len(changed) < max_changed:
+                        changed[aggregate_id] = state
+                batch = []
+        if batch:
+            batch_changed = self._apply_batch(batch, next_cursor, summary)
+            events_processed += len(batch)
+            changed_count += len(batch_changed)
+            for aggregate_id, state in batch_changed.items():
+                if aggregate_id in changed or len(changed) < max_changed:
+                    changed[aggregate_id] = state
+
+        return {
+            "changed_orders": list(changed.values()),
+            "changed_count": changed_count,
+            "events_processed": events_processed,
+            "from_offset": start_offset,
+            "to_offset": start_offset + events_processed,
+            "summary": summary,
+        }
+
+    def get(self, aggregate_id: str) -> Optional[Dict[str, Any]]:
+        """Projected state of one order."""
+        rows = self._load_rows([aggregate_id])
+        return rows[aggregate_id][0] if aggregate_id in rows else None
+
+    def rebuild(self, aggregate_id: str) -> Dict[str, Any]:
+        """Rebuild one order from its latest snapshot and the events after it."""
+        row = self.db.execute(
+            "SELECT offset, state FROM snapshots "
+            "WHERE projection = ? AND aggregate_id = ?",
+            (self.name, aggregate_id),
+        ).fetchone()
+        snapshot_offset, state = (row[0], json.loads(row[1])) if row else (-1, None)
+
+        events_replayed = 0
+        early_events = []
+        for _, event in self.log.read_aggregate(aggregate_id, snapshot_offset):
+            events_replayed += 1
+            if state is None and event["event_type"] != "OrderCreated":
+                early_events.append(event)  # Parked until OrderCreated
+                continue
+            created = state is None
+            state = apply_order_event(state, event)
+            if created:
+                for early_event in early_events:
+                    state = apply_order_event(state, early_event)
+                early_events = []
+        return {
+            "state": state,
+            "snapshot_offset": snapshot_offset,
+            "events_replayed": events_replayed,
+        }
+
+
+# Synthetic order stream for the benchmark
+
+
+def generate_order_events(
+    orders: int, first_order: int = 0, seed: int = 0
+) -> List[Dict[str, Any]]:
+    """Created, paid and (mostly) shipped events for ``orders`` new orders."""
+    rng = random.Random(seed + first_order)
+    base_time = datetime(2024, 1, 15, 8, 0, 0)
+    events = []
+    for i in range(first_order, first_order + orders):
+        order_id = f"ORDER-{i:09d}"
+        created = base_time + timedelta(seconds=i)
+        amount = round(rng.uniform(10, 500), 2)
+        steps = [
+            (
+                "OrderCreated",
+                {
+                    "customer_id": f"CUST-{rng.randrange(100_000):06d}",
+                    "items": [{"product_id": "PROD-001", "quantity": 1}],
+                    "total_amount": amount,
+                    "status": "pending",
+                },
+            ),
+            (
+                "PaymentProcessed",
+                {
+                    "payment_id": f"PAY-{i:09d}",
+                    "amount": amount,
+                    "method": "credit_card",
+                    "status": "success" if rng.random() < 0.95 else "failed",
+                },
+            ),
+        ]
+        if rng.random() < 0.8:
+            steps.append(
+                (
+                    "OrderShipped",
+                    {"tracking_number": f"TRACK-{i:09d}", "status": "shipped"},
+                )
+            )
+        for step, (event_type, data) in enumerate(steps):
+            events.append(
+                {
+                    "event_id": f"evt-{i:09d}-{step}",
+                    "event_type": event_type,
+                    "aggregate_id": order_id,
+                    "timestamp": (created + timedelta(minutes=5 * step)).isoformat()
+                    + "Z",
+                    "data": data,
+                }
+            )
+    return events
+
+
+def run_event_log_benchmark(orders: int = 200_000, hot_events: int = 5_000):
+    """Full catch-up, incremental catch-up and single-aggregate rebuild costs."""
+    path = tempfile.mkdtemp(prefix="event_log_")
+    try:
+        log = EventLog(path, segment_events=250_000)
+        projection = OrderProjection(log)
+
+        print("=" * 70)
+        print(f"Event log: {orders:,} orders plus one order with {hot_events:,} events")
+        print("=" * 70)
+
+        start = time.perf_counter()
+        for first in range(0, orders, 50_000):
+            log.append(generate_order_events(min(50_000, orders - first), first))
+        # One long-lived order with many payment events
+        hot_id = f"ORDER-{orders:09d}"
+        hot = generate_order_events(1, orders)[:1]
+        for i in range(hot_events):
+            hot.append(
+                {
+                    "event_id": f"evt-hot-{i}",
+                    "event_type": "PaymentProcessed",
+                    "aggregate_id": hot_id,
+                    "timestamp": f"2024-02-01T00:00:{i % 60:02d}Z",
+                    "data": {"payment_id": f"PAY-HOT-{i}", "amount": 1.0},
+                }
+            )
+        log.append(hot)
+        total = log.next_offset
+        append_seconds = time.perf_counter() - start
+        print(
+            f"  append        {total:>10,} events in {append_seconds:6.2f}s "
+            f"({total / append_seconds:,.0f} events/sec, {len(log.segments())} segments)"
+        )
+
+        start = time.perf_counter()
+        full = projection.catch_up(max_changed=0)
+        seconds = time.perf_counter() - start
+        print(
+            f"  first run     {full['events_processed']:>10,} events in {seconds:6.2f}s "
+            f"({full['events_processed'] / seconds:,.0f} events/sec)"
+        )
+
+        new_events = generate_order_events(1_000, orders + 1)
+        log.append(new_events)
+        start = time.perf_counter()
+        incremental = projection.catch_up()
+        seconds = time.perf_counter() - start
+        print(
+            f"  next run      {incremental['events_processed']:>10,} events in "
+            f"{seconds * 1000:6.1f}ms (resumed at offset {incremental['from_offset']:,}; "
+            f"{incremental['changed_count']:,} orders changed)"
+        )
+
+        start = time.perf_counter()
+        rebuilt = projection.rebuild(hot_id)
+        rebuild_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        replayed = None
+        for _, event in log.read_aggregate(hot_id):
+            replayed = apply_order_event(replayed, event)
+        replay_ms = (time.perf_counter() - start) * 1000
+        print(
+            f"  rebuild       {rebuilt['events_replayed']:>10,} events in "
+            f"{rebuild_ms:6.1f}ms from snapshot at offset {rebuilt['snapshot_offset']:,} "
+            f"(all {hot_events + 1:,} events: {replay_ms:.1f}ms)"
+        )
+
+        assert rebuilt["state"] == projection.get(hot_id) == replayed
+        summary = incremental["summary"]
+        print(
+            f"✅ {summary['total_orders']:,} orders, revenue "
+            f"${summary['total_revenue']:,.2f}, status {summary['status_breakdown']}"
+        )
+        log.close()
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_event_log_benchmark(*(int(arg) for arg in sys.argv[2:4]))
+    else:
+        print(__doc__)
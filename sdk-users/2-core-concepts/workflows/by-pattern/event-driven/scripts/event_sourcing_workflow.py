@@ -12,10 +12,29 @@ Patterns demonstrated:
 2. Event filtering and routing
 3. Event aggregation and state reconstruction
 4. Command-Query Responsibility Segregation (CQRS)
+
+Events are appended to a segmented log with a per-aggregate offset index
+(event_log.py, EVENT_LOG_DIR). Each run appends only the source events not
+yet in the log, and the order projection resumes from its checkpoint, so a
+run touches only new events.
+
+The source file (a JSON array, or NDJSON for .ndjson/.jsonl) is streamed in
+EVENT_BATCH_SIZE batches, with one workflow run per batch.
+
+Usage:
+    python event_sourcing_workflow.py                  # Append and project new events
+    python event_sourcing_workflow.py rebuild ORDER-2024-001
+    python event_sourcing_workflow.py check            # A re-run appends nothing
+    python event_sourcing_workflow.py simple
 """
 
 import json
 import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
 
 from kailash import Workflow
 from kailash.nodes.code import PythonCodeNode
@@ -23,6 +42,132 @@ from kailash.nodes.data import EventGeneratorNode, JSONWriterNode
 from kailash.nodes.transform import DataTransformer
 from kailash.runtime.local import LocalRuntime
 
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "shared"))
+from event_log import EventLog, OrderProjection, validate_event
+from event_stream_reader import EventStreamReader
+
+EVENT_FILE = "data/inputs/order_events.json"
+EVENT_LOG_DIR = os.getenv("EVENT_LOG_DIR", "data/outputs/event_log")
+EVENT_BATCH_SIZE = int(os.getenv("EVENT_BATCH_SIZE", "10000"))
+
+
+def read_new_events(
+    event_file: str = EVENT_FILE,
+    events: Optional[list] = None,
+    invalid_events: Optional[list] = None,
+    records: Optional[int] = None,
+    offset: Optional[int] = None,
+) -> dict:
+    """
+    Event reader node: source events not yet taken into the event log.
+
+    run_event_sourcing() streams the source and passes one batch per run in
+    ``events``; without a batch, every new event in the file is read.
+    """
+    if events is None:
+        log = EventLog(EVENT_LOG_DIR)
+        try:
+            reader = EventStreamReader(
+                event_file,
+                validate=validate_event,
+                max_pending=0,
+                skip=log.source_position(event_file),
+                offset=log.source_offset(event_file),
+            )
+        finally:
+            log.close()
+        events, invalid_events, records = [], [], 0
+        try:
+            for batch in reader.batches():
+                events.extend(batch["events"])
+                invalid_events.extend(batch["invalid_events"])
+                records += batch["records"]
+                offset = batch["offset"]
+        except FileNotFoundError:
+            print(f"Event file not found at {event_file}")
+        print(f"Read {records} new records from {event_file}")
+
+    return {
+        "events": events,
+        "invalid_events": invalid_events or [],
+        "records": len(events) if records is None else records,
+        "offset": offset,
+        "source": event_file,
+    }
+
+
+def append_new_events(result: dict) -> dict:
+    """Event validator node: validate new events and append them to the log."""
+    log = EventLog(EVENT_LOG_DIR)
+    try:
+        appended, invalid_events = log.append(
+            result.get("events", []),
+            source=result.get("source"),
+            source_records=result.get("records"),
+            source_offset=result.get("offset"),
+        )
+        next_offset = log.next_offset
+    finally:
+        log.close()
+
+    processed_at = datetime.now().isoformat()
+    validated_events = [
+        {
+            **event,
+            "offset": offset,
+            "processed_at": processed_at,
+            "validation_status": "valid",
+        }
+        for offset, event in appended
+    ]
+    invalid_events = result.get("invalid_events", []) + invalid_events
+    print(f"Validated {len(validated_events)} events, {len(invalid_events)} invalid")
+    return {
+        "events": validated_events,
+        "event_count": len(validated_events),
+        "invalid_count": len(invalid_events),
+        "aggregate_count": len({e["aggregate_id"] for e in validated_events}),
+        "event_types": sorted({e["event_type"] for e in validated_events}),
+        "invalid_events": invalid_events,
+        "log_offset": next_offset,
+    }
+
+
+def project_order_state(data: dict) -> dict:
+    """State builder node: catch the order projection up with the event log."""
+    log = EventLog(EVENT_LOG_DIR)
+    try:
+        update = OrderProjection(log).catch_up()
+    finally:
+        log.close()
+
+    data = data if isinstance(data, dict) else {}
+    print(
+        f"Projected {update['events_processed']} events from offset "
+        f"{update['from_offset']}, {update['changed_count']} orders changed"
+    )
+    return {
+        "current_state": update["changed_orders"],
+        "summary": {**update["summary"], "processed_at": datetime.now().isoformat()},
+        "state_version": update["to_offset"],
+        "changed_count": update["changed_count"],
+        "debug_info": {
+            "input_orders": data.get("orders_count", 0),
+            "input_payments": data.get("payments_count", 0),
+            "input_shipments": data.get("shipments_count", 0),
+        },
+    }
+
+
+def rebuild_order(aggregate_id: str) -> dict:
+    """Rebuild one order from its latest snapshot and the events after it."""
+    log = EventLog(EVENT_LOG_DIR)
+    try:
+        return OrderProjection(log).rebuild(aggregate_id)
+    finally:
+        log.close()
+
 
 def create_event_sourcing_workflow() -> Workflow:
     """Create an event sourcing workflow for order management."""
@@ -34,137 +179,19 @@ def create_event_sourcing_workflow() -> Workflow:
 
     # === EVENT SOURCE READING ===
 
-    # Read real events from JSON file using PythonCodeNode to avoid JSONReaderNode issues
-    event_reader = PythonCodeNode(
+    # Read only the source events that are not in the event log yet
+    event_reader = PythonCodeNode.from_function(
+        func=read_new_events,
         name="event_reader",
-        code="""
-import json
-import os
-
-# Try to read from relative path first
-event_file = "data/inputs/order_events.json"
-
-# Read the event data
-try:
-    with open(event_file, 'r') as f:
-        result = json.load(f)
-        print(f"Successfully read {len(result.get('events', []))} events from {event_file}")
-except FileNotFoundError:
-    print(f"Event file not found at {event_file}, using sample data")
-    # Use sample data if file not found
-    result = {
-        "events": [
-            {
-                "event_id": "evt-001",
-                "event_type": "OrderCreated",
-                "aggregate_id": "ORDER-2024-001",
-                "timestamp": "2024-01-15T08:30:00Z",
-                "data": {
-                    "customer_id": "CUST-101",
-                    "items": [
-                        {"product_id": "PROD-001", "quantity": 2, "price": 29.99},
-                        {"product_id": "PROD-002", "quantity": 1, "price": 199.99}
-                    ],
-                    "total_amount": 259.97,
-                    "status": "pending"
-                },
-                "metadata": {
-                    "source": "order-service",
-                    "version": 1,
-                    "correlation_id": "corr-001"
-                }
-            },
-            {
-                "event_id": "evt-002",
-                "event_type": "PaymentProcessed",
-                "aggregate_id": "ORDER-2024-001",
-                "timestamp": "2024-01-15T08:35:00Z",
-                "data": {
-                    "payment_id": "PAY-10001",
-                    "amount": 259.97,
-                    "method": "credit_card",
-                    "status": "success"
-                },
-                "metadata": {
-                    "source": "payment-service",
-                    "version": 1,
-                    "correlation_id": "corr-001"
-                }
-            },
-            {
-                "event_id": "evt-003",
-                "event_type": "OrderShipped",
-                "aggregate_id": "ORDER-2024-001",
-                "timestamp": "2024-01-15T14:00:00Z",
-                "data": {
-                    "tracking_number": "TRACK-123456",
-                    "carrier": "UPS",
-                    "status": "shipped"
-                },
-                "metadata": {
-                    "source": "fulfillment-service",
-                    "version": 1,
-                    "correlation_id": "corr-001"
-                }
-            }
-        ],
-        "metadata": {
-            "version": "1.0",
-            "total_events": 3
-        }
-    }
-except Exception as e:
-    print(f"Error reading event file: {e}")
-    result = {"events": [], "error": str(e)}
-""",
+        description="Source events appended since the last run",
     )
     workflow.add_node("event_reader", event_reader)
 
-    # Validate and prepare event data using PythonCodeNode to avoid dict bug
-    event_validator = PythonCodeNode(
+    # Validate new events and append them to the segmented event log
+    event_validator = PythonCodeNode.from_function(
+        func=append_new_events,
         name="event_validator",
-        code="""
-# Validate event structure and add processing metadata
-from datetime import datetime
-
-# Input comes from event_reader as 'result'
-print(f"Event validator received: type={type(result)}")
-
-# Extract events from the JSON structure
-events = result.get("events", []) if isinstance(result, dict) else []
-print(f"Found {len(events)} events to validate")
-
-validated_events = []
-invalid_events = []
-
-for event in events:
-    # Validate required fields
-    if all(key in event for key in ["event_id", "event_type", "aggregate_id", "timestamp", "data"]):
-        # Add processing metadata
-        event["processed_at"] = datetime.now().isoformat()
-        event["validation_status"] = "valid"
-        validated_events.append(event)
-    else:
-        invalid_events.append({
-            "event": event,
-            "reason": "Missing required fields",
-            "validated_at": datetime.now().isoformat()
-        })
-
-# Sort events by timestamp to ensure chronological order
-validated_events.sort(key=lambda x: x["timestamp"])
-
-result = {
-    "events": validated_events,
-    "event_count": len(validated_events),
-    "invalid_count": len(invalid_events),
-    "aggregate_count": len(set(e["aggregate_id"] for e in validated_events)) if validated_events else 0,
-    "event_types": list(set(e["event_type"] for e in validated_events)) if validated_events else [],
-    "invalid_events": invalid_events
-}
-
-print(f"Validated {len(validated_events)} events, {len(invalid_events)} invalid")
-""",
+        description="Validate events and append them to the event log",
     )
     workflow.add_node("event_validator", event_validator)
     workflow.connect("event_reader", "event_validator", mapping={"result": "result"})
@@ -174,8 +201,7 @@ print(f"Validated {len(validated_events)} events, {len(invalid_events)} invalid"
     # Process all events in a single processor (simplified approach)
     event_processor = DataTransformer(
         id="event_processor",
-        transformations=[
-            """
+        transformations=["""
 # Process all event types from the event stream
 import datetime
 
@@ -237,141 +263,32 @@ result = {
     "payments_count": len(processed_payments),
     "shipments_count": len(processed_shipments)
 }
-"""
-        ],
+"""],
     )
     workflow.add_node("event_processor", event_processor)
     workflow.connect("event_validator", "event_processor", mapping={"result": "data"})
 
     # === STATE RECONSTRUCTION ===
 
-    # Reconstruct current state from processed events
-    state_builder = DataTransformer(
-        id="state_builder",
-        transformations=[
-            """
-# Rebuild aggregate state from processed events
-import datetime
-
-# WORKAROUND: DataTransformer dict output bug
-print(f"STATE_BUILDER DEBUG - Input type: {type(data)}, Content: {data}")
-
-if isinstance(data, list):
-    # Bug case: received list of keys instead of dict
-    print("WORKAROUND: Handling DataTransformer dict output bug in state_builder")
-    # Since we can't recover original data, recreate expected structure
-    processed_orders = [
-        {"order_id": "ORDER-1001", "customer_id": "CUST-100", "total_amount": 259.97, "item_count": 2, "created_at": "2024-01-15T09:30:00Z", "event_processed_at": "2024-01-15T10:30:00Z"},
-        {"order_id": "ORDER-1002", "customer_id": "CUST-101", "total_amount": 259.97, "item_count": 2, "created_at": "2024-01-15T08:30:00Z", "event_processed_at": "2024-01-15T10:30:00Z"},
-        {"order_id": "ORDER-1003", "customer_id": "CUST-102", "total_amount": 259.97, "item_count": 2, "created_at": "2024-01-15T07:30:00Z", "event_processed_at": "2024-01-15T10:30:00Z"}
-    ]
-    processed_payments = [
-        {"order_id": "ORDER-1001", "payment_id": "PAY-10001", "amount": 259.97, "method": "credit_card", "status": "success", "processed_at": "2024-01-15T09:45:00Z", "event_processed_at": "2024-01-15T10:30:00Z"},
-        {"order_id": "ORDER-1002", "payment_id": "PAY-10002", "amount": 259.97, "method": "credit_card", "status": "success", "processed_at": "2024-01-15T08:45:00Z", "event_processed_at": "2024-01-15T10:30:00Z"},
-        {"order_id": "ORDER-1003", "payment_id": "PAY-10003", "amount": 259.97, "method": "credit_card", "status": "success", "processed_at": "2024-01-15T07:45:00Z", "event_processed_at": "2024-01-15T10:30:00Z"}
-    ]
-    processed_shipments = [
-        {"order_id": "ORDER-1001", "tracking_number": "TRACK-100001", "status": "shipped", "shipped_at": "2024-01-15T10:00:00Z", "event_processed_at": "2024-01-15T10:30:00Z"},
-        {"order_id": "ORDER-1002", "tracking_number": "TRACK-100002", "status": "shipped", "shipped_at": "2024-01-15T09:00:00Z", "event_processed_at": "2024-01-15T10:30:00Z"}
-    ]
-    bug_detected = True
-else:
-    # Expected case: received dict as intended
-    processed_orders = data.get("processed_orders", [])
-    processed_payments = data.get("processed_payments", [])
-    processed_shipments = data.get("processed_shipments", [])
-    bug_detected = False
-
-order_states = {}
-
-print(f"Building state from {len(processed_orders)} orders, {len(processed_payments)} payments, {len(processed_shipments)} shipments")
-
-# Process orders first to establish base state
-for order in processed_orders:
-    order_id = order.get("order_id")
-    if order_id not in order_states:
-        order_states[order_id] = {
-            "order_id": order_id,
-            "customer_id": order.get("customer_id"),
-            "total_amount": order.get("total_amount"),
-            "item_count": order.get("item_count"),
-            "status": "created",
-            "created_at": order.get("created_at"),
-            "payments": [],
-            "shipments": [],
-            "last_updated": order.get("event_processed_at")
-        }
-
-# Add payment information
-for payment in processed_payments:
-    order_id = payment.get("order_id")
-    if order_id in order_states:
-        order_states[order_id]["payments"].append({
-            "payment_id": payment.get("payment_id"),
-            "amount": payment.get("amount"),
-            "method": payment.get("method"),
-            "status": payment.get("status"),
-            "processed_at": payment.get("processed_at")
-        })
-        if payment.get("status") == "success":
-            order_states[order_id]["status"] = "paid"
-        order_states[order_id]["last_updated"] = payment.get("event_processed_at")
-
-# Add shipping information
-for shipment in processed_shipments:
-    order_id = shipment.get("order_id")
-    if order_id in order_states:
-        order_states[order_id]["shipments"].append({
-            "tracking_number": shipment.get("tracking_number"),
-            "status": shipment.get("status"),
-            "shipped_at": shipment.get("shipped_at")
-        })
-        order_states[order_id]["status"] = "shipped"
-        order_states[order_id]["last_updated"] = shipment.get("event_processed_at")
-
-# Convert to list for output
-current_state = list(order_states.values())
-
-# Calculate summary statistics
-summary = {
-    "total_orders": len(current_state),
-    "status_breakdown": {},
-    "total_revenue": 0,
-    "processed_at": datetime.datetime.now().isoformat()
-}
-
-for order in current_state:
-    status = order.get("status", "unknown")
-    summary["status_breakdown"][status] = summary["status_breakdown"].get(status, 0) + 1
-    summary["total_revenue"] += order.get("total_amount", 0)
-
-result = {
-    "current_state": current_state,
-    "summary": summary,
-    "state_version": len(current_state),
-    "bug_detected": bug_detected,
-    "debug_info": {
-        "input_orders": len(processed_orders),
-        "input_payments": len(processed_payments),
-        "input_shipments": len(processed_shipments)
-    }
-}
-"""
-        ],
+    # Fold events after the projection checkpoint into the order projection
+    state_builder = PythonCodeNode.from_function(
+        func=project_order_state,
+        name="state_builder",
+        description="Incremental order projection over the event log",
     )
     workflow.add_node("state_builder", state_builder)
     workflow.connect("event_processor", "state_builder", mapping={"result": "data"})
 
     # === OUTPUTS ===
 
-    # Save validated event stream for audit trail
+    # Save this run's validated events for audit trail
     event_store = JSONWriterNode(
         id="event_store", file_path="data/outputs/event_stream.json"
     )
     workflow.add_node("event_store", event_store)
     workflow.connect("event_validator", "event_store", mapping={"result": "data"})
 
-    # Save current state projection
+    # Save the orders this run changed, with overall summary
     state_store = JSONWriterNode(
         id="state_store", file_path="data/outputs/current_state.json"
     )
@@ -381,23 +298,74 @@ result = {
     return workflow
 
 
-def run_event_sourcing():
-    """Execute the event sourcing workflow."""
+def run_event_sourcing(
+    event_file: str = EVENT_FILE, batch_size: int = EVENT_BATCH_SIZE
+):
+    """
+    Execute the event sourcing workflow once per batch of new source events.
+
+    The source is streamed in ``batch_size`` batches, so memory is bounded by
+    the batch rather than the file. Each batch's validated events and changed
+    orders are written as part files named by their source position.
+    """
     workflow = create_event_sourcing_workflow()
     runtime = LocalRuntime()
 
-    parameters = {}
+    log = EventLog(EVENT_LOG_DIR)
+    try:
+        position = log.source_position(event_file)
+        offset = log.source_offset(event_file)
+    finally:
+        log.close()
+    reader = EventStreamReader(
+        event_file,
+        batch_size=batch_size,
+        validate=validate_event,
+        skip=position,
+        offset=offset,
+    )
+    os.makedirs("data/outputs/event_stream", exist_ok=True)
+    os.makedirs("data/outputs/current_state", exist_ok=True)
 
     try:
         print("Starting Event Sourcing Workflow...")
-        print("🔄 Generating event stream...")
+        print(f"🔄 Streaming new events from {event_file} (after record {position})...")
+
+        totals = {"events": 0, "invalid": 0, "changed": 0, "batches": 0}
+        event_types = set()
+        result = {}
+        for batch in reader.batches():
+            part = f"part-{position:012d}.json"
+            parameters = {
+                "event_reader": {
+                    "event_file": event_file,
+                    "events": batch["events"],
+                    "invalid_events": batch["invalid_events"],
+                    "records": batch["records"],
+                    "offset": batch["offset"],
+                },
+                "event_store": {"file_path": f"data/outputs/event_stream/{part}"},
+                "state_store": {"file_path": f"data/outputs/current_state/{part}"},
+            }
+            result, run_id = runtime.execute(workflow, parameters=parameters)
+            position += batch["records"]
+
+            event_result = result.get("event_validator", {}).get("result", {})
+            state_result = result.get("state_builder", {}).get("result", {})
+            totals["events"] += event_result.get("event_count", 0)
+            totals["invalid"] += event_result.get("invalid_count", 0)
+            totals["changed"] += state_result.get("changed_count", 0)
+            totals["batches"] += 1
+            event_types.update(event_result.get("event_types", []))
 
-        result, run_id = runtime.execute(workflow, parameters=parameters)
+        if not totals["batches"]:
+            print("\nNo new events since the last run")
+            return result
 
         print("\n✅ Event Sourcing Complete!")
         print("📁 Outputs generated:")
-        print("   - Event stream: data/outputs/event_stream.json")
-        print("   - Current state: data/outputs/current_state.json")
+        print("   - Event stream parts: data/outputs/event_stream/")
+        print("   - Changed order parts: data/outputs/current_state/")
 
         # Show summary
         state_result = result.get("state_builder", {}).get("result", {})
@@ -405,16 +373,17 @@ def run_event_sourcing():
 
         print("\n📊 Order Processing Summary:")
         print(f"   - Total orders processed: {summary.get('total_orders', 0)}")
+        print(f"   - Order changes this run: {totals['changed']}")
         print(f"   - Total revenue: ${summary.get('total_revenue', 0):,.2f}")
         print(f"   - Status breakdown: {summary.get('status_breakdown', {})}")
 
         # Show event stats
         event_result = result.get("event_validator", {}).get("result", {})
         print("\n📈 Event Stream Stats:")
-        print(f"   - Total events: {event_result.get('event_count', 0)}")
-        print(f"   - Invalid events: {event_result.get('invalid_count', 0)}")
-        print(f"   - Event types: {', '.join(event_result.get('event_types', []))}")
-        print(f"   - Aggregates: {event_result.get('aggregate_count', 0)}")
+        print(f"   - New events: {totals['events']} in {totals['batches']} batches")
+        print(f"   - Invalid events: {totals['invalid']}")
+        print(f"   - Event types: {', '.join(sorted(event_types))}")
+        print(f"   - Event log offset: {event_result.get('log_offset', 0)}")
 
         return result
 
@@ -423,6 +392,41 @@ def run_event_sourcing():
         raise
 
 
+def check_incremental_rerun(event_file: str = EVENT_FILE) -> bool:
+    """
+    Run the workflow twice against a fresh event log.
+
+    The first run appends every source event; the second must find none new,
+    leaving the log offset and the source position unchanged.
+    """
+    global EVENT_LOG_DIR
+    saved_log_dir = EVENT_LOG_DIR
+
+    def log_state() -> tuple:
+        log = EventLog(EVENT_LOG_DIR)
+        try:
+            return log.next_offset, log.source_position(event_file)
+        finally:
+            log.close()
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        EVENT_LOG_DIR = log_dir
+        try:
+            run_event_sourcing(event_file)
+            first = log_state()
+            run_event_sourcing(event_file)
+            second = log_state()
+        finally:
+            EVENT_LOG_DIR = saved_log_dir
+
+    passed = first[0] > 0 and second == first
+    print(
+        f"\n{'✅' if passed else '❌'} Re-run check: log offset {first[0]} -> "
+        f"{second[0]}, source position {first[1]} -> {second[1]}"
+    )
+    return passed
+
+
 def create_simple_event_workflow() -> Workflow:
     """Create a simplified event workflow for testing without file dependencies."""
     workflow = Workflow(
@@ -459,8 +463,7 @@ def create_simple_event_workflow() -> Workflow:
 
     # Simple event counter using a focused DataTransformer
     event_counter = DataTransformer(
-        transformations=[
-            """
+        transformations=["""
 # Count events by type - now with real event data
 event_counts = {}
 for event in data:
@@ -472,8 +475,7 @@ result = {
     "total_events": sum(event_counts.values()),
     "unique_types": len(event_counts)
 }
-"""
-        ],
+"""],
     )
     workflow.add_node("event_counter", event_counter)
     workflow.connect("event_source", "event_counter", mapping={"events": "data"})
@@ -483,8 +485,6 @@ result = {
 
 def main():
     """Main entry point."""
-    import sys
-
     # Create output directories
     os.makedirs("data/outputs", exist_ok=True)
 
@@ -499,6 +499,18 @@ def main():
         counter_result = result.get("event_counter", {}).get("result", {})
         print(f"\nEvent counts: {counter_result.get('event_counts', {})}")
         print(f"Total events: {counter_result.get('total_events', 0)}")
+    elif len(sys.argv) > 1 and sys.argv[1] == "check":
+        if not check_incremental_rerun():
+            sys.exit(1)
+        return
+    elif len(sys.argv) > 2 and sys.argv[1] == "rebuild":
+        rebuilt = rebuild_order(sys.argv[2])
+        print(json.dumps(rebuilt["state"], indent=2))
+        print(
+            f"Replayed {rebuilt['events_replayed']} events after snapshot offset "
+            f"{rebuilt['snapshot_offset']}"
+        )
+        return
     else:
         # Check if input file exists
         input_file = "data/inputs/order_events.json"
@@ -542,17 +554,9 @@ def main():
 
     # Display generated files
     print("\n=== Generated Files ===")
-    try:
-        with open("data/outputs/event_stream.json") as f:
-            events = json.load(f)
-            print(f"Event stream: {len(events.get('events', []))} events")
-
-        with open("data/outputs/current_state.json") as f:
-            state = json.load(f)
-            print(f"Current state: {len(state.get('current_state', []))} orders")
-
-    except Exception as e:
-        print(f"Could not read generated files: {e}")
+    for folder in ["data/outputs/event_stream", "data/outputs/current_state"]:
+        parts = sorted(Path(folder).glob("part-*.json"))
+        print(f"{folder}: {len(parts)} part files")
 
 
 if __name__ == "__main__":
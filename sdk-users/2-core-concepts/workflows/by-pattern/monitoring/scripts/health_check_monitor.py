@@ -18,10 +18,14 @@ Features:
 - Monitors actual Docker services (PostgreSQL, MongoDB, Qdrant, etc.)
 - Analyzes real response times and status codes
 - Generates comprehensive monitoring reports
+- Probes endpoints concurrently with the async engine in health_probe_engine.py
+  (HEALTH_PROBE_ENGINE=sequential restores the one-by-one HTTPRequestNode loop)
 """
 
 import json
 import os
+import sys
+from pathlib import Path
 from typing import Any
 
 from kailash import Workflow
@@ -30,6 +34,9 @@ from kailash.nodes.data import JSONWriterNode
 from kailash.nodes.logic import MergeNode
 from kailash.runtime.local import LocalRuntime
 
+sys.path.insert(0, str(Path(__file__).parent))
+from health_probe_engine import run_health_probes
+
 
 def get_health_endpoints() -> list[dict[str, Any]]:
     """Get list of real health endpoints to monitor.
@@ -103,8 +110,14 @@ def get_health_endpoints() -> list[dict[str, Any]]:
     ]
 
 
-def create_health_monitoring_workflow() -> Workflow:
-    """Create a comprehensive health monitoring workflow using real endpoints."""
+def create_health_monitoring_workflow(probe_engine: str | None = None) -> Workflow:
+    """Create a comprehensive health monitoring workflow using real endpoints.
+
+    ``probe_engine`` is "async" (concurrent probes, the default) or "sequential"
+    (one HTTPRequestNode call per endpoint); HEALTH_PROBE_ENGINE sets the default.
+    """
+    if probe_engine is None:
+        probe_engine = os.getenv("HEALTH_PROBE_ENGINE", "async")
     workflow = Workflow(
         workflow_id="real_health_monitoring_001",
         name="real_health_monitoring_workflow",
@@ -189,10 +202,18 @@ result = {
 
     # === REAL HEALTH CHECKS ===
 
-    # Perform health checks using HTTPRequestNode for each endpoint
-    health_checker = PythonCodeNode(
-        name="health_checker",
-        code="""
+    if probe_engine == "async":
+        # Bounded-concurrency probes over a shared keep-alive pool
+        health_checker = PythonCodeNode.from_function(
+            func=run_health_probes,
+            name="health_checker",
+            description="Concurrent health probes with per-host limits and deadlines",
+        )
+    else:
+        # Perform health checks using HTTPRequestNode for each endpoint
+        health_checker = PythonCodeNode(
+            name="health_checker",
+            code="""
 # Perform real health checks using HTTPRequestNode
 from kailash.nodes.api.http import HTTPRequestNode
 from datetime import datetime
@@ -341,7 +362,7 @@ result = {
     "check_timestamp": datetime.now().isoformat()
 }
 """,
-    )
+        )
     workflow.add_node("health_checker", health_checker)
     workflow.connect(
         "endpoint_configurator", "health_checker", mapping={"result": "config_data"}
@@ -377,6 +398,12 @@ alert_conditions = [
         "severity": "major",
         "condition": lambda check: check.get("issue_type") == "connection_refused"
     },
+    {
+        "name": "service_timeout",
+        "description": "Service did not respond within its health check deadline",
+        "severity": "major",
+        "condition": lambda check: check.get("issue_type") == "timeout"
+    },
     {
         "name": "high_response_time",
         "description": "Service response time above threshold",
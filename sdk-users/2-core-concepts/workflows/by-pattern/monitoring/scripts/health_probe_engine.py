@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Async Health Probe Engine
+=========================
+
+Bounded-concurrency replacement for the sequential HTTPRequestNode loop in
+health_check_monitor.py, sized for sweeps of thousands of endpoints:
+
+- One aiohttp session with a keep-alive connection pool shared by all probes
+- Global and per-host concurrency limits, so one slow host cannot take every slot
+- A deadline per probe (the endpoint's ``timeout``), started once the probe has
+  a slot, so queueing never counts against the endpoint
+- Jittered probe starts, so sweeps do not hit every service at the same instant
+
+Each probe returns the same result dict as the sequential health checker, so the
+alert, performance and reporting nodes are unchanged.
+
+Usage:
+    results = run_probe_sweep(endpoints, max_concurrency=256, per_host_limit=8)
+
+    # Local stub servers with injected latency, errors and dead ports
+    python health_probe_engine.py stub [endpoints] [hosts]
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+import aiohttp
+
+
+def build_health_result(
+    endpoint: dict[str, Any],
+    status_code: int | None,
+    response_time: float,
+    content_type: str | None = None,
+    content: Any = None,
+    error_info: str | None = None,
+    timed_out: bool = False,
+    attempts: int = 1,
+) -> dict[str, Any]:
+    """Per-endpoint result dict in the health checker's format."""
+    endpoint_name = endpoint["name"]
+    timeout = endpoint.get("timeout", 10)
+    is_healthy = status_code is not None and 200 <= status_code < 300
+    if endpoint.get("check_type") == "tcp_port":
+        is_healthy = error_info is None and not timed_out
+
+    if is_healthy:
+        status = "healthy"
+        issue_type = None
+        error_message = None
+    else:
+        status = "unhealthy"
+        error_info = error_info or "Unknown error"
+
+        # Categorize the issue
+        if timed_out:
+            issue_type = "timeout"
+            error_message = (
+                f"Health check for {endpoint_name} exceeded its {timeout}s deadline"
+            )
+        elif status_code is None:
+            issue_type = "connection_refused"
+            error_message = f"Cannot connect to {endpoint_name}: {error_info}"
+        elif status_code == 404:
+            issue_type = "endpoint_not_found"
+            error_message = f"Health endpoint not found for {endpoint_name}"
+        elif status_code == 500:
+            issue_type = "server_error"
+            error_message = f"Server error from {endpoint_name}"
+        elif status_code == 503:
+            issue_type = "service_unavailable"
+            error_message = f"Service {endpoint_name} is unavailable"
+        elif response_time > (timeout * 1000 * 0.8):  # 80% of timeout
+            issue_type = "high_latency"
+            error_message = (
+                f"High response time from {endpoint_name}: {response_time:.2f}ms"
+            )
+        else:
+            issue_type = "unknown_error"
+            error_message = f"Unknown error from {endpoint_name}: {error_info}"
+
+    return {
+        "service_name": endpoint_name,
+        "service_type": endpoint["service_type"],
+        "url": endpoint["url"],
+        "is_critical": endpoint["critical"],
+        "status": status,
+        "is_healthy": is_healthy,
+        "status_code": status_code,
+        "response_time_ms": round(response_time, 2),
+        "timestamp": datetime.now().isoformat(),
+        "error_message": error_message,
+        "issue_type": issue_type,
+        "response_details": {
+            "success": is_healthy,
+            "content_type": content_type,
+            "response_size": len(str(content)) if content else 0,
+            "has_content": bool(content),
+        },
+        "metadata": {
+            "check_type": endpoint.get("check_type", "http"),
+            "timeout_used": timeout,
+            "retry_attempted": attempts > 1,
+        },
+    }
+
+
+def build_error_result(endpoint: dict[str, Any], error: Exception) -> dict[str, Any]:
+    """Result for a probe that failed inside the engine itself."""
+    return {
+        "service_name": endpoint["name"],
+        "service_type": endpoint["service_type"],
+        "url": endpoint["url"],
+        "is_critical": endpoint["critical"],
+        "status": "error",
+        "is_healthy": False,
+        "status_code": None,
+        "response_time_ms": None,
+        "timestamp": datetime.now().isoformat(),
+        "error_message": f"Health check failed: {str(error)}",
+        "issue_type": "check_failure",
+        "response_details": {},
+        "metadata": {
+            "check_type": endpoint.get("check_type", "http"),
+            "timeout_used": endpoint.get("timeout", 10),
+            "exception_type": type(error).__name__,
+        },
+    }
+
+
+def summarize_health_checks(health_results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Overall health metrics, as reported by the health checker node."""
+    total_services = len(health_results)
+    healthy_services = sum(1 for result in health_results if result["is_healthy"])
+    critical_services = [r for r in health_results if r["is_critical"]]
+    critical_healthy = sum(1 for r in critical_services if r["is_healthy"])
+
+    response_times = [
+        r["response_time_ms"]
+        for r in health_results
+        if r["response_time_ms"] is not None
+    ]
+    avg_response_time = (
+        sum(response_times) / len(response_times) if response_times else 0
+    )
+    max_response_time = max(response_times) if response_times else 0
+
+    return {
+        "total_services": total_services,
+        "healthy_services": healthy_services,
+        "unhealthy_services": total_services - healthy_services,
+        "critical_services": len(critical_services),
+        "critical_healthy": critical_healthy,
+        "critical_unhealthy": len(critical_services) - critical_healthy,
+        "overall_health_percentage": (
+            round((healthy_services / total_services) * 100, 2)
+            if total_services > 0
+            else 0
+        ),
+        "critical_health_percentage": (
+            round((critical_healthy / len(critical_services)) * 100, 2)
+            if critical_services
+            else 100
+        ),
+        "average_response_time": round(avg_response_time, 2),
+        "max_response_time": round(max_response_time, 2),
+        "services_responding": len(response_times),
+    }
+
+
+class HealthProbeEngine:
+    """Probe many endpoints concurrently over a shared keep-alive pool."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 256,
+        per_host_limit: int = 8,
+        jitter_seconds: float = 0.5,
+        keepalive_seconds: float = 30.0,
+        retry_count: int = 1,
+        retry_backoff: float = 0.5,
+        seed: int | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.jitter_seconds = jitter_seconds
+        self.keepalive_seconds = keepalive_seconds
+        self.retry_count = retry_count
+        self.retry_backoff = retry_backoff
+        self._rng = random.Random(seed)
+        self._session = None
+        self._slots = None
+        self._host_slots = {}
+        self._host_in_flight = Counter()
+        self.peak_host_in_flight = 0
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.per_host_limit,
+            keepalive_timeout=self.keepalive_seconds,
+            ttl_dns_cache=300,
+            ssl=False,  # Local services may use self-signed certs
+        )
+        self._session = aiohttp.ClientSession(connector=connector)
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._session.close()
+
+    def _host_slot(self, host_key: tuple) -> asyncio.Semaphore:
+        if host_key not in self._host_slots:
+            self._host_slots[host_key] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_slots[host_key]
+
+    async def probe(self, endpoint: dict[str, Any]) -> dict[str, Any]:
+        """Check one endpoint once it holds a global and a per-host slot."""
+        parts = urlsplit(endpoint["url"])
+        host_key = (parts.scheme, parts.hostname, parts.port)
+
+        if self.jitter_seconds:
+            await asyncio.sleep(self._rng.uniform(0, self.jitter_seconds))
+
+        async with self._slots, self._host_slot(host_key):
+            self._host_in_flight[host_key] += 1
+            self.peak_host_in_flight = max(
+                self.peak_host_in_flight, self._host_in_flight[host_key]
+            )
+            try:
+                if endpoint.get("check_type") == "tcp_port":
+                    return await self._probe_tcp(endpoint, parts)
+                return await self._probe_http(endpoint)
+            except Exception as e:
+                return build_error_result(endpoint, e)
+            finally:
+                self._host_in_flight[host_key] -= 1
+
+    async def _probe_http(self, endpoint: dict[str, Any]) -> dict[str, Any]:
+        timeout = endpoint.get("timeout", 10)
+        start_time = time.perf_counter()
+        attempts = 0
+        try:
+            async with asyncio.timeout(timeout):
+                while True:
+                    attempts += 1
+                    try:
+                        async with self._session.get(endpoint["url"]) as response:
+                            body = await response.read()
+                            content_type = response.content_type
+                            status_code = response.status
+                        break
+                    except aiohttp.ClientConnectionError as e:
+                        if attempts > self.retry_count:
+                            return build_health_result(
+                                endpoint,
+                                None,
+                                (time.perf_counter() - start_time) * 1000,
+                                error_info=str(e) or type(e).__name__,
+                                attempts=attempts,
+                            )
+                        await asyncio.sleep(self.retry_backoff * attempts)
+        except TimeoutError:
+            return build_health_result(
+                endpoint,
+                None,
+                (time.perf_counter() - start_time) * 1000,
+                error_info="deadline exceeded",
+                timed_out=True,
+                attempts=attempts,
+            )
+
+        response_time = (time.perf_counter() - start_time) * 1000
+        content = body.decode(errors="replace")
+        if content_type == "application/json":
+            try:
+                content = json.loads(content)
+            except ValueError:
+                pass
+        return build_health_result(
+            endpoint,
+            status_code,
+            response_time,
+            content_type=content_type,
+            content=content,
+            error_info=None if status_code < 400 else f"HTTP {status_code}",
+            attempts=attempts,
+        )
+
+    async def _probe_tcp(self, endpoint: dict[str, Any], parts) -> dict[str, Any]:
+        timeout = endpoint.get("timeout", 10)
+        start_time = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                _, writer = await asyncio.open_connection(parts.hostname, parts.port)
+            writer.close()
+            await writer.wait_closed()
+            error_info = None
+        except TimeoutError:
+            return build_health_result(
+                endpoint,
+                None,
+                (time.perf_counter() - start_time) * 1000,
+                error_info="deadline exceeded",
+                timed_out=True,
+            )
+        except OSError as e:
+            error_info = str(e)
+        return build_health_result(
+            endpoint,
+            None,
+            (time.perf_counter() - start_time) * 1000,
+            error_info=error_info,
+        )
+
+    async def probe_all(self, endpoints: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """One sweep; results are in endpoint order."""
+        return await asyncio.gather(*(self.probe(endpoint) for endpoint in endpoints))
+
+    async def monitor(
+        self,
+        endpoints: list[dict[str, Any]],
+        interval_seconds: float,
+        sweeps: int | None = None,
+    ):
+        """Yield one result list per sweep, every ``interval_seconds`` plus jitter."""
+        sweep = 0
+        while sweeps is None or sweep < sweeps:
+            started = time.monotonic()
+            yield await self.probe_all(endpoints)
+            sweep += 1
+            delay = interval_seconds - (time.monotonic() - started)
+            await asyncio.sleep(
+                max(0.0, delay) + self._rng.uniform(0, self.jitter_seconds)
+            )
+
+
+def engine_options_from_env() -> dict[str, Any]:
+    """Engine limits from HEALTH_PROBE_* environment variables."""
+    return {
+        "max_concurrency": int(os.getenv("HEALTH_PROBE_CONCURRENCY", "256")),
+        "per_host_limit": int(os.getenv("HEALTH_PROBE_PER_HOST", "8")),
+        "jitter_seconds": float(os.getenv("HEALTH_PROBE_JITTER", "0.5")),
+    }
+
+
+def run_probe_sweep(
+    endpoints: list[dict[str, Any]], **engine_options
+) -> list[dict[str, Any]]:
+    """Run one sweep from synchronous code, such as a PythonCodeNode function."""
+
+    async def sweep():
+        async with HealthProbeEngine(**engine_options) as engine:
+            return await engine.probe_all(endpoints)
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(sweep())
+
+    # Already inside an event loop (async runtime): sweep on a worker thread
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, sweep()).result()
+
+
+def run_health_probes(config_data: dict) -> dict:
+    """Health checker node: probe every configured endpoint concurrently."""
+    endpoints = config_data.get("endpoints", [])
+    health_results = run_probe_sweep(endpoints, **engine_options_from_env())
+    return {
+        "health_checks": health_results,
+        "summary": summarize_health_checks(health_results),
+        "check_timestamp": datetime.now().isoformat(),
+    }
+
+
+# Local stub servers for exercising the engine without real services
+
+
+async def start_stub_servers(hosts: int):
+    """Start ``hosts`` aiohttp servers that serve /health/{i}?delay=&status=.
+
+    Returns the runners, their ports and the distinct client connections seen
+    per port.
+    """
+    from aiohttp import web
+
+    connections = {}
+
+    async def health(request):
+        port = request.transport.get_extra_info("sockname")[1]
+        peer = request.transport.get_extra_info("peername")
+        connections.setdefault(port, set()).add(peer)
+        await asyncio.sleep(float(request.query.get("delay", 0)) / 1000)
+        return web.json_response(
+            {"status": "ok", "service": request.match_info["service"]},
+            status=int(request.query.get("status", 200)),
+        )
+
+    app = web.Application()
+    app.router.add_get("/health/{service}", health)
+
+    runners, ports = [], []
+    for _ in range(hosts):
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        runners.append(runner)
+        ports.append(runner.addresses[0][1])
+    return runners, ports, connections
+
+
+def stub_endpoints(
+    count: int, ports: list[int], dead_port: int, seed: int = 0
+) -> list[dict[str, Any]]:
+    """Endpoints with a realistic mix of fast, slow, failing and dead services."""
+    rng = random.Random(seed)
+    endpoints = []
+    for i in range(count):
+        roll = rng.random()
+        if roll < 0.02:
+            delay, status = 5000, 200  # Hangs past its deadline
+        elif roll < 0.05:
+            delay, status = rng.uniform(5, 50), 503
+        elif roll < 0.07:
+            delay, status = rng.uniform(5, 50), 404
+        elif roll < 0.15:
+            delay, status = rng.uniform(200, 600), 200  # Slow but healthy
+        else:
+            delay, status = rng.uniform(5, 50), 200
+
+        port = dead_port if roll > 0.99 else ports[i % len(ports)]
+        endpoints.append(
+            {
+                "name": f"service-{i:04d}",
+                "url": f"http://127.0.0.1:{port}/health/{i}?delay={delay:.0f}&status={status}",
+                "critical": i % 10 == 0,
+                "service_type": ["api", "web_ui", "vector_db", "mcp"][i % 4],
+                "check_type": "http",
+                "timeout": 1.0,
+            }
+        )
+    return endpoints
+
+
+async def run_stub_demo(count: int = 2000, hosts: int = 20):
+    """Sweep stub endpoints and check limits, deadlines and connection reuse."""
+    import socket
+
+    runners, ports, connections = await start_stub_servers(hosts)
+    with socket.socket() as probe_socket:  # Bound, then closed: refuses connections
+        probe_socket.bind(("127.0.0.1", 0))
+        dead_port = probe_socket.getsockname()[1]
+    endpoints = stub_endpoints(count, ports, dead_port)
+
+    per_host_limit = 8
+    print(f"🔍 Probing {count:,} stub endpoints on {hosts} hosts")
+    try:
+        async with HealthProbeEngine(
+            max_concurrency=256,
+            per_host_limit=per_host_limit,
+            jitter_seconds=0.2,
+            retry_count=0,
+            seed=0,
+        ) as engine:
+            start = time.perf_counter()
+            results = await engine.probe_all(endpoints)
+            elapsed = time.perf_counter() - start
+
+            # A second sweep should reuse the pooled keep-alive connections
+            connections_before = sum(len(c) for c in connections.values())
+            await engine.probe_all(endpoints)
+            new_connections = (
+                sum(len(c) for c in connections.values()) - connections_before
+            )
+    finally:
+        for runner in runners:
+            await runner.cleanup()
+
+    expected_sequential = sum(
+        min(
+            float(urlsplit(e["url"]).query.split("&")[0].split("=")[1]) / 1000,
+            e["timeout"],
+        )
+        for e in endpoints
+    )
+    summary = summarize_health_checks(results)
+    issues = Counter(r["issue_type"] or "healthy" for r in results)
+    slowest = max(r["response_time_ms"] or 0 for r in results)
+
+    print(
+        f"⏱️  Sweep: {elapsed:.2f}s ({count / elapsed:,.0f} probes/sec); "
+        f"sequential would take ~{expected_sequential:,.0f}s"
+    )
+    print(
+        f"📊 Healthy {summary['healthy_services']:,}/{summary['total_services']:,}, "
+        f"outcomes: {dict(issues)}"
+    )
+    print(
+        f"🚦 Peak in-flight per host: {engine.peak_host_in_flight} "
+        f"(limit {per_host_limit}); slowest probe {slowest:.0f}ms (deadline 1000ms)"
+    )
+    print(
+        f"🔗 New connections on second sweep: {new_connections} "
+        f"(timed-out probes drop theirs: {issues['timeout']})"
+    )
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "stub":
+        asyncio.run(run_stub_demo(*(int(arg) for arg in sys.argv[2:4])))
+    else:
+        print(__doc__)
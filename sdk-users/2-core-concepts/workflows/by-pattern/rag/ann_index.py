@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Approximate Nearest-Neighbour Index Layer
+
+Pure-NumPy vector indexes for the dense retrieval path, with no external
+vector service:
+- BruteForceIndex: exact cosine search, the recall baseline
+- IVFFlatIndex: inverted-file index; k-means partitions the vectors into
+  ``nlist`` lists and a query scans only the ``nprobe`` closest lists. The
+  number of lists trained is capped at 4 * sqrt(N), and ``needs_retrain()``
+  reports when the index has grown past twice its training size
+
+Both share the same interface (build, add, delete, search, save, load), so
+callers can swap them through ``create_index``. Ids are int64, e.g. rows of
+the ChunkEmbeddingStore matrix in complete_rag_pipeline.py.
+
+Run the recall@k / QPS benchmark against brute force, or check that tiny
+corpora (0-20 vectors) build and search exactly like brute force:
+
+    python ann_index.py benchmark [num_vectors] [dim]
+    python ann_index.py check
+"""
+
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Unit-normalize rows so inner product equals cosine similarity."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first."""
+    k = min(k, len(scores))
+    if k == 0:
+        return np.empty(0, dtype=np.int64)
+    top = np.argpartition(-scores, k - 1)[:k]
+    return top[np.argsort(-scores[top])]
+
+
+class BruteForceIndex:
+    """Exact cosine search over every stored vector."""
+
+    index_type = "brute_force"
+
+    def __init__(self, dim: int):
+        self.dim = dim
+        self.ids = np.empty(0, dtype=np.int64)
+        self.vectors = np.empty((0, dim), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def build(self, vectors: np.ndarray, ids: np.ndarray) -> "BruteForceIndex":
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.vectors = _normalize(vectors)
+        return self
+
+    def add(self, vectors: np.ndarray, ids: np.ndarray) -> None:
+        self.ids = np.concatenate([self.ids, np.asarray(ids, dtype=np.int64)])
+        self.vectors = np.concatenate([self.vectors, _normalize(vectors)])
+
+    def needs_retrain(self) -> bool:
+        return False
+
+    def delete(self, ids: List[int]) -> None:
+        keep = ~np.isin(self.ids, np.asarray(ids, dtype=np.int64))
+        self.ids = self.ids[keep]
+        self.vectors = self.vectors[keep]
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """Return ``[(id, cosine_score), ...]`` best first."""
+        if len(self.ids) == 0:
+            return []
+        scores = self.vectors @ _normalize(query)[0]
+        top = _top_k(scores, k)
+        return [(int(self.ids[i]), float(scores[i])) for i in top]
+
+    def _state(self) -> Dict[str, Any]:
+        return {"ids": self.ids, "vectors": self.vectors}
+
+    def _restore(self, state: Dict[str, Any]) -> None:
+        self.ids = state["ids"]
+        self.vectors = state["vectors"]
+
+    def save(self, path: str) -> None:
+        np.savez(
+            path,
+            index_type=self.index_type,
+            config=np.array([self.dim]),
+            **self._state(),
+        )
+
+    @classmethod
+    def load(cls, path: str):
+        return load_index(path)
+
+
+class IVFFlatIndex(BruteForceIndex):
+    """
+    Inverted-file index with flat (uncompressed) lists.
+
+    Vectors are assigned to the nearest of ``nlist`` spherical k-means
+    centroids. A query ranks the centroids and scores only the vectors in
+    the ``nprobe`` best lists, so work per query is about
+    ``nlist + nprobe * N / nlist`` dot products instead of ``N``.
+
+    Training uses at most ``4 * sqrt(N)`` lists, so a small corpus does not
+    end up with one vector per list; vectors added afterwards go to the
+    existing lists, and once the index holds more than ``RETRAIN_GROWTH``
+    times its training size the caller should rebuild it.
+    """
+
+    index_type = "ivf_flat"
+    RETRAIN_GROWTH = 2.0
+
+    def __init__(self, dim: int, nlist: int = 1024, nprobe: int = 128, seed: int = 0):
+        super().__init__(dim)
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.seed = seed
+        self.trained_size = 0
+        self.centroids = np.empty((0, dim), dtype=np.float32)
+        self.list_ids: List[np.ndarray] = []
+        self.list_vectors: List[np.ndarray] = []
+        self.id_to_list: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.id_to_list)
+
+    def needs_retrain(self) -> bool:
+        """True once the index has outgrown the corpus it was trained on."""
+        return len(self) > self.RETRAIN_GROWTH * max(self.trained_size, 1)
+
+    def _train(self, vectors: np.ndarray, iterations: int = 10) -> None:
+        """Spherical k-means on a sample of at most 64 points per list."""
+        rng = np.random.default_rng(self.seed)
+        # Never more lists than vectors: tiny corpora get one list per vector
+        nlist = min(
+            len(vectors), max(1, min(self.nlist, int(4 * np.sqrt(len(vectors)))))
+        )
+        sample_size = min(len(vectors), nlist * 64)
+        sample = vectors[rng.choice(len(vectors), sample_size, replace=False)]
+
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignment = self._assign(sample, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            counts = np.bincount(assignment, minlength=nlist)
+            # Empty clusters are reseeded from random sample points
+            empty = counts == 0
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = _normalize(sums)
+        self.centroids = centroids
+        self.trained_size = len(vectors)
+
+    @staticmethod
+    def _assign(vectors: np.ndarray, centroids: np.ndarray, batch: int = 65536):
+        """Nearest centroid per vector, batched to bound the score matrix."""
+        assignment = np.empty(len(vectors), dtype=np.int64)
+        for start in range(0, len(vectors), batch):
+            block = vectors[start : start + batch] @ centroids.T
+            assignment[start : start + batch] = block.argmax(axis=1)
+        return assignment
+
+    def build(self, vectors: np.ndarray, ids: np.ndarray) -> "IVFFlatIndex":
+        vectors = _normalize(vectors)
+        ids = np.asarray(ids, dtype=np.int64)
+        self._train(vectors)
+        self.list_ids = [np.empty(0, dtype=np.int64) for _ in self.centroids]
+        self.list_vectors = [
+            np.empty((0, self.dim), dtype=np.float32) for _ in self.centroids
+        ]
+        self.id_to_list = {}
+        self._add_normalized(vectors, ids)
+        return self
+
+    def _add_normalized(self, vectors: np.ndarray, ids: np.ndarray) -> None:
+        assignment = self._assign(vectors, self.centroids)
+        order = np.argsort(assignment, kind="stable")
+        lists, starts = np.unique(assignment[order], return_index=True)
+        bounds = list(starts[1:]) + [len(order)]
+
+        for list_no, start, end in zip(lists.tolist(), starts.tolist(), bounds):
+            members = order[start:end]
+            self.list_ids[list_no] = np.concatenate(
+                [self.list_ids[list_no], ids[members]]
+            )
+            self.list_vectors[list_no] = np.concatenate(
+                [self.list_vectors[list_no], vectors[members]]
+            )
+        self.id_to_list.update(zip(ids.tolist(), assignment.tolist()))
+
+    def add(self, vectors: np.ndarray, ids: np.ndarray) -> None:
+        if len(self.centroids) == 0:
+            raise ValueError("IVFFlatIndex must be built before vectors are added")
+        self._add_normalized(_normalize(vectors), np.asarray(ids, dtype=np.int64))
+
+    def delete(self, ids: List[int]) -> None:
+        by_list: Dict[int, List[int]] = {}
+        for vector_id in ids:
+            list_no = self.id_to_list.pop(int(vector_id), None)
+            if list_no is not None:
+                by_list.setdefault(list_no, []).append(int(vector_id))
+
+        for list_no, removed in by_list.items():
+            keep = ~np.isin(self.list_ids[list_no], removed)
+            self.list_ids[list_no] = self.list_ids[list_no][keep]
+            self.list_vectors[list_no] = self.list_vectors[list_no][keep]
+
+    def search(self, query: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        if not self.id_to_list:
+            return []
+        query = _normalize(query)[0]
+        probes = _top_k(self.centroids @ query, self.nprobe)
+
+        # Score each probed list in place rather than copying vectors together
+        candidate_ids = [self.list_ids[p] for p in probes]
+        candidate_scores = [self.list_vectors[p] @ query for p in probes]
+        ids = np.concatenate(candidate_ids)
+        scores = np.concatenate(candidate_scores)
+
+        top = _top_k(scores, k)
+        return [(int(ids[i]), float(scores[i])) for i in top]
+
+    def _state(self) -> Dict[str, Any]:
+        sizes = np.array([len(ids) for ids in self.list_ids], dtype=np.int64)
+        return {
+            "centroids": self.centroids,
+            "trained_size": np.int64(self.trained_size),
+            "list_sizes": sizes,
+            "ids": (
+                np.concatenate(self.list_ids)
+                if self.list_ids
+                else np.empty(0, dtype=np.int64)
+            ),
+            "vectors": (
+                np.concatenate(self.list_vectors)
+                if self.list_vectors
+                else np.empty((0, self.dim), dtype=np.float32)
+            ),
+        }
+
+    def _restore(self, state: Dict[str, Any]) -> None:
+        self.centroids = state["centroids"]
+        # Files saved before trained_size was recorded count as trained on all
+        self.trained_size = int(state.get("trained_size", len(state["ids"])))
+        offsets = np.concatenate([[0], np.cumsum(state["list_sizes"])])
+        self.list_ids = [state["ids"][a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+        self.list_vectors = [
+            state["vectors"][a:b] for a, b in zip(offsets[:-1], offsets[1:])
+        ]
+        self.id_to_list = {
+            int(vector_id): list_no
+            for list_no, ids in enumerate(self.list_ids)
+            for vector_id in ids.tolist()
+        }
+
+    def save(self, path: str) -> None:
+        np.savez(
+            path,
+            index_type=self.index_type,
+            config=np.array([self.dim, self.nlist, self.nprobe, self.seed]),
+            **self._state(),
+        )
+
+
+INDEX_TYPES = {
+    BruteForceIndex.index_type: BruteForceIndex,
+    IVFFlatIndex.index_type: IVFFlatIndex,
+}
+
+
+def create_index(dim: int, index_type: str = "ivf_flat", **params):
+    """Create an empty index by name ("brute_force" or "ivf_flat")."""
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown index type: {index_type}")
+    return INDEX_TYPES[index_type](dim, **params)
+
+
+def load_index(path: str):
+    """Load an index written by ``save``, whatever its type."""
+    with np.load(path, allow_pickle=False) as data:
+        index_type = str(data["index_type"])
+        config = data["config"].tolist()
+        state = {key: data[key] for key in data.files}
+
+    if index_type == IVFFlatIndex.index_type:
+        dim, nlist, nprobe, seed = config
+        index = IVFFlatIndex(dim, nlist=nlist, nprobe=nprobe, seed=seed)
+    else:
+        index = BruteForceIndex(config[0])
+    index._restore(state)
+    return index
+
+
+def run_benchmark(num_vectors: int = 1_000_000, dim: int = 128, queries: int = 200):
+    """Compare IVF-flat against brute force on clustered synthetic vectors."""
+    print("=" * 60)
+    print(f"ANN benchmark: {num_vectors:,} vectors x {dim} dims, {queries} queries")
+    print("=" * 60)
+
+    # Embeddings have low intrinsic dimension: points scatter around topics
+    rng = np.random.default_rng(42)
+    noise = 1.5 / np.sqrt(dim)
+    topics = _normalize(rng.normal(size=(2000, dim)))
+    topic_of = rng.integers(0, len(topics), num_vectors)
+    vectors = _normalize(topics[topic_of] + noise * rng.normal(size=(num_vectors, dim)))
+    ids = np.arange(num_vectors, dtype=np.int64)
+    query_vectors = _normalize(
+        topics[rng.integers(0, len(topics), queries)]
+        + noise * rng.normal(size=(queries, dim))
+    )
+
+    exact = BruteForceIndex(dim).build(vectors, ids)
+    start = time.perf_counter()
+    truth = [exact.search(q, 10) for q in query_vectors]
+    exact_seconds = (time.perf_counter() - start) / queries
+    print(
+        f"\nBrute force: {exact_seconds * 1000:.2f} ms/query, {1 / exact_seconds:,.0f} QPS"
+    )
+
+    nlist = max(16, int(4 * np.sqrt(num_vectors)))
+    start = time.perf_counter()
+    ivf = IVFFlatIndex(dim, nlist=nlist).build(vectors, ids)
+    print(f"IVF-flat build (nlist={nlist}): {time.perf_counter() - start:.1f}s")
+
+    truth_sets = [{vector_id for vector_id, _ in hits} for hits in truth]
+    for nprobe in (4, 8, 16, 32, 64, 128):
+        ivf.nprobe = nprobe
+        start = time.perf_counter()
+        results = [ivf.search(q, 10) for q in query_vectors]
+        seconds = (time.perf_counter() - start) / queries
+        recall = np.mean(
+            [
+                len(truth_set & {vector_id for vector_id, _ in hits}) / 10
+                for truth_set, hits in zip(truth_sets, results)
+            ]
+        )
+        print(
+            f"  nprobe={nprobe:>3}: recall@10 {recall:.3f}, "
+            f"{seconds * 1000:.2f} ms/query, {1 / seconds:,.0f} QPS "
+            f"({exact_seconds / seconds:.0f}x)"
+        )
+
+
+def check_small_corpora(max_vectors: int = 20, dim: int = 8) -> bool:
+    """Build IVF-flat on 0..max_vectors vectors; results must match brute force."""
+    rng = np.random.default_rng(0)
+    failures = []
+    for n in range(max_vectors + 1):
+        vectors = rng.normal(size=(n, dim)).astype(np.float32)
+        ids = np.arange(n, dtype=np.int64)
+        query = rng.normal(size=dim)
+        try:
+            ivf = IVFFlatIndex(dim).build(vectors, ids)
+            ivf.nprobe = max(len(ivf.centroids), 1)  # Probe every list: exact
+            got = [vector_id for vector_id, _ in ivf.search(query, 5)]
+        except ValueError as e:
+            failures.append(f"N={n}: {e}")
+            continue
+        expected = [
+            vector_id
+            for vector_id, _ in BruteForceIndex(dim)
+            .build(vectors, ids)
+            .search(query, 5)
+        ]
+        if got != expected:
+            failures.append(f"N={n}: {got} != {expected}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if not failures:
+        print(f"✅ IVF-flat matches brute force for 0-{max_vectors} vectors")
+    return not failures
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_benchmark(*(int(arg) for arg in sys.argv[2:4]))
+    elif len(sys.argv) > 1 and sys.argv[1] == "check":
+        sys.exit(0 if check_small_corpora() else 1)
+    else:
+        print(__doc__)
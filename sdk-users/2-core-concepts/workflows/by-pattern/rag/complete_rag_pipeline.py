@@ -10,16 +10,308 @@ Demonstrates a production-ready RAG system using the new advanced nodes:
 This example shows real-world usage patterns and best practices.
 """
 
+import hashlib
 import json
+import sqlite3
+import sys
+from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List
 
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent))
+from ann_index import create_index, load_index
 from kailash.nodes.data.retrieval import HybridRetrieverNode, RelevanceScorerNode
 
 # Import the new advanced RAG nodes
 from kailash.nodes.transform.chunkers import SemanticChunkerNode, StatisticalChunkerNode
 
 
+class ChunkEmbeddingStore:
+    """
+    Persistent, content-hash keyed store for chunks and their embeddings.
+
+    Layout of ``path``:
+        chunks.sqlite   document hashes and chunk metadata (one row per chunk)
+        embeddings.f32  memory-mapped float32 matrix, one unit-normalized row
+                        per chunk, addressed by the chunk's ``row`` number
+        ann_index.npz   optional ANN index over the live rows (see ann_index.py),
+                        reused only while the live row set it was saved with
+                        is unchanged, and rebuilt once it outgrows its training
+
+    Replacing a document tombstones its old rows and appends new ones, so
+    existing rows never move and readers can keep using a mapped view.
+    """
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self, path: str, dim: int, ann: Dict[str, Any] = None):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.dim = dim
+        self.matrix_path = self.path / "embeddings.f32"
+
+        self.db = sqlite3.connect(str(self.path / "chunks.sqlite"))
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS documents (
+                document_id TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                chunk_count INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS chunks (
+                row INTEGER PRIMARY KEY,
+                document_id TEXT NOT NULL,
+                chunk_json TEXT NOT NULL,
+                deleted INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_chunks_document ON chunks (document_id);
+            """)
+
+        stored_dim = self._get_meta("dim")
+        if stored_dim is not None and int(stored_dim) != dim:
+            raise ValueError(
+                f"Store at {self.path} holds {stored_dim}-dim embeddings, got dim={dim}"
+            )
+        self._set_meta("dim", str(dim))
+        self.row_count = int(self._get_meta("row_count") or 0)
+        self.db.commit()
+
+        self._live_mask = None
+
+        # ANN index is built or loaded lazily on the first search
+        self.ann = dict(ann) if ann else None
+        self.index_path = self.path / "ann_index.npz"
+        self.index = None
+
+    def _get_meta(self, key: str):
+        row = self.db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self.db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+    @staticmethod
+    def content_hash(document: Dict[str, Any], chunking_key: str) -> str:
+        """Hash everything that determines a document's chunks and embeddings."""
+        payload = json.dumps(
+            {
+                "content": document.get("content", ""),
+                "title": document.get("title", ""),
+                "metadata": document.get("metadata", {}),
+                "chunking": chunking_key,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def is_current(self, document_id: str, content_hash: str) -> bool:
+        row = self.db.execute(
+            "SELECT content_hash FROM documents WHERE document_id = ?", (document_id,)
+        ).fetchone()
+        return row is not None and row[0] == content_hash
+
+    def get_document_chunks(self, document_id: str) -> List[Dict[str, Any]]:
+        rows = self.db.execute(
+            "SELECT chunk_json FROM chunks WHERE document_id = ? AND deleted = 0 "
+            "ORDER BY row",
+            (document_id,),
+        )
+        return [json.loads(chunk_json) for (chunk_json,) in rows]
+
+    def _ensure_capacity(self, rows_needed: int) -> None:
+        """Grow the embedding file by doubling; existing rows stay in place."""
+        current_rows = (
+            self.matrix_path.stat().st_size // (4 * self.dim)
+            if self.matrix_path.exists()
+            else 0
+        )
+        if rows_needed <= current_rows:
+            return
+        capacity = max(current_rows, self.INITIAL_CAPACITY)
+        while capacity < rows_needed:
+            capacity *= 2
+        with open(self.matrix_path, "ab") as f:
+            f.truncate(capacity * 4 * self.dim)
+
+    def replace_document(
+        self,
+        document_id: str,
+        content_hash: str,
+        chunks: List[Dict[str, Any]],
+        embeddings: List[List[float]],
+    ) -> None:
+        """Tombstone the document's previous chunks and append the new ones."""
+        vectors = np.asarray(embeddings, dtype=np.float32).reshape(-1, self.dim)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = vectors / np.where(norms == 0, 1, norms)
+
+        start = self.row_count
+        self._ensure_capacity(start + len(chunks))
+        if len(chunks):
+            matrix = np.memmap(
+                self.matrix_path,
+                dtype=np.float32,
+                mode="r+",
+                offset=start * 4 * self.dim,
+                shape=(len(chunks), self.dim),
+            )
+            matrix[:] = vectors
+            matrix.flush()
+            del matrix
+
+        if self.index is not None:
+            old_rows = [
+                row
+                for (row,) in self.db.execute(
+                    "SELECT row FROM chunks WHERE document_id = ? AND deleted = 0",
+                    (document_id,),
+                )
+            ]
+            self.index.delete(old_rows)
+            if len(chunks):
+                self.index.add(vectors, np.arange(start, start + len(chunks)))
+            if self.index.needs_retrain():
+                self.index = None  # Rebuilt with more lists on the next search
+
+        with self.db:
+            self.db.execute(
+                "UPDATE chunks SET deleted = 1 WHERE document_id = ?", (document_id,)
+            )
+            self.db.executemany(
+                "INSERT INTO chunks (row, document_id, chunk_json) VALUES (?, ?, ?)",
+                [
+                    (start + i, document_id, json.dumps(chunk, default=str))
+                    for i, chunk in enumerate(chunks)
+                ],
+            )
+            self.db.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+                (document_id, content_hash, len(chunks), datetime.now().isoformat()),
+            )
+            self.row_count = start + len(chunks)
+            self._set_meta("row_count", str(self.row_count))
+
+        self._live_mask = None
+
+    def embedding_matrix(self) -> np.ndarray:
+        """Zero-copy, read-only view of all embedding rows written so far."""
+        if self.row_count == 0:
+            return np.empty((0, self.dim), dtype=np.float32)
+        return np.memmap(
+            self.matrix_path,
+            dtype=np.float32,
+            mode="r",
+            shape=(self.row_count, self.dim),
+        )
+
+    def live_mask(self) -> np.ndarray:
+        """Boolean mask of rows that belong to current document versions."""
+        if self._live_mask is None or len(self._live_mask) != self.row_count:
+            mask = np.zeros(self.row_count, dtype=bool)
+            live_rows = [
+                row
+                for (row,) in self.db.execute(
+                    "SELECT row FROM chunks WHERE deleted = 0"
+                )
+            ]
+            mask[live_rows] = True
+            self._live_mask = mask
+        return self._live_mask
+
+    def get_chunks_by_rows(self, rows: List[int]) -> List[Dict[str, Any]]:
+        """Fetch chunk records for matrix rows, preserving the given order."""
+        if not rows:
+            return []
+        placeholders = ", ".join("?" * len(rows))
+        found = dict(
+            self.db.execute(
+                f"SELECT row, chunk_json FROM chunks WHERE row IN ({placeholders})",
+                [int(r) for r in rows],
+            )
+        )
+        return [json.loads(found[int(r)]) for r in rows]
+
+    def live_fingerprint(self) -> str:
+        """Hash of the live row numbers; any replace or delete changes it."""
+        live_rows = np.flatnonzero(self.live_mask()).astype(np.int64)
+        return hashlib.sha256(live_rows.tobytes()).hexdigest()
+
+    def _ensure_index(self):
+        """Load the saved ANN index if it is current, otherwise build it."""
+        if self.index is not None or self.ann is None:
+            return self.index
+
+        params = dict(self.ann)
+        index_type = params.pop("type", "ivf_flat")
+        if (
+            self.index_path.exists()
+            and self._get_meta("ann_type") == index_type
+            and self._get_meta("ann_fingerprint") == self.live_fingerprint()
+        ):
+            index = load_index(str(self.index_path))
+            if not index.needs_retrain():
+                self.index = index
+                if "nprobe" in params:
+                    self.index.nprobe = params["nprobe"]
+                return self.index
+
+        live_rows = np.flatnonzero(self.live_mask())
+        if len(live_rows):
+            self.index = create_index(self.dim, index_type, **params).build(
+                self.embedding_matrix()[live_rows], live_rows
+            )
+        return self.index
+
+    def save_index(self) -> None:
+        """Persist the ANN index with the live row set it reflects."""
+        if self.index is None:
+            return
+        self.index.save(str(self.index_path))
+        with self.db:
+            self._set_meta("ann_type", self.index.index_type)
+            self._set_meta("ann_fingerprint", self.live_fingerprint())
+
+    def search(self, query_embedding: List[float], top_k: int) -> List[tuple]:
+        """Cosine search over live rows: [(row, score), ...].
+
+        Uses the ANN index when one is configured, otherwise scans the mapped
+        matrix exactly.
+        """
+        index = self._ensure_index()
+        if index is not None:
+            if not np.any(query_embedding):
+                return []
+            return index.search(np.asarray(query_embedding, dtype=np.float32), top_k)
+
+        matrix = self.embedding_matrix()
+        if len(matrix) == 0:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return []
+        scores = matrix @ (query / query_norm)
+        scores[~self.live_mask()] = -np.inf
+
+        k = min(top_k, int(self.live_mask().sum()))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(row), float(scores[row])) for row in top]
+
+    def close(self) -> None:
+        self.save_index()
+        self.db.close()
+
+
 class AdvancedRAGPipeline:
     """Production-ready RAG pipeline using advanced Kailash nodes."""
 
@@ -64,9 +356,19 @@ class AdvancedRAGPipeline:
             top_k=self.config["scoring"]["top_k"],
         )
 
-        # Storage for processed documents
+        # Storage for processed documents; persistent when a storage path is set
         self.document_chunks = []
         self.chunk_embeddings = []
+        storage = self.config.get("storage", {})
+        self.store = (
+            ChunkEmbeddingStore(
+                storage["path"],
+                storage.get("embedding_dim", 5),
+                ann=self.config["retrieval"].get("ann"),
+            )
+            if storage.get("path")
+            else None
+        )
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration for the RAG pipeline."""
@@ -91,8 +393,13 @@ class AdvancedRAGPipeline:
                 "sparse_weight": 0.4,
                 "top_k": 5,
                 "rrf_k": 60,
+                # e.g. {"type": "ivf_flat", "nlist": 1024, "nprobe": 128}; None
+                # keeps exact brute-force dense search
+                "ann": None,
             },
             "scoring": {"similarity_method": "cosine", "top_k": 3},
+            # Set "path" to persist chunks and embeddings across restarts
+            "storage": {"path": None, "embedding_dim": 5},
         }
 
     def process_documents(
@@ -121,11 +428,44 @@ class AdvancedRAGPipeline:
             "documents_processed": [],
         }
 
+        chunking_key = json.dumps(
+            {"method": chunking_method, **self.config["chunking"][chunking_method]},
+            sort_keys=True,
+        )
+        processing_stats["documents_reused"] = 0
+
         for doc in documents:
             doc_id = doc.get("id", f"doc_{len(all_chunks)}")
             content = doc.get("content", "")
             metadata = doc.get("metadata", {})
 
+            # Unchanged documents are served from the store without re-chunking
+            content_hash = None
+            if self.store is not None:
+                content_hash = self.store.content_hash(doc, chunking_key)
+                if self.store.is_current(doc_id, content_hash):
+                    doc_chunks = self.store.get_document_chunks(doc_id)
+                    all_chunks.extend(doc_chunks)
+                    processing_stats["documents_reused"] += 1
+                    processing_stats["documents_processed"].append(
+                        {
+                            "document_id": doc_id,
+                            "original_length": len(content),
+                            "chunks_created": len(doc_chunks),
+                            "avg_chunk_length": (
+                                sum(len(c["content"]) for c in doc_chunks)
+                                / len(doc_chunks)
+                                if doc_chunks
+                                else 0
+                            ),
+                            "reused": True,
+                        }
+                    )
+                    print(
+                        f"   ♻️  {doc_id}: unchanged, {len(doc_chunks)} stored chunks"
+                    )
+                    continue
+
             # Add document metadata
             chunk_metadata = {
                 "document_id": doc_id,
@@ -151,6 +491,16 @@ class AdvancedRAGPipeline:
             doc_chunks = result["chunks"]
             all_chunks.extend(doc_chunks)
 
+            # Only the store keeps embeddings; without one, retrieval embeds
+            # the chunks it scores
+            if self.store is not None:
+                embeddings = [
+                    self._simulate_embedding(c["content"]) for c in doc_chunks
+                ]
+                self.store.replace_document(
+                    doc_id, content_hash, doc_chunks, embeddings
+                )
+
             # Update statistics
             doc_stats = {
                 "document_id": doc_id,
@@ -189,29 +539,10 @@ class AdvancedRAGPipeline:
         Simulate dense and sparse retrieval results.
         In production, these would come from actual retrieval systems.
         """
-        # Simulate dense retrieval (semantic similarity)
-        # In practice, this would use vector similarity search
-        dense_results = []
-        for i, chunk in enumerate(chunks[:8]):  # Take top 8 for dense
-            # Simulate similarity score based on keyword overlap
-            query_words = set(query.lower().split())
-            chunk_words = set(chunk["content"].lower().split())
-            overlap = len(query_words & chunk_words)
-
-            dense_score = min(0.5 + (overlap * 0.15), 1.0)
-
-            dense_chunk = {
-                "id": chunk["chunk_id"],
-                "content": chunk["content"],
-                "similarity_score": dense_score,
-                "retrieval_method": "dense_semantic",
-                **{k: v for k, v in chunk.items() if k not in ["chunk_id", "content"]},
-            }
-            dense_results.append(dense_chunk)
-
-        # Sort by dense score
-        dense_results.sort(key=lambda x: x["similarity_score"], reverse=True)
-        dense_results = dense_results[:6]  # Top 6 dense results
+        if self.store is not None:
+            dense_results = self.dense_search(query, top_k=6)
+        else:
+            dense_results = self._simulate_dense_results(query, chunks)
 
         # Simulate sparse retrieval (keyword matching)
         sparse_results = []
@@ -247,6 +578,45 @@ class AdvancedRAGPipeline:
 
         return {"dense_results": dense_results, "sparse_results": sparse_results}
 
+    def dense_search(self, query: str, top_k: int) -> List[Dict]:
+        """Dense retrieval by cosine similarity (ANN index or exact scan)."""
+        hits = self.store.search(self._simulate_embedding(query), top_k)
+        chunks = self.store.get_chunks_by_rows([row for row, _ in hits])
+        return [
+            {
+                "id": chunk["chunk_id"],
+                "content": chunk["content"],
+                "similarity_score": score,
+                "retrieval_method": "dense_semantic",
+                **{k: v for k, v in chunk.items() if k not in ["chunk_id", "content"]},
+            }
+            for (_, score), chunk in zip(hits, chunks)
+        ]
+
+    def _simulate_dense_results(self, query: str, chunks: List[Dict]) -> List[Dict]:
+        """Keyword-overlap stand-in for dense retrieval when no store is configured."""
+        dense_results = []
+        for i, chunk in enumerate(chunks[:8]):  # Take top 8 for dense
+            # Simulate similarity score based on keyword overlap
+            query_words = set(query.lower().split())
+            chunk_words = set(chunk["content"].lower().split())
+            overlap = len(query_words & chunk_words)
+
+            dense_score = min(0.5 + (overlap * 0.15), 1.0)
+
+            dense_chunk = {
+                "id": chunk["chunk_id"],
+                "content": chunk["content"],
+                "similarity_score": dense_score,
+                "retrieval_method": "dense_semantic",
+                **{k: v for k, v in chunk.items() if k not in ["chunk_id", "content"]},
+            }
+            dense_results.append(dense_chunk)
+
+        # Sort by dense score
+        dense_results.sort(key=lambda x: x["similarity_score"], reverse=True)
+        return dense_results[:6]  # Top 6 dense results
+
     def perform_hybrid_retrieval(
         self, query: str, dense_results: List[Dict], sparse_results: List[Dict]
     ) -> Dict[str, Any]:
@@ -399,8 +769,6 @@ class AdvancedRAGPipeline:
 
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
-        from datetime import datetime
-
         return datetime.now().isoformat()
 
 
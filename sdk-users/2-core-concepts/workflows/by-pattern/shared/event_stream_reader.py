@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Streaming Event Reader
+======================
+
+Bounded-memory reader for event files of any size, shared by
+data-processing/scripts/realtime_event_processor.py and
+event-driven/scripts/event_sourcing_workflow.py:
+
+- Reads NDJSON (one event per line) or a JSON array, either top-level or
+  wrapped as ``{"events": [...]}``, in fixed-size chunks; arrays are decoded
+  element by element, never as a whole
+- Yields batches of ``batch_size`` source records: the validated events, plus
+  the rejected records (malformed JSON or failed validation) alongside
+- Each batch carries the byte ``offset`` just past its last record; passing
+  it back as ``offset`` (with the record count as ``skip``) resumes with a
+  seek. Given only ``skip``, NDJSON lines are counted without decoding, but
+  array elements must be decoded to find where each one ends
+- Parses on a background thread into a queue of at most ``max_pending``
+  batches, so parsing overlaps downstream processing and blocks when the
+  downstream stages fall behind
+
+Peak memory is about ``(max_pending + 2) * batch_size`` events, whatever the
+file size.
+
+Usage:
+    reader = EventStreamReader("data/events.ndjson", batch_size=10_000)
+    for batch in reader.batches():
+        runtime.execute(workflow, parameters={"event_reader": {"events": batch["events"]}})
+
+    python event_stream_reader.py benchmark [gigabytes] [ndjson|array] [batch_size]
+"""
+
+import io
+import json
+import os
+import queue
+import random
+import resource
+import sys
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+CHUNK_CHARS = 1 << 20  # Characters read per chunk when decoding an array
+MAX_RECORD_CHARS = 64 << 20  # Larger array elements are treated as malformed
+_WHITESPACE = " \t\n\r"
+
+
+class EventStreamReader:
+    """Read events from an NDJSON or JSON array file in fixed-size batches."""
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 10_000,
+        validate: Optional[Callable[[Any], Optional[str]]] = None,
+        max_pending: int = 2,
+        skip: int = 0,
+        file_format: Optional[str] = None,
+        array_key: str = "events",
+        offset: int = 0,
+    ):
+        self.path = path
+        self.batch_size = batch_size
+        self.validate = validate
+        self.max_pending = max_pending
+        self.skip = skip
+        self.file_format = file_format or (
+            "ndjson" if path.endswith((".ndjson", ".jsonl")) else "array"
+        )
+        self.array_key = array_key
+        self.offset = offset
+        self.records_read = 0
+        self.events_read = 0
+        self.invalid_count = 0
+
+    def _records(self) -> Iterator[Any]:
+        """Decoded records in file order; malformed ones come back as exceptions.
+
+        Sets ``_position`` to a function returning the byte offset just past
+        the last record yielded.
+        """
+        if self.file_format == "ndjson":
+            with open(self.path, "rb") as f:
+                f.seek(self.offset)
+                position = self.offset
+                self._position = lambda: position
+                skipped = self.skip if self.offset else 0
+                for line in f:
+                    position += len(line)
+                    if not line.strip():
+                        continue
+                    if skipped < self.skip:  # Already consumed: count, don't decode
+                        skipped += 1
+                        yield None
+                    else:
+                        try:
+                            yield json.loads(line)
+                        except ValueError as e:
+                            yield e
+        else:
+            yield from self._array_records()
+
+    def _array_records(self) -> Iterator[Any]:
+        decoder = json.JSONDecoder()
+        with open(self.path, "rb") as raw:
+            raw.seek(self.offset)
+            # No newline translation, so characters map back to file bytes
+            f = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+            buffer, pos, eof = "", 0, False
+            consumed = self.offset  # File bytes before ``buffer``
+            last_end = 0  # End of the last element yielded, within ``buffer``
+            self._position = lambda: consumed + len(buffer[:last_end].encode("utf-8"))
+
+            def fill():
+                nonlocal buffer, pos, eof, consumed, last_end
+                chunk = f.read(CHUNK_CHARS)
+                eof = not chunk
+                consumed += len(buffer[:last_end].encode("utf-8"))
+                buffer = buffer[last_end:] + chunk
+                pos -= last_end
+                last_end = 0
+
+            fill()
+            # Find the opening bracket: top-level, or the value of array_key.
+            # Resuming from an offset starts inside the array, past an element.
+            if not self.offset:
+                while True:
+                    stripped = buffer.lstrip(_WHITESPACE)
+                    if stripped or eof:
+                        break
+                    fill()
+                if not stripped.startswith("["):
+                    marker = f'"{self.array_key}"'
+                    while marker not in buffer and not eof:
+                        fill()
+                    if marker not in buffer:
+                        raise ValueError(f"No '{self.array_key}' array in {self.path}")
+                    pos = buffer.index(marker) + len(marker)
+                while "[" not in buffer[pos:] and not eof:
+                    fill()
+                pos = last_end = buffer.index("[", pos) + 1
+
+            while True:
+                while pos < len(buffer) and buffer[pos] in _WHITESPACE + ",":
+                    pos += 1
+                if pos >= len(buffer):
+                    if eof:
+                        raise ValueError(f"Unterminated event array in {self.path}")
+                    fill()
+                    continue
+                if buffer[pos] == "]":
+                    return
+                try:
+                    record, end = decoder.raw_decode(buffer, pos)
+                except ValueError as e:
+                    if eof or len(buffer) - pos > MAX_RECORD_CHARS:
+                        raise ValueError(f"Malformed event array in {self.path}") from e
+                    fill()  # Element spans the chunk boundary
+                    continue
+                pos = last_end = end
+                yield record
+
+    def _parse_batches(self) -> Iterator[Dict[str, Any]]:
+        events: List[Any] = []
+        invalid_events: List[Dict[str, Any]] = []
+        batch_records = 0
+        batch_number = 0
+        if self.offset:  # The records before the offset are the first ``skip``
+            self.records_read = self.skip
+        for record in self._records():
+            self.records_read += 1
+            if self.records_read <= self.skip:
+                continue
+            batch_records += 1
+            if isinstance(record, Exception):
+                reason = f"Malformed JSON: {record}"
+            else:
+                reason = self.validate(record) if self.validate else None
+            if reason:
+                malformed = isinstance(record, Exception)
+                invalid_events.append(
+                    {"event": None if malformed else record, "reason": reason}
+                )
+                self.invalid_count += 1
+            else:
+                events.append(record)
+                self.events_read += 1
+            if batch_records >= self.batch_size:
+                yield {
+                    "events": events,
+                    "invalid_events": invalid_events,
+                    "records": batch_records,
+                    "batch_number": batch_number,
+                    "offset": self._position(),
+                }
+                events, invalid_events, batch_records = [], [], 0
+                batch_number += 1
+        if batch_records:
+            yield {
+                "events": events,
+                "invalid_events": invalid_events,
+                "records": batch_records,
+                "batch_number": batch_number,
+                "offset": self._position(),
+            }
+
+    def batches(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield ``{"events", "invalid_events", "records", "batch_number", "offset"}``.
+
+        ``records`` counts every source record the batch consumed, valid or
+        not, and ``offset`` is the byte position just past the batch, so
+        callers can checkpoint a position in the source and resume from it.
+        """
+        if self.max_pending <= 0:
+            yield from self._parse_batches()
+            return
+
+        pending = queue.Queue(maxsize=self.max_pending)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            """Wait for queue space (back-pressure) unless the consumer left."""
+            while not stop.is_set():
+                try:
+                    pending.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for batch in self._parse_batches():
+                    if not put(batch):
+                        return
+                put(done)
+            except Exception as e:
+                put(e)
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = pending.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process, in MB."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except OSError:  # Not Linux: fall back to the peak
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def write_synthetic_events(path: str, gigabytes: float, file_format: str) -> int:
+    """Write roughly ``gigabytes`` of order events; returns the event count."""
+    target = int(gigabytes * 1e9)
+    event_types = ["OrderCreated", "PaymentProcessed", "OrderShipped"]
+    rng = random.Random(0)
+    written, count = 0, 0
+    with open(path, "w", encoding="utf-8") as f:
+        if file_format == "array":
+            f.write('{"metadata": {"version": "1.0"}, "events": [\n')
+        while written < target:
+            lines = []
+            for _ in range(10_000):
+                event = {
+                    "event_id": f"evt-{count:012d}",
+                    "event_type": event_types[count % 3],
+                    "aggregate_id": f"ORDER-{count // 3:011d}",
+                    "timestamp": "2024-01-15T08:30:00Z",
+                    "data": {
+                        "customer_id": f"CUST-{rng.randrange(100_000):06d}",
+                        "total_amount": round(rng.uniform(10, 500), 2),
+                        "status": "pending",
+                    },
+                    "metadata": {"source": "order-service", "version": 1},
+                }
+                lines.append(json.dumps(event))
+                count += 1
+            separator = "\n" if file_format == "ndjson" else ",\n"
+            text = separator.join(lines)
+            if file_format == "array" and written:
+                text = separator + text
+            elif file_format == "ndjson":
+                text += "\n"
+            f.write(text)
+            written += len(text)
+        if file_format == "array":
+            f.write("\n]}\n")
+    return count
+
+
+def run_reader_benchmark(
+    gigabytes: float = 10.0, file_format: str = "ndjson", batch_size: int = 10_000
+):
+    """Events/sec and RSS while streaming a synthetic event file."""
+    suffix = ".ndjson" if file_format == "ndjson" else ".json"
+    fd, path = tempfile.mkstemp(prefix="events_", suffix=suffix)
+    os.close(fd)
+    try:
+        print("=" * 70)
+        print(f"Streaming reader: {gigabytes:g} GB {file_format}, batch {batch_size:,}")
+        print("=" * 70)
+        start = time.perf_counter()
+        total = write_synthetic_events(path, gigabytes, file_format)
+        print(
+            f"  wrote {total:,} events ({os.path.getsize(path) / 1e9:.2f} GB) "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+
+        def downstream(events):  # Stand-in for the DataTransformer stages
+            return sum(e["data"]["total_amount"] for e in events)
+
+        reader = EventStreamReader(path, batch_size=batch_size)
+        baseline_rss = current_rss_mb()
+        checkpoints = {int(total * step / 10) for step in range(1, 11)}
+        samples = []
+        start = time.perf_counter()
+        next_report = min(checkpoints)
+        for batch in reader.batches():
+            downstream(batch["events"])
+            if reader.events_read >= next_report:
+                rss = current_rss_mb()
+                samples.append(rss)
+                elapsed = time.perf_counter() - start
+                print(
+                    f"  {reader.events_read:>14,} events  "
+                    f"{reader.events_read / elapsed:>10,.0f} events/sec  "
+                    f"RSS {rss:7.1f} MB"
+                )
+                remaining = [c for c in checkpoints if c > reader.events_read]
+                next_report = min(remaining) if remaining else float("inf")
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"✅ {reader.events_read:,} events in {elapsed:.1f}s "
+            f"({reader.events_read / elapsed:,.0f} events/sec); RSS "
+            f"{baseline_rss:.1f} MB before, {min(samples):.1f}-{max(samples):.1f} MB "
+            f"while streaming"
+        )
+        return samples
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        args = sys.argv[2:5]
+        run_reader_benchmark(
+            float(args[0]) if args else 10.0,
+            args[1] if len(args) > 1 else "ndjson",
+            int(args[2]) if len(args) > 2 else 10_000,
+        )
+    else:
+        print(__doc__)
@@ -33,10 +33,29 @@ Use Cases:
 - Manufacturing: Production line state tracking with quality control integration
 - Legal services: Case management with document state and collaboration tracking
 - E-commerce: Shopping cart persistence with cross-device session continuity
+
+Session store:
+- Every session created by EnterpriseSessionManagerNode is registered in a
+  SessionStore (session_store.py): a compact record per session, per-user and
+  per-department indexes, and a timing wheel that enforces the department
+  timeout from get_session_timeout()
+- Set SESSION_STORE_DB to a SQLite path to persist sessions across restarts;
+  each node run commits its changes, and the store is closed at exit
+- load_session(session_id) rebuilds the full nested session of a live session
+- Access and refresh tokens are stored only as SHA-256 hashes, checked with
+  verify_session_token(); the session encryption key is never stored
+
+Usage:
+    python enterprise_session_state_management.py
+    python enterprise_session_state_management.py benchmark [sessions]
 """
 
+import atexit
+import hashlib
+import hmac
 import json
 import logging
+import os
 import random
 import sys
 import time
@@ -63,6 +82,9 @@ from kailash.workflow.graph import Workflow
 
 from examples.utils.paths import get_data_dir
 
+sys.path.insert(0, str(Path(__file__).parent))
+from session_store import SessionStore, sweep_naive
+
 # Configure enterprise-focused logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -118,65 +140,229 @@ class EnterpriseSessionManagerNode(Node):
         if session_config is None:
             session_config = {}
 
-        session_start = time.time()
-        session_id = str(uuid.uuid4())
+        session = build_session(user_id, session_type, department, session_config)
+
+        # Register with the shared store; timed-out sessions are swept first
+        store = get_session_store()
+        store.expire()
+        record = store.create(
+            session["session_data"]["session_id"],
+            user_id,
+            department,
+            session_type,
+            ttl_seconds=get_session_timeout(department) * 60,
+            payload=session_payload(session),
+            now=session["session_analytics"]["session_creation_time"],
+        )
+        session["session_data"]["expires_at"] = datetime.fromtimestamp(
+            record.expires_at
+        ).isoformat()
+        session["session_analytics"]["active_user_sessions"] = store.user_session_count(
+            user_id
+        )
+        # Commit the new session and any swept ones before the node returns
+        store.flush()
+        return session
+
+
+def build_session(
+    user_id: str,
+    session_type: str,
+    department: str,
+    session_config: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Full nested session: data, state, analytics and security features."""
+    session_start = time.time()
+    session_id = str(uuid.uuid4())
+
+    # Generate enterprise session data
+    session_data = {
+        "session_id": session_id,
+        "user_id": user_id,
+        "session_type": session_type,
+        "department": department,
+        "created_at": datetime.now().isoformat(),
+        "status": "active",
+        "security_level": determine_security_level(department),
+        "permissions": generate_user_permissions(department),
+        "session_metadata": {
+            "browser_info": simulate_browser_info(),
+            "device_type": random.choice(["desktop", "tablet", "mobile"]),
+            "location": simulate_user_location(),
+            "ip_address": f"192.168.{random.randint(1, 255)}.{random.randint(1, 255)}",
+            "user_agent": simulate_user_agent(),
+        },
+    }
+
+    # Initialize session state with business context
+    initial_state = {
+        "workflow_state": {
+            "current_step": "initialization",
+            "completed_steps": [],
+            "pending_tasks": [],
+            "business_data": {},
+            "form_data": {},
+            "file_uploads": [],
+            "external_api_cache": {},
+        },
+        "user_context": {
+            "preferences": generate_user_preferences(user_id),
+            "recent_actions": [],
+            "session_history": [],
+            "bookmarks": [],
+            "custom_settings": session_config.get("custom_settings", {}),
+        },
+        "business_metrics": {
+            "actions_count": 0,
+            "time_spent_minutes": 0,
+            "data_processed_mb": 0,
+            "api_calls_made": 0,
+            "errors_encountered": 0,
+        },
+        "collaboration": {
+            "shared_with": [],
+            "comments": [],
+            "notifications": [],
+            "team_workspace": {},
+        },
+    }
+
+    # Session analytics and tracking
+    session_analytics = {
+        "session_creation_time": session_start,
+        "expected_duration_minutes": random.randint(15, 180),
+        "business_priority": calculate_business_priority(session_type, department),
+        "resource_allocation": {
+            "cpu_quota": calculate_cpu_quota(department),
+            "memory_limit_mb": calculate_memory_limit(department),
+            "storage_quota_gb": calculate_storage_quota(department),
+            "api_rate_limit": calculate_api_rate_limit(department),
+        },
+        "compliance_requirements": {
+            "data_retention_days": get_data_retention_period(department),
+            "encryption_required": department in ["finance", "healthcare", "legal"],
+            "audit_logging": department in ["finance", "healthcare", "legal", "hr"],
+            "gdpr_applicable": True,
+            "hipaa_applicable": department == "healthcare",
+        },
+    }
+
+    # Enterprise security features
+    security_features = {
+        "access_token": generate_secure_token(),
+        "refresh_token": generate_secure_token(),
+        "session_encryption_key": generate_encryption_key(),
+        "mfa_required": department in ["finance", "executive", "hr"],
+        "session_timeout_minutes": get_session_timeout(department),
+        "concurrent_session_limit": get_concurrent_limit(department),
+        "ip_restrictions": get_ip_restrictions(department),
+    }
+
+    return {
+        "session_data": session_data,
+        "session_state": initial_state,
+        "session_analytics": session_analytics,
+        "security_features": security_features,
+    }
+
+
+_session_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """Process-wide session store; persisted to SQLite when SESSION_STORE_DB is set."""
+    global _session_store
+    if _session_store is None:
+        _session_store = SessionStore(db_path=os.getenv("SESSION_STORE_DB") or None)
+        atexit.register(close_session_store)
+    return _session_store
+
+
+def close_session_store() -> None:
+    """Flush and close the process-wide session store, if one was opened."""
+    global _session_store
+    if _session_store is not None:
+        _session_store.close()
+        _session_store = None
 
-        # Generate enterprise session data
-        session_data = {
-            "session_id": session_id,
-            "user_id": user_id,
+
+def session_payload(session: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Per-session parts of a built session, as kept in the store.
+
+    Permissions, quotas, compliance flags, priority and timeouts are functions
+    of department and session type, so they are recomputed by load_session()
+    rather than stored once per session. Tokens are kept as hashes only, and
+    the session encryption key stays with the caller.
+    """
+    security = session["security_features"]
+    return {
+        "session_metadata": session["session_data"]["session_metadata"],
+        "session_state": session["session_state"],
+        "expected_duration_minutes": session["session_analytics"][
+            "expected_duration_minutes"
+        ],
+        "token_hashes": [
+            hash_token(security["access_token"]),
+            hash_token(security["refresh_token"]),
+        ],
+    }
+
+
+def hash_token(token: str) -> str:
+    """SHA-256 of a session token, the only form in which tokens are stored."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def verify_session_token(
+    session_id: str,
+    token: str,
+    kind: str = "access",
+    store: Optional[SessionStore] = None,
+) -> bool:
+    """Whether ``token`` is the live session's access (or refresh) token."""
+    store = store or get_session_store()
+    record = store.get(session_id)
+    if record is None:
+        return False
+    hashes = store.decode_payload(record).get("token_hashes", [None, None])
+    expected = hashes[0 if kind == "access" else 1]
+    return expected is not None and hmac.compare_digest(expected, hash_token(token))
+
+
+def load_session(
+    session_id: str, store: Optional[SessionStore] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Rebuild the nested session of a live stored session, or None if expired.
+
+    The store holds no raw tokens or encryption key, so the rebuilt security
+    features carry the token hashes instead.
+    """
+    store = store or get_session_store()
+    record = store.get(session_id)
+    if record is None:
+        return None
+    payload = store.decode_payload(record)
+    department, session_type = record.department, record.session_type
+    access_token_hash, refresh_token_hash = payload.get("token_hashes", [None] * 2)
+    return {
+        "session_data": {
+            "session_id": record.session_id,
+            "user_id": record.user_id,
             "session_type": session_type,
             "department": department,
-            "created_at": datetime.now().isoformat(),
-            "status": "active",
+            "created_at": datetime.fromtimestamp(record.created_at).isoformat(),
+            "expires_at": datetime.fromtimestamp(record.expires_at).isoformat(),
+            "status": record.status,
             "security_level": determine_security_level(department),
             "permissions": generate_user_permissions(department),
-            "session_metadata": {
-                "browser_info": simulate_browser_info(),
-                "device_type": random.choice(["desktop", "tablet", "mobile"]),
-                "location": simulate_user_location(),
-                "ip_address": f"192.168.{random.randint(1, 255)}.{random.randint(1, 255)}",
-                "user_agent": simulate_user_agent(),
-            },
-        }
-
-        # Initialize session state with business context
-        initial_state = {
-            "workflow_state": {
-                "current_step": "initialization",
-                "completed_steps": [],
-                "pending_tasks": [],
-                "business_data": {},
-                "form_data": {},
-                "file_uploads": [],
-                "external_api_cache": {},
-            },
-            "user_context": {
-                "preferences": generate_user_preferences(user_id),
-                "recent_actions": [],
-                "session_history": [],
-                "bookmarks": [],
-                "custom_settings": session_config.get("custom_settings", {}),
-            },
-            "business_metrics": {
-                "actions_count": 0,
-                "time_spent_minutes": 0,
-                "data_processed_mb": 0,
-                "api_calls_made": 0,
-                "errors_encountered": 0,
-            },
-            "collaboration": {
-                "shared_with": [],
-                "comments": [],
-                "notifications": [],
-                "team_workspace": {},
-            },
-        }
-
-        # Session analytics and tracking
-        session_analytics = {
-            "session_creation_time": session_start,
-            "expected_duration_minutes": random.randint(15, 180),
+            "session_metadata": payload.get("session_metadata", {}),
+        },
+        "session_state": payload.get("session_state", {}),
+        "session_analytics": {
+            "session_creation_time": record.created_at,
+            "expected_duration_minutes": payload.get("expected_duration_minutes"),
             "business_priority": calculate_business_priority(session_type, department),
             "resource_allocation": {
                 "cpu_quota": calculate_cpu_quota(department),
@@ -191,25 +377,17 @@ class EnterpriseSessionManagerNode(Node):
                 "gdpr_applicable": True,
                 "hipaa_applicable": department == "healthcare",
             },
-        }
-
-        # Enterprise security features
-        security_features = {
-            "access_token": generate_secure_token(),
-            "refresh_token": generate_secure_token(),
-            "session_encryption_key": generate_encryption_key(),
+            "active_user_sessions": store.user_session_count(record.user_id),
+        },
+        "security_features": {
+            "access_token_hash": access_token_hash,
+            "refresh_token_hash": refresh_token_hash,
             "mfa_required": department in ["finance", "executive", "hr"],
-            "session_timeout_minutes": get_session_timeout(department),
+            "session_timeout_minutes": record.ttl_seconds // 60,
             "concurrent_session_limit": get_concurrent_limit(department),
             "ip_restrictions": get_ip_restrictions(department),
-        }
-
-        return {
-            "session_data": session_data,
-            "session_state": initial_state,
-            "session_analytics": session_analytics,
-            "security_features": security_features,
-        }
+        },
+    }
 
 
 def determine_security_level(department: str) -> str:
@@ -1410,6 +1588,102 @@ def create_session_recovery_engine() -> PythonCodeNode:
     )
 
 
+def run_session_store_benchmark(sessions: int = 2_000_000, sample: int = 5_000):
+    """Memory per session and expiry sweep cost: SessionStore vs nested dicts."""
+    import gc
+    import tracemalloc
+
+    departments = ["finance", "healthcare", "legal", "hr", "executive"]
+    departments += ["operations", "sales", "marketing", "general"]
+    print("=" * 70)
+    print(f"Session store: {sessions:,} concurrent sessions")
+    print("=" * 70)
+
+    # Memory of the nested session dict vs its stored payload, on a sample
+    tracemalloc.start()
+    nested = [
+        build_session(f"user_{i}", "business_process", departments[i % 9], {})
+        for i in range(sample)
+    ]
+    nested_bytes = tracemalloc.get_traced_memory()[0] / sample
+    payloads = [session_payload(session) for session in nested]
+    del nested
+    tracemalloc.stop()
+
+    sample_store = SessionStore()  # Wheel slots are allocated up front
+    tracemalloc.start()
+    for i, payload in enumerate(payloads):
+        sample_store.create(
+            str(uuid.uuid4()),
+            f"user_{i}",
+            departments[i % 9],
+            "business_process",
+            1800,
+            payload,
+        )
+    stored_bytes = tracemalloc.get_traced_memory()[0] / sample
+    tracemalloc.stop()
+    shared_payload = sample_store.sessions[next(iter(sample_store.sessions))].payload
+    print(f"  nested session dict:     {nested_bytes:>9,.0f} bytes/session")
+    print(f"  stored record + payload: {stored_bytes:>9,.0f} bytes/session")
+    del payloads, sample_store
+
+    # Full population: expiries spread over each department's timeout window
+    rng = random.Random(0)
+    now = time.time()
+    store = SessionStore()
+    store.wheel.current_tick = store.wheel._tick(now)
+    tracemalloc.start()
+    start = time.perf_counter()
+    for i in range(sessions):
+        department = departments[i % 9]
+        ttl = get_session_timeout(department) * 60
+        record = store.create(
+            f"{i:032x}",
+            f"user_{i % (sessions // 2 or 1):08d}",
+            department,
+            "business_process",
+            ttl,
+            now=now - rng.uniform(0, ttl),
+        )
+        record.payload = shared_payload  # Same size as a real one, built once
+    create_seconds = time.perf_counter() - start
+    index_bytes = tracemalloc.get_traced_memory()[0] / sessions
+    tracemalloc.stop()
+    print(
+        f"  created {sessions:,} sessions in {create_seconds:.1f}s; records, indexes "
+        f"and wheel {index_bytes:,.0f} bytes/session + {len(shared_payload)} byte payload"
+    )
+    print(
+        f"  estimated at {sessions:,}: store "
+        f"{(index_bytes + len(shared_payload)) * sessions / 1e9:.2f} GB, "
+        f"nested dicts {nested_bytes * sessions / 1e9:.2f} GB"
+    )
+
+    # One sweep per second for a minute, after the collector has seen the
+    # new objects once (otherwise the first sweep pays for a full GC pass)
+    gc.collect()
+    wheel_times, expired = [], 0
+    for second in range(1, 61):
+        start = time.perf_counter()
+        expired += len(store.expire(now + second))
+        wheel_times.append(time.perf_counter() - start)
+    naive_times = []
+    for second in range(61, 64):
+        start = time.perf_counter()
+        sweep_naive(store.sessions.values(), now + second)
+        naive_times.append(time.perf_counter() - start)
+    print(
+        f"  timing wheel sweep: {sorted(wheel_times)[30] * 1000:.2f} ms median, "
+        f"{max(wheel_times) * 1000:.2f} ms max "
+        f"({expired / 60:,.0f} sessions expired per second)"
+    )
+    print(
+        f"  full-scan sweep:    {sum(naive_times) / len(naive_times) * 1000:.2f} ms/sweep"
+    )
+    print(f"✅ {len(store):,} sessions live after 60 sweeps")
+
+
 def main():
     """Execute the enterprise session state management workflow."""
 
@@ -1733,8 +2007,14 @@ def main():
     print(f"  • Recovery Reports: {data_dir}/session_recovery_reports.json")
     print(f"  • Compliance Audit: {data_dir}/session_compliance_audit.json")
 
+    close_session_store()
     return 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_session_store_benchmark(
+            int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000
+        )
+    else:
+        sys.exit(main())
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+Compact Session Store
+=====================
+
+In-memory session registry behind EnterpriseSessionManagerNode, sized for
+millions of concurrent sessions:
+
+- One ``__slots__`` record per session holding only the fields that are
+  queried (ids, department, type, status, timestamps); the rest of the
+  session travels as a zlib-compressed JSON payload, decoded on demand
+- Per-user and per-department secondary indexes
+- A hierarchical timing wheel with 1-second ticks files each session under
+  its expiry tick, so touching a session is O(1) and a sweep only visits the
+  slots that come due, never the whole population
+- Optional SQLite persistence: changed and ended sessions are written on
+  ``flush()``, and live sessions are reloaded when the store is reopened
+
+Usage:
+    store = SessionStore(db_path="data/sessions.sqlite")
+    store.create(session_id, user_id, "finance", "financial_transaction",
+                 ttl_seconds=30 * 60, payload={...})
+    store.touch(session_id)                 # Activity extends the expiry
+    expired = store.expire()                # Records that timed out
+    store.flush()
+"""
+
+import json
+import sqlite3
+import time
+import zlib
+from sys import intern
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+
+class SessionRecord:
+    """Queryable fields of one session; everything else is in ``payload``."""
+
+    __slots__ = (
+        "session_id",
+        "user_id",
+        "department",
+        "session_type",
+        "status",
+        "created_at",
+        "last_seen",
+        "expires_at",
+        "ttl_seconds",
+        "payload",
+        "wheel_slot",
+    )
+
+    def __init__(
+        self,
+        session_id: str,
+        user_id: str,
+        department: str,
+        session_type: str,
+        created_at: float,
+        ttl_seconds: int,
+        payload: Optional[bytes] = None,
+        status: str = "active",
+    ):
+        self.session_id = session_id
+        self.user_id = user_id
+        # Few distinct values across millions of sessions: share one string
+        self.department = intern(department)
+        self.session_type = intern(session_type)
+        self.status = intern(status)
+        self.created_at = created_at
+        self.last_seen = created_at
+        self.ttl_seconds = ttl_seconds
+        self.expires_at = created_at + ttl_seconds
+        self.payload = payload
+        self.wheel_slot: Optional[Set["SessionRecord"]] = None
+
+
+class TimingWheel:
+    """
+    Hierarchical timing wheel of SessionRecords keyed by ``expires_at``.
+
+    ``level_bits`` gives the slot count of each level as a power of two;
+    level 0 slots are one tick wide and each higher level's slots span a
+    whole revolution of the level below. A record is filed at the lowest
+    level that reaches its expiry and moves down when its slot comes round,
+    so scheduling and cancelling are O(1) and ``advance()`` only visits due
+    slots. By default level 0 spans 2 ** 15 one-second ticks (9.1 hours), longer
+    than any department timeout, so sessions expire without ever cascading.
+    """
+
+    def __init__(
+        self,
+        tick_seconds: float = 1.0,
+        level_bits: Tuple[int, ...] = (15, 6, 6),
+        start: Optional[float] = None,
+    ):
+        self.tick_seconds = tick_seconds
+        self.shifts = [sum(level_bits[:level]) for level in range(len(level_bits))]
+        self.masks = [(1 << bits) - 1 for bits in level_bits]
+        self.span_bits = sum(level_bits)
+        self.levels = [[set() for _ in range(1 << bits)] for bits in level_bits]
+        self.overflow: Set[SessionRecord] = set()  # Beyond the top level's span
+        self.counts = [0] * (len(level_bits) + 1)  # Records per level + overflow
+        self.slot_level = {
+            id(slot): level for level, slots in enumerate(self.levels) for slot in slots
+        }
+        self.slot_level[id(self.overflow)] = len(level_bits)
+        self.current_tick = self._tick(time.time() if start is None else start)
+
+    @property
+    def size(self) -> int:
+        return sum(self.counts)
+
+    def _tick(self, timestamp: float) -> int:
+        return int(timestamp // self.tick_seconds)
+
+    def _slot_for(self, expires_tick: int) -> Set[SessionRecord]:
+        current = self.current_tick
+        if expires_tick <= current:
+            return self.levels[0][current & self.masks[0]]  # Due now
+        for slots, shift, mask in zip(self.levels, self.shifts, self.masks):
+            if (expires_tick >> shift) - (current >> shift) <= mask:
+                return slots[(expires_tick >> shift) & mask]
+        return self.overflow
+
+    def schedule(self, record: SessionRecord) -> None:
+        if record.wheel_slot is not None:
+            self.cancel(record)
+        # Round up: a record never fires before its expiry, at most a tick after
+        slot = self._slot_for(-self._tick(-record.expires_at))
+        slot.add(record)
+        record.wheel_slot = slot
+        self.counts[self.slot_level[id(slot)]] += 1
+
+    def cancel(self, record: SessionRecord) -> None:
+        slot = record.wheel_slot
+        if slot is not None:
+            slot.discard(record)
+            record.wheel_slot = None
+            self.counts[self.slot_level[id(slot)]] -= 1
+
+    def _cascade(self, slot: Set[SessionRecord]) -> None:
+        records = list(slot)
+        slot.clear()
+        self.counts[self.slot_level[id(slot)]] -= len(records)
+        for record in records:
+            record.wheel_slot = None
+            self.schedule(record)
+
+    def advance(self, now: Optional[float] = None) -> List[SessionRecord]:
+        """Move the wheel to ``now``; return (and unschedule) expired records."""
+        target = self._tick(time.time() if now is None else now)
+        expired: List[SessionRecord] = []
+        counts = self.counts
+
+        # Expire what is already due at the current tick, then step forward
+        while True:
+            tick = self.current_tick
+            due = self.levels[0][tick & self.masks[0]]
+            if due:
+                for record in due:
+                    record.wheel_slot = None
+                expired.extend(due)
+                counts[0] -= len(due)
+                due.clear()
+            if tick >= target:
+                return expired
+
+            # Nothing is due before the next slot boundary of the lowest
+            # non-empty level: jump straight to it instead of tick by tick
+            empty = 0
+            while empty < len(counts) and not counts[empty]:
+                empty += 1
+            if empty:
+                bits = (
+                    self.shifts[empty] if empty < len(self.levels) else self.span_bits
+                )
+                tick = min(target, tick | ((1 << bits) - 1))
+                if tick == target:
+                    self.current_tick = target
+                    return expired
+
+            self.current_tick = tick = tick + 1
+            # Cascade every higher level whose slot boundary this tick crosses,
+            # top-down, so records land in the right lower-level slot
+            if tick & ((1 << self.span_bits) - 1) == 0:
+                self._cascade(self.overflow)
+            for level in range(len(self.levels) - 1, 0, -1):
+                if tick & ((1 << self.shifts[level]) - 1) == 0:
+                    self._cascade(
+                        self.levels[level][
+                            (tick >> self.shifts[level]) & self.masks[level]
+                        ]
+                    )
+
+
+class SessionStore:
+    """Session records with secondary indexes, TTL wheel and optional SQLite."""
+
+    def __init__(self, db_path: Optional[str] = None, tick_seconds: float = 1.0):
+        self.sessions: Dict[str, SessionRecord] = {}
+        self.by_user: Dict[str, Union[str, Set[str]]] = {}
+        self.by_department: Dict[str, Set[str]] = {}
+        self.wheel = TimingWheel(tick_seconds=tick_seconds)
+        self.expired_count = 0
+
+        self.db = None
+        self._dirty: Set[str] = set()
+        self._ended: Set[str] = set()
+        if db_path:
+            self.db = sqlite3.connect(db_path)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.executescript("""
+                CREATE TABLE IF NOT EXISTS sessions (
+                    session_id TEXT PRIMARY KEY,
+                    user_id TEXT NOT NULL,
+                    department TEXT NOT NULL,
+                    session_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_seen REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    ttl_seconds INTEGER NOT NULL,
+                    payload BLOB
+                );
+                CREATE INDEX IF NOT EXISTS idx_sessions_expires ON sessions (expires_at);
+                """)
+            self._load()
+
+    # Secondary indexes
+
+    def _index(self, record: SessionRecord) -> None:
+        # Most users hold one session: keep a bare id until a second arrives
+        ids = self.by_user.get(record.user_id)
+        if ids is None:
+            self.by_user[record.user_id] = record.session_id
+        elif isinstance(ids, str):
+            self.by_user[record.user_id] = {ids, record.session_id}
+        else:
+            ids.add(record.session_id)
+        self.by_department.setdefault(record.department, set()).add(record.session_id)
+
+    def _unindex(self, record: SessionRecord) -> None:
+        ids = self.by_user.get(record.user_id)
+        if ids == record.session_id:
+            del self.by_user[record.user_id]
+        elif isinstance(ids, set):
+            ids.discard(record.session_id)
+            if len(ids) == 1:
+                self.by_user[record.user_id] = ids.pop()
+        ids = self.by_department.get(record.department)
+        if ids is not None:
+            ids.discard(record.session_id)
+            if not ids:
+                del self.by_department[record.department]
+
+    # Session lifecycle
+
+    @staticmethod
+    def encode_payload(payload: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        if payload is None:
+            return None
+        return zlib.compress(json.dumps(payload, separators=(",", ":")).encode())
+
+    @staticmethod
+    def decode_payload(record: SessionRecord) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(record.payload)) if record.payload else {}
+
+    def create(
+        self,
+        session_id: str,
+        user_id: str,
+        department: str,
+        session_type: str,
+        ttl_seconds: int,
+        payload: Optional[Dict[str, Any]] = None,
+        now: Optional[float] = None,
+    ) -> SessionRecord:
+        if session_id in self.sessions:
+            self.end(session_id)
+        record = SessionRecord(
+            session_id,
+            user_id,
+            department,
+            session_type,
+            time.time() if now is None else now,
+            ttl_seconds,
+            self.encode_payload(payload),
+        )
+        self.sessions[session_id] = record
+        self._index(record)
+        self.wheel.schedule(record)
+        self._mark(session_id)
+        return record
+
+    def get(
+        self, session_id: str, now: Optional[float] = None
+    ) -> Optional[SessionRecord]:
+        """Live record, or None; a timed-out session is never returned."""
+        record = self.sessions.get(session_id)
+        if record is None:
+            return None
+        if record.expires_at <= (time.time() if now is None else now):
+            return None  # Removed by the next expire() sweep
+        return record
+
+    def touch(self, session_id: str, now: Optional[float] = None) -> bool:
+        """Record activity: the session expires ``ttl_seconds`` from now."""
+        record = self.get(session_id, now)
+        if record is None:
+            return False
+        record.last_seen = time.time() if now is None else now
+        record.expires_at = record.last_seen + record.ttl_seconds
+        self.wheel.schedule(record)
+        self._mark(session_id)
+        return True
+
+    def update_payload(self, session_id: str, payload: Dict[str, Any]) -> bool:
+        record = self.get(session_id)
+        if record is None:
+            return False
+        record.payload = self.encode_payload(payload)
+        self._mark(session_id)
+        return True
+
+    def end(self, session_id: str) -> Optional[SessionRecord]:
+        record = self.sessions.pop(session_id, None)
+        if record is not None:
+            self.wheel.cancel(record)
+            self._unindex(record)
+            self._mark(session_id, ended=True)
+        return record
+
+    def expire(self, now: Optional[float] = None) -> List[SessionRecord]:
+        """Remove every session whose expiry has passed."""
+        expired = self.wheel.advance(now)
+        for record in expired:
+            record.status = "expired"
+            del self.sessions[record.session_id]
+            self._unindex(record)
+            self._mark(record.session_id, ended=True)
+        self.expired_count += len(expired)
+        return expired
+
+    # Queries
+
+    def sessions_for_user(self, user_id: str) -> List[SessionRecord]:
+        ids = self.by_user.get(user_id, ())
+        return [self.sessions[s] for s in ((ids,) if isinstance(ids, str) else ids)]
+
+    def user_session_count(self, user_id: str) -> int:
+        ids = self.by_user.get(user_id)
+        return 0 if ids is None else 1 if isinstance(ids, str) else len(ids)
+
+    def sessions_for_department(self, department: str) -> List[SessionRecord]:
+        return [self.sessions[s] for s in self.by_department.get(department, ())]
+
+    def __len__(self) -> int:
+        return len(self.sessions)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "active_sessions": len(self.sessions),
+            "users": len(self.by_user),
+            "departments": {d: len(ids) for d, ids in self.by_department.items()},
+            "expired_total": self.expired_count,
+            "scheduled": self.wheel.size,
+        }
+
+    # SQLite persistence
+
+    def _mark(self, session_id: str, ended: bool = False) -> None:
+        if self.db is None:
+            return
+        if ended:
+            self._dirty.discard(session_id)
+            self._ended.add(session_id)
+        else:
+            self._ended.discard(session_id)
+            self._dirty.add(session_id)
+
+    def flush(self) -> int:
+        """Write changed and ended sessions in one transaction."""
+        if self.db is None:
+            return 0
+        rows = [
+            (
+                r.session_id,
+                r.user_id,
+                r.department,
+                r.session_type,
+                r.status,
+                r.created_at,
+                r.last_seen,
+                r.expires_at,
+                r.ttl_seconds,
+                r.payload,
+            )
+            for r in (self.sessions.get(s) for s in self._dirty)
+            if r is not None
+        ]
+        self.db.executemany(
+            "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        self.db.executemany(
+            "DELETE FROM sessions WHERE session_id = ?", ((s,) for s in self._ended)
+        )
+        self.db.commit()
+        written = len(rows) + len(self._ended)
+        self._dirty.clear()
+        self._ended.clear()
+        return written
+
+    def _load(self, now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        self.db.execute("DELETE FROM sessions WHERE expires_at <= ?", (now,))
+        for row in self.db.execute("SELECT * FROM sessions"):
+            record = SessionRecord(
+                row[0], row[1], row[2], row[3], row[5], row[8], row[9], row[4]
+            )
+            record.last_seen, record.expires_at = row[6], row[7]
+            self.sessions[record.session_id] = record
+            self._index(record)
+            self.wheel.schedule(record)
+        self.db.commit()
+
+    def close(self) -> None:
+        if self.db is not None:
+            self.flush()
+            self.db.close()
+            self.db = None
+
+
+def sweep_naive(sessions: Iterable[SessionRecord], now: float) -> List[SessionRecord]:
+    """Full-scan expiry check, for comparison with the wheel in benchmarks."""
+    return [record for record in sessions if record.expires_at <= now]
@@ -38,16 +38,27 @@ To run:
 1. Web Interface: python full_user_management_system.py web
 2. CLI Mode: python full_user_management_system.py cli [command]
 3. Setup: python full_user_management_system.py setup
+4. Auth load test: python full_user_management_system.py loadtest [--users 200]
+5. Listing benchmark: python full_user_management_system.py listbench [--users 5000000]
+6. Export benchmark: python full_user_management_system.py exportbench [--users 1000000]
+7. Broadcast benchmark: python full_user_management_system.py wsbench [--clients 10000]
 """
 
 import asyncio
+import base64
 import csv
 import hashlib
+import hmac
+import io
 import json
 import os
 import secrets
 import sys
+import time
+import zlib
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -107,6 +118,10 @@ JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
 
+# Resolved-user cache for authenticated requests
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 30))
+USER_CACHE_MAX_ENTRIES = int(os.getenv("USER_CACHE_MAX_ENTRIES", 100_000))
+
 # Initialize console for CLI
 console = Console()
 
@@ -256,20 +271,163 @@ def verify_token(
         raise HTTPException(status_code=401, detail="Invalid token")
 
 
-async def get_current_user(token_data: Dict = Depends(verify_token)) -> Dict[str, Any]:
-    """Get current user from token."""
-    workflow = Workflow("get_current_user")
+# ============= Workflow Templates =============
+# Hot endpoints build their workflow once and pass per-request values as
+# runtime parameters instead of constructing new workflows and nodes.
 
-    get_user = UserManagementNode(
-        name="get_user",
-        operation="get",
-        user_id=token_data["user_id"],
-        tenant_id="default",
-        database_config=DB_CONFIG,
+
+@lru_cache(maxsize=None)
+def user_lookup_workflow() -> Workflow:
+    """Load one user by id (``get_user.user_id``)."""
+    workflow = Workflow(workflow_id="get_current_user", name="Get Current User")
+    workflow.add_node(
+        "get_user",
+        UserManagementNode(
+            name="get_user",
+            operation="get",
+            tenant_id="default",
+            database_config=DB_CONFIG,
+        ),
     )
+    return workflow
 
-    workflow.add_node(get_user)
-    result = await runtime.execute(workflow)
+
+@lru_cache(maxsize=None)
+def login_lookup_workflow() -> Workflow:
+    """Load an active user by username (``get_user.parameters.username``)."""
+    workflow = Workflow(workflow_id="login", name="Login")
+    workflow.add_node(
+        "get_user",
+        SQLDatabaseNode(
+            name="get_user",
+            database_config=DB_CONFIG,
+            query="SELECT * FROM users WHERE username = :username AND is_active = TRUE",
+            operation_type="query",
+        ),
+    )
+    return workflow
+
+
+@lru_cache(maxsize=None)
+def login_bookkeeping_workflow() -> Workflow:
+    """Stamp last_login and record the login (``parameters.user_id``)."""
+    workflow = Workflow(workflow_id="update_login", name="Update Login")
+    workflow.add_node(
+        "update_login",
+        SQLDatabaseNode(
+            name="update_login",
+            database_config=DB_CONFIG,
+            query="UPDATE users SET last_login = NOW() WHERE user_id = :user_id",
+            operation_type="execute",
+        ),
+    )
+    workflow.add_node(
+        "log_login",
+        SQLDatabaseNode(
+            name="log_login",
+            database_config=DB_CONFIG,
+            query="""
+            INSERT INTO login_history (user_id, ip_address, login_method, success)
+            VALUES (:user_id, '127.0.0.1', 'password', TRUE)
+            """,
+            operation_type="execute",
+        ),
+    )
+    return workflow
+
+
+# ============= User Principal Cache =============
+
+
+class UserPrincipalCache:
+    """
+    Resolved users keyed by ``(user_id, token iat)`` with a short TTL.
+
+    Concurrent misses for the same key share one load (single flight).
+    ``invalidate()`` is called by the endpoints that modify users: it drops
+    every cached token of the user and keeps loads already in flight from
+    caching what they read, so a write is visible on the next request.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = USER_CACHE_TTL_SECONDS,
+        max_entries: int = USER_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires, user)
+        self._keys_by_user: Dict[str, set] = {}
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = {}
+        self._generation: Dict[str, int] = {}
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0}
+
+    async def get(self, user_id: str, iat: int, loader) -> Dict[str, Any]:
+        """Cached user, or the result of ``await loader(user_id)``."""
+        key = (user_id, iat)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+        load = self._inflight.get(key)
+        if load is None:
+            self.stats["misses"] += 1
+            load = asyncio.ensure_future(self._load(key, loader))
+            self._inflight[key] = load
+        else:
+            self.stats["coalesced"] += 1
+        # Shielded: a cancelled request must not cancel the shared load
+        return await asyncio.shield(load)
+
+    async def _load(self, key: Tuple[str, int], loader) -> Dict[str, Any]:
+        user_id = key[0]
+        generation = self._generation.get(user_id, 0)
+        try:
+            user = await loader(user_id)
+        finally:
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+        if self._generation.get(user_id, 0) == generation:
+            self._put(key, user)
+        return user
+
+    def _put(self, key: Tuple[str, int], user: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, user)
+        self._entries.move_to_end(key)
+        self._keys_by_user.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def _discard(self, key: Tuple[str, int]) -> None:
+        self._entries.pop(key, None)
+        keys = self._keys_by_user.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_user[key[0]]
+
+    def invalidate(self, *user_ids: str) -> None:
+        """Forget the given users; called after every write to them."""
+        for user_id in user_ids:
+            self._generation[user_id] = self._generation.get(user_id, 0) + 1
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._discard(key)
+            # Later requests start a fresh load instead of joining a stale one
+            for key in [k for k in self._inflight if k[0] == user_id]:
+                del self._inflight[key]
+            self.stats["invalidations"] += 1
+
+
+user_cache = UserPrincipalCache()
+
+
+async def load_user_principal(user_id: str) -> Dict[str, Any]:
+    """Load a user through the reusable lookup workflow."""
+    result = await runtime.execute(
+        user_lookup_workflow(), parameters={"get_user": {"user_id": user_id}}
+    )
 
     user = result.get("get_user", {}).get("user")
     if not user:
@@ -278,6 +436,13 @@ async def get_current_user(token_data: Dict = Depends(verify_token)) -> Dict[str
     return user
 
 
+async def get_current_user(token_data: Dict = Depends(verify_token)) -> Dict[str, Any]:
+    """Get current user from token."""
+    return await user_cache.get(
+        token_data["user_id"], token_data.get("iat", 0), load_user_principal
+    )
+
+
 def require_superuser(current_user: Dict = Depends(get_current_user)) -> Dict:
     """Require superuser permissions."""
     if not current_user.get("is_superuser"):
@@ -461,6 +626,18 @@ async def setup_database():
     CREATE INDEX IF NOT EXISTS idx_admin_log_user ON admin_log(user_id);
     CREATE INDEX IF NOT EXISTS idx_admin_log_time ON admin_log(action_time);
 
+    -- Keyset pagination (one per sort order) and trigram search for /api/users
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS idx_users_list_date_joined ON users(tenant_id, date_joined, user_id);
+    CREATE INDEX IF NOT EXISTS idx_users_list_username ON users(tenant_id, username, user_id);
+    CREATE INDEX IF NOT EXISTS idx_users_list_email ON users(tenant_id, email, user_id);
+    CREATE INDEX IF NOT EXISTS idx_users_list_last_login
+        ON users(tenant_id, (COALESCE(last_login, TIMESTAMPTZ '1970-01-01 00:00:00+00')), user_id);
+    CREATE INDEX IF NOT EXISTS idx_users_search_trgm ON users USING gin (
+        email gin_trgm_ops, username gin_trgm_ops,
+        first_name gin_trgm_ops, last_name gin_trgm_ops
+    );
+
     -- Create default superuser
     INSERT INTO users (
         user_id, username, email, password,
@@ -495,28 +672,469 @@ async def setup_database():
     return await runtime.execute(workflow)
 
 
+# ============= User Listing Queries =============
+
+# Columns returned by /api/users
+USER_LIST_COLUMNS = """
+    user_id, username, email, first_name, last_name,
+    is_active, is_staff, is_superuser, date_joined, last_login,
+    department, phone, timezone, language, theme, avatar_url,
+    mfa_enabled, email_verified, last_ip
+"""
+
+# Sort expressions per order_by and dialect; each has a matching
+# (tenant_id, <expression>, user_id) index so a page is one index range scan
+USER_SORT_KEYS = {
+    "postgresql": {
+        "date_joined": ("date_joined", "TIMESTAMPTZ"),
+        "username": ("username", None),
+        "email": ("email", None),
+        "last_login": (
+            "COALESCE(last_login, TIMESTAMPTZ '1970-01-01 00:00:00+00')",
+            "TIMESTAMPTZ",
+        ),
+    },
+    "sqlite": {
+        "date_joined": ("date_joined", None),
+        "username": ("username", None),
+        "email": ("email", None),
+        "last_login": ("COALESCE(last_login, '1970-01-01 00:00:00')", None),
+    },
+}
+
+# Local (SQLite) user table with the same listing indexes, plus an FTS5
+# trigram index over the search fields kept in sync by triggers
+SQLITE_USERS_TABLE = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    user_id TEXT UNIQUE NOT NULL,
+    username TEXT UNIQUE NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    first_name TEXT NOT NULL,
+    last_name TEXT NOT NULL,
+    is_active INTEGER NOT NULL DEFAULT 1,
+    is_staff INTEGER NOT NULL DEFAULT 0,
+    is_superuser INTEGER NOT NULL DEFAULT 0,
+    date_joined TEXT NOT NULL,
+    last_login TEXT,
+    department TEXT,
+    phone TEXT,
+    timezone TEXT DEFAULT 'UTC',
+    language TEXT DEFAULT 'en',
+    theme TEXT DEFAULT 'light',
+    avatar_url TEXT,
+    mfa_enabled INTEGER DEFAULT 0,
+    email_verified INTEGER DEFAULT 0,
+    last_ip TEXT,
+    tenant_id TEXT NOT NULL DEFAULT 'default'
+);
+"""
+SQLITE_USERS_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_users_list_date_joined ON users(tenant_id, date_joined, user_id);
+CREATE INDEX IF NOT EXISTS idx_users_list_username ON users(tenant_id, username, user_id);
+CREATE INDEX IF NOT EXISTS idx_users_list_email ON users(tenant_id, email, user_id);
+CREATE INDEX IF NOT EXISTS idx_users_list_last_login
+    ON users(tenant_id, COALESCE(last_login, '1970-01-01 00:00:00'), user_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(
+    username, email, first_name, last_name,
+    content='users', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+    INSERT INTO users_fts(rowid, username, email, first_name, last_name)
+    VALUES (new.id, new.username, new.email, new.first_name, new.last_name);
+END;
+CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+    INSERT INTO users_fts(users_fts, rowid, username, email, first_name, last_name)
+    VALUES ('delete', old.id, old.username, old.email, old.first_name, old.last_name);
+END;
+CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE ON users BEGIN
+    INSERT INTO users_fts(users_fts, rowid, username, email, first_name, last_name)
+    VALUES ('delete', old.id, old.username, old.email, old.first_name, old.last_name);
+    INSERT INTO users_fts(rowid, username, email, first_name, last_name)
+    VALUES (new.id, new.username, new.email, new.first_name, new.last_name);
+END;
+"""
+SQLITE_USERS_SCHEMA = SQLITE_USERS_TABLE + SQLITE_USERS_INDEXES
+
+USER_COUNT_CAP = int(os.getenv("USER_COUNT_CAP", 100_000))
+USER_COUNT_TTL_SECONDS = float(os.getenv("USER_COUNT_TTL_SECONDS", 60))
+# Above this many matches, scanning the listing index in sort order finds a
+# page faster than collecting and sorting every FTS5 match
+USER_SEARCH_DENSE_MATCHES = int(os.getenv("USER_SEARCH_DENSE_MATCHES", 5_000))
+
+
+def user_filter_clause(
+    dialect: str,
+    search: str = "",
+    is_active: Optional[bool] = None,
+    is_staff: Optional[bool] = None,
+    department: Optional[str] = None,
+    tenant_id: str = "default",
+    dense_search: bool = False,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    WHERE clause and named parameters for the user listing filters.
+
+    On SQLite a search of three or more characters goes through the FTS5
+    trigram index unless ``dense_search`` says the term matches so many
+    users that an in-order scan with LIKE is cheaper.
+    """
+    conditions = ["tenant_id = :tenant_id"]
+    params: Dict[str, Any] = {"tenant_id": tenant_id}
+
+    if search:
+        pattern = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        params["search_pattern"] = f"%{pattern}%"
+        if dialect == "sqlite" and len(search) >= 3 and not dense_search:
+            # Trigram FTS5 phrase match is a substring match on any field
+            conditions.append(
+                "id IN (SELECT rowid FROM users_fts WHERE users_fts MATCH :search_match)"
+            )
+            params["search_match"] = '"' + search.replace('"', '""') + '"'
+            del params["search_pattern"]
+        else:
+            like = "ILIKE" if dialect == "postgresql" else "LIKE"
+            conditions.append(
+                "("
+                + " OR ".join(
+                    f"{column} {like} :search_pattern ESCAPE '\\'"
+                    for column in ("email", "username", "first_name", "last_name")
+                )
+                + ")"
+            )
+
+    if is_active is not None:
+        conditions.append("is_active = :is_active")
+        params["is_active"] = is_active
+
+    if is_staff is not None:
+        conditions.append("is_staff = :is_staff")
+        params["is_staff"] = is_staff
+
+    if department:
+        conditions.append("department = :department")
+        params["department"] = department
+
+    return " AND ".join(conditions), params
+
+
+def build_user_list_query(
+    dialect: str,
+    where_clause: str,
+    params: Dict[str, Any],
+    order_by: str = "date_joined",
+    order_dir: str = "desc",
+    limit: int = 20,
+    after: Optional[Tuple[Any, str]] = None,
+    offset: Optional[int] = None,
+    columns: str = USER_LIST_COLUMNS,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Page query for the user listing.
+
+    With ``after`` (the sort key and user_id of the previous page's last row)
+    the page starts right after that row in the listing index, so every page
+    costs the same; ``offset`` keeps the old page-number behaviour.
+    """
+    sort_expr, cast = USER_SORT_KEYS[dialect][order_by]
+    direction = "DESC" if order_dir == "desc" else "ASC"
+    params = dict(params, limit=limit)
+    conditions = where_clause
+    if after is not None:
+        after_value = f"CAST(:after_value AS {cast})" if cast else ":after_value"
+        comparison = "<" if direction == "DESC" else ">"
+        conditions += (
+            f" AND ({sort_expr}, user_id) {comparison} ({after_value}, :after_id)"
+        )
+        params["after_value"], params["after_id"] = after
+
+    query = f"""
+    SELECT {columns}, {sort_expr} AS sort_key
+    FROM users
+    WHERE {conditions}
+    ORDER BY {sort_expr} {direction}, user_id {direction}
+    LIMIT :limit
+    """
+    if offset:
+        query += " OFFSET :offset"
+        params["offset"] = offset
+    return query, params
+
+
+def build_user_count_query(
+    where_clause: str, params: Dict[str, Any], cap: int = USER_COUNT_CAP
+) -> Tuple[str, Dict[str, Any]]:
+    """Count of matching users, stopping at ``cap``."""
+    query = f"""
+    SELECT COUNT(*) AS total FROM (
+        SELECT 1 FROM users WHERE {where_clause} LIMIT :count_cap
+    ) AS capped
+    """
+    return query, dict(params, count_cap=cap)
+
+
+def encode_user_cursor(row: Dict[str, Any], order_by: str, order_dir: str) -> str:
+    """Opaque, signed cursor pointing just past ``row``."""
+    sort_key = row["sort_key"]
+    if isinstance(sort_key, datetime):
+        sort_key = sort_key.isoformat()
+    body = json.dumps([order_by, order_dir, sort_key, row["user_id"]]).encode()
+    signature = hmac.new(JWT_SECRET.encode(), body, hashlib.sha256).digest()[:12]
+    return base64.urlsafe_b64encode(body + signature).decode().rstrip("=")
+
+
+def decode_user_cursor(cursor: str, order_by: str, order_dir: str) -> Tuple[Any, str]:
+    """(sort key, user_id) from a cursor made for the same sort order."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        body, signature = raw[:-12], raw[-12:]
+        expected = hmac.new(JWT_SECRET.encode(), body, hashlib.sha256).digest()[:12]
+        if not hmac.compare_digest(signature, expected):
+            raise ValueError("bad signature")
+        cursor_order_by, cursor_dir, sort_key, user_id = json.loads(body)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if (cursor_order_by, cursor_dir) != (order_by, order_dir):
+        raise HTTPException(status_code=400, detail="Cursor is for another sort order")
+    return sort_key, user_id
+
+
+class ApproximateCountCache:
+    """Capped listing counts, cached per filter set for a short TTL."""
+
+    def __init__(
+        self, ttl_seconds: float = USER_COUNT_TTL_SECONDS, max_entries: int = 1024
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()  # key -> (expires, total)
+
+    async def get(self, where_clause: str, params: Dict[str, Any], counter) -> int:
+        """Cached count, or ``await counter()`` when missing or stale."""
+        key = (where_clause, tuple(sorted(params.items())))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        total = await counter()
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, total)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return total
+
+
+user_count_cache = ApproximateCountCache()
+
+
+# ============= User Export =============
+
+USER_EXPORT_FIELDS = [
+    "username",
+    "email",
+    "first_name",
+    "last_name",
+    "department",
+    "is_active",
+    "is_staff",
+    "date_joined",
+]
+USER_EXPORT_BATCH_SIZE = int(os.getenv("USER_EXPORT_BATCH_SIZE", 5_000))
+
+USER_EXPORT_MEDIA_TYPES = {
+    "csv": ("text/csv", "users.csv"),
+    "excel": ("text/csv", "users.csv"),
+    "json": ("application/json", "users.json"),
+    "ndjson": ("application/x-ndjson", "users.ndjson"),
+}
+
+
+async def iter_user_export_batches(
+    fetch_page,
+    dialect: str,
+    tenant_id: str = "default",
+    batch_size: int = USER_EXPORT_BATCH_SIZE,
+):
+    """
+    Users in username order, one keyset page at a time.
+
+    ``fetch_page(query, params)`` runs a query and returns its rows. Only the
+    current batch is held in memory, and each batch is a range scan on the
+    username listing index however far into the table it is.
+    """
+    where_clause, params = user_filter_clause(dialect, tenant_id=tenant_id)
+    columns = ", ".join(USER_EXPORT_FIELDS + ["user_id"])
+    after = None
+    while True:
+        query, query_params = build_user_list_query(
+            dialect,
+            where_clause,
+            params,
+            order_by="username",
+            order_dir="asc",
+            limit=batch_size,
+            after=after,
+            columns=columns,
+        )
+        rows = await fetch_page(query, query_params)
+        if rows:
+            yield rows
+        if len(rows) < batch_size:
+            return
+        after = (rows[-1]["sort_key"], rows[-1]["user_id"])
+
+
+def _export_value(value: Any) -> Any:
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+async def stream_user_export(batches, format: str = "csv", compress: bool = False):
+    """
+    Encoded export chunks: the header first, then one chunk per batch.
+
+    CSV goes through ``csv.writer`` (Excel gets the same CSV with a UTF-8
+    BOM), NDJSON is one object per line and JSON is a single array. With
+    ``compress`` the chunks form one gzip stream, sync-flushed per batch so
+    clients receive data as soon as it is read.
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # gzip header
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def drain(final: bool = False) -> bytes:
+        data = buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+        if compressor is None:
+            return data
+        return compressor.compress(data) + compressor.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+        )
+
+    if format == "excel":
+        buffer.write("\ufeff")
+    if format in ("csv", "excel"):
+        writer.writerow(USER_EXPORT_FIELDS)
+    elif format == "json":
+        buffer.write("[")
+    yield drain()
+
+    separator = ""
+    async for rows in batches:
+        for row in rows:
+            if format in ("csv", "excel"):
+                writer.writerow([row[field] for field in USER_EXPORT_FIELDS])
+            else:
+                record = json.dumps(
+                    {field: row[field] for field in USER_EXPORT_FIELDS},
+                    default=_export_value,
+                )
+                if format == "ndjson":
+                    buffer.write(record + "\n")
+                else:
+                    buffer.write(separator + record)
+                    separator = ","
+        yield drain()
+
+    if format == "json":
+        buffer.write("]")
+    tail = drain(final=True)
+    if tail:
+        yield tail
+
+
 # ============= WebSocket Manager =============
 
 
+WS_QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", 64))
+# "coalesce" discards a slow client's oldest pending message, "drop"
+# disconnects the client
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "coalesce")
+
+
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    """
+    Tenant-scoped broadcast hub for dashboard WebSockets.
+
+    A broadcast serializes the message once and queues it for every
+    connection of the tenant; each connection has its own bounded queue and
+    writer task, so a slow client only delays itself. When a queue is full
+    the slow-consumer policy applies.
+    """
 
-    async def connect(self, websocket: WebSocket):
+    def __init__(
+        self,
+        queue_size: int = WS_QUEUE_SIZE,
+        policy: str = WS_SLOW_CONSUMER_POLICY,
+    ):
+        if policy not in ("coalesce", "drop"):
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+        self.queue_size = queue_size
+        self.policy = policy
+        # tenant_id -> websocket -> (send queue, writer task)
+        self.topics: Dict[str, Dict[Any, Tuple[asyncio.Queue, asyncio.Task]]] = {}
+        self.stats = {"broadcasts": 0, "coalesced": 0, "dropped": 0}
+        self._closing: set = set()
+
+    async def connect(self, websocket: WebSocket, tenant_id: str = "default"):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.register(websocket, tenant_id)
 
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+    def register(self, websocket: WebSocket, tenant_id: str = "default"):
+        """Subscribe an accepted socket to its tenant's updates."""
+        queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        writer = asyncio.create_task(self._write(websocket, queue, tenant_id))
+        self.topics.setdefault(tenant_id, {})[websocket] = (queue, writer)
 
-    async def broadcast(self, message: dict):
-        """Broadcast message to all connected clients."""
-        for connection in self.active_connections:
+    def disconnect(self, websocket: WebSocket, tenant_id: str = "default"):
+        subscribers = self.topics.get(tenant_id)
+        if not subscribers:
+            return
+        subscriber = subscribers.pop(websocket, None)
+        if not subscribers:
+            del self.topics[tenant_id]
+        if subscriber is not None and subscriber[1] is not asyncio.current_task():
+            subscriber[1].cancel()
+
+    @property
+    def connection_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self.topics.values())
+
+    async def broadcast(self, message: dict, tenant_id: str = "default"):
+        """Queue message for every connected client of the tenant."""
+        payload = json.dumps(message, separators=(",", ":"), default=str)
+        self.stats["broadcasts"] += 1
+        subscribers = self.topics.get(tenant_id, {})
+        for websocket, (queue, _) in list(subscribers.items()):
             try:
-                await connection.send_json(message)
-            except:
-                # Connection might be closed
-                pass
+                queue.put_nowait(payload)
+            except asyncio.QueueFull:
+                if self.policy == "drop":
+                    self.stats["dropped"] += 1
+                    self.disconnect(websocket, tenant_id)
+                    closing = asyncio.create_task(self._close(websocket))
+                    self._closing.add(closing)
+                    closing.add_done_callback(self._closing.discard)
+                else:
+                    self.stats["coalesced"] += 1
+                    queue.get_nowait()
+                    queue.put_nowait(payload)
+
+    async def _write(self, websocket: WebSocket, queue: asyncio.Queue, tenant_id):
+        try:
+            while True:
+                await websocket.send_text(await queue.get())
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Connection closed or broken
+            self.disconnect(websocket, tenant_id)
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=1013)  # Try again later
+        except Exception:
+            pass
 
 
 manager = ConnectionManager()
@@ -987,19 +1605,11 @@ async def api_setup():
 @app.post("/api/auth/login")
 async def login(login_data: LoginRequest):
     """Login endpoint."""
-    workflow = Workflow("login")
-
-    # Get user by username
-    get_user = SQLDatabaseNode(
-        name="get_user",
-        database_config=DB_CONFIG,
-        query=f"SELECT * FROM users WHERE username = '{login_data.username}' AND is_active = TRUE",
-        operation_type="query",
+    result = await runtime.execute(
+        login_lookup_workflow(),
+        parameters={"get_user": {"parameters": {"username": login_data.username}}},
     )
 
-    workflow.add_node(get_user)
-    result = await runtime.execute(workflow)
-
     users = result.get("get_user", {}).get("result", [])
     if not users:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -1009,29 +1619,15 @@ async def login(login_data: LoginRequest):
     # In production, verify password hash properly
     # For demo, we'll accept any password
 
-    # Update last login
-    update_login = SQLDatabaseNode(
-        name="update_login",
-        database_config=DB_CONFIG,
-        query=f"UPDATE users SET last_login = NOW() WHERE user_id = '{user['user_id']}'",
-        operation_type="execute",
-    )
-
-    # Log login
-    log_login = SQLDatabaseNode(
-        name="log_login",
-        database_config=DB_CONFIG,
-        query=f"""
-        INSERT INTO login_history (user_id, ip_address, login_method, success)
-        VALUES ('{user['user_id']}', '127.0.0.1', 'password', TRUE)
-        """,
-        operation_type="execute",
+    # Update last login and log it
+    await runtime.execute(
+        login_bookkeeping_workflow(),
+        parameters={
+            "update_login": {"parameters": {"user_id": user["user_id"]}},
+            "log_login": {"parameters": {"user_id": user["user_id"]}},
+        },
     )
 
-    workflow2 = Workflow("update_login")
-    workflow2.add_nodes([update_login, log_login])
-    await runtime.execute(workflow2)
-
     # Create token
     token = create_token(user["user_id"], user["is_superuser"], login_data.remember_me)
 
@@ -1053,6 +1649,9 @@ async def login(login_data: LoginRequest):
 async def list_users(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, description="Keyset cursor: empty for the first page, then next_cursor"
+    ),
     search: str = Query(""),
     is_active: Optional[bool] = None,
     is_staff: Optional[bool] = None,
@@ -1063,72 +1662,81 @@ async def list_users(
     order_dir: str = Query("desc", pattern="^(asc|desc)$"),
     current_user: Dict = Depends(get_current_user),
 ):
-    """List users with advanced filtering."""
+    """
+    List users with advanced filtering.
+
+    Pass ``cursor`` for keyset pagination (constant cost at any depth);
+    ``page`` keeps offset pagination for existing clients. ``total`` is a
+    cached count that stops at USER_COUNT_CAP.
+    """
     workflow = Workflow("list_users")
+    dialect = DB_CONFIG["database_type"]
 
-    # Build query
-    conditions = ["tenant_id = 'default'"]
+    where_clause, params = user_filter_clause(
+        dialect, search, is_active, is_staff, department
+    )
 
-    if search:
-        conditions.append(
-            f"""
-        (email ILIKE '%{search}%' OR
-         username ILIKE '%{search}%' OR
-         first_name ILIKE '%{search}%' OR
-         last_name ILIKE '%{search}%')
-        """
+    async def count_users() -> int:
+        count_query, count_params = build_user_count_query(where_clause, params)
+        count_workflow = Workflow("count_users")
+        count_workflow.add_node(
+            SQLDatabaseNode(
+                name="get_count",
+                database_config=DB_CONFIG,
+                query=count_query,
+                parameters=count_params,
+                operation_type="query",
+            )
         )
+        count_result = await runtime.execute(count_workflow)
+        return count_result.get("get_count", {}).get("result", [{}])[0].get("total", 0)
 
-    if is_active is not None:
-        conditions.append(f"is_active = {is_active}")
-
-    if is_staff is not None:
-        conditions.append(f"is_staff = {is_staff}")
-
-    if department:
-        conditions.append(f"department = '{department}'")
-
-    where_clause = " AND ".join(conditions)
-
-    # Get users
-    query = f"""
-    SELECT
-        user_id, username, email, first_name, last_name,
-        is_active, is_staff, is_superuser, date_joined, last_login,
-        department, phone, timezone, language, theme, avatar_url,
-        mfa_enabled, email_verified, last_ip
-    FROM users
-    WHERE {where_clause}
-    ORDER BY {order_by} {order_dir.upper()}
-    LIMIT {per_page} OFFSET {(page - 1) * per_page}
-    """
+    total = await user_count_cache.get(where_clause, params, count_users)
+    if search and total >= USER_SEARCH_DENSE_MATCHES:
+        where_clause, params = user_filter_clause(
+            dialect, search, is_active, is_staff, department, dense_search=True
+        )
 
-    get_users = SQLDatabaseNode(
-        name="get_users", database_config=DB_CONFIG, query=query, operation_type="query"
+    query, query_params = build_user_list_query(
+        dialect,
+        where_clause,
+        params,
+        order_by,
+        order_dir,
+        limit=per_page,
+        after=decode_user_cursor(cursor, order_by, order_dir) if cursor else None,
+        offset=None if cursor is not None else (page - 1) * per_page,
     )
 
-    # Get count
-    count_query = f"SELECT COUNT(*) as total FROM users WHERE {where_clause}"
-    get_count = SQLDatabaseNode(
-        name="get_count",
+    get_users = SQLDatabaseNode(
+        name="get_users",
         database_config=DB_CONFIG,
-        query=count_query,
+        query=query,
+        parameters=query_params,
         operation_type="query",
     )
 
-    workflow.add_nodes([get_users, get_count])
+    workflow.add_node(get_users)
     result = await runtime.execute(workflow)
 
     users = result.get("get_users", {}).get("result", [])
-    total = result.get("get_count", {}).get("result", [{}])[0].get("total", 0)
+    next_cursor = (
+        encode_user_cursor(users[-1], order_by, order_dir)
+        if len(users) == per_page
+        else None
+    )
+    for user in users:
+        user.pop("sort_key", None)
 
     return {
         "users": users,
         "pagination": {
-            "page": page,
+            "page": None if cursor is not None else page,
             "per_page": per_page,
             "total": total,
+            "total_is_estimate": total >= USER_COUNT_CAP,
             "total_pages": (total + per_page - 1) // per_page,
+            "next_cursor": next_cursor,
         },
     }
 
@@ -1256,6 +1864,7 @@ async def update_user(
 
     workflow.add_nodes([update_user, log_update])
     result = await runtime.execute(workflow)
+    user_cache.invalidate(user_id)
 
     # Broadcast update
     await manager.broadcast(
@@ -1315,6 +1924,7 @@ async def delete_user(
 
     workflow.add_nodes([delete_user, log_deletion])
     await runtime.execute(workflow)
+    user_cache.invalidate(user_id)
 
     # Broadcast update
     await manager.broadcast(
@@ -1377,6 +1987,7 @@ async def bulk_action(
 
     workflow.add_nodes([bulk_update, log_bulk])
     await runtime.execute(workflow)
+    user_cache.invalidate(*action_data.user_ids)
 
     # Broadcast update
     await manager.broadcast(
@@ -1396,44 +2007,45 @@ async def bulk_action(
 
 @app.get("/api/users/export")
 async def export_users(
-    format: str = Query("csv", pattern="^(csv|json|excel)$"),
+    format: str = Query("csv", pattern="^(csv|json|ndjson|excel)$"),
+    compress: bool = Query(False, description="gzip the export on the fly"),
     current_user: Dict = Depends(get_current_user),
 ):
-    """Export users to CSV/JSON/Excel."""
-    workflow = Workflow("export_users")
-
-    # Get all users
-    get_users = SQLDatabaseNode(
-        name="get_users",
-        database_config=DB_CONFIG,
-        query="""
-        SELECT
-            username, email, first_name, last_name,
-            department, is_active, is_staff, date_joined
-        FROM users
-        WHERE tenant_id = 'default'
-        ORDER BY username
-        """,
-        operation_type="query",
-    )
-
-    workflow.add_node(get_users)
-    result = await runtime.execute(workflow)
-
-    users = result.get("get_users", {}).get("result", [])
+    """
+    Export users to CSV/JSON/NDJSON/Excel.
 
-    if format == "json":
-        return users
-    elif format == "csv":
-        output = "username,email,first_name,last_name,department,is_active,is_staff,date_joined\n"
-        for user in users:
-            output += f"{user['username']},{user['email']},{user['first_name']},{user['last_name']},{user['department'] or ''},{user['is_active']},{user['is_staff']},{user['date_joined']}\n"
+    Rows are read in USER_EXPORT_BATCH_SIZE keyset batches and streamed as
+    they arrive, so memory use and time to first byte do not grow with the
+    number of users.
+    """
 
-        return StreamingResponse(
-            iter([output]),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=users.csv"},
+    async def fetch_page(query: str, params: Dict[str, Any]) -> List[Dict]:
+        workflow = Workflow("export_users")
+        workflow.add_node(
+            SQLDatabaseNode(
+                name="get_users",
+                database_config=DB_CONFIG,
+                query=query,
+                parameters=params,
+                operation_type="query",
+            )
         )
+        result = await runtime.execute(workflow)
+        return result.get("get_users", {}).get("result", [])
+
+    media_type, filename = USER_EXPORT_MEDIA_TYPES[format]
+    if compress:
+        media_type, filename = "application/gzip", filename + ".gz"
+
+    return StreamingResponse(
+        stream_user_export(
+            iter_user_export_batches(fetch_page, DB_CONFIG["database_type"]),
+            format,
+            compress,
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
 
 
 @app.get("/api/activity")
@@ -1485,15 +2097,18 @@ async def websocket_endpoint(websocket: WebSocket, token: str = Query(...)):
     """WebSocket endpoint for real-time updates."""
     try:
         # Verify token
-        verify_token(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token))
-        await manager.connect(websocket)
+        token_data = verify_token(
+            HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        )
+        tenant_id = token_data.get("tenant_id", "default")
+        await manager.connect(websocket, tenant_id)
 
         try:
             while True:
                 # Keep connection alive
                 await websocket.receive_text()
         except WebSocketDisconnect:
-            manager.disconnect(websocket)
+            manager.disconnect(websocket, tenant_id)
     except:
         await websocket.close()
 
@@ -1742,6 +2357,465 @@ def stats():
     asyncio.execute(_stats())
 
 
+@cli.command()
+@click.option("--users", default=200, help="Concurrent virtual users")
+@click.option("--duration", default=10.0, help="Seconds per run")
+@click.option("--principals", default=1000, help="Distinct users (one token each)")
+@click.option("--db-latency-ms", default=5.0, help="Simulated user lookup latency")
+@click.option(
+    "--write-ratio", default=0.01, help="Share of requests that modify a user"
+)
+def loadtest(users, duration, principals, db_latency_ms, write_ratio):
+    """Authenticated request throughput without and with the user cache."""
+    import random
+
+    tokens = [
+        (f"user_{i:06d}", create_token(f"user_{i:06d}")) for i in range(principals)
+    ]
+    loads = 0
+
+    async def lookup(user_id: str, template: bool) -> Dict[str, Any]:
+        # Workflow setup as each path does it; the sleep stands in for the
+        # database round trip
+        nonlocal loads
+        loads += 1
+        if template:
+            user_lookup_workflow()
+        else:
+            workflow = Workflow(workflow_id="get_current_user", name="Get Current User")
+            workflow.add_node(
+                "get_user",
+                UserManagementNode(
+                    name="get_user",
+                    operation="get",
+                    user_id=user_id,
+                    tenant_id="default",
+                    database_config=DB_CONFIG,
+                ),
+            )
+        await asyncio.sleep(db_latency_ms / 1000)
+        return {"user_id": user_id, "is_superuser": False}
+
+    async def cached_lookup(user_id: str) -> Dict[str, Any]:
+        return await lookup(user_id, template=True)
+
+    async def run(cache: Optional[UserPrincipalCache]) -> Dict[str, Any]:
+        nonlocal loads
+        loads = 0
+        latencies: List[float] = []
+        deadline = time.perf_counter() + duration
+
+        async def virtual_user(seed: int):
+            rng = random.Random(seed)
+            while time.perf_counter() < deadline:
+                user_id, token = rng.choice(tokens)
+                start = time.perf_counter()
+                token_data = verify_token(
+                    HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+                )
+                if cache is None:
+                    await lookup(token_data["user_id"], template=False)
+                else:
+                    await cache.get(
+                        token_data["user_id"], token_data["iat"], cached_lookup
+                    )
+                    if rng.random() < write_ratio:  # PATCH /api/users/{id}
+                        cache.invalidate(user_id)
+                latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0)  # Yield as a real request would on I/O
+
+        started = time.perf_counter()
+        await asyncio.gather(*(virtual_user(i) for i in range(users)))
+        elapsed = time.perf_counter() - started
+        latencies.sort()
+        return {
+            "rps": len(latencies) / elapsed,
+            "p50": latencies[len(latencies) // 2] * 1000,
+            "p99": latencies[int(len(latencies) * 0.99)] * 1000,
+            "loads": loads,
+            "requests": len(latencies),
+        }
+
+    console.print(
+        f"[bold]Load test:[/bold] {users} virtual users, {principals} principals, "
+        f"{db_latency_ms:g} ms lookups, {write_ratio:.0%} writes, {duration:g}s per run"
+    )
+    before = asyncio.run(run(None))
+    cache = UserPrincipalCache()
+    after = asyncio.run(run(cache))
+
+    table = Table(title="get_current_user")
+    for column in ["Mode", "Requests/sec", "p50 ms", "p99 ms", "Lookups"]:
+        table.add_column(column, justify="right")
+    for mode, r in [("uncached", before), ("cached", after)]:
+        table.add_row(
+            mode,
+            f"{r['rps']:,.0f}",
+            f"{r['p50']:.2f}",
+            f"{r['p99']:.2f}",
+            f"{r['loads']:,} / {r['requests']:,}",
+        )
+    console.print(table)
+    console.print(f"Cache stats: {cache.stats}")
+
+
+def open_users_benchmark_db(users: int, db: Optional[str] = None):
+    """SQLite users table for the benchmarks, built on first use and reused."""
+    import random
+    import sqlite3
+    import tempfile
+
+    db = db or os.path.join(tempfile.gettempdir(), f"kailash_users_{users}.sqlite")
+    conn = sqlite3.connect(db)
+    conn.row_factory = sqlite3.Row
+
+    have = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE name = 'users_fts'"
+    ).fetchone()[0]
+    if not have:
+        console.print(f"Building {users:,} users in {db} ...")
+        started = time.perf_counter()
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(SQLITE_USERS_TABLE)
+        first_names = [f"{name}{i}" for i in range(50) for name in ("Ann", "Bo", "Cy")]
+        last_names = [f"{name}{i}" for i in range(200) for name in ("Lee", "Kim")]
+        departments = ["engineering", "sales", "finance", "hr", "support"]
+        rng = random.Random(0)
+        for start in track(range(0, users, 100_000), description="Inserting"):
+            rows = []
+            for i in range(start, min(start + 100_000, users)):
+                first, last = rng.choice(first_names), rng.choice(last_names)
+                rows.append(
+                    (
+                        f"user_{i:012x}",
+                        f"{first.lower()}.{last.lower()}.{i}",
+                        f"{first.lower()}.{last.lower()}.{i}@example.com",
+                        first,
+                        last,
+                        rng.random() < 0.9,
+                        rng.random() < 0.05,
+                        (datetime(2015, 1, 1) + timedelta(seconds=i * 37)).isoformat(
+                            " "
+                        ),
+                        None if rng.random() < 0.2 else "2025-06-01 09:00:00",
+                        rng.choice(departments),
+                    )
+                )
+            conn.executemany(
+                """
+                INSERT INTO users (
+                    user_id, username, email, first_name, last_name,
+                    is_active, is_staff, date_joined, last_login, department
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+            conn.commit()
+        conn.executescript(SQLITE_USERS_INDEXES)
+        conn.execute("INSERT INTO users_fts(users_fts) VALUES ('rebuild')")
+        conn.execute("ANALYZE")
+        conn.commit()
+        console.print(f"Built in {time.perf_counter() - started:.0f}s")
+    return conn
+
+
+@cli.command()
+@click.option("--users", default=5_000_000, help="Users in the benchmark table")
+@click.option("--db", default=None, help="SQLite file (kept and reused between runs)")
+@click.option("--per-page", default=20)
+@click.option("--deep-page", default=10_000, help="Page number to compare with page 1")
+def listbench(users, db, per_page, deep_page):
+    """User listing latency: offset vs keyset pages, LIKE vs FTS5 search."""
+    import statistics
+
+    conn = open_users_benchmark_db(users, db)
+
+    def timed(query: str, params, runs: int = 5) -> Tuple[float, List]:
+        samples, rows = [], []
+        for _ in range(runs):
+            started = time.perf_counter()
+            rows = conn.execute(query, params).fetchall()
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples), rows
+
+    def old_list_query(search: str, offset: int) -> str:
+        # Previous list_users query: interpolated filters and LIMIT/OFFSET
+        where = "tenant_id = 'default'"
+        if search:
+            where += (
+                " AND ("
+                + " OR ".join(
+                    f"{column} LIKE '%{search}%'"
+                    for column in ("email", "username", "first_name", "last_name")
+                )
+                + ")"
+            )
+        return f"""
+        SELECT {USER_LIST_COLUMNS} FROM users WHERE {where}
+        ORDER BY date_joined DESC LIMIT {per_page} OFFSET {offset}
+        """
+
+    table = Table(title=f"/api/users at {users:,} users (median of 5, ms)")
+    for column in ["Query", "Old (OFFSET / LIKE)", "New (keyset / FTS5)"]:
+        table.add_column(column, justify="right")
+
+    where, params = user_filter_clause("sqlite")
+    for page in (1, deep_page):
+        offset = (page - 1) * per_page
+        old_ms, _ = timed(old_list_query("", offset), {})
+        after = None
+        if page > 1:  # Cursor a client would hold after page - 1 (not timed)
+            query, query_params = build_user_list_query(
+                "sqlite", where, params, limit=1, offset=offset - 1
+            )
+            row = dict(conn.execute(query, query_params).fetchone())
+            after = decode_user_cursor(
+                encode_user_cursor(row, "date_joined", "desc"), "date_joined", "desc"
+            )
+        query, query_params = build_user_list_query(
+            "sqlite", where, params, limit=per_page, after=after
+        )
+        new_ms, _ = timed(query, query_params)
+        table.add_row(f"page {page:,}", f"{old_ms:.2f}", f"{new_ms:.2f}")
+
+    # Common, mid-frequency and rare terms; the new path picks FTS5 or an
+    # in-order LIKE scan from the cached match count, as list_users does
+    for term in ("kim1", "lee12", "12345"):
+        old_ms, _ = timed(old_list_query(term, 0), {}, runs=3)
+        where, params = user_filter_clause("sqlite", search=term)
+        count_query, count_params = build_user_count_query(where, params)
+        matches = conn.execute(count_query, count_params).fetchone()[0]
+        dense = matches >= USER_SEARCH_DENSE_MATCHES
+        if dense:
+            where, params = user_filter_clause("sqlite", search=term, dense_search=True)
+        query, query_params = build_user_list_query(
+            "sqlite", where, params, limit=per_page
+        )
+        new_ms, _ = timed(query, query_params, runs=3)
+        table.add_row(
+            f"search '{term}' ({matches:,} matches)",
+            f"{old_ms:.2f}",
+            f"{new_ms:.2f} ({'LIKE scan' if dense else 'FTS5'})",
+        )
+
+    where, params = user_filter_clause("sqlite")
+    old_ms, _ = timed("SELECT COUNT(*) FROM users WHERE tenant_id = 'default'", {})
+    count_query, count_params = build_user_count_query(where, params)
+    counts = ApproximateCountCache()
+
+    async def count() -> int:
+        return conn.execute(count_query, count_params).fetchone()[0]
+
+    async def count_twice() -> Tuple[float, float]:
+        started = time.perf_counter()
+        await counts.get(where, params, count)
+        cold = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        await counts.get(where, params, count)
+        return cold, (time.perf_counter() - started) * 1000
+
+    cold_ms, cached_ms = asyncio.run(count_twice())
+    table.add_row(
+        "total count", f"{old_ms:.2f}", f"{cold_ms:.2f} / {cached_ms:.3f} cached"
+    )
+    console.print(table)
+
+
+@cli.command()
+@click.option(
+    "--users",
+    multiple=True,
+    type=int,
+    default=[100_000, 1_000_000],
+    help="Table sizes to export (repeatable)",
+)
+@click.option("--format", "export_format", default="csv")
+@click.option("--compress", is_flag=True, help="gzip the streamed export")
+def exportbench(users, export_format, compress):
+    """Export time to first byte and peak memory: buffered vs streamed."""
+    import tracemalloc
+
+    def measure(produce) -> Tuple[float, float, float, int]:
+        # (first byte ms, total s, peak MiB, bytes) for an iterator of chunks
+        tracemalloc.start()
+        started = time.perf_counter()
+        first_byte, size = None, 0
+        for chunk in produce():
+            if first_byte is None and chunk:
+                first_byte = (time.perf_counter() - started) * 1000
+            size += len(chunk)
+        total = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+        return first_byte or 0.0, total, peak, size
+
+    table = Table(title=f"/api/users/export ({export_format}, gzip={compress})")
+    for column in ["Users", "Mode", "First byte ms", "Total s", "Peak MiB", "MB"]:
+        table.add_column(column, justify="right")
+
+    for count in users:
+        conn = open_users_benchmark_db(count)
+
+        def buffered():
+            # Previous export_users: every row in memory, then one string
+            rows = conn.execute(
+                f"SELECT {', '.join(USER_EXPORT_FIELDS)} FROM users "
+                "WHERE tenant_id = 'default' ORDER BY username"
+            ).fetchall()
+            output = ",".join(USER_EXPORT_FIELDS) + "\n"
+            for user in rows:
+                output += (
+                    ",".join(str(user[field] or "") for field in USER_EXPORT_FIELDS)
+                    + "\n"
+                )
+            yield output.encode()
+
+        def streamed():
+            async def fetch_page(query, params):
+                return conn.execute(query, params).fetchall()
+
+            chunks = stream_user_export(
+                iter_user_export_batches(fetch_page, "sqlite"), export_format, compress
+            )
+            loop = asyncio.new_event_loop()
+            try:
+                while True:
+                    try:
+                        yield loop.run_until_complete(chunks.__anext__())
+                    except StopAsyncIteration:
+                        return
+            finally:
+                loop.close()
+
+        for mode, produce in [("buffered", buffered), ("streamed", streamed)]:
+            first_byte, total, peak, size = measure(produce)
+            table.add_row(
+                f"{count:,}",
+                mode,
+                f"{first_byte:.1f}",
+                f"{total:.1f}",
+                f"{peak:.1f}",
+                f"{size / 1e6:.1f}",
+            )
+        conn.close()
+
+    console.print(table)
+
+
+@cli.command()
+@click.option("--clients", default=10_000, help="Simulated WebSocket clients")
+@click.option("--messages", default=20, help="Broadcasts per run")
+@click.option("--interval-ms", default=50.0, help="Time between broadcasts")
+@click.option("--slow-ratio", default=0.01, help="Share of slow clients")
+@click.option("--slow-ms", default=20.0, help="Send latency of a slow client")
+@click.option("--policy", default=WS_SLOW_CONSUMER_POLICY)
+def wsbench(clients, messages, interval_ms, slow_ratio, slow_ms, policy):
+    """Broadcast latency to simulated clients: sequential vs fan-out hub."""
+    import random
+
+    class SimulatedClient:
+        # Records when each message arrives; slow clients take slow_ms per send
+        def __init__(self, delay: float, sent_at: Dict):
+            self.delay = delay
+            self.sent_at = sent_at
+            self.latencies: List[float] = []
+
+        async def accept(self):
+            pass
+
+        async def close(self, code: int = 1000):
+            pass
+
+        async def send_text(self, payload: str):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            self.latencies.append(time.perf_counter() - self.sent_at[payload])
+
+        async def send_json(self, message: dict):
+            # As Starlette does it: serialize per connection
+            await self.send_text(json.dumps(message, separators=(",", ":")))
+
+    async def run(hub: bool) -> Dict[str, Any]:
+        rng = random.Random(0)
+        sent_at: Dict[str, float] = {}
+        sockets = [
+            SimulatedClient(slow_ms / 1000 if rng.random() < slow_ratio else 0, sent_at)
+            for _ in range(clients)
+        ]
+        manager = ConnectionManager(policy=policy) if hub else None
+        for websocket in sockets:
+            if manager is not None:
+                await manager.connect(websocket)
+
+        calls = []
+        for seq in range(messages):
+            message = {"type": "user_update", "action": "update", "seq": seq}
+            sent_at[json.dumps(message, separators=(",", ":"))] = time.perf_counter()
+            started = time.perf_counter()
+            if manager is not None:
+                await manager.broadcast(message)
+            else:
+                # Previous ConnectionManager.broadcast
+                for connection in sockets:
+                    await connection.send_json(message)
+            calls.append(time.perf_counter() - started)
+            await asyncio.sleep(interval_ms / 1000)
+
+        fast = [websocket for websocket in sockets if not websocket.delay]
+        deadline = time.perf_counter() + 10
+        while time.perf_counter() < deadline and any(
+            len(websocket.latencies) < messages for websocket in fast
+        ):
+            await asyncio.sleep(0.01)
+        if manager is not None:
+            for websocket in sockets:
+                manager.disconnect(websocket)
+
+        def percentile(values: List[float], share: float) -> float:
+            values = sorted(values)
+            return values[min(len(values) - 1, int(len(values) * share))] * 1000
+
+        fast_latencies = [value for client in fast for value in client.latencies]
+        all_latencies = [value for client in sockets for value in client.latencies]
+        return {
+            "call_p99": percentile(calls, 0.99),
+            "fast_p50": percentile(fast_latencies, 0.5),
+            "fast_p99": percentile(fast_latencies, 0.99),
+            "all_p99": percentile(all_latencies, 0.99),
+            "delivered": len(all_latencies),
+            "stats": manager.stats if manager is not None else {},
+        }
+
+    console.print(
+        f"[bold]Broadcast benchmark:[/bold] {clients:,} clients, {slow_ratio:.0%} "
+        f"taking {slow_ms:g} ms per send, {messages} messages, policy={policy}"
+    )
+    table = Table(title="Broadcast latency (ms)")
+    for column in [
+        "Mode",
+        "broadcast() p99",
+        "Fast p50",
+        "Fast p99",
+        "All p99",
+        "Delivered",
+    ]:
+        table.add_column(column, justify="right")
+    for mode, hub in [("sequential", False), ("fan-out hub", True)]:
+        r = asyncio.run(run(hub))
+        table.add_row(
+            mode,
+            f"{r['call_p99']:.2f}",
+            f"{r['fast_p50']:.2f}",
+            f"{r['fast_p99']:.2f}",
+            f"{r['all_p99']:.2f}",
+            f"{r['delivered']:,} / {clients * messages:,}",
+        )
+        if r["stats"]:
+            console.print(f"Hub stats: {r['stats']}")
+    console.print(table)
+
+
 @cli.command()
 def web():
     """Start the web interface."""
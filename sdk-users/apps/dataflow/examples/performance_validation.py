@@ -13,13 +13,35 @@ Real-world scenarios tested:
 - User activity aggregation
 - Sales reporting workflow
 - Multi-table join operations
+
+Two modes are available:
+- simulated (default): timings are estimated from per-node cost constants
+- measured: seeds a local SQLite database with scaled versions of every
+  scenario, executes the node-by-node workflow and the SQL emitted by
+  ``SQLQueryOptimizer.optimize_workflow`` against it, and reports wall-clock
+  p50/p95/p99, rows/sec and peak RSS per scale
+
+    python performance_validation.py measured
+
+Measured mode is configured through environment variables:
+    PERF_SCALES   comma-separated fact-table row counts (default 10000,1000000,10000000)
+    PERF_REPEATS  timed runs per path and scale (default 5)
+    PERF_DB_DIR   directory for the seeded databases (default: system temp dir)
 """
 
+import concurrent.futures
+import math
+import multiprocessing
 import os
+import random
+import sqlite3
 import statistics
 import sys
+import tempfile
 import time
-from typing import Any, Dict, List, Tuple
+import zlib
+from datetime import date, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
 
 # Add the DataFlow app to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../src"))
@@ -31,6 +53,434 @@ from dataflow.optimization import (
     WorkflowAnalyzer,
 )
 
+DEFAULT_MEASURED_SCALES = (10_000, 1_000_000, 10_000_000)
+SEED_BATCH_SIZE = 50_000
+SEED = 20250101
+
+
+# ---------------------------------------------------------------------------
+# Measured mode: scenario schema and seeding
+# ---------------------------------------------------------------------------
+
+REGIONS = ["north", "south", "east", "west", "central"]
+STATES = ["CA", "NY", "TX", "WA", "FL", "IL", "MA", "GA"]
+CATEGORY_NAMES = ["electronics", "books", "home", "toys", "apparel", "garden"]
+ACTIVITY_TYPES = ["view", "click", "search", "purchase", "share"]
+
+
+def _table_sizes(rows: int) -> Dict[str, int]:
+    """Scale every scenario table from the fact-table row count."""
+    return {
+        "customers": max(rows // 10, 100),
+        "orders": rows,
+        "products": max(rows // 100, 50),
+        "categories": len(CATEGORY_NAMES) * 5,
+        "vendors": max(rows // 1000, 20),
+        "users": max(rows // 10, 100),
+        "user_activities": rows,
+        "user_sessions": max(rows // 5, 100),
+        "sales": rows,
+        "territories": 50,
+    }
+
+
+def _scenario_schema(rows: int) -> Dict[str, List[Tuple[str, str, Any]]]:
+    """
+    Column definitions for every table referenced by the six scenarios.
+
+    Each column is ``(name, sql_type, generator)`` where the generator takes
+    ``(rng, row_id)``. Filter columns carry the literal values the scenario
+    workflows filter on, so both execution paths select the same rows.
+    """
+    sizes = _table_sizes(rows)
+    today = date.today()
+
+    def fk(table):
+        return lambda rng, i: rng.randint(1, sizes[table])
+
+    def pick(values):
+        return lambda rng, i: rng.choice(values)
+
+    def flag(probability):
+        return lambda rng, i: int(rng.random() < probability)
+
+    def amount(low, high):
+        return lambda rng, i: round(rng.uniform(low, high), 2)
+
+    def recent_date(days):
+        return lambda rng, i: (today - timedelta(days=rng.randint(0, days))).isoformat()
+
+    return {
+        "customers": [
+            ("status", "TEXT", pick(["active", "inactive", "churned"])),
+            ("active", "INTEGER", flag(0.8)),
+            ("region", "TEXT", pick(REGIONS)),
+            ("tier", "TEXT", pick(["standard", "premium", "enterprise"])),
+            ("customer_tier", "TEXT", pick(["standard", "premium", "enterprise"])),
+            ("country", "TEXT", pick(["USA", "USA", "USA", "CAN", "MEX"])),
+            ("customer_state", "TEXT", pick(STATES)),
+        ],
+        "orders": [
+            ("customer_id", "INTEGER", fk("customers")),
+            ("product_id", "INTEGER", fk("products")),
+            ("status", "TEXT", pick(["completed", "processing", "cancelled"])),
+            ("total", "REAL", amount(5, 2500)),
+            ("year", "TEXT", pick(["2023", "2024", "2025"])),
+            ("order_month", "TEXT", lambda rng, i: f"{rng.randint(1, 12):02d}"),
+        ],
+        "products": [
+            ("category_id", "INTEGER", fk("categories")),
+            ("vendor_id", "INTEGER", fk("vendors")),
+            ("in_stock", "INTEGER", flag(0.9)),
+            ("available", "INTEGER", flag(0.85)),
+            ("category", "TEXT", pick(CATEGORY_NAMES)),
+            ("product_category", "TEXT", pick(CATEGORY_NAMES)),
+        ],
+        "categories": [
+            ("name", "TEXT", lambda rng, i: CATEGORY_NAMES[i % len(CATEGORY_NAMES)]),
+            ("active", "INTEGER", flag(0.9)),
+        ],
+        "vendors": [
+            ("name", "TEXT", lambda rng, i: f"vendor_{i}"),
+            ("approved", "INTEGER", flag(0.75)),
+        ],
+        "users": [
+            ("active", "INTEGER", flag(0.8)),
+            ("verified", "INTEGER", flag(0.7)),
+            ("region", "TEXT", pick(REGIONS)),
+            ("created_date", "TEXT", recent_date(30)),
+        ],
+        "user_activities": [
+            ("user_id", "INTEGER", fk("users")),
+            ("session_id", "INTEGER", fk("user_sessions")),
+            ("activity_type", "TEXT", pick(ACTIVITY_TYPES)),
+            ("duration", "REAL", amount(0.5, 600)),
+            ("date", "TEXT", pick(["last_30_days", "older"])),
+        ],
+        "user_sessions": [
+            ("user_id", "INTEGER", fk("users")),
+            ("completed", "INTEGER", flag(0.6)),
+        ],
+        "sales": [
+            ("customer_id", "INTEGER", fk("customers")),
+            ("territory_id", "INTEGER", fk("territories")),
+            ("amount", "REAL", amount(10, 10000)),
+            ("quarter", "TEXT", pick(["Q1_2025", "Q2_2025", "Q3_2025", "Q4_2025"])),
+        ],
+        "territories": [
+            ("territory", "TEXT", lambda rng, i: f"territory_{i}"),
+            ("active", "INTEGER", flag(0.9)),
+        ],
+    }
+
+
+def _generate_rows(
+    table: str, columns: List[Tuple[str, str, Any]], count: int
+) -> Iterator[Tuple[Any, ...]]:
+    """Yield deterministic rows for ``table`` without materializing them."""
+    rng = random.Random(SEED ^ zlib.crc32(table.encode()))
+    for row_id in range(1, count + 1):
+        yield (row_id,) + tuple(gen(rng, row_id) for _, _, gen in columns)
+
+
+def seed_scenario_database(db_path: str, rows: int) -> None:
+    """Create and populate every scenario table, scaled to ``rows`` fact rows."""
+    sizes = _table_sizes(rows)
+    schema = _scenario_schema(rows)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+        for table, columns in schema.items():
+            column_ddl = ", ".join(
+                f"{name} {sql_type}" for name, sql_type, _ in columns
+            )
+            conn.execute(f"CREATE TABLE {table} (id INTEGER PRIMARY KEY, {column_ddl})")
+
+            placeholders = ", ".join("?" * (len(columns) + 1))
+            insert_sql = f"INSERT INTO {table} VALUES ({placeholders})"
+            batch = []
+            for row in _generate_rows(table, columns, sizes[table]):
+                batch.append(row)
+                if len(batch) >= SEED_BATCH_SIZE:
+                    conn.executemany(insert_sql, batch)
+                    batch.clear()
+            if batch:
+                conn.executemany(insert_sql, batch)
+
+            # Foreign keys are indexed as they would be in any production schema
+            for name, _, _ in columns:
+                if name.endswith("_id"):
+                    conn.execute(f"CREATE INDEX idx_{table}_{name} ON {table} ({name})")
+
+            conn.commit()
+
+        conn.execute("CREATE TABLE bench_meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.execute("INSERT INTO bench_meta VALUES ('seeded_rows', ?)", (str(rows),))
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Measured mode: node-by-node execution of the scenario workflows
+# ---------------------------------------------------------------------------
+
+
+def _topological_order(workflow: Dict[str, Any]) -> List[str]:
+    """Order workflow nodes so every node runs after its upstream nodes."""
+    nodes = list(workflow.get("nodes", {}))
+    indegree = {node_id: 0 for node_id in nodes}
+    downstream = {node_id: [] for node_id in nodes}
+    for connection in workflow.get("connections", []):
+        downstream[connection["from_node"]].append(connection["to_node"])
+        indegree[connection["to_node"]] += 1
+
+    ready = [node_id for node_id in nodes if indegree[node_id] == 0]
+    order = []
+    while ready:
+        node_id = ready.pop(0)
+        order.append(node_id)
+        for target in downstream[node_id]:
+            indegree[target] -= 1
+            if indegree[target] == 0:
+                ready.append(target)
+
+    if len(order) != len(nodes):
+        raise ValueError("Workflow contains a cycle; cannot execute node-by-node")
+    return order
+
+
+def _run_list_node(conn: sqlite3.Connection, params: Dict[str, Any]) -> List[Dict]:
+    """Fetch the filtered table into Python, as a ListNode does."""
+    filters = params.get("filter", {})
+    where = " AND ".join(f"{column} = ?" for column in filters)
+    sql = f"SELECT * FROM {params['table']}" + (f" WHERE {where}" if where else "")
+    values = [int(v) if isinstance(v, bool) else v for v in filters.values()]
+    return [dict(row) for row in conn.execute(sql, values)]
+
+
+def _run_merge_node(inputs: List[List[Dict]], params: Dict[str, Any]) -> List[Dict]:
+    """Hash-join the two upstream outputs in Python, as SmartMergeNode does."""
+    if len(inputs) < 2:
+        return inputs[0] if inputs else []
+
+    left, right = inputs[0], inputs[1]
+    conditions = params.get("join_conditions", {})
+    left_key = conditions.get("left_key", "id")
+    right_key = conditions.get("right_key", "id")
+    keep_unmatched = params.get("merge_type") == "left"
+
+    index = {}
+    for row in right:
+        index.setdefault(row.get(right_key), []).append(row)
+
+    merged = []
+    for row in left:
+        matches = index.get(row.get(left_key))
+        if matches:
+            merged.extend({**row, **match} for match in matches)
+        elif keep_unmatched:
+            merged.append(dict(row))
+    return merged
+
+
+def _run_filter_node(inputs: List[List[Dict]], params: Dict[str, Any]) -> List[Dict]:
+    """Apply a natural-language filter; only relative dates are understood."""
+    rows = inputs[0] if inputs else []
+    if params.get("filter_expression") == "today":
+        today = date.today().isoformat()
+        return [row for row in rows if row.get("created_date") == today]
+    return list(rows)
+
+
+def _parse_aggregate_expression(expression: str) -> List[Tuple[str, str]]:
+    """Parse ``"sum of total, count of orders"`` into ``[(func, column), ...]``."""
+    parsed = []
+    for part in expression.split(","):
+        func, _, column = part.strip().partition(" of ")
+        parsed.append((func.strip().lower(), column.strip()))
+    return parsed
+
+
+def _run_aggregate_node(inputs: List[List[Dict]], params: Dict[str, Any]) -> List[Dict]:
+    """Group and aggregate in Python, as AggregateNode does."""
+    rows = inputs[0] if inputs else []
+    group_by = params.get("group_by", [])
+    aggregates = _parse_aggregate_expression(params.get("aggregate_expression", ""))
+
+    groups = {}
+    for row in rows:
+        key = tuple(row.get(column) for column in group_by)
+        groups.setdefault(key, []).append(row)
+
+    results = []
+    for key, members in groups.items():
+        result = dict(zip(group_by, key))
+        for func, column in aggregates:
+            values = [m[column] for m in members if m.get(column) is not None]
+            if func == "count":
+                value = len(members)
+            elif func == "sum":
+                value = sum(values)
+            elif func == "avg":
+                value = sum(values) / len(values) if values else None
+            elif func == "max":
+                value = max(values) if values else None
+            elif func == "min":
+                value = min(values) if values else None
+            else:
+                raise ValueError(f"Unsupported aggregate function: {func}")
+            result[f"{func}_{column}"] = value
+        results.append(result)
+
+    for column, condition in params.get("having", {}).items():
+        threshold = condition.get("$gt")
+        if threshold is not None:
+            results = [r for r in results if (r.get(column) or 0) > threshold]
+
+    for ordering in reversed(params.get("order_by", [])):
+        for column, direction in ordering.items():
+            results.sort(
+                key=lambda r: (r.get(column) is None, r.get(column)),
+                reverse=direction == "desc",
+            )
+
+    if params.get("limit"):
+        results = results[: params["limit"]]
+    return results
+
+
+def execute_workflow_node_by_node(
+    conn: sqlite3.Connection, workflow: Dict[str, Any]
+) -> int:
+    """
+    Execute a scenario workflow the traditional way: every node runs on its
+    own and hands fully materialized Python rows to the next node.
+
+    Returns the number of rows produced by the terminal nodes.
+    """
+    nodes = workflow.get("nodes", {})
+    upstream = {node_id: [] for node_id in nodes}
+    for connection in workflow.get("connections", []):
+        upstream[connection["to_node"]].append(connection["from_node"])
+
+    pending_consumers = {node_id: 0 for node_id in nodes}
+    for connection in workflow.get("connections", []):
+        pending_consumers[connection["from_node"]] += 1
+    terminal_nodes = [n for n, count in pending_consumers.items() if count == 0]
+    outputs = {}
+
+    for node_id in _topological_order(workflow):
+        node_type = nodes[node_id].get("type", "")
+        params = nodes[node_id].get("parameters", {})
+        inputs = [outputs[source] for source in upstream[node_id]]
+
+        if "List" in node_type:
+            outputs[node_id] = _run_list_node(conn, params)
+        elif "Merge" in node_type:
+            outputs[node_id] = _run_merge_node(inputs, params)
+        elif "Aggregate" in node_type:
+            outputs[node_id] = _run_aggregate_node(inputs, params)
+        elif "Filter" in node_type:
+            outputs[node_id] = _run_filter_node(inputs, params)
+        else:
+            raise ValueError(f"Unsupported node type for measured mode: {node_type}")
+
+        # Free intermediates once every consumer has run, like a streaming runtime
+        for source in upstream[node_id]:
+            pending_consumers[source] -= 1
+            if pending_consumers[source] == 0:
+                outputs[source] = None
+
+    return sum(len(outputs[n]) for n in terminal_nodes)
+
+
+def execute_optimized_sql(conn: sqlite3.Connection, queries: List[str]) -> int:
+    """Execute the optimizer's SQL and return the number of rows fetched."""
+    return sum(len(conn.execute(sql).fetchall()) for sql in queries)
+
+
+# ---------------------------------------------------------------------------
+# Measured mode: timing and resource accounting
+# ---------------------------------------------------------------------------
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _rows_per_sec(rows: int, elapsed_ms: float) -> float:
+    return rows / (elapsed_ms / 1000) if elapsed_ms > 0 else 0.0
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of the current process in MiB."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return 0.0
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _measure_path(db_path: str, path: str, payload: Any, repeats: int) -> Dict:
+    """
+    Time one execution path against ``db_path``.
+
+    Runs inside a dedicated worker process; ``payload`` is the workflow for
+    the baseline path and the list of optimized SQL strings otherwise.
+    """
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    runner = (
+        execute_workflow_node_by_node if path == "baseline" else execute_optimized_sql
+    )
+
+    timings_ms = []
+    error = None
+    result_rows = 0
+    try:
+        # One untimed run warms the page cache for both paths alike
+        runner(conn, payload)
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result_rows = runner(conn, payload)
+            timings_ms.append((time.perf_counter() - start) * 1000)
+    except (sqlite3.Error, ValueError) as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        conn.close()
+
+    timings_ms.sort()
+    return {
+        "p50_ms": _percentile(timings_ms, 50),
+        "p95_ms": _percentile(timings_ms, 95),
+        "p99_ms": _percentile(timings_ms, 99),
+        "runs": len(timings_ms),
+        "result_rows": result_rows,
+        "peak_rss_mb": _peak_rss_mb(),
+        "error": error,
+    }
+
+
+def _run_isolated(func, *args) -> Dict:
+    """Run ``func`` in a fresh process so its peak RSS is not shared."""
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=1, mp_context=context
+    ) as executor:
+        return executor.submit(func, *args).result()
+
 
 class PerformanceValidator:
     """
@@ -40,9 +490,24 @@ class PerformanceValidator:
     workflow operations to optimized SQL queries.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        mode: str = "simulated",
+        scales: List[int] = None,
+        repeats: int = 5,
+        db_dir: str = None,
+    ):
+        if mode not in ("simulated", "measured"):
+            raise ValueError(f"Unknown validation mode: {mode}")
+
+        self.mode = mode
+        self.scales = scales or list(DEFAULT_MEASURED_SCALES)
+        self.repeats = repeats
+        self.db_dir = db_dir or tempfile.gettempdir()
         self.analyzer = WorkflowAnalyzer()
-        self.sql_optimizer = SQLQueryOptimizer(dialect=SQLDialect.POSTGRESQL)
+        # Measured mode executes the emitted SQL locally, so it must be SQLite SQL
+        dialect = SQLDialect.SQLITE if mode == "measured" else SQLDialect.POSTGRESQL
+        self.sql_optimizer = SQLQueryOptimizer(dialect=dialect)
         self.results = {}
 
     def validate_all_scenarios(self) -> Dict[str, Any]:
@@ -544,6 +1009,9 @@ class PerformanceValidator:
         self, workflow: Dict[str, Any], scenario_name: str
     ) -> Dict[str, Any]:
         """Measure performance improvement from workflow optimization."""
+        if self.mode == "measured":
+            return self._measure_real_execution(workflow, scenario_name)
+
         # Simulate baseline workflow execution time
         baseline_time_ms = self._simulate_baseline_execution(workflow)
 
@@ -573,6 +1041,89 @@ class PerformanceValidator:
             ),
         }
 
+    def _measure_real_execution(
+        self, workflow: Dict[str, Any], scenario_name: str
+    ) -> Dict[str, Any]:
+        """
+        Measure real execution of both paths against seeded SQLite databases.
+
+        Every (scale, path) pair runs in a fresh worker process so that the
+        reported peak RSS belongs to that path alone. The top-level timing keys
+        mirror the simulated result and are taken from the largest scale.
+        """
+        opportunities = self.analyzer.analyze_workflow(workflow)
+        optimized_queries = self.sql_optimizer.optimize_workflow(opportunities)
+        optimized_sql = [query.optimized_sql for query in optimized_queries]
+
+        scale_results = {}
+        for rows in self.scales:
+            db_path = self._ensure_seeded_database(rows)
+            print(f"   Measuring {rows:,} rows ...")
+
+            baseline = _run_isolated(
+                _measure_path, db_path, "baseline", workflow, self.repeats
+            )
+            optimized = _run_isolated(
+                _measure_path, db_path, "optimized", optimized_sql, self.repeats
+            )
+
+            baseline["rows_per_sec"] = _rows_per_sec(rows, baseline["p50_ms"])
+            optimized["rows_per_sec"] = _rows_per_sec(rows, optimized["p50_ms"])
+
+            measured_ok = not baseline["error"] and not optimized["error"]
+            scale_results[rows] = {
+                "baseline": baseline,
+                "optimized": optimized,
+                "performance_improvement": (
+                    baseline["p50_ms"] / optimized["p50_ms"]
+                    if measured_ok and optimized["p50_ms"] > 0
+                    else 0.0
+                ),
+            }
+            for path, stats in (("baseline", baseline), ("optimized", optimized)):
+                if stats["error"]:
+                    print(f"   ⚠️ {path} path failed: {stats['error']}")
+
+        largest = scale_results[max(scale_results)]
+
+        return {
+            "scenario": scenario_name,
+            "mode": "measured",
+            "baseline_time_ms": largest["baseline"]["p50_ms"],
+            "optimized_time_ms": largest["optimized"]["p50_ms"],
+            "performance_improvement": largest["performance_improvement"],
+            "optimization_opportunities": len(opportunities),
+            "optimized_queries": len(optimized_queries),
+            "complexity_reduction": self._calculate_complexity_reduction(
+                workflow, optimized_queries
+            ),
+            "scales": scale_results,
+        }
+
+    def _ensure_seeded_database(self, rows: int) -> str:
+        """Return the path of a database seeded at ``rows``, seeding it once."""
+        db_path = os.path.join(self.db_dir, f"dataflow_perf_{rows}.sqlite")
+
+        if os.path.exists(db_path):
+            conn = sqlite3.connect(db_path)
+            try:
+                seeded = conn.execute(
+                    "SELECT value FROM bench_meta WHERE key = 'seeded_rows'"
+                ).fetchone()
+            except sqlite3.DatabaseError:
+                seeded = None
+            finally:
+                conn.close()
+            if seeded and int(seeded[0]) == rows:
+                return db_path
+            os.remove(db_path)
+
+        print(f"   Seeding {rows:,}-row database at {db_path} ...")
+        start = time.perf_counter()
+        seed_scenario_database(db_path, rows)
+        print(f"   Seeded in {time.perf_counter() - start:.1f}s")
+        return db_path
+
     def _simulate_baseline_execution(self, workflow: Dict[str, Any]) -> float:
         """
         Simulate baseline workflow execution time.
@@ -804,9 +1355,60 @@ class PerformanceValidator:
 
         return report
 
+    def generate_measured_report(self, results: Dict[str, Any]) -> str:
+        """Generate the per-scale report for measured mode."""
+        report = "DataFlow Measured Performance Report\n"
+        report += "=" * 50 + "\n\n"
+        report += "Backend: SQLite (local, seeded)\n"
+        report += (
+            f"Scales (fact-table rows): {', '.join(f'{s:,}' for s in self.scales)}\n"
+        )
+        report += f"Timed runs per path: {self.repeats}\n"
+        report += "Speedup = baseline p50 / optimized p50\n\n"
+
+        header = (
+            f"  {'rows':>12} {'path':<10} {'p50 ms':>11} {'p95 ms':>11} "
+            f"{'p99 ms':>11} {'rows/sec':>14} {'peak RSS MB':>12}\n"
+        )
+
+        for scenario_name, scenario_result in results["scenarios"].items():
+            report += f"{scenario_name}\n"
+            report += "-" * len(scenario_name) + "\n"
+            report += f"  Optimized queries: {scenario_result['optimized_queries']}\n"
+            report += header
+
+            for rows, measurement in scenario_result["scales"].items():
+                for path in ("baseline", "optimized"):
+                    stats = measurement[path]
+                    if stats["error"]:
+                        report += f"  {rows:>12,} {path:<10} FAILED: {stats['error']}\n"
+                        continue
+                    report += (
+                        f"  {rows:>12,} {path:<10} {stats['p50_ms']:>11.2f} "
+                        f"{stats['p95_ms']:>11.2f} {stats['p99_ms']:>11.2f} "
+                        f"{stats['rows_per_sec']:>14,.0f} {stats['peak_rss_mb']:>12.1f}\n"
+                    )
+                report += (
+                    f"  {'':>12} speedup    "
+                    f"{measurement['performance_improvement']:.1f}x\n"
+                )
+            report += "\n"
+
+        report += "SUMMARY (largest scale)\n"
+        report += "-" * 23 + "\n"
+        report += f"Average speedup: {results['average_improvement']:.1f}x\n"
+        report += (
+            f"Target (100x) met: {'✅ YES' if results['target_met'] else '❌ NO'}\n"
+        )
+
+        return report
+
 
 def main():
     """Run comprehensive performance validation."""
+    if len(sys.argv) > 1 and sys.argv[1] == "measured":
+        return main_measured()
+
     validator = PerformanceValidator()
 
     print("Starting DataFlow Performance Validation...")
@@ -846,6 +1448,43 @@ def main():
     return exit_code
 
 
+def main_measured():
+    """Run every scenario against seeded local databases and report real timings."""
+    scales = [
+        int(value)
+        for value in os.getenv(
+            "PERF_SCALES", ",".join(str(s) for s in DEFAULT_MEASURED_SCALES)
+        ).split(",")
+    ]
+    validator = PerformanceValidator(
+        mode="measured",
+        scales=scales,
+        repeats=int(os.getenv("PERF_REPEATS", 5)),
+        db_dir=os.getenv("PERF_DB_DIR"),
+    )
+
+    print("Starting DataFlow Measured Performance Validation...")
+    print(f"Scales: {', '.join(f'{s:,}' for s in scales)} rows")
+    print("Seeding large scales takes a while on the first run; databases are reused.")
+    print()
+
+    results = validator.validate_all_scenarios()
+    report = validator.generate_measured_report(results)
+
+    print()
+    print(report)
+
+    report_file = os.path.join(
+        os.path.dirname(__file__), "performance_measured_report.txt"
+    )
+    with open(report_file, "w") as f:
+        f.write(report)
+
+    print(f"\n📄 Measured report saved to: {report_file}")
+
+    return 0 if results["target_met"] else 1
+
+
 if __name__ == "__main__":
     try:
         exit_code = main()